@@ -0,0 +1,90 @@
+"""customer search: pg_trgm indexes, phone digits and chosung columns
+
+Revision ID: 3f2a9c1d7b4e
+Revises:
+Create Date: 2026-10-18 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2a9c1d7b4e'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+KOREAN_CHOSUNG_FUNCTION = """
+CREATE OR REPLACE FUNCTION korean_chosung(input text) RETURNS text
+LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+DECLARE
+    initials text[] := ARRAY['ㄱ','ㄲ','ㄴ','ㄷ','ㄸ','ㄹ','ㅁ','ㅂ','ㅃ','ㅅ','ㅆ','ㅇ','ㅈ','ㅉ','ㅊ','ㅋ','ㅌ','ㅍ','ㅎ'];
+    result text := '';
+    ch text;
+    code int;
+BEGIN
+    IF input IS NULL THEN
+        RETURN NULL;
+    END IF;
+    FOR i IN 1..char_length(input) LOOP
+        ch := substr(input, i, 1);
+        code := ascii(ch);
+        IF code BETWEEN 44032 AND 55203 THEN
+            result := result || initials[(code - 44032) / 588 + 1];
+        ELSE
+            result := result || ch;
+        END IF;
+    END LOOP;
+    RETURN result;
+END;
+$$
+"""
+
+# (인덱스 이름, 테이블, 정의)
+INDEXES = [
+    ("idx_customers_name_trgm", "customers", "USING gin (name gin_trgm_ops)"),
+    ("idx_customers_email_trgm", "customers", "USING gin (email gin_trgm_ops)"),
+    ("idx_customers_phone_digits_trgm", "customers", "USING gin (phone_digits gin_trgm_ops)"),
+    ("idx_customers_name_chosung_trgm", "customers", "USING gin (name_chosung gin_trgm_ops)"),
+    ("idx_customers_name_prefix", "customers", "(name text_pattern_ops)"),
+    ("idx_marketing_leads_name_trgm", "marketing_leads", "USING gin (name gin_trgm_ops)"),
+    ("idx_marketing_leads_phone_trgm", "marketing_leads", "USING gin (phone gin_trgm_ops)"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(KOREAN_CHOSUNG_FUNCTION)
+
+    # 생성 컬럼 - 기존 행도 ALTER 시점에 계산됨
+    op.execute("""
+        ALTER TABLE customers
+        ADD COLUMN IF NOT EXISTS phone_digits text
+        GENERATED ALWAYS AS (regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g')) STORED
+    """)
+    op.execute("""
+        ALTER TABLE customers
+        ADD COLUMN IF NOT EXISTS name_chosung text
+        GENERATED ALWAYS AS (korean_chosung(name)) STORED
+    """)
+
+    # 운영 중 테이블 잠금을 피하기 위해 CONCURRENTLY (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, definition in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {definition}")
+
+    op.execute("ANALYZE customers")
+    op.execute("ANALYZE marketing_leads")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    op.drop_column("customers", "name_chosung")
+    op.drop_column("customers", "phone_digits")
+    op.execute("DROP FUNCTION IF EXISTS korean_chosung(text)")
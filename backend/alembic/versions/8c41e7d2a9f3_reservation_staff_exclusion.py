@@ -0,0 +1,65 @@
+"""reservations: staff overlap EXCLUDE constraint
+
+Revision ID: 8c41e7d2a9f3
+Revises: 3f2a9c1d7b4e
+Create Date: 2026-10-18 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c41e7d2a9f3'
+down_revision: Union[str, None] = '3f2a9c1d7b4e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONSTRAINT_NAME = "reservations_staff_no_overlap"
+
+ACTIVE_STATUSES = "('pending', 'confirmed')"
+
+
+def _reservation_range(alias: str = "") -> str:
+    """예약 구간 식 - date + time (타임존 없음) 이라 tstzrange 대신 tsrange"""
+    prefix = f"{alias}." if alias else ""
+    start = f"{prefix}reservation_date + {prefix}reservation_time"
+    return f"tsrange({start}, {start} + coalesce({prefix}duration_minutes, 60) * interval '1 minute')"
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # 이미 겹친 예약이 있으면 제약 생성이 실패하므로 먼저 알려준다
+    conflicts = op.get_bind().execute(sa.text(f"""
+        SELECT a.reservation_id, b.reservation_id
+        FROM reservations a
+        JOIN reservations b
+          ON b.staff_id = a.staff_id
+         AND b.reservation_date = a.reservation_date
+         AND b.reservation_id > a.reservation_id
+        WHERE a.status IN {ACTIVE_STATUSES}
+          AND b.status IN {ACTIVE_STATUSES}
+          AND {_reservation_range('a')} && {_reservation_range('b')}
+        LIMIT 20
+    """)).all()
+    if conflicts:
+        pairs = ", ".join(f"{a}/{b}" for a, b in conflicts)
+        raise RuntimeError(
+            f"직원 일정이 겹치는 활성 예약이 있어 {CONSTRAINT_NAME} 제약을 만들 수 없습니다. "
+            f"정리 후 다시 실행하세요 (reservation_id 쌍: {pairs})"
+        )
+
+    op.execute(f"""
+        ALTER TABLE reservations
+        ADD CONSTRAINT {CONSTRAINT_NAME}
+        EXCLUDE USING gist (staff_id WITH =, ({_reservation_range()}) WITH &&)
+        WHERE (staff_id IS NOT NULL AND status IN {ACTIVE_STATUSES})
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"ALTER TABLE reservations DROP CONSTRAINT IF EXISTS {CONSTRAINT_NAME}")
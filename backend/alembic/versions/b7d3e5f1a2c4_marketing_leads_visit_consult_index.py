@@ -0,0 +1,33 @@
+"""marketing_leads: visit_consult_date index for key metrics
+
+Revision ID: b7d3e5f1a2c4
+Revises: 8c41e7d2a9f3
+Create Date: 2026-10-18 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e5f1a2c4'
+down_revision: Union[str, None] = '8c41e7d2a9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 핵심 지표 집계가 방문상담일 범위만 읽도록 (registration_date 포함 → index-only scan)
+    # 배포 전 단계에서 쓰기를 막지 않도록 CONCURRENTLY (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_marketing_leads_visit_consult_date "
+            "ON marketing_leads (visit_consult_date, registration_date) "
+            "WHERE visit_consult_date IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_marketing_leads_visit_consult_date")
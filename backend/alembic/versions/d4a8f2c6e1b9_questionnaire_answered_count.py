@@ -0,0 +1,41 @@
+"""questionnaire_responses: answered_count, answers (response_id, question_id) index
+
+Revision ID: d4a8f2c6e1b9
+Revises: b7d3e5f1a2c4
+Create Date: 2026-10-18 18:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8f2c6e1b9'
+down_revision: Union[str, None] = 'b7d3e5f1a2c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 응답별 답변 조회 (중복 답변 확인, 답변한 질문 ID)가 answers 전체를 훑지 않도록
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_answers_response_question "
+        "ON answers (response_id, question_id)"
+    )
+
+    # 답변 제출/진행 상태 조회 때 answers를 COUNT하지 않도록 답변 수를 응답 행에 유지
+    # init_db(create_all)로 만든 DB에는 이미 컬럼이 있으므로 IF NOT EXISTS
+    op.execute("""
+        ALTER TABLE questionnaire_responses
+        ADD COLUMN IF NOT EXISTS answered_count integer NOT NULL DEFAULT 0
+    """)
+    op.execute(
+        "UPDATE questionnaire_responses r "
+        "SET answered_count = (SELECT COUNT(*) FROM answers a WHERE a.response_id = r.response_id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('questionnaire_responses', 'answered_count')
+    op.execute("DROP INDEX IF EXISTS idx_answers_response_question")
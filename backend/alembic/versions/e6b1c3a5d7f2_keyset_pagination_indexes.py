@@ -0,0 +1,50 @@
+"""keyset pagination: created_at NOT NULL, (sort column, id) indexes
+
+Revision ID: e6b1c3a5d7f2
+Revises: d4a8f2c6e1b9
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1c3a5d7f2'
+down_revision: Union[str, None] = 'd4a8f2c6e1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스 이름, 테이블, 컬럼) - 기존 테이블에는 create_all이 인덱스를 만들지 않으므로 여기서 생성
+INDEXES = [
+    ("idx_customers_created_at_id", "customers", "(created_at, customer_id)"),
+    ("idx_marketing_leads_created_at_id", "marketing_leads", "(created_at, lead_id)"),
+    ("idx_payments_payment_date_id", "payments", "(payment_date, payment_id)"),
+]
+
+
+def upgrade() -> None:
+    # 목록 기본 정렬(created_at DESC)이 NULLS LAST / OR created_at IS NULL 없이
+    # (created_at, id) 인덱스 역방향 스캔 하나로 처리되도록 NOT NULL로 고정
+    for table in ("customers", "marketing_leads"):
+        op.execute(f"UPDATE {table} SET created_at = coalesce(updated_at, now()) WHERE created_at IS NULL")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at SET NOT NULL")
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} {columns}")
+
+    # approximate 건수(pg_class.reltuples) 정확도를 위해 통계 갱신
+    for _, table, _ in INDEXES:
+        op.execute(f"ANALYZE {table}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    for table in ("customers", "marketing_leads"):
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN created_at DROP NOT NULL")
@@ -1,5 +1,4 @@
 # This file makes the v1 directory a Python package
-
-from . import auth, customers, customer_packages, dashboard, kits, packages, payments, payments_upload, reports, services, settings, notifications, reservations, counseling
-
-__all__ = ['auth', 'customers', 'customer_packages', 'dashboard', 'kits', 'packages', 'payments', 'payments_upload', 'reports', 'services', 'settings', 'notifications', 'reservations', 'counseling']
+#
+# 라우터 모듈은 main.py에서 필요한 것만 직접 import한다.
+# (여기서 전부 import하면 패키지를 건드리기만 해도 모든 라우터와 의존 모듈이 로드되어 콜드 스타트가 느려짐)
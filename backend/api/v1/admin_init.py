@@ -7,7 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from core.database import get_db
 from models.user import User
-from core.auth import get_password_hash
+from core.auth import get_password_hash, principal_cache
 import os
 
 router = APIRouter()
@@ -77,6 +77,7 @@ def initialize_accounts(
             results.append("✅ manager@aibio.kr 비밀번호 초기화 완료")
 
         db.commit()
+        principal_cache.clear()
 
         return {
             "success": True,
@@ -18,7 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(
 router = APIRouter()
 
 @router.post("/restore-services", response_model=Dict[str, str])
-async def restore_services(
+def restore_services(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -5,6 +5,7 @@ from datetime import timedelta
 
 from core.database import get_db
 from core.auth import (
+    AuthenticatedUser,
     verify_password,
     get_password_hash,
     create_access_token,
@@ -12,6 +13,7 @@ from core.auth import (
     verify_token,
     get_current_active_user,
     check_permission,
+    invalidate_principal,
     ACCESS_TOKEN_EXPIRE_MINUTES
 )
 from models.user import User
@@ -29,7 +31,7 @@ router = APIRouter()
 
 @router.post("/login", response_model=Token)
 @router.post("/login/", response_model=Token)
-async def login(login_data: UserLogin, db: Session = Depends(get_db)):
+def login(login_data: UserLogin, db: Session = Depends(get_db)):
     user = db.query(User).filter(User.email == login_data.email).first()
     if not user or not verify_password(login_data.password, user.password_hash):
         raise HTTPException(
@@ -57,7 +59,7 @@ async def login(login_data: UserLogin, db: Session = Depends(get_db)):
 
 @router.post("/refresh", response_model=Token)
 @router.post("/refresh/", response_model=Token)
-async def refresh_token(token_data: TokenRefresh, db: Session = Depends(get_db)):
+def refresh_token(token_data: TokenRefresh, db: Session = Depends(get_db)):
     email = verify_token(token_data.refresh_token, token_type="refresh")
     user = db.query(User).filter(User.email == email).first()
     if not user or not user.is_active:
@@ -79,14 +81,14 @@ async def refresh_token(token_data: TokenRefresh, db: Session = Depends(get_db))
     }
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
+async def get_current_user_info(current_user: AuthenticatedUser = Depends(get_current_active_user)):
     return current_user
 
 @router.post("/users", response_model=UserResponse)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("admin"))
+    current_user: AuthenticatedUser = Depends(check_permission("admin"))
 ):
     existing_user = db.query(User).filter(User.email == user_data.email).first()
     if existing_user:
@@ -108,21 +110,21 @@ async def create_user(
     return db_user
 
 @router.get("/users", response_model=List[UserResponse])
-async def list_users(
+def list_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("manager"))
+    current_user: AuthenticatedUser = Depends(check_permission("manager"))
 ):
     users = db.query(User).offset(skip).limit(limit).all()
     return users
 
 @router.patch("/users/{user_id}", response_model=UserResponse)
-async def update_user(
+def update_user(
     user_id: int,
     user_update: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("admin"))
+    current_user: AuthenticatedUser = Depends(check_permission("admin"))
 ):
     user = db.query(User).filter(User.user_id == user_id).first()
     if not user:
@@ -140,22 +142,25 @@ async def update_user(
 
     db.commit()
     db.refresh(user)
+    invalidate_principal(user)
     return user
 
 @router.post("/change-password")
 @router.post("/change-password/")
-async def change_password(
+def change_password(
     password_data: PasswordChange,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    current_user: AuthenticatedUser = Depends(get_current_active_user)
 ):
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    user = db.get(User, current_user.user_id)
+    if not user or not verify_password(password_data.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password"
         )
 
-    current_user.password_hash = get_password_hash(password_data.new_password)
+    user.password_hash = get_password_hash(password_data.new_password)
     db.commit()
+    invalidate_principal(user)
 
     return {"message": "Password changed successfully"}
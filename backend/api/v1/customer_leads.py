@@ -8,7 +8,6 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_, or_, func, desc, asc, Integer
-import pandas as pd
 from io import BytesIO
 import json
 from pydantic import BaseModel
@@ -33,7 +32,9 @@ from schemas.lead import (
     CampaignTarget as CampaignTargetSchema,
     CampaignTargetCreate
 )
+from services.lead_metrics_service import LeadMetricsService, MAX_TREND_MONTHS, MAX_TREND_WEEKS
 from utils.response_formatter import paginate_query
+from utils.pagination import KeysetPage, count_rows, validate_count_mode
 
 router = APIRouter(
     prefix="/api/v1/customer-leads",
@@ -66,11 +67,18 @@ def get_customer_leads(
     page_size: int = Query(20, ge=1, le=100),
     sort_by: str = Query("created_at"),
     sort_order: str = Query("desc"),
+    pagination: str = Query("offset", description="offset | cursor"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (커서 모드)"),
+    count: str = Query("exact", description="전체 건수: exact | approximate | none"),
     # 인증
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """유입고객 목록 조회 (고급 필터링)"""
+    """유입고객 목록 조회 (고급 필터링)
+
+    pagination=cursor(또는 cursor 지정)이면 page 대신 next_cursor로 다음 페이지를 조회한다.
+    """
+    validate_count_mode(count)
     try:
         query = db.query(MarketingLead).options(
             joinedload(MarketingLead.assigned_staff),
@@ -134,22 +142,46 @@ def get_customer_leads(
             )
             query = query.filter(search_filter)
 
-        # 정렬
-        try:
-            if hasattr(MarketingLead, sort_by):
-                if sort_order == "desc":
-                    query = query.order_by(desc(getattr(MarketingLead, sort_by)))
-                else:
-                    query = query.order_by(asc(getattr(MarketingLead, sort_by)))
+        # 커서 모드: 컬럼 정렬 + lead_id로 keyset 페이지네이션
+        if pagination == "cursor" or cursor:
+            if sort_by in MarketingLead.__table__.c:
+                sort_column = getattr(MarketingLead, sort_by)
             else:
-                # 기본 정렬
+                sort_column = MarketingLead.created_at
+            keyset = KeysetPage(sort_column, MarketingLead.lead_id, descending=sort_order == "desc")
+
+            total = count_rows(db, query, count, table_name="marketing_leads") if cursor is None else None
+            rows = keyset.apply(query, cursor, page_size).all()
+            items, next_cursor = keyset.page(
+                rows, page_size,
+                get_sort_value=lambda lead: getattr(lead, sort_column.key),
+                get_id=lambda lead: lead.lead_id
+            )
+            result = {
+                "items": items,
+                "total": total,
+                "page_size": page_size,
+                "has_next": next_cursor is not None,
+                "has_prev": cursor is not None,
+                "next_cursor": next_cursor
+            }
+        else:
+            # 정렬
+            try:
+                if hasattr(MarketingLead, sort_by):
+                    if sort_order == "desc":
+                        query = query.order_by(desc(getattr(MarketingLead, sort_by)))
+                    else:
+                        query = query.order_by(asc(getattr(MarketingLead, sort_by)))
+                else:
+                    # 기본 정렬
+                    query = query.order_by(desc(MarketingLead.created_at))
+            except Exception as e:
+                # 에러 시 기본 정렬
                 query = query.order_by(desc(MarketingLead.created_at))
-        except Exception as e:
-            # 에러 시 기본 정렬
-            query = query.order_by(desc(MarketingLead.created_at))
 
-        # 페이지네이션
-        result = paginate_query(query, page, page_size)
+            # 페이지네이션
+            result = paginate_query(query, page, page_size, count_mode=count, table_name="marketing_leads")
 
         # 관계 필드 추가
         for item in result["items"]:
@@ -159,6 +191,8 @@ def get_customer_leads(
                 item.converted_customer_name = item.converted_customer.name
 
         return result
+    except HTTPException:
+        raise
     except Exception as e:
         import traceback
         print(f"Error in get_customer_leads: {str(e)}")
@@ -240,194 +274,24 @@ def get_customer_lead_stats(
 @router.get("/key-metrics")
 def get_key_metrics(
     target_month: Optional[str] = None,  # YYYY-MM 형식
+    months: Optional[int] = Query(None, ge=1, le=MAX_TREND_MONTHS, description="월별 추이 개월 수 (기본 LEAD_METRICS_TREND_MONTHS)"),
+    weeks: Optional[int] = Query(None, ge=1, le=MAX_TREND_WEEKS, description="주간 추이 주 수 (기본 LEAD_METRICS_TREND_WEEKS)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """핵심 지표 조회 - 전월 기준"""
-    from models.payment import Payment
-    from models.customer import Customer
-    from dateutil.relativedelta import relativedelta
-
-    try:
-        # 대상 월 설정 (기본값: 전월)
-        if target_month:
+    """핵심 지표 조회 - 전월 기준 (월별/주간 추이 포함, 캐시)"""
+    # 대상 월 설정 (기본값: 전월)
+    if target_month:
+        try:
             target_date = datetime.strptime(target_month + "-01", "%Y-%m-%d").date()
-        else:
-            today = datetime.now().date()
-            target_date = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
-
-        # 월의 첫날과 마지막날
-        month_start = target_date
-        month_end = (target_date + relativedelta(months=1) - timedelta(days=1))
-
-        # 1. 신규 방문상담 수 (전월)
-        visit_consult_count = db.query(MarketingLead).filter(
-            and_(
-                MarketingLead.visit_consult_date >= month_start,
-                MarketingLead.visit_consult_date <= month_end,
-                MarketingLead.visit_consult_date.isnot(None)
-            )
-        ).count()
-
-        # 2. 결제 고객 수 (전월 신규 방문상담 중 전환된 고객)
-        converted_from_visit = db.query(MarketingLead).filter(
-            and_(
-                MarketingLead.visit_consult_date >= month_start,
-                MarketingLead.visit_consult_date <= month_end,
-                MarketingLead.registration_date.isnot(None)
-            )
-        ).count()
-
-        # 3. 전환율
-        conversion_rate = round(converted_from_visit / visit_consult_count * 100, 1) if visit_consult_count > 0 else 0
-
-        # 4. 전월 전체 결제 고객 수 및 매출
-        payment_customers = db.query(
-            func.count(func.distinct(Payment.customer_id)).label('customer_count'),
-            func.sum(Payment.amount).label('total_revenue')
-        ).filter(
-            and_(
-                Payment.payment_date >= month_start,
-                Payment.payment_date <= month_end
-            )
-        ).first()
-
-        total_payment_customers = payment_customers.customer_count or 0
-        total_revenue = float(payment_customers.total_revenue or 0)
-
-        # 5. 평균 결제 객단가
-        avg_payment_amount = round(total_revenue / total_payment_customers, 0) if total_payment_customers > 0 else 0
-
-        # 월별 추이 (최근 6개월)
-        monthly_trends = []
-        for i in range(6):
-            trend_start = (target_date - relativedelta(months=i)).replace(day=1)
-            trend_end = (trend_start + relativedelta(months=1) - timedelta(days=1))
-
-            # 해당 월 방문상담 수
-            trend_visits = db.query(MarketingLead).filter(
-                and_(
-                    MarketingLead.visit_consult_date >= trend_start,
-                    MarketingLead.visit_consult_date <= trend_end,
-                    MarketingLead.visit_consult_date.isnot(None)
-                )
-            ).count()
-
-            # 해당 월 전환 수
-            trend_conversions = db.query(MarketingLead).filter(
-                and_(
-                    MarketingLead.visit_consult_date >= trend_start,
-                    MarketingLead.visit_consult_date <= trend_end,
-                    MarketingLead.registration_date.isnot(None)
-                )
-            ).count()
-
-            # 해당 월 결제 현황
-            trend_payments = db.query(
-                func.count(func.distinct(Payment.customer_id)).label('customer_count'),
-                func.sum(Payment.amount).label('revenue')
-            ).filter(
-                and_(
-                    Payment.payment_date >= trend_start,
-                    Payment.payment_date <= trend_end
-                )
-            ).first()
-
-            trend_payment_customers = trend_payments.customer_count or 0
-            trend_revenue = float(trend_payments.revenue or 0)
-            trend_avg_amount = round(trend_revenue / trend_payment_customers, 0) if trend_payment_customers > 0 else 0
-
-            monthly_trends.append({
-                "month": trend_start.strftime("%Y-%m"),
-                "visit_consults": trend_visits,
-                "conversions": trend_conversions,
-                "conversion_rate": round(trend_conversions / trend_visits * 100, 1) if trend_visits > 0 else 0,
-                "payment_customers": trend_payment_customers,
-                "revenue": trend_revenue,
-                "avg_payment_amount": trend_avg_amount
-            })
-
-        # 주간 추이 (최근 8주)
-        weekly_trends = []
-        for i in range(8):
-            week_start = target_date - timedelta(weeks=i)
-            week_end = week_start + timedelta(days=6)
-
-            # 해당 주 방문상담 수
-            week_visits = db.query(MarketingLead).filter(
-                and_(
-                    MarketingLead.visit_consult_date >= week_start,
-                    MarketingLead.visit_consult_date <= week_end,
-                    MarketingLead.visit_consult_date.isnot(None)
-                )
-            ).count()
-
-            # 해당 주 전환 수
-            week_conversions = db.query(MarketingLead).filter(
-                and_(
-                    MarketingLead.visit_consult_date >= week_start,
-                    MarketingLead.visit_consult_date <= week_end,
-                    MarketingLead.registration_date.isnot(None)
-                )
-            ).count()
-
-            # 해당 주 결제 현황
-            week_payments = db.query(
-                func.count(func.distinct(Payment.customer_id)).label('customer_count'),
-                func.sum(Payment.amount).label('revenue')
-            ).filter(
-                and_(
-                    Payment.payment_date >= week_start,
-                    Payment.payment_date <= week_end
-                )
-            ).first()
-
-            week_payment_customers = week_payments.customer_count or 0
-            week_revenue = float(week_payments.revenue or 0)
-
-            weekly_trends.append({
-                "week": f"{week_start.strftime('%Y-%m-%d')} ~ {week_end.strftime('%Y-%m-%d')}",
-                "visit_consults": week_visits,
-                "conversions": week_conversions,
-                "conversion_rate": round(week_conversions / week_visits * 100, 1) if week_visits > 0 else 0,
-                "payment_customers": week_payment_customers,
-                "revenue": week_revenue
-            })
-
-        return {
-            "target_month": target_date.strftime("%Y년 %m월"),
-            "key_metrics": {
-                "new_visit_consults": visit_consult_count,
-                "converted_customers": converted_from_visit,
-                "conversion_rate": conversion_rate,
-                "total_payment_customers": total_payment_customers,
-                "total_revenue": total_revenue,
-                "avg_payment_amount": avg_payment_amount
-            },
-            "formulas": {
-                "formula1": {
-                    "description": "신규 방문상담 수 × 전환율 = 결제 고객 수",
-                    "calculation": f"{visit_consult_count} × {conversion_rate}% = {converted_from_visit}명",
-                    "values": {
-                        "visit_consults": visit_consult_count,
-                        "conversion_rate": conversion_rate,
-                        "result": converted_from_visit
-                    }
-                },
-                "formula2": {
-                    "description": "결제 고객 수 × 평균 결제 객단가 = 매출액",
-                    "calculation": f"{total_payment_customers}명 × {avg_payment_amount:,}원 = {total_revenue:,}원",
-                    "values": {
-                        "payment_customers": total_payment_customers,
-                        "avg_amount": avg_payment_amount,
-                        "result": total_revenue
-                    }
-                }
-            },
-            "monthly_trends": list(reversed(monthly_trends)),
-            "weekly_trends": list(reversed(weekly_trends))
-        }
+        except ValueError:
+            raise HTTPException(status_code=400, detail="target_month는 YYYY-MM 형식이어야 합니다")
+    else:
+        today = datetime.now().date()
+        target_date = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
 
+    try:
+        return LeadMetricsService(db).get_key_metrics(target_date, months=months, weeks=weeks)
     except Exception as e:
         print(f"Key metrics error: {str(e)}")
         import traceback
@@ -634,6 +498,8 @@ def export_leads(
     current_user: User = Depends(get_current_user)
 ):
     """유입고객 데이터 내보내기"""
+    import pandas as pd  # 내보내기 요청에서만 로드 (콜드 스타트에서 제외)
+
     # format 검증
     if format not in ["excel", "csv"]:
         format = "excel"
@@ -750,14 +616,16 @@ def assign_staff_bulk(
 
 
 @router.post("/bulk-import")
-async def bulk_import_leads(
+def bulk_import_leads(
     file: UploadFile,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """엑셀 파일로 유입고객 일괄 등록"""
+    import pandas as pd
+
     # 파일 읽기
-    contents = await file.read()
+    contents = file.file.read()
     df = pd.read_excel(BytesIO(contents))
 
     # 컬럼 매핑
@@ -32,7 +32,7 @@ class CustomerPreferencesUpdate(BaseModel):
 
 @router.get("")
 @router.get("/")
-async def get_customer_preferences(
+def get_customer_preferences(
     customer_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -60,7 +60,7 @@ async def get_customer_preferences(
 
 @router.post("")
 @router.post("/")
-async def create_customer_preferences(
+def create_customer_preferences(
     customer_id: int,
     preferences: CustomerPreferencesCreate,
     db: Session = Depends(get_db),
@@ -100,7 +100,7 @@ async def create_customer_preferences(
 
 @router.put("")
 @router.put("/")
-async def update_customer_preferences(
+def update_customer_preferences(
     customer_id: int,
     preferences: CustomerPreferencesUpdate,
     db: Session = Depends(get_db),
@@ -1,10 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File, status
-from fastapi.responses import Response
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, desc, or_, and_, text
+from sqlalchemy import select, func, desc, and_, text
 from typing import List, Optional, Dict, Any
 from datetime import date, datetime
-import pandas as pd
 import io
 import logging
 
@@ -13,14 +11,20 @@ logger = logging.getLogger(__name__)
 from core.database import get_db
 from models.customer import Customer as CustomerModel
 from schemas.customer import Customer, CustomerCreate, CustomerUpdate
-from utils.excel import ExcelHandler, ExcelValidator
 from utils.error_handlers import ErrorResponses, handle_database_error, handle_api_errors
 from crud.customer import customer as customer_crud
-from schemas.response import APIResponse, PaginatedResponse, success_response, paginated_response
+from schemas.response import APIResponse, PaginatedResponse, success_response, paginated_response, cursor_paginated_response
 from utils.response_wrapper import wrap_response, wrap_paginated_response
+from utils.pagination import KeysetPage, count_rows, validate_count_mode
+from utils.export_stream import ExportColumn, streaming_export, iter_query_rows, map_rows, format_datetime
 
 from models.inbody import InBodyRecord
 from models.customer_extended import CustomerPreference
+from models.payment import Payment as PaymentModel
+from models.service import ServiceUsage as ServiceUsageModel
+from services.daily_rollup_service import DailyRollupService
+from services.customer_analytics_service import invalidate_customer_analytics
+from services.customer_search_service import CustomerSearchService
 
 router = APIRouter()
 
@@ -53,25 +57,24 @@ def read_customers(
     # 정렬
     sort_by: Optional[str] = Query(None, description="정렬 기준: last_visit_date, name, membership_level, assigned_staff"),
     sort_order: Optional[str] = Query("desc", description="정렬 순서: asc, desc"),
+    # 페이지네이션 방식
+    pagination: str = Query("offset", description="offset | cursor"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (커서 모드)"),
+    count: str = Query("exact", description="전체 건수: exact | approximate | none"),
     db: Session = Depends(get_db)
 ):
-    """고객 목록 조회 (페이지네이션 지원)"""
+    """고객 목록 조회 (페이지네이션 지원)
+
+    pagination=cursor(또는 cursor 지정)이면 OFFSET 대신 keyset 방식으로 조회한다.
+    """
+    validate_count_mode(count)
     try:
         # 기본 쿼리
         query = select(CustomerModel)
 
-        # 검색 조건 적용
+        # 검색 조건 적용 (이름/이메일/전화번호 숫자/초성)
         if search:
-            search_conditions = [
-                CustomerModel.name.contains(search),
-                CustomerModel.phone.contains(search)
-            ]
-            # email이 None이 아닌 경우에만 검색
-            if search:
-                search_conditions.append(
-                    and_(CustomerModel.email.is_not(None), CustomerModel.email.contains(search))
-                )
-            query = query.where(or_(*search_conditions))
+            query = query.where(CustomerSearchService.build_condition(search))
 
         # 기본 필터
         if region:
@@ -96,42 +99,45 @@ def read_customers(
         if first_visit_to:
             query = query.where(CustomerModel.first_visit_date <= first_visit_to)
 
-        # 정렬
-        if sort_by == "last_visit_date":
-            if sort_order == "asc":
-                query = query.order_by(CustomerModel.last_visit_date.asc().nulls_last())
-            else:
-                query = query.order_by(CustomerModel.last_visit_date.desc().nulls_last())
-        elif sort_by == "name":
-            if sort_order == "asc":
-                query = query.order_by(CustomerModel.name.asc())
-            else:
-                query = query.order_by(CustomerModel.name.desc())
-        elif sort_by == "membership_level":
-            if sort_order == "asc":
-                query = query.order_by(CustomerModel.membership_level.asc())
-            else:
-                query = query.order_by(CustomerModel.membership_level.desc())
-        elif sort_by == "assigned_staff":
-            if sort_order == "asc":
-                query = query.order_by(CustomerModel.assigned_staff.asc().nulls_last())
-            else:
-                query = query.order_by(CustomerModel.assigned_staff.desc().nulls_last())
-        elif sort_by == "created_at":
-            if sort_order == "asc":
-                query = query.order_by(CustomerModel.created_at.asc())
-            else:
-                query = query.order_by(CustomerModel.created_at.desc())
+        # 정렬 (같은 값은 customer_id로 순서 고정)
+        sort_columns = {
+            "last_visit_date": CustomerModel.last_visit_date,
+            "name": CustomerModel.name,
+            "membership_level": CustomerModel.membership_level,
+            "assigned_staff": CustomerModel.assigned_staff,
+            "created_at": CustomerModel.created_at,
+        }
+        if sort_by in sort_columns:
+            sort_column = sort_columns[sort_by]
+            descending = sort_order != "asc"
         else:
             # 기본 정렬 - 최신 등록 고객부터
-            query = query.order_by(CustomerModel.created_at.desc())
+            sort_column = CustomerModel.created_at
+            descending = True
+        keyset = KeysetPage(sort_column, CustomerModel.customer_id, descending=descending)
+
+        if pagination == "cursor" or cursor:
+            # 전체 개수는 첫 페이지에서만 조회
+            total = count_rows(db, query, count, table_name="customers") if cursor is None else None
+            rows = db.execute(keyset.apply(query, cursor, limit)).scalars().all()
+            customers, next_cursor = keyset.page(
+                rows, limit,
+                get_sort_value=lambda c: getattr(c, sort_column.key),
+                get_id=lambda c: c.customer_id
+            )
+            return cursor_paginated_response(
+                data=[Customer.model_validate(c) for c in customers],
+                page_size=limit,
+                next_cursor=next_cursor,
+                has_prev=cursor is not None,
+                total=total
+            )
 
         # 전체 개수 조회
-        count_query = select(func.count()).select_from(query.subquery())
-        total = db.execute(count_query).scalar()
+        total = count_rows(db, query, count, table_name="customers")
 
         # 페이지네이션 적용
-        query = query.offset(skip).limit(limit)
+        query = query.order_by(*keyset.order_by()).offset(skip).limit(limit)
         result = db.execute(query)
         customers = result.scalars().all()
 
@@ -158,6 +164,8 @@ def read_customers(
             page=page,
             page_size=limit
         )
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"고객 조회 에러 상세: {str(e)}")
         print(f"에러 타입: {type(e)}")
@@ -203,6 +211,15 @@ def get_referral_sources(
 
     return {"referral_sources": sources}
 
+@router.get("/search")
+def search_customers(
+    q: str = Query(..., min_length=1, description="이름, 전화번호(일부/뒷자리), 이메일 또는 초성(ㅎㄱㄷ)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """고객 빠른 검색 (관련도순)"""
+    return CustomerSearchService(db).search(q, limit)
+
 @router.get("/count")
 def count_customers(
     search: Optional[str] = None,
@@ -233,12 +250,7 @@ def count_customers(
 
     # 기본 검색 필터
     if search:
-        search_conditions = [
-            CustomerModel.name.contains(search),
-            CustomerModel.phone.contains(search),
-            and_(CustomerModel.email.is_not(None), CustomerModel.email.contains(search))
-        ]
-        query = query.where(or_(*search_conditions))
+        query = query.where(CustomerSearchService.build_condition(search))
 
     # 기본 필터
     if region:
@@ -427,7 +439,18 @@ def delete_customer(
     if not customer:
         raise ErrorResponses.not_found("고객", customer_id)
 
+    # 일별 집계 갱신 대상 날짜 (삭제 전에 수집)
+    payment_dates = []
+    service_dates = []
+
     if cascade:
+        payment_dates = db.execute(
+            select(PaymentModel.payment_date).where(PaymentModel.customer_id == customer_id).distinct()
+        ).scalars().all()
+        service_dates = db.execute(
+            select(ServiceUsageModel.service_date).where(ServiceUsageModel.customer_id == customer_id).distinct()
+        ).scalars().all()
+
         # 관련 데이터 먼저 삭제 (외래키 제약 조건 순서에 맞춰서)
         try:
             # 1. 서비스 이용 내역 삭제
@@ -472,7 +495,14 @@ def delete_customer(
             )
 
     db.delete(customer)
+
+    # 결제/서비스 이용은 raw SQL로 삭제했으므로 직접 갱신 (고객은 커밋 시 자동 갱신)
+    rollup = DailyRollupService(db)
+    rollup.refresh_revenue(payment_dates)
+    rollup.refresh_visits(service_dates)
+
     db.commit()
+    invalidate_customer_analytics(customer_id)
     return {"message": "고객이 삭제되었습니다."}
 
 @router.get("/stats/by-region")
@@ -507,212 +537,47 @@ def customer_stats_by_referral(
 
 @router.post("/import/excel", include_in_schema=False)
 @router.post("/import/excel/")
-async def import_customers_from_excel(
+def import_customers_from_excel(
     file: UploadFile = File(...),
+    on_duplicate: str = Query("skip", description="이미 등록된 전화번호 처리: skip(건너뜀) | update(엑셀 값으로 갱신)"),
     db: Session = Depends(get_db)
 ):
-    """엑셀 파일에서 고객 데이터 가져오기"""
-    # 특정 시트가 있는 경우 처리
-    if hasattr(file, 'filename') and file.filename and '고객관리대장' in file.filename:
-        # 고객관리대장 형식의 경우 특별 처리
+    """엑셀 파일에서 고객 데이터 가져오기 (일괄 upsert, 행별 오류 보고)"""
+    # pandas 기반 모듈은 가져오기 요청에서만 로드 (콜드 스타트에서 제외)
+    import pandas as pd
+    from services.customer_import_service import CustomerImportService, MAX_IMPORT_ROWS, ON_DUPLICATE_MODES
+    from utils.excel import ExcelHandler
+
+    if on_duplicate not in ON_DUPLICATE_MODES:
+        raise HTTPException(status_code=400, detail="on_duplicate는 skip 또는 update만 가능합니다")
+
+    df = None
+    # 고객관리대장 형식의 경우 '전체 고객관리대장' 시트(3행 헤더)를 읽음
+    if file.filename and '고객관리대장' in file.filename:
         try:
-            contents = await file.read()
+            contents = file.file.read()
             xl_file = pd.ExcelFile(io.BytesIO(contents))
-
-            # '전체 고객관리대장' 시트 찾기
             if '전체 고객관리대장' in xl_file.sheet_names:
                 df = pd.read_excel(xl_file, sheet_name='전체 고객관리대장', header=2)
-                # NO 컬럼이 있는 행만 필터링 (실제 데이터)
+                # NO 컬럼이 있는 행만 실제 데이터
                 if 'NO' in df.columns:
                     df = df.dropna(subset=['NO'])
             else:
-                # 기본 시트 읽기
                 df = pd.read_excel(io.BytesIO(contents))
         except Exception as e:
-            print(f"고객관리대장 특별 처리 실패: {e}")
-            # 실패 시 일반 처리
-            await file.seek(0)
-            df = await ExcelHandler.read_excel_file(file)
-    else:
-        # 일반 엑셀 파일 읽기
-        df = await ExcelHandler.read_excel_file(file)
-
-    # 컬럼명 매핑 (다양한 형식 지원)
-    column_mapping = {
-        '성함': '이름',
-        '연락처': '전화번호',
-        '거주지역': '지역',
-        '방문경로': '유입경로',
-        '비고(메모)': '메모',
-        '담당자': '담당직원',
-        '첫방문일': '첫방문일자',
-        '첫 방문일': '첫방문일자',  # 띄어쓰기 있는 버전
-        '첫방문일자': '첫방문일자',  # 이미 정확한 경우
-        '최초방문일': '첫방문일자',  # 다른 표현
-        '최초 방문일': '첫방문일자',
-        '첫방문': '첫방문일자',
-        '등록일': '첫방문일자',  # 등록일도 첫방문일로 매핑
-        '가입일': '첫방문일자',  # 가입일도 지원
-        '호소문제': '건강고민'
-    }
-
-    # 컬럼명 변경
-    df = df.rename(columns=column_mapping)
-
-    # 디버깅: 엑셀 컬럼명 확인
-    print(f"엑셀 파일 컬럼: {list(df.columns)}")
-    print(f"첫방문일자 컬럼 존재 여부: {'첫방문일자' in df.columns}")
-    print(f"등록일 컬럼 존재 여부: {'등록일' in df.columns}")
-    
-    if '첫방문일자' in df.columns:
-        print(f"첫방문일자 샘플 데이터 (처음 5개): {df['첫방문일자'].head().tolist()}")
-    elif '등록일' in df.columns:
-        print(f"등록일 샘플 데이터 (처음 5개): {df['등록일'].head().tolist()}")
-
-    # 필수 컬럼 검증
-    required_columns = ['이름', '전화번호']
-    # 유연한 검증 - 매핑된 컬럼명도 확인
-    missing_columns = []
-    for req_col in required_columns:
-        if req_col not in df.columns:
-            # 매핑 전 컬럼명도 확인
-            found = False
-            for old_col, new_col in column_mapping.items():
-                if new_col == req_col and old_col in df.columns:
-                    found = True
-                    break
-            if not found:
-                missing_columns.append(req_col)
-
-    if missing_columns:
-        raise HTTPException(
-            status_code=400,
-            detail=f"필수 컬럼이 누락되었습니다: {', '.join(missing_columns)}"
-        )
-
-    # 엑셀 파일 내 중복 체크 (NaN 제외)
-    df_with_phone = df[df['전화번호'].notna()]
-    phone_counts = df_with_phone['전화번호'].value_counts()
-    excel_duplicates = phone_counts[phone_counts > 1]
-
-    # 중복된 전화번호가 있으면 경고만 표시 (에러로 중단하지 않음)
-    duplicate_warning = []
-    if len(excel_duplicates) > 0:
-        duplicate_warning.append(f"엑셀 파일 내 중복된 전화번호 {len(excel_duplicates)}개 발견")
-
-    # 데이터 처리 결과
-    success_count = 0
-    error_count = 0
-    errors = []
-    first_visit_date_issues = 0  # 첫방문일 파싱 실패 수
-
-    total_rows = len(df)
-    print(f"총 {total_rows}개 행 처리 시작...")
-
-    for index, row in df.iterrows():
-        # 진행 상황 출력 (10행마다)
-        if index > 0 and index % 10 == 0:
-            print(f"진행 중... {index}/{total_rows} ({index/total_rows*100:.1f}%)")
-        try:
-            # 데이터 정제 - 첫방문일자 또는 등록일 컬럼 사용
-            first_visit_raw = row.get('첫방문일자') or row.get('등록일')
-            first_visit_parsed = ExcelHandler.parse_date(first_visit_raw)
-
-            # 디버깅 로그 (첫방문일 파싱 확인)
-            if index < 5:  # 처음 5행만 상세 로그
-                print(f"행 {index + 2} 첫방문일 처리:")
-                print(f"  - 원본값: {first_visit_raw}")
-                print(f"  - 타입: {type(first_visit_raw)}")
-                print(f"  - 파싱 결과: {first_visit_parsed}")
-
-            if first_visit_raw and not first_visit_parsed:
-                print(f"첫방문일 파싱 실패 - 행 {index + 2}: 원본값={first_visit_raw}, 타입={type(first_visit_raw)}")
-                first_visit_date_issues += 1
-
-            customer_data = {
-                'name': ExcelHandler.clean_string(row.get('이름')),
-                'phone': ExcelHandler.clean_phone(row.get('전화번호')),
-                'email': ExcelHandler.clean_string(row.get('이메일')),
-                'birth_year': ExcelHandler.parse_year(row.get('생년월일')),
-                'gender': ExcelHandler.clean_string(row.get('성별')),
-                'address': ExcelHandler.clean_string(row.get('주소')),
-                'region': ExcelHandler.clean_string(row.get('지역')),
-                'referral_source': ExcelHandler.clean_string(row.get('유입경로')),
-                'notes': ExcelHandler.clean_string(row.get('메모')),
-                'health_concerns': ExcelHandler.clean_string(row.get('건강고민')),
-                'assigned_staff': ExcelHandler.clean_string(row.get('담당직원')),
-                'first_visit_date': first_visit_parsed
-            }
-
-            # None 값 제거
-            customer_data = {k: v for k, v in customer_data.items() if v is not None}
-
-            # enum 타입 필드는 제외 (모델의 기본값 사용)
-            customer_data.pop('membership_level', None)
-            customer_data.pop('customer_status', None)
-
-            # 필수 데이터 검증
-            if not customer_data.get('name'):
-                error_count += 1
-                errors.append(f"행 {index + 2}: 이름이 없습니다")
-                continue
-
-            # 중복 전화번호 체크 (전화번호가 있는 경우만)
-            if customer_data.get('phone'):
-                existing = db.query(CustomerModel).filter(
-                    CustomerModel.phone == customer_data['phone']
-                ).first()
-                if existing:
-                    error_count += 1
-                    errors.append(f"행 {index + 2}: 전화번호 {customer_data['phone']}는 이미 등록됨 (고객: {existing.name})")
-                    continue
-
-            # 고객 생성 (한 번에 하나씩 커밋)
-            try:
-                db_customer = CustomerModel(**customer_data)
-                db.add(db_customer)
-                db.commit()
-                db.refresh(db_customer)
-
-                # 디버깅: 실제 저장된 값 확인
-                if index < 5:
-                    print(f"DB 저장 완료 - 고객 ID: {db_customer.customer_id}")
-                    print(f"  - 이름: {db_customer.name}")
-                    print(f"  - 첫방문일: {db_customer.first_visit_date}")
-
-                success_count += 1
-            except Exception as e:
-                db.rollback()
-                error_count += 1
-                errors.append(f"행 {index + 2}: 데이터베이스 저장 실패 - {str(e)}")
-                continue
-
-        except Exception as e:
-            error_count += 1
-            errors.append(f"행 {index + 2}: {str(e)}")
-
-    # 이미 개별적으로 커밋했으므로 추가 커밋 불필요
+            logger.warning(f"고객관리대장 특별 처리 실패, 일반 처리로 전환: {e}")
+            file.file.seek(0)
+            df = None
 
-    result = {
-        "message": f"엑셀 가져오기 완료",
-        "success_count": success_count,
-        "error_count": error_count,
-        "errors": errors[:10]  # 최대 10개 에러만 반환
-    }
-
-    # 경고 메시지 추가
-    if duplicate_warning:
-        result["warnings"] = duplicate_warning
-
-    # 첫방문일 관련 정보 추가
-    if first_visit_date_issues > 0:
-        result["first_visit_date_issues"] = True
-        result["warnings"] = result.get("warnings", [])
-        result["warnings"].append(f"첫방문일 파싱 실패: {first_visit_date_issues}건")
+    if df is None:
+        df = ExcelHandler.read_excel_upload(file, max_rows=MAX_IMPORT_ROWS)
+    elif len(df) > MAX_IMPORT_ROWS:
+        raise HTTPException(status_code=400, detail=f"데이터가 너무 많습니다. 최대 {MAX_IMPORT_ROWS}행까지만 가능합니다")
 
-    print(f"\n처리 완료 - 성공: {success_count}, 실패: {error_count}, 첫방문일 문제: {first_visit_date_issues}")
-
-    return result
+    try:
+        return CustomerImportService(db).import_dataframe(df, on_duplicate=on_duplicate)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/export/excel")
 def export_customers_to_excel(
@@ -732,18 +597,27 @@ def export_customers_to_excel(
     first_visit_to: Optional[date] = None,
     last_visit_from: Optional[date] = None,
     last_visit_to: Optional[date] = None,
-    db: Session = Depends(get_db)
+    format: str = Query("xlsx", description="xlsx | csv"),
 ):
-    """고객 데이터를 엑셀 파일로 내보내기 - 필터링 지원"""
+    """고객 데이터를 엑셀/CSV 파일로 내보내기 - 필터링 지원 (스트리밍)"""
     # 고객 조회 (fetchCustomers와 동일한 필터 적용)
-    query = select(CustomerModel)
+    query = select(
+        CustomerModel.customer_id,
+        CustomerModel.name,
+        CustomerModel.phone,
+        CustomerModel.email,
+        CustomerModel.birth_year,
+        CustomerModel.gender,
+        CustomerModel.address,
+        CustomerModel.region,
+        CustomerModel.referral_source,
+        CustomerModel.notes,
+        CustomerModel.created_at
+    )
 
     # 검색어 필터
     if search:
-        query = query.where(
-            (CustomerModel.name.contains(search)) |
-            (CustomerModel.phone.contains(search))
-        )
+        query = query.where(CustomerSearchService.build_condition(search))
 
     # 지역 필터
     if region:
@@ -792,38 +666,39 @@ def export_customers_to_excel(
 
     query = query.order_by(CustomerModel.customer_id.desc())
 
-    result = db.execute(query)
-    customers = result.scalars().all()
-
-    # DataFrame 생성
-    data = []
-    for customer in customers:
-        data.append({
-            '고객ID': customer.customer_id,
-            '이름': customer.name,
-            '전화번호': customer.phone,
-            '이메일': customer.email,
-            '출생연도': customer.birth_year if customer.birth_year else '',
-            '성별': customer.gender,
-            '주소': customer.address,
-            '지역': customer.region,
-            '유입경로': customer.referral_source,
-            '메모': customer.notes,
-            '등록일': customer.created_at.strftime('%Y-%m-%d %H:%M:%S') if customer.created_at else ''
-        })
-
-    df = pd.DataFrame(data)
-
-    # 엑셀 파일 생성
-    excel_data = ExcelHandler.create_excel_response(
-        df,
-        f"customers_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    )
+    columns = [
+        ExportColumn('고객ID', 10),
+        ExportColumn('이름', 12),
+        ExportColumn('전화번호', 16),
+        ExportColumn('이메일', 28),
+        ExportColumn('출생연도', 10),
+        ExportColumn('성별', 8),
+        ExportColumn('주소', 40),
+        ExportColumn('지역', 16),
+        ExportColumn('유입경로', 14),
+        ExportColumn('메모', 40),
+        ExportColumn('등록일', 20),
+    ]
+
+    def to_row(customer):
+        return [
+            customer.customer_id,
+            customer.name,
+            customer.phone,
+            customer.email,
+            customer.birth_year if customer.birth_year else '',
+            customer.gender,
+            customer.address,
+            customer.region,
+            customer.referral_source,
+            customer.notes,
+            format_datetime(customer.created_at)
+        ]
 
-    return Response(
-        content=excel_data,
-        media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        headers={
-            'Content-Disposition': f'attachment; filename=customers_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-        }
+    return streaming_export(
+        columns,
+        map_rows(iter_query_rows(query), to_row),
+        "customers",
+        file_format=format,
+        sheet_name="고객목록"
     )
@@ -14,6 +14,7 @@ from decimal import Decimal
 
 from core.database import get_db
 from core.auth import get_current_user
+from services.customer_analytics_service import CustomerAnalyticsService
 from schemas.customer import CustomerDetail
 from models.user import User
 import logging
@@ -27,7 +28,7 @@ router = APIRouter(
 )
 
 @router.get("/{customer_id}/detail", response_model=Dict[str, Any])
-async def get_customer_detail(
+def get_customer_detail(
     customer_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -294,7 +295,7 @@ async def get_customer_detail(
         )
 
 @router.put("/{customer_id}/detail")
-async def update_customer_detail(
+def update_customer_detail(
     customer_id: int,
     data: Dict[str, Any],
     db: Session = Depends(get_db),
@@ -385,7 +386,7 @@ async def update_customer_detail(
     return {"message": "고객 정보가 업데이트되었습니다"}
 
 @router.get("/{customer_id}/service-history")
-async def get_service_history(
+def get_service_history(
     customer_id: int,
     limit: int = 50,
     offset: int = 0,
@@ -447,7 +448,7 @@ async def get_service_history(
     }
 
 @router.get("/{customer_id}/analytics")
-async def get_customer_analytics(
+def get_customer_analytics(
     customer_id: int,
     period: str = "90d",  # 30d, 90d, 180d, 1y, 6months
     db: Session = Depends(get_db),
@@ -456,257 +457,7 @@ async def get_customer_analytics(
     """고객 분석 데이터 조회"""
     
     try:
-        logger.info(f"Getting analytics for customer {customer_id}, period: {period}")
-        
-        # 기간 계산
-        period_days = {
-            "30d": 30,
-            "90d": 90,
-            "180d": 180,
-            "6months": 180,
-            "1y": 365
-        }.get(period, 90)
-        
-        logger.info(f"Period days calculated: {period_days}")
-        
-        # 월별 방문 횟수
-        monthly_visits_query = text(f"""
-            SELECT 
-                TO_CHAR(service_date, 'YYYY-MM') as month,
-                COUNT(*) as visits
-            FROM service_usage
-            WHERE customer_id = :customer_id
-                AND service_date >= CURRENT_DATE - INTERVAL '{period_days} days'
-            GROUP BY TO_CHAR(service_date, 'YYYY-MM')
-            ORDER BY month
-        """)
-        
-        monthly_visits = db.execute(monthly_visits_query, {
-            "customer_id": customer_id
-        }).all()
-        
-        # 2. 서비스 이용 분석
-        service_usage_query = text(f"""
-            SELECT 
-                st.service_type_id,
-                st.service_name,
-                COUNT(*) as usage_count,
-                AVG(CASE 
-                    WHEN su.session_number IS NOT NULL 
-                    THEN su.session_number 
-                    ELSE 0 
-                END) as avg_session_number
-            FROM service_usage su
-            JOIN service_types st ON su.service_type_id = st.service_type_id
-            WHERE su.customer_id = :customer_id
-                AND su.service_date >= CURRENT_DATE - INTERVAL '{period_days} days'
-            GROUP BY st.service_type_id, st.service_name
-            ORDER BY usage_count DESC
-        """)
-        
-        service_usage = db.execute(service_usage_query, {
-            "customer_id": customer_id
-        }).all()
-        
-        # 서비스별 분포 계산
-        total_services = sum(row.usage_count for row in service_usage)
-        service_distribution = {}
-        if total_services > 0:
-            for row in service_usage:
-                service_distribution[f"service_{row.service_type_id}"] = round((row.usage_count / total_services) * 100, 1)
-        
-        # 3. 수익 기여도 분석
-        revenue_query = text(f"""
-            SELECT 
-                COALESCE(SUM(amount), 0) as total_revenue,
-                COUNT(*) as payment_count,
-                AVG(amount) as avg_payment,
-                TO_CHAR(payment_date, 'YYYY-MM') as month,
-                SUM(amount) as monthly_revenue
-            FROM payments
-            WHERE customer_id = :customer_id
-                AND payment_date >= CURRENT_DATE - INTERVAL '{period_days} days'
-            GROUP BY TO_CHAR(payment_date, 'YYYY-MM')
-            ORDER BY month
-        """)
-        
-        revenue_data = db.execute(revenue_query, {
-            "customer_id": customer_id
-        }).all()
-        
-        # 전체 수익 통계
-        total_revenue_query = text(f"""
-            SELECT 
-                COALESCE(SUM(amount), 0) as total_revenue,
-                COUNT(*) as payment_count,
-                AVG(amount) as avg_payment
-            FROM payments
-            WHERE customer_id = :customer_id
-                AND payment_date >= CURRENT_DATE - INTERVAL '{period_days} days'
-        """)
-        
-        revenue_stats = db.execute(total_revenue_query, {
-            "customer_id": customer_id
-        }).first()
-        
-        # 4. 위험도 평가
-        # 최근 방문일 확인
-        last_visit_query = text("""
-            SELECT 
-                MAX(service_date) as last_visit,
-                CURRENT_DATE - MAX(service_date) as days_since_last_visit
-            FROM service_usage
-            WHERE customer_id = :customer_id
-        """)
-        
-        last_visit = db.execute(last_visit_query, {"customer_id": customer_id}).first()
-        
-        # 위험도 계산
-        days_since = last_visit.days_since_last_visit if last_visit and last_visit.days_since_last_visit else 999
-        if days_since < 30:
-            churn_risk = "low"
-            churn_probability = 10
-        elif days_since < 60:
-            churn_risk = "medium"
-            churn_probability = 30
-        elif days_since < 90:
-            churn_risk = "high"
-            churn_probability = 60
-        else:
-            churn_risk = "very_high"
-            churn_probability = 85
-        
-        # 방문 기본 정보 조회
-        basic_info_query = text("""
-            SELECT 
-                COUNT(DISTINCT service_date) as total_visits,
-                MIN(service_date) as first_visit,
-                MAX(service_date) as last_visit,
-                COUNT(DISTINCT TO_CHAR(service_date, 'YYYY-MM')) as active_months
-            FROM service_usage
-            WHERE customer_id = :customer_id
-        """)
-        
-        basic_info = db.execute(basic_info_query, {"customer_id": customer_id}).first()
-        
-        # 평균 방문 주기 계산
-        if basic_info and basic_info.total_visits > 1:
-            days_between = (basic_info.last_visit - basic_info.first_visit).days
-            avg_interval = days_between / (basic_info.total_visits - 1) if basic_info.total_visits > 1 else 0
-        else:
-            avg_interval = 0
-        
-        # 서비스별 카운트
-        service_counts = {}
-        most_used_service = None
-        total_sessions = 0
-        
-        if service_usage:
-            for row in service_usage:
-                service_counts[row.service_name] = row.usage_count
-                total_sessions += row.usage_count
-            most_used_service = service_usage[0].service_name
-        
-        # 선호 시간대/요일 분석 (간단 버전) - service_date가 DATE이므로 시간 정보 없음
-        preferred_time = "정보 없음"  # TODO: 향후 TIMESTAMP 컬럼 추가 시 구현
-        
-        # 요일 패턴
-        day_pattern_query = text("""
-            SELECT 
-                CASE EXTRACT(DOW FROM service_date)
-                    WHEN 0 THEN '일요일'
-                    WHEN 1 THEN '월요일'
-                    WHEN 2 THEN '화요일'
-                    WHEN 3 THEN '수요일'
-                    WHEN 4 THEN '목요일'
-                    WHEN 5 THEN '금요일'
-                    WHEN 6 THEN '토요일'
-                END as day_name,
-                COUNT(*) as count
-            FROM service_usage
-            WHERE customer_id = :customer_id
-            GROUP BY EXTRACT(DOW FROM service_date)
-            ORDER BY count DESC
-            LIMIT 1
-        """)
-        
-        preferred_day_result = db.execute(day_pattern_query, {"customer_id": customer_id}).first()
-        preferred_day = preferred_day_result.day_name if preferred_day_result else "정보 없음"
-        
-        # 예약 취소율 및 노쇼율 계산
-        reservation_stats_query = text(f"""
-            SELECT 
-                COUNT(*) FILTER (WHERE status = 'cancelled') as cancelled_count,
-                COUNT(*) FILTER (WHERE status = 'no_show') as no_show_count,
-                COUNT(*) as total_reservations
-            FROM reservations
-            WHERE customer_id = :customer_id
-                AND reservation_date >= CURRENT_DATE - INTERVAL '{period_days} days'
-        """)
-        
-        reservation_stats = db.execute(reservation_stats_query, {"customer_id": customer_id}).first()
-        
-        cancellation_rate = 0
-        no_show_rate = 0
-        
-        if reservation_stats and reservation_stats.total_reservations > 0:
-            cancellation_rate = (reservation_stats.cancelled_count / reservation_stats.total_reservations) * 100
-            no_show_rate = (reservation_stats.no_show_count / reservation_stats.total_reservations) * 100
-        
-        # 월별 매출 데이터
-        revenue_by_month = []
-        total_revenue = 0
-        
-        if revenue_data:
-            for row in revenue_data:
-                revenue_by_month.append({
-                    "month": row.month,
-                    "revenue": float(row.monthly_revenue)
-                })
-                total_revenue += float(row.monthly_revenue)
-        
-        # 결과 포맷팅 (프론트엔드 인터페이스에 맞춤)
-        # 1970-01-01 같은 기본값은 None으로 처리
-        first_visit = None
-        last_visit = None
-        
-        if basic_info and basic_info.first_visit:
-            if basic_info.first_visit.year > 1970:
-                first_visit = basic_info.first_visit.isoformat()
-        
-        if basic_info and basic_info.last_visit:
-            if basic_info.last_visit.year > 1970:
-                last_visit = basic_info.last_visit.isoformat()
-        
-        result = {
-            "visit_summary": {
-                "total_visits": basic_info.total_visits if basic_info else 0,
-                "first_visit": first_visit,
-                "last_visit": last_visit,
-                "visit_frequency": basic_info.total_visits if basic_info else 0,
-                "average_interval_days": int(avg_interval) if avg_interval > 0 else 0
-            },
-            "service_summary": {
-                "most_used_service": most_used_service or "정보 없음",
-                "service_counts": service_counts,
-                "total_sessions": total_sessions
-            },
-            "revenue_summary": {
-                "total_revenue": total_revenue,
-                "average_per_visit": total_revenue / basic_info.total_visits if basic_info and basic_info.total_visits > 0 else 0,
-                "revenue_by_month": revenue_by_month
-            },
-            "patterns": {
-                "preferred_time": preferred_time,
-                "preferred_day": preferred_day,
-                "cancellation_rate": round(cancellation_rate, 1),
-                "no_show_rate": round(no_show_rate, 1)
-            }
-        }
-        
-        logger.info(f"Analytics result prepared for customer {customer_id}")
-        return result
-        
+        return CustomerAnalyticsService(db).get_analytics(customer_id, period)
     except Exception as e:
         logger.error(f"Error in get_customer_analytics for customer {customer_id}: {str(e)}", exc_info=True)
         raise HTTPException(
@@ -715,7 +466,7 @@ async def get_customer_analytics(
         )
 
 @router.get("/{customer_id}/recommendations")
-async def get_customer_recommendations(
+def get_customer_recommendations(
     customer_id: int,
     recommendation_type: str = "all",  # service, package, schedule, all
     count: int = 5,
@@ -1250,7 +1001,7 @@ async def get_customer_recommendations(
     }
 
 @router.get("/{customer_id}/packages")
-async def get_customer_packages(
+def get_customer_packages(
     customer_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
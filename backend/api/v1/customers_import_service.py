@@ -1,8 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import select
-from typing import Optional
-import pandas as pd
+from typing import Optional, TYPE_CHECKING
 import io
 from datetime import datetime
 
@@ -10,13 +9,15 @@ from core.database import get_db
 from models.customer import Customer as CustomerModel
 from models.service import ServiceUsage as ServiceUsageModel
 from models.package import PackagePurchase as PackagePurchaseModel
-from utils.excel import ExcelHandler
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 router = APIRouter()
 
 @router.post("/import/service-history")
 @router.post("/import/service-history/")
-async def import_service_history(
+def import_service_history(
     file: UploadFile = File(...),
     update_mode: Optional[str] = Query("merge", description="업데이트 모드: merge(병합), replace(교체)"),
     db: Session = Depends(get_db)
@@ -27,20 +28,22 @@ async def import_service_history(
     - 서비스 이용 내역 업데이트
     - 패키지 구매 정보 업데이트
     """
+    import pandas as pd  # 가져오기 요청에서만 로드 (콜드 스타트에서 제외)
+
     try:
         # 엑셀 파일 읽기
-        contents = await file.read()
+        contents = file.file.read()
 
         # 파일 형식에 따라 시트 읽기
         if file.filename and ('서비스' in file.filename or '이용' in file.filename):
             # 서비스 이용 내역 파일
             df = pd.read_excel(io.BytesIO(contents))
-            return await process_service_usage(df, db, update_mode)
+            return process_service_usage(df, db, update_mode)
 
         elif file.filename and ('결제' in file.filename or '패키지' in file.filename):
             # 패키지 구매 내역 파일
             df = pd.read_excel(io.BytesIO(contents))
-            return await process_package_purchases(df, db, update_mode)
+            return process_package_purchases(df, db, update_mode)
 
         else:
             # 일반 고객 관리 파일 (서비스 이력 포함)
@@ -57,7 +60,7 @@ async def import_service_history(
             for sheet_name in xl_file.sheet_names:
                 if '서비스' in sheet_name or '이용' in sheet_name:
                     df = pd.read_excel(xl_file, sheet_name=sheet_name)
-                    result = await process_service_usage(df, db, update_mode)
+                    result = process_service_usage(df, db, update_mode)
                     results["service_records_added"] += result.get("success_count", 0)
                     results["errors"].extend(result.get("errors", []))
 
@@ -67,8 +70,11 @@ async def import_service_history(
         raise HTTPException(status_code=400, detail=f"파일 처리 중 오류: {str(e)}")
 
 
-async def process_service_usage(df: pd.DataFrame, db: Session, update_mode: str):
+def process_service_usage(df: "pd.DataFrame", db: Session, update_mode: str):
     """서비스 이용 내역 처리"""
+    import pandas as pd
+    from utils.excel import ExcelHandler
+
     success_count = 0
     error_count = 0
     errors = []
@@ -194,8 +200,11 @@ async def process_service_usage(df: pd.DataFrame, db: Session, update_mode: str)
     }
 
 
-async def process_package_purchases(df: pd.DataFrame, db: Session, update_mode: str):
+def process_package_purchases(df: "pd.DataFrame", db: Session, update_mode: str):
     """패키지 구매 내역 처리"""
+    import pandas as pd
+    from utils.excel import ExcelHandler
+
     success_count = 0
     error_count = 0
     errors = []
@@ -1,12 +1,13 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_, extract
+from sqlalchemy import select, func, and_
 from datetime import date, datetime, timedelta
 
 from core.database import get_db
 from models import Customer, Payment, PackagePurchase, ServiceUsage, ServiceType
 from models.lead_management import LeadConsultationHistory
 from core.auth import get_current_user
+from services.daily_rollup_service import DailyRollupService
 
 router = APIRouter()
 
@@ -15,69 +16,39 @@ def get_dashboard_stats(
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
-    """대시보드 통계 조회 - 최적화 버전"""
+    """대시보드 통계 조회 - 일별 집계 테이블 기반"""
     today = date.today()
     month_start = date(today.year, today.month, 1)
     thirty_days_ago = today - timedelta(days=30)
-    
-    # 🚀 최적화: 여러 쿼리를 3개로 통합
-    
-    # 1. 고객 및 결제 통계 (단일 쿼리)
-    from sqlalchemy import case
-    
-    stats_query = db.query(
-        func.count(func.distinct(Customer.customer_id)).label('total_customers'),
-        func.sum(
-            case(
-                (Payment.payment_date == today, Payment.amount),
-                else_=0
-            )
-        ).label('today_revenue'),
-        func.sum(
-            case(
-                (Payment.payment_date >= month_start, Payment.amount),
-                else_=0
-            )
-        ).label('monthly_revenue'),
-        func.sum(
-            case(
-                (Payment.payment_date >= thirty_days_ago, Payment.amount),
-                else_=0
-            )
-        ).label('last_30_days_revenue'),
-        func.count(
-            func.distinct(
-                case(
-                    (Customer.first_visit_date >= month_start, Customer.customer_id),
-                    else_=None
-                )
-            )
-        ).label('new_customers')
-    ).select_from(Customer).outerjoin(Payment, Customer.customer_id == Payment.customer_id)
-    
-    result = stats_query.first()
-    
-    # 2. 활성 패키지 (별도 테이블)
+
+    # 🚀 최적화: 결제/방문 원본 대신 일별 집계(daily_*)에서 조회 기간 일수만큼만 읽음
+    rollup = DailyRollupService(db)
+
+    # 1. 전체 고객 수 (조인 없이 단일 카운트)
+    total_customers = db.query(func.count(Customer.customer_id)).scalar() or 0
+
+    # 2. 매출 통계 (일별 매출 집계, 최대 31일치 행)
+    revenue_by_date = rollup.get_revenue_by_date(min(month_start, thirty_days_ago), today)
+    today_revenue = revenue_by_date.get(today, 0)
+    monthly_revenue = sum(v for d, v in revenue_by_date.items() if d >= month_start)
+    last_30_days_revenue = sum(v for d, v in revenue_by_date.items() if d >= thirty_days_ago)
+
+    # 3. 활성 패키지 (별도 테이블)
     active_packages = db.query(func.count(PackagePurchase.purchase_id)).filter(
         and_(
             PackagePurchase.remaining_sessions > 0,
             PackagePurchase.expiry_date >= today
         )
     ).scalar() or 0
-    
-    # 3. 오늘 방문 (별도 테이블)
-    today_visits = db.query(func.count(func.distinct(ServiceUsage.customer_id))).filter(
-        ServiceUsage.service_date == today
-    ).scalar() or 0
-    
+
     return {
-        "total_customers": result.total_customers or 0,
-        "today_revenue": float(result.today_revenue or 0),
-        "monthly_revenue": float(result.monthly_revenue or 0),
-        "last_30_days_revenue": float(result.last_30_days_revenue or 0),
+        "total_customers": total_customers,
+        "today_revenue": float(today_revenue),
+        "monthly_revenue": float(monthly_revenue),
+        "last_30_days_revenue": float(last_30_days_revenue),
         "active_packages": active_packages,
-        "today_visits": today_visits,
-        "new_customers": result.new_customers or 0
+        "today_visits": rollup.get_visit_count(today),
+        "new_customers": rollup.count_new_customers(month_start)
     }
 
 @router.get("/revenue-trend")
@@ -89,24 +60,11 @@ def get_revenue_trend(
     """매출 추이 조회"""
     end_date = date.today()
     start_date = end_date - timedelta(days=days-1)
-    
-    query = db.query(
-        Payment.payment_date,
-        func.sum(Payment.amount).label('daily_revenue')
-    ).filter(
-        Payment.payment_date.between(start_date, end_date)
-    ).group_by(
-        Payment.payment_date
-    ).order_by(
-        Payment.payment_date
-    )
-    
-    data = query.all()
-    
+
     # 날짜별 데이터 생성 (데이터가 없는 날은 0으로)
-    date_revenue_map = {row[0]: float(row[1]) for row in data}
+    date_revenue_map = DailyRollupService(db).get_revenue_by_date(start_date, end_date)
     trend = []
-    
+
     current_date = start_date
     while current_date <= end_date:
         trend.append({
@@ -114,7 +72,7 @@ def get_revenue_trend(
             "revenue": date_revenue_map.get(current_date, 0)
         })
         current_date += timedelta(days=1)
-    
+
     return trend
 
 @router.get("/service-usage-stats")
@@ -158,21 +116,10 @@ def get_monthly_revenue(
     if year is None:
         year = date.today().year
     
-    # 월별 매출 집계
-    query = db.query(
-        extract('month', Payment.payment_date).label('month'),
-        func.sum(Payment.amount).label('revenue')
-    ).filter(
-        extract('year', Payment.payment_date) == year
-    ).group_by(
-        extract('month', Payment.payment_date)
-    ).order_by('month')
-    
-    data = query.all()
-    
+    # 월별 매출 집계 (일별 매출 집계 기반 - 리포트와 같은 RevenueWindow 월별 합산)
+    monthly_data = DailyRollupService(db).get_monthly_revenue(year)
+
     # 12개월 데이터 생성 (데이터가 없는 달은 0으로)
-    monthly_data = {row[0]: float(row[1]) for row in data}
-    
     return [
         {
             "month": month,
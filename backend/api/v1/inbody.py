@@ -27,7 +27,7 @@ router = APIRouter(prefix="/inbody", tags=["inbody"])
 @router.post("", response_model=dict)
 @router.post("/records", response_model=dict)
 @router.post("/records/", response_model=dict)
-async def create_inbody_record(
+def create_inbody_record(
     record_data: InBodyRecordCreate,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -64,7 +64,7 @@ async def create_inbody_record(
         )
 
 @router.post("/manual", response_model=dict)
-async def create_manual_inbody_record(
+def create_manual_inbody_record(
     record_data: ManualInBodyCreate,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -109,7 +109,7 @@ async def create_manual_inbody_record(
         )
 
 @router.get("/customer/{customer_id}", response_model=dict)
-async def get_customer_inbody_records(
+def get_customer_inbody_records(
     customer_id: int,
     limit: Optional[int] = 10,
     db: Session = Depends(get_db),
@@ -185,7 +185,7 @@ async def get_customer_inbody_records(
         )
 
 @router.get("/{record_id}", response_model=dict)
-async def get_inbody_record(
+def get_inbody_record(
     record_id: int,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -211,7 +211,7 @@ async def get_inbody_record(
 
 @router.put("/{record_id}", response_model=dict)
 @router.put("/{record_id}/", response_model=dict)
-async def update_inbody_record(
+def update_inbody_record(
     record_id: int,
     record_data: InBodyRecordUpdate,
     db: Session = Depends(get_db),
@@ -250,7 +250,7 @@ async def update_inbody_record(
 
 @router.delete("/{record_id}", response_model=dict)
 @router.delete("/{record_id}/", response_model=dict)
-async def delete_inbody_record(
+def delete_inbody_record(
     record_id: int,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
@@ -278,7 +278,7 @@ async def delete_inbody_record(
         )
 
 @router.get("/customer/{customer_id}/chart-data", response_model=dict)
-async def get_inbody_chart_data(
+def get_inbody_chart_data(
     customer_id: int,
     months: Optional[int] = 6,
     db: Session = Depends(get_db),
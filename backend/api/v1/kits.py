@@ -1,10 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
-from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func
+from sqlalchemy import func, select
 from typing import List, Optional
-from datetime import date, datetime
-import pandas as pd
+from datetime import date
 from io import BytesIO
 import re
 
@@ -13,6 +11,7 @@ from core.auth import get_current_user
 from models.kit import KitManagement, KitType
 from models.user import User
 from models.customer import Customer
+from utils.export_stream import ExportColumn, streaming_export, iter_query_rows, map_rows, format_date, format_datetime
 from schemas.kit import (
     KitType as KitTypeSchema,
     KitTypeCreate,
@@ -29,7 +28,7 @@ router = APIRouter()
 
 # Kit Type Endpoints
 @router.get("/kit-types", response_model=KitTypeListResponse)
-async def list_kit_types(
+def list_kit_types(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
     is_active: Optional[bool] = None,
@@ -51,7 +50,7 @@ async def list_kit_types(
     }
 
 @router.get("/kit-types/{kit_type_id}", response_model=KitTypeSchema)
-async def get_kit_type(
+def get_kit_type(
     kit_type_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -63,7 +62,7 @@ async def get_kit_type(
     return kit_type
 
 @router.post("/kit-types", response_model=KitTypeSchema)
-async def create_kit_type(
+def create_kit_type(
     kit_type: KitTypeCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -81,7 +80,7 @@ async def create_kit_type(
     return db_kit_type
 
 @router.patch("/kit-types/{kit_type_id}", response_model=KitTypeSchema)
-async def update_kit_type(
+def update_kit_type(
     kit_type_id: int,
     kit_type: KitTypeUpdate,
     db: Session = Depends(get_db),
@@ -112,7 +111,7 @@ async def update_kit_type(
 
 # 통계 및 대시보드 엔드포인트 (더 구체적인 경로를 먼저 정의)
 @router.get("/stats/summary")
-async def get_kit_stats(
+def get_kit_stats(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     db: Session = Depends(get_db),
@@ -155,7 +154,7 @@ async def get_kit_stats(
 
 # Kit Management Endpoints
 @router.get("/")
-async def list_kits(
+def list_kits(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
     customer_id: Optional[int] = None,
@@ -198,7 +197,7 @@ async def list_kits(
     }
 
 @router.get("/{kit_id}", response_model=KitManagementWithRelations)
-async def get_kit(
+def get_kit(
     kit_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -214,7 +213,7 @@ async def get_kit(
     return kit
 
 @router.post("/", response_model=KitManagementSchema)
-async def create_kit(
+def create_kit(
     kit: KitManagementCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -248,7 +247,7 @@ async def create_kit(
     return db_kit
 
 @router.patch("/{kit_id}")
-async def update_kit(
+def update_kit(
     kit_id: int,
     kit: KitManagementUpdate,
     db: Session = Depends(get_db),
@@ -336,7 +335,7 @@ async def update_kit(
         raise HTTPException(status_code=500, detail=f"Update failed: {str(e)}")
 
 @router.delete("/{kit_id}")
-async def delete_kit(
+def delete_kit(
     kit_id: int,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -352,76 +351,75 @@ async def delete_kit(
 
 # Excel Export/Import Endpoints
 @router.get("/export/excel")
-async def export_kits_to_excel(
-    db: Session = Depends(get_db),
+def export_kits_to_excel(
+    format: str = Query("xlsx", description="xlsx | csv"),
     current_user: User = Depends(get_current_user)
 ):
-    """검사키트 데이터를 엑셀로 다운로드"""
-    try:
-        # 데이터 조회
-        kits = db.query(KitManagement).options(
-            joinedload(KitManagement.customer),
-            joinedload(KitManagement.kit_type_ref)
-        ).order_by(KitManagement.created_at.desc()).all()
-
-        # 데이터프레임 생성
-        data = []
-        for kit in kits:
-            data.append({
-                "키트ID": kit.kit_id,
-                "고객명": kit.customer.name if kit.customer else "",
-                "고객전화번호": kit.customer.phone if kit.customer else "",
-                "키트종류": kit.kit_type,
-                "시리얼번호": kit.serial_number or "",
-                "키트수령일": kit.received_date.strftime("%Y-%m-%d") if kit.received_date else "",
-                "결과수령일": kit.result_received_date.strftime("%Y-%m-%d") if kit.result_received_date else "",
-                "결과전달일": kit.result_delivered_date.strftime("%Y-%m-%d") if kit.result_delivered_date else "",
-                "상태": get_kit_status(kit),
-                "등록일": kit.created_at.strftime("%Y-%m-%d %H:%M:%S") if kit.created_at else ""
-            })
-
-        df = pd.DataFrame(data)
-
-        # Excel 파일 생성
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='검사키트목록', index=False)
-
-            # 컬럼 너비 자동 조정
-            worksheet = writer.sheets['검사키트목록']
-            for column in df:
-                column_width = max(df[column].astype(str).map(len).max(), len(column))
-                col_idx = df.columns.get_loc(column)
-                worksheet.column_dimensions[chr(65 + col_idx)].width = min(column_width + 2, 50)
-
-        output.seek(0)
-
-        # 파일명 생성 (한글 제거)
-        filename = f"kits_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-
-        return StreamingResponse(
-            BytesIO(output.getvalue()),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
+    """검사키트 데이터를 엑셀/CSV로 다운로드 (스트리밍)"""
+    query = select(
+        KitManagement.kit_id,
+        KitManagement.kit_type,
+        KitManagement.serial_number,
+        KitManagement.received_date,
+        KitManagement.result_received_date,
+        KitManagement.result_delivered_date,
+        KitManagement.created_at,
+        Customer.name.label("customer_name"),
+        Customer.phone.label("customer_phone")
+    ).outerjoin(
+        Customer, KitManagement.customer_id == Customer.customer_id
+    ).order_by(KitManagement.created_at.desc())
+
+    columns = [
+        ExportColumn("키트ID", 10),
+        ExportColumn("고객명", 12),
+        ExportColumn("고객전화번호", 16),
+        ExportColumn("키트종류", 16),
+        ExportColumn("시리얼번호", 18),
+        ExportColumn("키트수령일", 12),
+        ExportColumn("결과수령일", 12),
+        ExportColumn("결과전달일", 12),
+        ExportColumn("상태", 8),
+        ExportColumn("등록일", 20),
+    ]
+
+    def to_row(row):
+        return [
+            row.kit_id,
+            row.customer_name or "",
+            row.customer_phone or "",
+            row.kit_type,
+            row.serial_number or "",
+            format_date(row.received_date),
+            format_date(row.result_received_date),
+            format_date(row.result_delivered_date),
+            get_kit_status(row),
+            format_datetime(row.created_at)
+        ]
 
-    except Exception as e:
-        print(f"Excel export error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Excel export failed: {str(e)}")
+    return streaming_export(
+        columns,
+        map_rows(iter_query_rows(query), to_row),
+        "kits",
+        file_format=format,
+        sheet_name="검사키트목록"
+    )
 
 @router.post("/import/excel")
-async def import_kits_from_excel(
+def import_kits_from_excel(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """엑셀 파일에서 검사키트 데이터 업로드"""
+    import pandas as pd  # 가져오기 요청에서만 로드 (콜드 스타트에서 제외)
+
     if not file.filename.endswith(('.xlsx', '.xls')):
         raise HTTPException(status_code=400, detail="엑셀 파일(.xlsx, .xls)만 업로드 가능합니다.")
 
     try:
         # 파일 읽기
-        contents = await file.read()
+        contents = file.file.read()
         df = pd.read_excel(BytesIO(contents))
 
         # 필수 컬럼 확인
@@ -519,6 +517,8 @@ def get_kit_status(kit: KitManagement) -> str:
 
 def clean_phone_number(phone):
     """전화번호 정리"""
+    import pandas as pd
+
     if pd.isna(phone) or not phone:
         return None
 
@@ -535,6 +535,8 @@ def clean_phone_number(phone):
 
 def parse_date(date_value):
     """날짜 파싱"""
+    import pandas as pd
+
     if pd.isna(date_value) or not date_value:
         return None
 
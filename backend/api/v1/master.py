@@ -5,7 +5,7 @@ from sqlalchemy import desc
 from pydantic import BaseModel
 
 from core.database import get_db
-from core.auth import check_permission, get_password_hash
+from core.auth import AuthenticatedUser, check_permission, get_password_hash, invalidate_principal
 from models.user import User
 from models.customer import Customer
 from models.service import ServiceUsage
@@ -31,21 +31,21 @@ class UserResponse(BaseModel):
     is_active: bool
 
 @router.get("/users", response_model=List[UserResponse])
-async def get_all_users(
+def get_all_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("master"))
+    current_user: AuthenticatedUser = Depends(check_permission("master"))
 ):
     """모든 사용자 목록 조회 (마스터 권한 필요)"""
     users = db.query(User).offset(skip).limit(limit).all()
     return users
 
 @router.post("/reset-password")
-async def reset_user_password(
+def reset_user_password(
     request: PasswordResetRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("master"))
+    current_user: AuthenticatedUser = Depends(check_permission("master"))
 ):
     """사용자 비밀번호 초기화 (마스터 권한 필요)"""
     # 대상 사용자 확인
@@ -66,16 +66,17 @@ async def reset_user_password(
     # 비밀번호 업데이트
     user.password_hash = get_password_hash(request.new_password)
     db.commit()
+    invalidate_principal(user)
 
     logger.info(f"마스터 {current_user.email}가 사용자 {user.email}의 비밀번호를 초기화했습니다")
 
     return {"message": f"사용자 {user.email}의 비밀번호가 초기화되었습니다"}
 
 @router.delete("/users")
-async def delete_users(
+def delete_users(
     request: UserDeleteRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("master"))
+    current_user: AuthenticatedUser = Depends(check_permission("master"))
 ):
     """사용자 삭제 (마스터 권한 필요)"""
     # 자기 자신은 삭제 불가
@@ -111,6 +112,7 @@ async def delete_users(
         deleted_emails.append(user.email)
 
     db.commit()
+    invalidate_principal(*users_to_delete)
 
     logger.info(f"마스터 {current_user.email}가 사용자들을 삭제했습니다: {', '.join(deleted_emails)}")
 
@@ -120,9 +122,9 @@ async def delete_users(
     }
 
 @router.get("/system-stats")
-async def get_system_statistics(
+def get_system_statistics(
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("master"))
+    current_user: AuthenticatedUser = Depends(check_permission("master"))
 ):
     """시스템 전체 통계 (마스터 권한 필요)"""
     total_users = db.query(User).count()
@@ -155,11 +157,11 @@ async def get_system_statistics(
     }
 
 @router.put("/users/{user_id}/role")
-async def update_user_role(
+def update_user_role(
     user_id: int,
     new_role: str = Query(..., description="새로운 권한 역할"),  # query parameter 지원
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("master"))
+    current_user: AuthenticatedUser = Depends(check_permission("master"))
 ):
     """사용자 권한 변경 (마스터 권한 필요)"""
     # 유효한 역할인지 확인
@@ -196,6 +198,7 @@ async def update_user_role(
     old_role = user.role
     user.role = new_role
     db.commit()
+    invalidate_principal(user)
 
     logger.info(f"마스터 {current_user.email}가 사용자 {user.email}의 권한을 {old_role}에서 {new_role}로 변경했습니다")
 
@@ -204,9 +207,9 @@ async def update_user_role(
     }
 
 @router.get("/system/overview")
-async def get_system_overview(
+def get_system_overview(
     db: Session = Depends(get_db),
-    current_user: User = Depends(check_permission("master"))
+    current_user: AuthenticatedUser = Depends(check_permission("master"))
 ):
     """시스템 전체 개요 (마스터 권한 필요)"""
     try:
@@ -13,6 +13,7 @@ from core.database import get_db
 from core.auth import get_current_user
 from models.user import User
 from models.system import SystemSettings
+from services.membership_batch import MembershipBatchUpdater
 
 router = APIRouter(
     prefix="/membership",
@@ -20,7 +21,7 @@ router = APIRouter(
 )
 
 @router.get("/criteria")
-async def get_membership_criteria(
+def get_membership_criteria(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -38,7 +39,7 @@ async def get_membership_criteria(
     return json.loads(setting.setting_value)
 
 @router.put("/criteria")
-async def update_membership_criteria(
+def update_membership_criteria(
     criteria: Dict[str, Any],
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -84,7 +85,7 @@ async def update_membership_criteria(
     return {"message": "회원 등급 기준이 업데이트되었습니다.", "criteria": criteria}
 
 @router.get("/status-descriptions")
-async def get_status_descriptions(
+def get_status_descriptions(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -118,7 +119,7 @@ async def get_status_descriptions(
     return json.loads(setting.setting_value)
 
 @router.post("/update-all-customers")
-async def update_all_customers_membership(
+def update_all_customers_membership(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -143,24 +144,12 @@ async def update_all_customers_membership(
     
     criteria = json.loads(setting.setting_value)
     
-    # 모든 고객 조회 및 업데이트
-    from models.customer import Customer
-    customers = db.query(Customer).all()
-    
-    updated_count = 0
-    for customer in customers:
-        # 고객 상태 업데이트
-        customer.update_customer_status()
-        
-        # 회원 등급 업데이트
-        customer.update_membership_level(criteria)
-        
-        
-        updated_count += 1
-    
-    db.commit()
+    # 그룹 집계 기반 일괄 재계산
+    report = MembershipBatchUpdater(db).run(criteria)
+    updated_count = report["rows_changed"]
     
     return {
         "message": f"{updated_count}명의 고객 정보가 업데이트되었습니다.",
-        "updated_count": updated_count
+        "updated_count": updated_count,
+        "report": report
     }
\ No newline at end of file
@@ -105,12 +105,13 @@ def broadcast_notification(
     result = db.execute(user_query)
     user_ids = [row[0] for row in result.all()]
 
-    # 대량 알림 생성
-    notifications = service.create_bulk_notifications(user_ids, notification)
+    # 대량 알림 생성 (한 번의 INSERT, 오늘 같은 알림을 이미 받은 사용자는 건너뜀)
+    result = service.create_bulk_notifications(user_ids, notification)
 
     return ResponseFormatter.success({
-        "message": f"{len(notifications)}명에게 알림이 발송되었습니다",
-        "count": len(notifications)
+        "message": f"{result['created']}명에게 알림이 발송되었습니다",
+        "count": result["created"],
+        "skipped": result["skipped"]
     })
 
 
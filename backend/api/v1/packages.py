@@ -39,7 +39,7 @@ class PackageUpdateRequest(BaseModel):
 router = APIRouter()
 
 @router.get("/available")
-async def get_available_packages(
+def get_available_packages(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -86,7 +86,7 @@ async def get_available_packages(
         )
 
 @router.post("/purchase")
-async def purchase_package(
+def purchase_package(
     purchase_data: PackagePurchaseRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
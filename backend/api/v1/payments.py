@@ -1,12 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
-from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func, and_, or_
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import date, datetime, timedelta
 from decimal import Decimal
-import pandas as pd
-import io
 from dateutil.relativedelta import relativedelta
 import re
 
@@ -14,10 +11,13 @@ from core.database import get_db
 from models.payment import Payment as PaymentModel
 from models.customer import Customer as CustomerModel
 from schemas.payment import Payment, PaymentCreate, PaymentInDB
+from utils.pagination import KeysetPage, count_rows, validate_count_mode
+from services.customer_search_service import CustomerSearchService
+from utils.export_stream import ExportColumn, streaming_export, iter_query_rows, map_rows, format_date, format_datetime
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Dict[str, Any]])
+@router.get("/", response_model=Union[List[Dict[str, Any]], Dict[str, Any]])
 def get_payments(
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
@@ -27,9 +27,17 @@ def get_payments(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     search: Optional[str] = None,
+    pagination: str = Query("offset", description="offset | cursor"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (커서 모드)"),
+    count: str = Query("none", description="커서 모드 전체 건수: exact | approximate | none"),
     db: Session = Depends(get_db)
 ):
-    """결제 내역 조회 - 수정된 버전"""
+    """결제 내역 조회 - 수정된 버전
+
+    커서 모드(pagination=cursor 또는 cursor 지정)에서는
+    {"items", "next_cursor", "has_next", "total"} 형태로 반환한다.
+    """
+    validate_count_mode(count)
     # 디버깅: 받은 파라미터 확인
     print(f"🔍 Payment search params: date_from={date_from}, date_to={date_to}, search={search}")
     
@@ -77,13 +85,7 @@ def get_payments(
 
         # 검색 조건
         if search:
-            search_pattern = f"%{search}%"
-            filters.append(
-                or_(
-                    CustomerModel.name.ilike(search_pattern),
-                    CustomerModel.phone.ilike(search_pattern)
-                )
-            )
+            filters.append(CustomerSearchService.build_condition(search))
 
         if filters:
             query = query.where(and_(*filters))
@@ -91,45 +93,65 @@ def get_payments(
         else:
             print(f"🔍 No filters applied - returning all payments")
 
+        keyset = KeysetPage(PaymentModel.payment_date, PaymentModel.payment_id, descending=True)
+
+        if pagination == "cursor" or cursor:
+            total = count_rows(db, query, count, table_name="payments") if cursor is None else None
+            rows = db.execute(keyset.apply(query, cursor, limit)).all()
+            rows, next_cursor = keyset.page(
+                rows, limit,
+                get_sort_value=lambda r: r.payment_date,
+                get_id=lambda r: r.payment_id
+            )
+            return {
+                "items": [_payment_row_to_dict(row) for row in rows],
+                "next_cursor": next_cursor,
+                "has_next": next_cursor is not None,
+                "total": total
+            }
+
         # 정렬 및 페이징
-        query = query.order_by(PaymentModel.payment_date.desc(), PaymentModel.payment_id.desc())
+        query = query.order_by(*keyset.order_by())
         query = query.offset(skip).limit(limit)
 
         # 실행
         result = db.execute(query)
-        payments = []
-
-        for row in result:
-            payment_dict = {
-                "payment_id": row.payment_id,
-                "payment_number": row.payment_number or "",
-                "customer_id": row.customer_id,
-                "customer_name": row.customer_name or "",
-                "customer_phone": row.customer_phone or "",
-                "payment_date": row.payment_date.isoformat() if row.payment_date else None,
-                "amount": float(row.amount) if row.amount else 0.0,
-                "payment_method": row.payment_method or "",
-                "payment_type": row.payment_type or "single",
-                "payment_status": row.payment_status or "completed",
-                "payment_staff": row.payment_staff or "",
-                "approval_number": row.transaction_id or "",
-                "card_holder_name": row.card_holder_name or "",
-                "purchase_type": row.reference_type or "",
-                "purchase_order": row.reference_id,
-                "notes": row.notes or "",
-                "created_at": row.created_at.isoformat() if row.created_at else None
-            }
-            payments.append(payment_dict)
+        payments = [_payment_row_to_dict(row) for row in result]
 
         print(f"🔍 Returning {len(payments)} payments")
         return payments
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ 결제 조회 에러: {str(e)}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=str(e))
 
+
+def _payment_row_to_dict(row) -> Dict[str, Any]:
+    """결제 목록 행 → 응답 dict"""
+    return {
+        "payment_id": row.payment_id,
+        "payment_number": row.payment_number or "",
+        "customer_id": row.customer_id,
+        "customer_name": row.customer_name or "",
+        "customer_phone": row.customer_phone or "",
+        "payment_date": row.payment_date.isoformat() if row.payment_date else None,
+        "amount": float(row.amount) if row.amount else 0.0,
+        "payment_method": row.payment_method or "",
+        "payment_type": row.payment_type or "single",
+        "payment_status": row.payment_status or "completed",
+        "payment_staff": row.payment_staff or "",
+        "approval_number": row.transaction_id or "",
+        "card_holder_name": row.card_holder_name or "",
+        "purchase_type": row.reference_type or "",
+        "purchase_order": row.reference_id,
+        "notes": row.notes or "",
+        "created_at": row.created_at.isoformat() if row.created_at else None
+    }
+
 @router.get("/stats")
 def get_payment_stats(
     date_from: Optional[date] = Query(None),
@@ -335,9 +357,9 @@ def export_payments_to_excel(
     customer_id: Optional[int] = None,
     payment_method: Optional[str] = None,
     search: Optional[str] = None,
-    db: Session = Depends(get_db)
+    format: str = Query("xlsx", description="xlsx | csv"),
 ):
-    """결제 데이터를 엑셀 파일로 내보내기"""
+    """결제 데이터를 엑셀/CSV 파일로 내보내기 (스트리밍)"""
     try:
         # 결제 데이터 조회 (동일한 로직)
         query = select(
@@ -378,12 +400,10 @@ def export_payments_to_excel(
 
         # 검색 조건
         if search:
-            search_pattern = f"%{search}%"
             filters.append(
                 or_(
-                    CustomerModel.name.ilike(search_pattern),
-                    CustomerModel.phone.ilike(search_pattern),
-                    PaymentModel.transaction_id.ilike(search_pattern)
+                    CustomerSearchService.build_condition(search),
+                    PaymentModel.transaction_id.ilike(f"%{search}%")
                 )
             )
 
@@ -393,75 +413,55 @@ def export_payments_to_excel(
         # 정렬
         query = query.order_by(PaymentModel.payment_date.desc(), PaymentModel.payment_id.desc())
 
-        # 실행
-        result = db.execute(query)
-
-        # 데이터 준비
-        data = []
-        for row in result:
-            data.append({
-                "결제번호": row.payment_number or "",
-                "결제ID": row.payment_id,
-                "결제일": row.payment_date.strftime('%Y-%m-%d') if row.payment_date else "",
-                "고객명": row.customer_name or "",
-                "고객전화번호": row.customer_phone or "",
-                "결제금액": float(row.amount) if row.amount else 0.0,
-                "결제방법": row.payment_method or "",
-                "결제유형": row.payment_type or "",
-                "결제상태": row.payment_status or "",
-                "담당직원": row.payment_staff or "",
-                "승인번호": row.transaction_id or "",
-                "카드명의자": row.card_holder_name or "",
-                "구매항목": row.reference_type or "",
-                "구매차수": row.reference_id or "",
-                "메모": row.notes or "",
-                "생성일시": row.created_at.strftime('%Y-%m-%d %H:%M:%S') if row.created_at else ""
-            })
-
-        # DataFrame 생성
-        df = pd.DataFrame(data)
-
-        if df.empty:
-            df = pd.DataFrame(columns=[
-                "결제번호", "결제ID", "결제일", "고객명", "고객전화번호", "결제금액",
-                "결제방법", "결제유형", "결제상태", "담당직원", "승인번호",
-                "카드명의자", "구매항목", "구매차수", "메모", "생성일시"
-            ])
-
-        # 엑셀 파일 생성
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df.to_excel(writer, index=False, sheet_name='결제내역')
-
-            # 워크시트 가져오기 및 스타일 적용
-            worksheet = writer.sheets['결제내역']
-
-            # 컬럼 너비 자동 조정
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-
-        output.seek(0)
-
-        # 응답 생성
-        headers = {
-            'Content-Disposition': f'attachment; filename=payments_{date.today().strftime("%Y%m%d")}.xlsx'
-        }
-
-        return Response(
-            content=output.getvalue(),
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers=headers
+        columns = [
+            ExportColumn("결제번호", 18),
+            ExportColumn("결제ID", 10),
+            ExportColumn("결제일", 12),
+            ExportColumn("고객명", 12),
+            ExportColumn("고객전화번호", 16),
+            ExportColumn("결제금액", 12),
+            ExportColumn("결제방법", 10),
+            ExportColumn("결제유형", 10),
+            ExportColumn("결제상태", 10),
+            ExportColumn("담당직원", 10),
+            ExportColumn("승인번호", 16),
+            ExportColumn("카드명의자", 12),
+            ExportColumn("구매항목", 20),
+            ExportColumn("구매차수", 10),
+            ExportColumn("메모", 40),
+            ExportColumn("생성일시", 20),
+        ]
+
+        def to_row(row):
+            return [
+                row.payment_number or "",
+                row.payment_id,
+                format_date(row.payment_date),
+                row.customer_name or "",
+                row.customer_phone or "",
+                float(row.amount) if row.amount else 0.0,
+                row.payment_method or "",
+                row.payment_type or "",
+                row.payment_status or "",
+                row.payment_staff or "",
+                row.transaction_id or "",
+                row.card_holder_name or "",
+                row.reference_type or "",
+                row.reference_id or "",
+                row.notes or "",
+                format_datetime(row.created_at)
+            ]
+
+        return streaming_export(
+            columns,
+            map_rows(iter_query_rows(query), to_row),
+            "payments",
+            file_format=format,
+            sheet_name="결제내역"
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"❌ 엑셀 내보내기 에러: {str(e)}")
         import traceback
@@ -1,16 +1,16 @@
 from fastapi import APIRouter
-import requests
+import httpx
 
 router = APIRouter()
 
 @router.get("/check-ip")
 @router.get("/check-ip/")
-async def check_server_ip():
+def check_server_ip():
     """서버의 외부 IP 주소 확인 (공개 엔드포인트)"""
 
     try:
         # 외부 서비스를 통해 IP 확인
-        response = requests.get("https://api.ipify.org?format=text", timeout=5)
+        response = httpx.get("https://api.ipify.org?format=text", timeout=5)
         if response.status_code == 200:
             server_ip = response.text.strip()
 
@@ -26,7 +26,7 @@ async def check_server_ip():
     except Exception as e:
         # 백업 서비스 시도
         try:
-            response = requests.get("https://ifconfig.me/ip", timeout=5)
+            response = httpx.get("https://ifconfig.me/ip", timeout=5)
             if response.status_code == 200:
                 server_ip = response.text.strip()
                 is_allowed = server_ip.startswith("180.65.83.")
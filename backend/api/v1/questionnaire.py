@@ -25,6 +25,7 @@ from schemas.questionnaire import (
     CompleteQuestionnaireRequest,
     Answer as AnswerSchema
 )
+from services.questionnaire_template_service import template_cache
 
 router = APIRouter(
     prefix="/questionnaire",
@@ -32,6 +33,17 @@ router = APIRouter(
 )
 
 
+def _answered_question_ids(db: Session, response_id: int) -> List[int]:
+    """응답에서 답변한 질문 ID (idx_answers_response_question만 읽음)"""
+    return [row[0] for row in db.query(Answer.question_id).filter(Answer.response_id == response_id)]
+
+
+def _answer_with_question(answer: Answer, question: QuestionSchema) -> AnswerSchema:
+    """답변 + 캐시된 질문 (answer.question 지연 로딩 없이)"""
+    fields = {name: getattr(answer, name) for name in AnswerSchema.model_fields if name != "question"}
+    return AnswerSchema(**fields, question=question)
+
+
 @router.get("/templates", response_model=List[QuestionnaireTemplateSchema])
 def get_questionnaire_templates(
     is_active: Optional[bool] = True,
@@ -57,23 +69,17 @@ def get_questionnaire_template(
     current_user: User = Depends(get_current_user)
 ):
     """
-    특정 문진 템플릿 상세 조회 (질문 포함)
+    특정 문진 템플릿 상세 조회 (질문 포함, order_index 순 - 템플릿 캐시)
     """
-    template = db.query(QuestionnaireTemplate)\
-        .options(joinedload(QuestionnaireTemplate.questions))\
-        .filter(QuestionnaireTemplate.template_id == template_id)\
-        .first()
+    snapshot = template_cache.get(db, template_id)
     
-    if not template:
+    if not snapshot:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="문진 템플릿을 찾을 수 없습니다."
         )
     
-    # 질문을 순서대로 정렬
-    template.questions.sort(key=lambda x: x.order_index)
-    
-    return template
+    return snapshot.template
 
 
 @router.post("/start", response_model=QuestionnaireResponseSchema)
@@ -86,11 +92,9 @@ def start_questionnaire(
     문진 시작
     """
     # 템플릿 확인
-    template = db.query(QuestionnaireTemplate)\
-        .filter(QuestionnaireTemplate.template_id == request.template_id)\
-        .first()
+    snapshot = template_cache.get(db, request.template_id)
     
-    if not template or not template.is_active:
+    if not snapshot or not snapshot.template.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="유효한 문진 템플릿을 찾을 수 없습니다."
@@ -171,30 +175,14 @@ def get_questionnaire_progress(
             detail="문진 응답을 찾을 수 없습니다."
         )
     
-    # 전체 질문 수
-    total_questions = db.query(Question)\
-        .filter(Question.template_id == response.template_id)\
-        .count()
-    
-    # 답변한 질문 수
-    answered_questions = db.query(Answer)\
-        .filter(Answer.response_id == response_id)\
-        .count()
+    # 질문 수/순서는 템플릿 캐시, 답변 수는 answered_count (COUNT 쿼리 없음)
+    snapshot = template_cache.get(db, response.template_id)
+    total_questions = snapshot.total_questions if snapshot else 0
+    answered_questions = response.answered_count
+    answered_question_ids = _answered_question_ids(db, response_id)
     
-    # 다음 질문 찾기
-    answered_question_ids = db.query(Answer.question_id)\
-        .filter(Answer.response_id == response_id)\
-        .subquery()
-    
-    next_question = db.query(Question)\
-        .filter(
-            and_(
-                Question.template_id == response.template_id,
-                ~Question.question_id.in_(answered_question_ids)
-            )
-        )\
-        .order_by(Question.order_index)\
-        .first()
+    # 다음 질문 찾기 (order_index 순으로 아직 답하지 않은 첫 질문)
+    next_question = snapshot.next_question(answered_question_ids) if snapshot else None
     
     # 현재 섹션 결정
     current_section = QuestionnaireSection.BASIC
@@ -212,7 +200,8 @@ def get_questionnaire_progress(
         total_questions=total_questions,
         completion_rate=(answered_questions / total_questions * 100) if total_questions > 0 else 0,
         next_question=next_question,
-        estimated_time_remaining=estimated_time_remaining
+        estimated_time_remaining=estimated_time_remaining,
+        sections=snapshot.section_progress(answered_question_ids) if snapshot else []
     )
 
 
@@ -243,16 +232,20 @@ def submit_answer(
             detail="이미 완료된 문진입니다."
         )
     
-    # 질문 확인
-    question = db.query(Question)\
-        .filter(Question.question_id == request.question_id)\
-        .first()
-    
-    if not question:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="질문을 찾을 수 없습니다."
-        )
+    # 질문 확인 (템플릿 캐시 - 다른 템플릿의 질문이면 DB에서 확인)
+    snapshot = template_cache.get(db, response.template_id)
+    question = snapshot.questions_by_id.get(request.question_id) if snapshot else None
+    if question is None:
+        question_row = db.query(Question)\
+            .filter(Question.question_id == request.question_id)\
+            .first()
+        
+        if not question_row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="질문을 찾을 수 없습니다."
+            )
+        question = QuestionSchema.model_validate(question_row)
     
     # 기존 답변 확인 (중복 방지)
     existing_answer = db.query(Answer)\
@@ -293,27 +286,21 @@ def submit_answer(
     elif question.question_type == QuestionType.DATE:
         answer.answer_date = request.answer if request.answer else None
     
-    # 완료율 업데이트
-    total_questions = db.query(Question)\
-        .filter(Question.template_id == response.template_id)\
-        .count()
-    
-    answered_questions = db.query(Answer)\
-        .filter(Answer.response_id == response_id)\
-        .count()
-    
-    if not existing_answer:
-        answered_questions += 1
+    # 완료율 업데이트 (새 답변이면 answered_count를 UPDATE 안에서 증가 - 동시 제출에도 누락 없음)
+    total_questions = snapshot.total_questions if snapshot else 0
+    if existing_answer:
+        answered_questions = response.answered_count
+    else:
+        answered_questions = QuestionnaireResponse.answered_count + 1
+        response.answered_count = answered_questions
     
-    response.completion_rate = (answered_questions / total_questions * 100) if total_questions > 0 else 0
+    response.completion_rate = (answered_questions * 100.0 / total_questions) if total_questions > 0 else 0
     
     db.commit()
     db.refresh(answer)
     
     # 질문 정보 포함하여 반환
-    answer.question = question
-    
-    return answer
+    return _answer_with_question(answer, question)
 
 
 @router.post("/responses/{response_id}/answers/batch", response_model=List[AnswerSchema])
@@ -373,24 +360,8 @@ def complete_questionnaire(
     
     # 필수 질문 답변 확인
     if not request.force_complete:
-        required_questions = db.query(Question)\
-            .filter(
-                and_(
-                    Question.template_id == response.template_id,
-                    Question.is_required == True
-                )
-            )\
-            .all()
-        
-        answered_question_ids = db.query(Answer.question_id)\
-            .filter(Answer.response_id == response_id)\
-            .all()
-        answered_question_ids = [id[0] for id in answered_question_ids]
-        
-        missing_required = [
-            q for q in required_questions 
-            if q.question_id not in answered_question_ids
-        ]
+        snapshot = template_cache.get(db, response.template_id)
+        missing_required = snapshot.missing_required(_answered_question_ids(db, response_id)) if snapshot else []
         
         if missing_required:
             raise HTTPException(
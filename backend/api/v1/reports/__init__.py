@@ -6,6 +6,7 @@ from .customer import router as customer_router
 from .service import router as service_router
 from .staff import router as staff_router
 from .export import router as export_router
+from .renders import router as renders_router
 
 # Create main router
 router = APIRouter()
@@ -16,4 +17,5 @@ router.include_router(revenue_router, prefix="/revenue", tags=["reports-revenue"
 router.include_router(customer_router, prefix="/customers", tags=["reports-customers"])
 router.include_router(service_router, prefix="/services", tags=["reports-services"]) 
 router.include_router(staff_router, prefix="/staff", tags=["reports-staff"])
-router.include_router(export_router, prefix="/export", tags=["reports-export"])
\ No newline at end of file
+router.include_router(export_router, prefix="/export", tags=["reports-export"])
+router.include_router(renders_router, prefix="/renders", tags=["reports-renders"])
\ No newline at end of file
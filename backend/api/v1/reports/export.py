@@ -5,7 +5,7 @@ from datetime import date, timedelta
 from typing import Optional
 import csv
 import io
-from core.database import get_db
+from core.database import get_report_db
 from models.payment import Payment
 from models.customer import Customer
 
@@ -15,7 +15,7 @@ router = APIRouter()
 def export_revenue_report(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_report_db)
 ):
     """Export revenue report as CSV"""
     if not end_date:
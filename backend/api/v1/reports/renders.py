@@ -0,0 +1,48 @@
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session
+from core.auth import AuthenticatedUser, get_current_user
+from core.database import get_db
+from services.report_render_service import RenderedReport, STATUS_SUCCEEDED, render_status, report_render_service
+
+router = APIRouter()
+
+
+def pdf_response(report: RenderedReport) -> Response:
+    """PDF 다운로드 응답 (X-Report-Cache: 저장된 PDF를 그대로 보냈는지)"""
+    return Response(
+        content=report.pdf,
+        media_type='application/pdf',
+        headers={
+            'Content-Disposition': f'attachment; filename={report.filename}',
+            'X-Report-Cache': 'hit' if report.cache_hit else 'miss',
+            'X-Report-Version': report.data_version,
+        }
+    )
+
+
+@router.get("/{render_id}")
+def get_render_status(
+    render_id: int,
+    db: Session = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """보고서 생성 작업 상태"""
+    row = report_render_service.get(db, render_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="보고서 작업을 찾을 수 없습니다")
+    return render_status(row)
+
+
+@router.get("/{render_id}/download")
+def download_render(
+    render_id: int,
+    db: Session = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """생성된 보고서 PDF 다운로드"""
+    row = report_render_service.get(db, render_id, with_pdf=True)
+    if row is None:
+        raise HTTPException(status_code=404, detail="보고서 작업을 찾을 수 없습니다")
+    if row.status != STATUS_SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"보고서가 아직 준비되지 않았습니다 (상태: {row.status})")
+    return pdf_response(RenderedReport(row.pdf, row.filename, row.data_version, True))
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, extract, desc, select
 from datetime import date, timedelta
 from typing import Optional
-from core.database import get_db
+from core.database import get_report_db
 from models.service import ServiceUsage, ServiceType
 
 router = APIRouter()
@@ -12,7 +12,7 @@ router = APIRouter()
 def get_service_usage_stats(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_report_db)
 ):
     """Get service usage statistics by type"""
     if not end_date:
@@ -60,7 +60,7 @@ def get_service_usage_stats(
 def get_service_trends(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_report_db)
 ):
     """Get service usage trends over time"""
     if not end_date:
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, select
 from datetime import date
 from typing import Optional
-from core.database import get_db
+from core.database import get_report_db
 from models.payment import Payment
 
 router = APIRouter()
@@ -12,7 +12,7 @@ router = APIRouter()
 def get_staff_performance(
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_report_db)
 ):
     """Get staff performance metrics"""
     if not end_date:
@@ -2,35 +2,26 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from sqlalchemy import func, select
 from datetime import date, timedelta
-from core.database import get_db
-from models.payment import Payment
+from core.database import get_report_db
 from models.customer import Customer
 from models.service import ServiceUsage
+from services.revenue_report_service import load_revenue_window
 
 router = APIRouter()
 
 @router.get("/summary")
 def get_summary_report(
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_report_db)
 ):
     """Get summary statistics for dashboard"""
     today = date.today()
     month_start = date(today.year, today.month, 1)
     year_start = date(today.year, 1, 1)
     
-    # Current month revenue
-    month_revenue_result = db.execute(
-        select(func.sum(Payment.amount))
-        .where(Payment.payment_date >= month_start)
-    )
-    month_revenue = month_revenue_result.scalar() or 0
-    
-    # Year to date revenue
-    ytd_revenue_result = db.execute(
-        select(func.sum(Payment.amount))
-        .where(Payment.payment_date >= year_start)
-    )
-    ytd_revenue = ytd_revenue_result.scalar() or 0
+    # Current month / year to date revenue (연초 이후 결제를 한 번만 집계)
+    revenue = load_revenue_window(db, year_start)
+    month_revenue, _ = revenue.total(month_start)
+    ytd_revenue, _ = revenue.total(year_start)
     
     # Total customers
     total_customers_result = db.execute(
@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
 from typing import List, Optional
 from datetime import date, datetime
 import logging
@@ -16,7 +15,10 @@ from schemas.reservation import (
     ReservationCreate, ReservationUpdate, ReservationResponse, ReservationCancel
 )
 from services.kakao_service import kakao_service
-from services.aligo_service import aligo_service, sms_templates
+from services.aligo_service import sms_templates
+from services.message_outbox_service import enqueue_sms, PURPOSE_RESERVATION_CONFIRMATION
+from services.reservation_availability_service import ACTIVE_STATUSES
+from services.reservation_booking_service import ReservationBookingService, ReservationConflictError
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -141,123 +143,99 @@ def create_reservation(
     current_user: User = Depends(get_current_user)
 ):
     """새 예약 생성 - 등록된 고객 또는 게스트 고객 모두 가능"""
-    # 중복 예약 확인 - 같은 서비스 타입끼리만 체크
-    existing = db.query(Reservation).filter(
-        and_(
-            Reservation.reservation_date == reservation.reservation_date,
-            Reservation.reservation_time == reservation.reservation_time,
-            Reservation.service_type_id == reservation.service_type_id,  # 같은 서비스 타입만 체크
-            Reservation.status.in_([ReservationStatus.pending, ReservationStatus.confirmed])
-        )
-    ).first()
-
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="해당 시간에 이미 같은 서비스의 예약이 있습니다"
-        )
-
-    # 직원 중복 확인 (staff_id가 있는 경우)
-    if reservation.staff_id:
-        staff_conflict = db.query(Reservation).filter(
-            and_(
-                Reservation.reservation_date == reservation.reservation_date,
-                Reservation.reservation_time == reservation.reservation_time,
-                Reservation.staff_id == reservation.staff_id,
-                Reservation.status.in_([ReservationStatus.pending, ReservationStatus.confirmed])
-            )
-        ).first()
-
-        if staff_conflict:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="해당 직원은 이미 다른 예약이 있습니다"
-            )
-
-    # 고객 처리: customer_id가 있으면 기존 고객, 없으면 게스트 고객 생성
-    if reservation.customer_id:
-        # 기존 고객
-        customer = db.query(Customer).filter(Customer.customer_id == reservation.customer_id).first()
-        if not customer:
-            raise HTTPException(status_code=404, detail="고객을 찾을 수 없습니다")
-    elif reservation.customer_name:
-        # 게스트 고객 - 먼저 같은 이름과 전화번호로 기존 고객 검색
-        if reservation.customer_phone:
-            customer = db.query(Customer).filter(
-                Customer.name == reservation.customer_name,
-                Customer.phone == reservation.customer_phone
-            ).first()
+    booking = ReservationBookingService(db)
+
+    def _book():
+        # 고객 처리: customer_id가 있으면 기존 고객, 없으면 게스트 고객 생성
+        if reservation.customer_id:
+            # 기존 고객
+            customer = db.query(Customer).filter(Customer.customer_id == reservation.customer_id).first()
+            if not customer:
+                raise HTTPException(status_code=404, detail="고객을 찾을 수 없습니다")
+        elif reservation.customer_name:
+            # 게스트 고객 - 먼저 같은 이름과 전화번호로 기존 고객 검색
+            if reservation.customer_phone:
+                customer = db.query(Customer).filter(
+                    Customer.name == reservation.customer_name,
+                    Customer.phone == reservation.customer_phone
+                ).first()
+            else:
+                customer = None
+
+            # 기존 고객이 없으면 새로 생성
+            if not customer:
+                customer = Customer(
+                    name=reservation.customer_name,
+                    phone=reservation.customer_phone,
+                    membership_level='basic',
+                    customer_status='active',
+                    memo=f"예약 시 자동 생성 ({reservation.reservation_date})"
+                )
+                db.add(customer)
+                db.flush()  # customer_id를 얻기 위해 flush
         else:
-            customer = None
-        
-        # 기존 고객이 없으면 새로 생성
-        if not customer:
-            customer = Customer(
-                name=reservation.customer_name,
-                phone=reservation.customer_phone,
-                membership_level='basic',
-                customer_status='active',
-                memo=f"예약 시 자동 생성 ({reservation.reservation_date})"
+            raise HTTPException(
+                status_code=400,
+                detail="고객 ID 또는 고객 이름을 입력해주세요"
             )
-            db.add(customer)
-            db.flush()  # customer_id를 얻기 위해 flush
-    else:
-        raise HTTPException(
-            status_code=400, 
-            detail="고객 ID 또는 고객 이름을 입력해주세요"
-        )
 
-    service_type = db.query(ServiceType).filter(ServiceType.service_type_id == reservation.service_type_id).first()
-    if not service_type:
-        raise HTTPException(status_code=404, detail="서비스 타입을 찾을 수 없습니다")
-
-    # 예약 생성
-    db_reservation = Reservation(
-        customer_id=customer.customer_id,
-        service_type_id=reservation.service_type_id,
-        staff_id=reservation.staff_id,
-        reservation_date=reservation.reservation_date,
-        reservation_time=reservation.reservation_time,
-        duration_minutes=reservation.duration_minutes or service_type.default_duration,
-        status=ReservationStatus.pending,
-        customer_request=reservation.customer_request,
-        internal_memo=reservation.internal_memo
-    )
+        service_type = db.query(ServiceType).filter(ServiceType.service_type_id == reservation.service_type_id).first()
+        if not service_type:
+            raise HTTPException(status_code=404, detail="서비스 타입을 찾을 수 없습니다")
 
-    db.add(db_reservation)
-    db.commit()
-    db.refresh(db_reservation)
+        duration_minutes = reservation.duration_minutes or service_type.default_duration
 
-    # 확인 메시지 발송
-    if send_confirmation and customer.phone:
-        try:
-            staff = db.query(User).filter(User.user_id == reservation.staff_id).first()
-            staff_name = staff.name if staff else None
-
-            # SMS 메시지 생성
-            message = sms_templates.reservation_confirmation(
-                customer_name=customer.name,
-                reservation_date=str(reservation.reservation_date),
-                reservation_time=str(reservation.reservation_time),
-                service_name=service_type.service_name,
-                staff_name=staff_name
-            )
+        # 중복 예약 확인 - 서비스/직원 락을 잡은 뒤 소요 시간 구간으로 확인 (동시 요청 이중 예약 방지)
+        booking.reserve(
+            reservation.reservation_date,
+            reservation.reservation_time,
+            duration_minutes,
+            reservation.service_type_id,
+            reservation.staff_id
+        )
 
-            # 알리고 SMS 발송
-            result = aligo_service.send_sms(
-                receiver=customer.phone,
-                message=message
+        # 예약 생성
+        db_reservation = Reservation(
+            customer_id=customer.customer_id,
+            service_type_id=reservation.service_type_id,
+            staff_id=reservation.staff_id,
+            reservation_date=reservation.reservation_date,
+            reservation_time=reservation.reservation_time,
+            duration_minutes=duration_minutes,
+            status=ReservationStatus.pending,
+            customer_request=reservation.customer_request,
+            internal_memo=reservation.internal_memo
+        )
+        db.add(db_reservation)
+        db.flush()
+
+        staff = db.query(User).filter(User.user_id == reservation.staff_id).first() if reservation.staff_id else None
+        staff_name = staff.name if staff else None
+
+        # 확인 SMS는 발송 대기열에 등록 (예약과 같은 트랜잭션, 발송 성공 시 워커가 confirmation_sent 갱신)
+        if send_confirmation and customer.phone:
+            enqueue_sms(
+                db,
+                customer.phone,
+                sms_templates.reservation_confirmation(
+                    customer_name=customer.name,
+                    reservation_date=str(reservation.reservation_date),
+                    reservation_time=str(reservation.reservation_time),
+                    service_name=service_type.service_name,
+                    staff_name=staff_name
+                ),
+                purpose=PURPOSE_RESERVATION_CONFIRMATION,
+                recipient_name=customer.name,
+                customer_id=customer.customer_id,
+                reservation_id=db_reservation.reservation_id
             )
+        return customer, service_type, db_reservation, staff_name
 
-            if result["success"]:
-                db_reservation.confirmation_sent = True
-                db.commit()
-                logger.info(f"예약 확인 SMS 발송 성공: {customer.name} ({customer.phone})")
-            else:
-                logger.error(f"예약 확인 SMS 발송 실패: {result.get('error_message')}")
-
-        except Exception as e:
-            logger.error(f"확인 메시지 발송 중 오류: {e}")
+    try:
+        customer, service_type, db_reservation, staff_name = booking.run(_book)
+    except ReservationConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    db.refresh(db_reservation)
 
     # Response 변환
     return ReservationResponse(
@@ -280,7 +258,7 @@ def create_reservation(
         customer_name=customer.name,
         customer_phone=customer.phone,
         service_name=service_type.service_name,
-        staff_name=staff_name if 'staff_name' in locals() else None
+        staff_name=staff_name
     )
 
 @router.put("/{reservation_id}", response_model=ReservationResponse)
@@ -299,54 +277,32 @@ def update_reservation(
     # 수정 가능한 필드만 업데이트
     update_data = reservation_update.dict(exclude_unset=True)
 
-    # 시간 변경 시 중복 확인
-    if 'reservation_date' in update_data or 'reservation_time' in update_data or 'service_type_id' in update_data:
-        new_date = update_data.get('reservation_date', db_reservation.reservation_date)
-        new_time = update_data.get('reservation_time', db_reservation.reservation_time)
-        new_service_type_id = update_data.get('service_type_id', db_reservation.service_type_id)
-
-        # 같은 서비스 타입끼리만 체크
-        existing = db.query(Reservation).filter(
-            and_(
-                Reservation.reservation_id != reservation_id,
-                Reservation.reservation_date == new_date,
-                Reservation.reservation_time == new_time,
-                Reservation.service_type_id == new_service_type_id,
-                Reservation.status.in_([ReservationStatus.pending, ReservationStatus.confirmed])
-            )
-        ).first()
-
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="해당 시간에 이미 같은 서비스의 예약이 있습니다"
-            )
-
-        # 직원 중복 확인 (staff_id가 있는 경우)
-        new_staff_id = update_data.get('staff_id', db_reservation.staff_id)
-        if new_staff_id:
-            staff_conflict = db.query(Reservation).filter(
-                and_(
-                    Reservation.reservation_id != reservation_id,
-                    Reservation.reservation_date == new_date,
-                    Reservation.reservation_time == new_time,
-                    Reservation.staff_id == new_staff_id,
-                    Reservation.status.in_([ReservationStatus.pending, ReservationStatus.confirmed])
+    # 시간/자원 변경 시 중복 확인 - 락을 잡은 트랜잭션 안에서 확인 후 수정
+    schedule_fields = {'reservation_date', 'reservation_time', 'duration_minutes', 'service_type_id', 'staff_id', 'status'}
+    booking = ReservationBookingService(db)
+
+    def _update():
+        if schedule_fields & update_data.keys():
+            new_status = update_data.get('status', db_reservation.status)
+            if new_status in ACTIVE_STATUSES:
+                booking.reserve(
+                    update_data.get('reservation_date', db_reservation.reservation_date),
+                    update_data.get('reservation_time', db_reservation.reservation_time),
+                    update_data.get('duration_minutes', db_reservation.duration_minutes),
+                    update_data.get('service_type_id', db_reservation.service_type_id),
+                    update_data.get('staff_id', db_reservation.staff_id),
+                    exclude_reservation_id=reservation_id
                 )
-            ).first()
 
-            if staff_conflict:
-                raise HTTPException(
-                    status_code=status.HTTP_409_CONFLICT,
-                    detail="해당 직원은 이미 다른 예약이 있습니다"
-                )
+        # 업데이트 실행
+        for field, value in update_data.items():
+            setattr(db_reservation, field, value)
+        db_reservation.updated_at = datetime.utcnow()
 
-    # 업데이트 실행
-    for field, value in update_data.items():
-        setattr(db_reservation, field, value)
-
-    db_reservation.updated_at = datetime.utcnow()
-    db.commit()
+    try:
+        booking.run(_update)
+    except ReservationConflictError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     db.refresh(db_reservation)
 
     # 관련 정보 조회
@@ -431,33 +387,25 @@ def confirm_reservation(
     db_reservation.status = 'confirmed'
     db_reservation.updated_at = datetime.utcnow()
 
-    db.commit()
-
-    # 확정 SMS 발송
+    # 확정 SMS는 발송 대기열에 등록 (확정과 같은 트랜잭션)
     if send_confirmation and db_reservation.customer.phone:
-        try:
-            # SMS 메시지 생성
-            message = sms_templates.reservation_confirmation(
+        enqueue_sms(
+            db,
+            db_reservation.customer.phone,
+            sms_templates.reservation_confirmation(
                 customer_name=db_reservation.customer.name,
                 reservation_date=str(db_reservation.reservation_date),
                 reservation_time=str(db_reservation.reservation_time),
                 service_name=db_reservation.service_type.service_name,
                 staff_name=db_reservation.staff.name if db_reservation.staff else None
-            )
-
-            # 알리고 SMS 발송
-            result = aligo_service.send_sms(
-                receiver=db_reservation.customer.phone,
-                message=message
-            )
-
-            if result["success"]:
-                logger.info(f"예약 확정 SMS 발송 성공: {db_reservation.customer.name} ({db_reservation.customer.phone})")
-            else:
-                logger.error(f"예약 확정 SMS 발송 실패: {result.get('error_message')}")
+            ),
+            purpose=PURPOSE_RESERVATION_CONFIRMATION,
+            recipient_name=db_reservation.customer.name,
+            customer_id=db_reservation.customer_id,
+            reservation_id=db_reservation.reservation_id
+        )
 
-        except Exception as e:
-            logger.error(f"확정 SMS 발송 중 오류: {e}")
+    db.commit()
 
     return {"message": "예약이 확정되었습니다"}
 
@@ -1,14 +1,21 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import and_
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 
 from core.database import get_db
 from core.auth import get_current_user
 from models.reservation import Reservation, ReservationStatus
 from models.user import User
-from models.reservation import KakaoMessageLog
-from services.kakao_service import kakao_service, message_builder
+from services.kakao_service import message_builder
+from services.message_outbox_service import (
+    enqueue_alimtalk,
+    queued_reservation_ids,
+    PURPOSE_RESERVATION_CONFIRMATION,
+    PURPOSE_RESERVATION_REMINDER,
+    PURPOSE_RESERVATION_CHANGE,
+    PURPOSE_RESERVATION_CANCELLATION,
+)
 
 router = APIRouter()
 
@@ -38,67 +45,51 @@ def send_tomorrow_reminders(
         )
     ).all()
 
-    success_count = 0
-    fail_count = 0
+    # 이미 대기열에 있는 리마인더는 다시 넣지 않음 (reminder_sent는 실제 발송 후 워커가 갱신)
+    already_queued = queued_reservation_ids(
+        db, PURPOSE_RESERVATION_REMINDER, [r.reservation_id for r in reservations]
+    )
+
+    queued_count = 0
+    skipped_count = 0
 
     for reservation in reservations:
-        if not reservation.customer.phone:
+        if not reservation.customer.phone or reservation.reservation_id in already_queued:
+            skipped_count += 1
             continue
 
-        try:
-            # 알림톡 발송
-            datetime_str = f"{reservation.reservation_date.strftime('%Y년 %m월 %d일')} {reservation.reservation_time.strftime('%H:%M')}"
-
-            template_args = message_builder.build_reminder(
-                customer_name=reservation.customer.name,
-                reservation_datetime=datetime_str,
-                service_name=reservation.service_type.service_name
-            )
-
-            result = kakao_service.send_alimtalk(
-                phone_number=reservation.customer.phone,
-                template_code="REMINDER_001",  # 실제 승인된 템플릿 코드
-                template_args=template_args
-            )
-
-            # 발송 이력 저장
-            log = KakaoMessageLog(
-                reservation_id=reservation.reservation_id,
-                customer_id=reservation.customer_id,
-                template_code="REMINDER_001",
-                phone_number=reservation.customer.phone,
-                message_type="alimtalk",
-                status="success" if result["success"] else "failed",
-                message_id=result.get("message_id"),
-                content=f"내일 {datetime_str} 예약 리마인더",
-                variables_used=template_args,
-                sent_at=datetime.now() if result["success"] else None,
-                error_code=result.get("error_code"),
-                error_message=result.get("error_message")
-            )
-            db.add(log)
-
-            if result["success"]:
-                reservation.reminder_sent = True
-                success_count += 1
-            else:
-                fail_count += 1
-
-        except Exception as e:
-            fail_count += 1
-            print(f"리마인더 발송 오류: {str(e)}")
+        datetime_str = f"{reservation.reservation_date.strftime('%Y년 %m월 %d일')} {reservation.reservation_time.strftime('%H:%M')}"
+
+        template_args = message_builder.build_reminder(
+            customer_name=reservation.customer.name,
+            reservation_datetime=datetime_str,
+            service_name=reservation.service_type.service_name
+        )
+
+        enqueue_alimtalk(
+            db,
+            reservation.customer.phone,
+            template_code="REMINDER_001",  # 실제 승인된 템플릿 코드
+            template_args=template_args,
+            content=f"내일 {datetime_str} 예약 리마인더",
+            purpose=PURPOSE_RESERVATION_REMINDER,
+            recipient_name=reservation.customer.name,
+            customer_id=reservation.customer_id,
+            reservation_id=reservation.reservation_id
+        )
+        queued_count += 1
 
     db.commit()
 
     return {
         "total": len(reservations),
-        "success": success_count,
-        "failed": fail_count
+        "queued": queued_count,
+        "skipped": skipped_count
     }
 
-# 알림톡 발송 헬퍼 함수들
+# 알림톡 발송 헬퍼 함수들 (발송 대기열 등록 - 호출한 쪽에서 커밋, 발송 이력은 워커가 kakao_message_logs에 기록)
 def send_reservation_confirmation(db: Session, reservation: Reservation):
-    """예약 확인 알림톡 발송"""
+    """예약 확인 알림톡 발송 예약"""
     datetime_str = f"{reservation.reservation_date.strftime('%Y년 %m월 %d일')} {reservation.reservation_time.strftime('%H:%M')}"
 
     template_args = message_builder.build_reservation_confirmation(
@@ -108,39 +99,21 @@ def send_reservation_confirmation(db: Session, reservation: Reservation):
         staff_name=reservation.staff.name if reservation.staff else "미정"
     )
 
-    result = kakao_service.send_alimtalk(
-        phone_number=reservation.customer.phone,
+    return enqueue_alimtalk(
+        db,
+        reservation.customer.phone,
         template_code="RESERVATION_CONFIRM_001",  # 실제 승인된 템플릿 코드
         template_args=template_args,
-        fallback_message=f"{reservation.customer.name}님, AIBIO Center 예약이 확인되었습니다. {datetime_str}"
-    )
-
-    # 발송 이력 저장
-    log = KakaoMessageLog(
-        reservation_id=reservation.reservation_id,
-        customer_id=reservation.customer_id,
-        template_code="RESERVATION_CONFIRM_001",
-        phone_number=reservation.customer.phone,
-        message_type="alimtalk",
-        status="success" if result["success"] else "failed",
-        message_id=result.get("message_id"),
         content=f"예약 확인: {datetime_str}",
-        variables_used=template_args,
-        sent_at=datetime.now() if result["success"] else None,
-        error_code=result.get("error_code"),
-        error_message=result.get("error_message")
+        purpose=PURPOSE_RESERVATION_CONFIRMATION,
+        fallback_message=f"{reservation.customer.name}님, AIBIO Center 예약이 확인되었습니다. {datetime_str}",
+        recipient_name=reservation.customer.name,
+        customer_id=reservation.customer_id,
+        reservation_id=reservation.reservation_id
     )
-    db.add(log)
-
-    if result["success"]:
-        reservation.confirmation_sent = True
-
-    db.commit()
-
-    return result
 
 def send_reservation_change_notification(db: Session, reservation: Reservation, old_datetime: str, new_datetime: str):
-    """예약 변경 알림톡 발송"""
+    """예약 변경 알림톡 발송 예약"""
     template_args = message_builder.build_change_notification(
         customer_name=reservation.customer.name,
         old_datetime=old_datetime,
@@ -148,34 +121,20 @@ def send_reservation_change_notification(db: Session, reservation: Reservation,
         service_name=reservation.service_type.service_name
     )
 
-    result = kakao_service.send_alimtalk(
-        phone_number=reservation.customer.phone,
-        template_code="RESERVATION_CHANGE_001",
-        template_args=template_args
-    )
-
-    # 발송 이력 저장
-    log = KakaoMessageLog(
-        reservation_id=reservation.reservation_id,
-        customer_id=reservation.customer_id,
+    return enqueue_alimtalk(
+        db,
+        reservation.customer.phone,
         template_code="RESERVATION_CHANGE_001",
-        phone_number=reservation.customer.phone,
-        message_type="alimtalk",
-        status="success" if result["success"] else "failed",
-        message_id=result.get("message_id"),
+        template_args=template_args,
         content=f"예약 변경: {old_datetime} → {new_datetime}",
-        variables_used=template_args,
-        sent_at=datetime.now() if result["success"] else None,
-        error_code=result.get("error_code"),
-        error_message=result.get("error_message")
+        purpose=PURPOSE_RESERVATION_CHANGE,
+        recipient_name=reservation.customer.name,
+        customer_id=reservation.customer_id,
+        reservation_id=reservation.reservation_id
     )
-    db.add(log)
-    db.commit()
-
-    return result
 
 def send_reservation_cancellation(db: Session, reservation: Reservation):
-    """예약 취소 알림톡 발송"""
+    """예약 취소 알림톡 발송 예약"""
     datetime_str = f"{reservation.reservation_date.strftime('%Y년 %m월 %d일')} {reservation.reservation_time.strftime('%H:%M')}"
 
     template_args = message_builder.build_cancellation(
@@ -185,28 +144,14 @@ def send_reservation_cancellation(db: Session, reservation: Reservation):
         cancel_reason=reservation.cancel_reason or "고객 요청"
     )
 
-    result = kakao_service.send_alimtalk(
-        phone_number=reservation.customer.phone,
+    return enqueue_alimtalk(
+        db,
+        reservation.customer.phone,
         template_code="RESERVATION_CANCEL_001",
-        template_args=template_args
-    )
-
-    # 발송 이력 저장
-    log = KakaoMessageLog(
-        reservation_id=reservation.reservation_id,
-        customer_id=reservation.customer_id,
-        template_code="RESERVATION_CANCEL_001",
-        phone_number=reservation.customer.phone,
-        message_type="alimtalk",
-        status="success" if result["success"] else "failed",
-        message_id=result.get("message_id"),
+        template_args=template_args,
         content=f"예약 취소: {datetime_str}",
-        variables_used=template_args,
-        sent_at=datetime.now() if result["success"] else None,
-        error_code=result.get("error_code"),
-        error_message=result.get("error_message")
+        purpose=PURPOSE_RESERVATION_CANCELLATION,
+        recipient_name=reservation.customer.name,
+        customer_id=reservation.customer_id,
+        reservation_id=reservation.reservation_id
     )
-    db.add(log)
-    db.commit()
-
-    return result
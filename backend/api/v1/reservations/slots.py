@@ -1,12 +1,13 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
 from typing import Optional
-from datetime import date, datetime, timedelta, time as datetime_time
+from datetime import date, timedelta, time as datetime_time
 
+from core.config import settings
 from core.database import get_db
 from core.auth import get_current_user
-from models import Reservation, ReservationStatus, User
+from models import User
+from services.reservation_availability_service import ReservationAvailabilityService
 
 router = APIRouter()
 
@@ -18,38 +19,45 @@ def get_available_slots(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """예약 가능한 시간대 조회"""
-    # 영업 시간 (설정에서 가져와야 하지만 일단 하드코딩)
-    business_start = datetime_time(9, 0)  # 09:00
-    business_end = datetime_time(18, 0)   # 18:00
-    slot_duration = 15  # 15분 단위
-
-    # 해당 날짜의 기존 예약 조회
-    existing_reservations = db.query(Reservation).filter(
-        and_(
-            Reservation.reservation_date == date,
-            Reservation.status.in_(['pending', 'confirmed'])
+    """예약 가능한 시간대 조회 (서비스 소요 시간/동시 수용 인원/직원 근무표 반영)"""
+    day = ReservationAvailabilityService(db).get_availability(
+        date, date, service_type_id, staff_id=staff_id
+    )[0]
+
+    return [
+        {
+            "date": date,
+            "time": datetime_time(start // 60, start % 60),
+            "staff_id": staff_id
+        }
+        for start in day.slots
+    ]
+
+@router.get("/availability")
+def get_availability(
+    start_date: date = Query(...),
+    end_date: Optional[date] = Query(None, description="미지정 시 start_date 하루"),
+    service_type_id: int = Query(...),
+    staff_id: Optional[int] = None,
+    duration_minutes: Optional[int] = Query(None, ge=5, le=480, description="미지정 시 서비스 기본 소요 시간"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """기간별 예약 가능 시간 (날짜마다 영업시간, 빈 구간, 시작 가능 시각)"""
+    end_date = end_date or start_date
+    if end_date < start_date:
+        raise HTTPException(status_code=400, detail="end_date는 start_date 이후여야 합니다")
+    if end_date - start_date >= timedelta(days=settings.RESERVATION_MAX_RANGE_DAYS):
+        raise HTTPException(
+            status_code=400,
+            detail=f"조회 기간은 최대 {settings.RESERVATION_MAX_RANGE_DAYS}일입니다"
         )
-    )
-
-    if staff_id:
-        existing_reservations = existing_reservations.filter(Reservation.staff_id == staff_id)
-
-    existing_times = [r.reservation_time for r in existing_reservations.all()]
 
-    # 가능한 시간대 생성
-    available_slots = []
-    current_time = datetime.combine(date, business_start)
-    end_time = datetime.combine(date, business_end)
-
-    while current_time < end_time:
-        slot_time = current_time.time()
-        if slot_time not in existing_times:
-            available_slots.append({
-                "date": date,
-                "time": slot_time,
-                "staff_id": staff_id
-            })
-        current_time += timedelta(minutes=slot_duration)
-
-    return available_slots
+    days = ReservationAvailabilityService(db).get_availability(
+        start_date, end_date, service_type_id, staff_id=staff_id, duration_minutes=duration_minutes
+    )
+    return {
+        "service_type_id": service_type_id,
+        "staff_id": staff_id,
+        "days": [day.to_dict() for day in days]
+    }
@@ -1,11 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func, and_
 from sqlalchemy.orm import selectinload
 from typing import List, Optional
-from datetime import date, datetime
-import pandas as pd
+from datetime import date
 
 from core.database import get_db
 from core.auth import get_current_user
@@ -14,7 +12,7 @@ from models.customer import Customer as CustomerModel
 from models.package import PackagePurchase as PackagePurchaseModel
 from models.user import User
 from schemas.service import ServiceUsage, ServiceUsageCreate, ServiceType
-from utils.excel import ExcelHandler
+from utils.export_stream import ExportColumn, streaming_export, iter_query_rows, map_rows, format_date, format_datetime
 
 router = APIRouter()
 
@@ -321,23 +319,26 @@ def export_service_usage_to_excel(
     date_to: Optional[date] = Query(None),
     customer_id: Optional[int] = None,
     service_type_id: Optional[int] = None,
-    db: Session = Depends(get_db),
+    format: str = Query("xlsx", description="xlsx | csv"),
     current_user: User = Depends(get_current_user)
 ):
-    """서비스 이용 내역을 엑셀 파일로 내보내기"""
+    """서비스 이용 내역을 엑셀/CSV 파일로 내보내기 (스트리밍)"""
     # 서비스 이용 내역 조회
     query = select(
-        ServiceUsageModel,
+        ServiceUsageModel.usage_id,
+        ServiceUsageModel.service_date,
+        ServiceUsageModel.session_number,
+        ServiceUsageModel.session_details,
+        ServiceUsageModel.package_id,
+        ServiceUsageModel.created_by,
+        ServiceUsageModel.created_at,
         CustomerModel.name.label('customer_name'),
         CustomerModel.phone.label('customer_phone'),
-        ServiceTypeModel.service_name.label('service_name'),
-        PackagePurchaseModel.package_id.label('package_name')
+        ServiceTypeModel.service_name.label('service_name')
     ).join(
         CustomerModel, ServiceUsageModel.customer_id == CustomerModel.customer_id
     ).join(
         ServiceTypeModel, ServiceUsageModel.service_type_id == ServiceTypeModel.service_type_id
-    ).outerjoin(
-        PackagePurchaseModel, ServiceUsageModel.package_id == PackagePurchaseModel.purchase_id
     )
 
     # 필터링
@@ -353,38 +354,37 @@ def export_service_usage_to_excel(
     # 정렬
     query = query.order_by(ServiceUsageModel.service_date.desc(), ServiceUsageModel.usage_id.desc())
 
-    result = db.execute(query)
-    rows = result.all()
+    columns = [
+        ExportColumn('이용ID', 10),
+        ExportColumn('서비스일자', 12),
+        ExportColumn('고객명', 12),
+        ExportColumn('전화번호', 16),
+        ExportColumn('서비스종류', 14),
+        ExportColumn('세션번호', 10),
+        ExportColumn('세션내용', 40),
+        ExportColumn('패키지사용', 10),
+        ExportColumn('담당자', 12),
+        ExportColumn('등록일시', 20),
+    ]
 
-    # DataFrame 생성
-    data = []
-    for row in rows:
-        usage = row[0]
-        data.append({
-            '이용ID': usage.usage_id,
-            '서비스일자': usage.service_date.strftime('%Y-%m-%d'),
-            '고객명': row.customer_name,
-            '전화번호': row.customer_phone,
-            '서비스종류': row.service_name,
-            '세션번호': usage.session_number or '',
-            '세션내용': usage.session_details or '',
-            '패키지사용': '예' if usage.package_id else '아니오',
-            '담당자': usage.created_by or '',
-            '등록일시': usage.created_at.strftime('%Y-%m-%d %H:%M:%S') if usage.created_at else ''
-        })
-
-    df = pd.DataFrame(data)
-
-    # 엑셀 파일 생성
-    excel_data = ExcelHandler.create_excel_response(
-        df,
-        f"service_usage_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    )
+    def to_row(row):
+        return [
+            row.usage_id,
+            format_date(row.service_date),
+            row.customer_name,
+            row.customer_phone,
+            row.service_name,
+            row.session_number or '',
+            row.session_details or '',
+            '예' if row.package_id else '아니오',
+            row.created_by or '',
+            format_datetime(row.created_at)
+        ]
 
-    return Response(
-        content=excel_data,
-        media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-        headers={
-            'Content-Disposition': f'attachment; filename=service_usage_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx'
-        }
+    return streaming_export(
+        columns,
+        map_rows(iter_query_rows(query), to_row),
+        "service_usage",
+        file_format=format,
+        sheet_name="서비스이용내역"
     )
@@ -3,14 +3,14 @@ from sqlalchemy.orm import Session
 
 from core.database import get_db
 from models import User
-from core.auth import get_current_user, verify_password, get_password_hash
+from core.auth import AuthenticatedUser, get_current_user, verify_password, get_password_hash, invalidate_principal
 from schemas.user import UserUpdate, PasswordChange
 
 router = APIRouter()
 
 @router.get("/profile")
 def get_profile(
-    current_user: User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     """현재 사용자 프로필 조회"""
     return {
@@ -26,7 +26,7 @@ def get_profile(
 def update_profile(
     user_update: UserUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     """프로필 정보 수정"""
     # 이메일 중복 확인
@@ -38,22 +38,24 @@ def update_profile(
                 detail="이미 사용 중인 이메일입니다."
             )
 
-    # 업데이트
+    # 업데이트 (current_user는 캐시된 스냅샷이므로 행을 다시 읽어서 수정)
+    user = db.get(User, current_user.user_id)
     if user_update.name:
-        current_user.name = user_update.name
+        user.name = user_update.name
     if user_update.email:
-        current_user.email = user_update.email
+        user.email = user_update.email
 
     db.commit()
-    db.refresh(current_user)
+    db.refresh(user)
+    invalidate_principal(current_user, user)
 
     return {
         "message": "프로필이 성공적으로 업데이트되었습니다.",
         "user": {
-            "user_id": current_user.user_id,
-            "email": current_user.email,
-            "name": current_user.name,
-            "role": current_user.role
+            "user_id": user.user_id,
+            "email": user.email,
+            "name": user.name,
+            "role": user.role
         }
     }
 
@@ -61,18 +63,20 @@ def update_profile(
 def change_password(
     password_data: PasswordChange,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     """비밀번호 변경"""
     # 현재 비밀번호 확인
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    user = db.get(User, current_user.user_id)
+    if not user or not verify_password(password_data.current_password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="현재 비밀번호가 올바르지 않습니다."
         )
 
     # 새 비밀번호 설정
-    current_user.password_hash = get_password_hash(password_data.new_password)
+    user.password_hash = get_password_hash(password_data.new_password)
     db.commit()
+    invalidate_principal(user)
 
     return {"message": "비밀번호가 성공적으로 변경되었습니다."}
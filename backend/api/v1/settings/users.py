@@ -5,7 +5,7 @@ from typing import List, Optional
 
 from core.database import get_db
 from models import User
-from core.auth import get_current_user, get_password_hash
+from core.auth import get_current_user, get_password_hash, invalidate_principal
 from schemas.user import UserUpdate, UserCreate, UserResponse
 
 router = APIRouter()
@@ -103,6 +103,7 @@ def update_user(
 
     db.commit()
     db.refresh(user)
+    invalidate_principal(user)
 
     return {"message": "사용자 정보가 업데이트되었습니다.", "user": user}
 
@@ -135,5 +136,6 @@ def delete_user(
 
     user.is_active = False
     db.commit()
+    invalidate_principal(user)
 
     return {"message": "사용자가 비활성화되었습니다."}
@@ -7,12 +7,37 @@ from core.database import get_db
 from core.auth import get_current_user
 from models import User, Customer
 from models.customer_extended import MarketingLead
-from services.aligo_service import aligo_service, sms_templates
+from services.aligo_service import sms_templates
+from services.message_outbox_service import enqueue_sms, PURPOSE_BULK_SMS
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+
+def _queue_messages(db: Session, receivers: List[Dict], title: Optional[str] = None, **extra) -> Dict:
+    """수신자별 메시지를 발송 대기열에 등록하고 커밋 (실제 발송은 백그라운드 워커가 send_mass로 묶어서 처리)"""
+    for receiver in receivers:
+        enqueue_sms(
+            db,
+            receiver["phone"],
+            receiver["message"],
+            purpose=PURPOSE_BULK_SMS,
+            title=title,
+            recipient_name=receiver.get("name"),
+            customer_id=receiver.get("customer_id")
+        )
+    db.commit()
+    return {
+        "success": True,
+        "total_count": len(receivers),
+        "success_count": len(receivers),
+        "error_count": 0,
+        "queued": True,
+        "message": f"{len(receivers)}건 발송 요청 완료",
+        **extra
+    }
+
 class SMSSendRequest(BaseModel):
     """SMS 발송 요청"""
     customer_ids: List[int]
@@ -49,7 +74,7 @@ async def get_sms_remain(current_user: User = Depends(get_current_user)):
     }
 
 @router.post("/send")
-async def send_sms(
+def send_sms(
     request: SMSSendRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -69,34 +94,19 @@ async def send_sms(
     if not valid_customers:
         return {"success": False, "message": "전화번호가 등록된 고객이 없습니다"}
 
-    # 실제 발송 (알리고 서비스 사용)
-    if len(valid_customers) == 1:
-        result = aligo_service.send_sms(
-            receiver=valid_customers[0].phone,
-            message=request.message,
-            title=request.title
-        )
-    else:
-        receivers = [
-            {
-                "phone": c.phone,
-                "message": request.message,
-                "name": c.name
-            }
-            for c in valid_customers
-        ]
-        result = aligo_service.send_mass(receivers)
-
-    return {
-        "success": result.get("success", False),
-        "total_count": len(valid_customers),
-        "success_count": result.get("success_cnt", 1 if result.get("success") else 0),
-        "error_count": result.get("error_cnt", 0),
-        "message": result.get("error_message", "발송 완료" if result.get("success") else "발송 실패")
-    }
+    receivers = [
+        {
+            "phone": c.phone,
+            "message": request.message,
+            "name": c.name,
+            "customer_id": c.customer_id
+        }
+        for c in valid_customers
+    ]
+    return _queue_messages(db, receivers, title=request.title)
 
 @router.post("/send-template")
-async def send_template_sms(
+def send_template_sms(
     request: SMSTemplateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -141,30 +151,14 @@ async def send_template_sms(
             receivers.append({
                 "phone": customer.phone,
                 "message": message,
-                "name": customer.name
+                "name": customer.name,
+                "customer_id": customer.customer_id
             })
 
-    # 실제 발송
-    if len(receivers) == 1:
-        result = aligo_service.send_sms(
-            receiver=receivers[0]["phone"],
-            message=receivers[0]["message"],
-            title="[AIBIO 센터]"
-        )
-    else:
-        result = aligo_service.send_mass(receivers)
-
-    return {
-        "success": result.get("success", False),
-        "total_count": len(receivers),
-        "success_count": result.get("success_cnt", 1 if result.get("success") else 0),
-        "error_count": result.get("error_cnt", 0),
-        "message": result.get("error_message", "발송 완료" if result.get("success") else "발송 실패"),
-        "template_type": request.template_type
-    }
+    return _queue_messages(db, receivers, title="[AIBIO 센터]", template_type=request.template_type)
 
 @router.post("/send-leads")
-async def send_sms_to_leads(
+def send_sms_to_leads(
     request: LeadSMSSendRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -184,34 +178,18 @@ async def send_sms_to_leads(
     if not valid_leads:
         return {"success": False, "message": "전화번호가 등록된 유입고객이 없습니다"}
 
-    # 실제 발송 (알리고 서비스 사용)
-    if len(valid_leads) == 1:
-        result = aligo_service.send_sms(
-            receiver=valid_leads[0].phone,
-            message=request.message,
-            title=request.title or "[AIBIO 센터]"
-        )
-    else:
-        receivers = [
-            {
-                "phone": l.phone,
-                "message": request.message,
-                "name": l.name
-            }
-            for l in valid_leads
-        ]
-        result = aligo_service.send_mass(receivers)
-
-    return {
-        "success": result.get("success", False),
-        "total_count": len(valid_leads),
-        "success_count": result.get("success_cnt", 1 if result.get("success") else 0),
-        "error_count": result.get("error_cnt", 0),
-        "message": result.get("error_message", "발송 완료" if result.get("success") else "발송 실패")
-    }
+    receivers = [
+        {
+            "phone": l.phone,
+            "message": request.message,
+            "name": l.name
+        }
+        for l in valid_leads
+    ]
+    return _queue_messages(db, receivers, title=request.title or "[AIBIO 센터]")
 
 @router.post("/send-leads-template")
-async def send_sms_template_to_leads(
+def send_sms_template_to_leads(
     request: LeadSMSTemplateRequest,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -262,21 +240,4 @@ async def send_sms_template_to_leads(
             "name": lead.name
         })
 
-    # 대량 발송
-    if len(receivers) == 1:
-        result = aligo_service.send_sms(
-            receiver=receivers[0]["phone"],
-            message=receivers[0]["message"],
-            title="[AIBIO 센터]"
-        )
-    else:
-        result = aligo_service.send_mass(receivers)
-
-    return {
-        "success": result.get("success", False),
-        "total_count": len(valid_leads),
-        "success_count": result.get("success_cnt", 1 if result.get("success") else 0),
-        "error_count": result.get("error_cnt", 0),
-        "message": result.get("error_message", "발송 완료" if result.get("success") else "발송 실패"),
-        "template_type": request.template_type
-    }
+    return _queue_messages(db, receivers, title="[AIBIO 센터]", template_type=request.template_type)
@@ -1,13 +1,19 @@
 from fastapi import APIRouter, Depends
-import requests
+import httpx
 from core.auth import get_current_user
+from core.config import settings
+from sqlalchemy.orm import Session
+from core.database import engine, replica_engine, get_pool_status, get_db
 from models.user import User
+from utils.cache import CacheService
+from utils.provider_client import provider_stats
+from core import query_profiler
 
 router = APIRouter()
 
 @router.get("/server-ip")
 @router.get("/server-ip/")
-async def get_server_ip(current_user: User = Depends(get_current_user)):
+def get_server_ip(current_user: User = Depends(get_current_user)):
     """서버의 외부 IP 주소 확인 (관리자만)"""
 
     if current_user.role != "admin":
@@ -15,7 +21,7 @@ async def get_server_ip(current_user: User = Depends(get_current_user)):
 
     try:
         # 외부 서비스를 통해 IP 확인
-        response = requests.get("https://api.ipify.org?format=text", timeout=5)
+        response = httpx.get("https://api.ipify.org?format=text", timeout=5)
         if response.status_code == 200:
             server_ip = response.text.strip()
 
@@ -32,3 +38,108 @@ async def get_server_ip(current_user: User = Depends(get_current_user)):
         return {"error": f"IP 확인 실패: {str(e)}"}
 
     return {"error": "IP를 확인할 수 없습니다"}
+
+@router.get("/db-pool")
+@router.get("/db-pool/")
+def get_db_pool_status(current_user: User = Depends(get_current_user)):
+    """DB 커넥션 풀 상태 (사용 중/오버플로우/대기 시간)"""
+
+    if current_user.role not in ("admin", "master"):
+        return {"error": "관리자만 접근 가능합니다"}
+
+    result = {
+        "primary": get_pool_status(engine),
+        "config": {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": settings.DB_POOL_PRE_PING,
+            "statement_timeout_ms": settings.DB_STATEMENT_TIMEOUT_MS,
+            "report_statement_timeout_ms": settings.DB_REPORT_STATEMENT_TIMEOUT_MS,
+            "replica_enabled": replica_engine is not engine,
+        }
+    }
+    if replica_engine is not engine:
+        result["replica"] = get_pool_status(replica_engine)
+
+    return result
+
+
+@router.get("/cache")
+@router.get("/cache/")
+def get_cache_status(current_user: User = Depends(get_current_user)):
+    """캐시 백엔드 상태 (적중률/제거 건수)"""
+
+    if current_user.role not in ("admin", "master"):
+        return {"error": "관리자만 접근 가능합니다"}
+
+    from core.auth import principal_cache
+    from services.questionnaire_template_service import template_cache
+    return {
+        **CacheService.stats(),
+        "principal_cache": principal_cache.stats(),
+        "questionnaire_template_cache": template_cache.stats(),
+    }
+
+
+@router.get("/message-providers")
+@router.get("/message-providers/")
+def get_message_provider_status(current_user: User = Depends(get_current_user)):
+    """메시지 공급자(알리고/카카오) 클라이언트 상태 (호출 지연 히스토그램/서킷/동시 요청 수)"""
+
+    if current_user.role not in ("admin", "master"):
+        return {"error": "관리자만 접근 가능합니다"}
+
+    # 서비스 모듈을 불러와야 클라이언트가 등록됨
+    import services.aligo_service  # noqa: F401
+    import services.kakao_service  # noqa: F401
+
+    return {"providers": provider_stats()}
+
+
+@router.get("/jobs")
+@router.get("/jobs/")
+def get_job_status(
+    recent_runs: int = 20,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """주기 작업 스케줄 (다음 실행 시각/실행 중인 노드)과 최근 실행 이력"""
+
+    if current_user.role not in ("admin", "master"):
+        return {"error": "관리자만 접근 가능합니다"}
+
+    from services.job_scheduler import JobScheduler
+    return JobScheduler(process_workers=0).status(db, recent_runs=min(max(recent_runs, 1), 200))
+
+
+@router.get("/query-profile")
+@router.get("/query-profile/")
+def get_query_profile(
+    limit: int = 20,
+    sort: str = "db_time",
+    current_user: User = Depends(get_current_user)
+):
+    """라우트별 SQL 쿼리 수/DB 시간 누적 통계 (sort: db_time, avg_db_time, queries, max_queries)"""
+
+    if current_user.role not in ("admin", "master"):
+        return {"error": "관리자만 접근 가능합니다"}
+
+    return query_profiler.store.top(
+        limit=min(max(limit, 1), 200),
+        sort=sort,
+        top_statements=settings.QUERY_PROFILER_TOP_STATEMENTS
+    )
+
+
+@router.delete("/query-profile")
+@router.delete("/query-profile/")
+def reset_query_profile(current_user: User = Depends(get_current_user)):
+    """라우트별 SQL 통계 초기화"""
+
+    if current_user.role not in ("admin", "master"):
+        return {"error": "관리자만 접근 가능합니다"}
+
+    query_profiler.store.reset()
+    return {"status": "reset"}
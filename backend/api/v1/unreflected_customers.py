@@ -3,7 +3,6 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select, func
 from typing import List, Optional
 from datetime import datetime
-import pandas as pd
 
 from core.database import get_db
 from models.unreflected_customer import UnreflectedCustomer
@@ -212,6 +211,8 @@ def get_unreflected_stats(db: Session = Depends(get_db)):
 @handle_database_error
 def migrate_unreflected_customers(db: Session = Depends(get_db)):
     """원본 엑셀에 없는 모든 고객을 미반영 고객으로 이동"""
+    import pandas as pd
+
     # 원본 엑셀의 customer_id 목록
     excel_path = "/Users/vibetj/coding/center/docs/AIBIO 관리대장 파일모음/고객관리대장_전체고객.csv"
     df = pd.read_csv(excel_path, encoding='utf-8-sig')
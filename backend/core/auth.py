@@ -1,3 +1,7 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -29,7 +33,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.utcnow() + expires_delta
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update({"exp": expire, "iat": datetime.utcnow(), "type": "access"})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -40,7 +44,8 @@ def create_refresh_token(data: dict):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str, token_type: str = "access"):
+def decode_token(token: str, token_type: str = "access") -> dict:
+    """서명/만료/타입을 확인한 JWT payload (sub 필수)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -48,41 +53,164 @@ def verify_token(token: str, token_type: str = "access"):
     )
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        if payload.get("type") != token_type:
-            raise credentials_exception
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        return email
     except JWTError:
         raise credentials_exception
+    if payload.get("type") != token_type or payload.get("sub") is None:
+        raise credentials_exception
+    return payload
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    email = verify_token(token)
-    user = db.query(User).filter(User.email == email).first()
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
+def verify_token(token: str, token_type: str = "access"):
+    return decode_token(token, token_type)["sub"]
+
+
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """
+    인증된 사용자 스냅샷 (get_current_user 반환값)
+
+    세션에 묶이지 않은 읽기 전용 값이라 요청 간에 캐시해도 안전하다.
+    비밀번호 해시는 들고 있지 않으므로 사용자 정보를 바꾸는 핸들러는
+    db.get(User, current_user.user_id)로 행을 다시 읽어서 수정한다.
+    """
+    user_id: int
+    email: str
+    name: str
+    role: Optional[str]
+    is_active: bool
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    @classmethod
+    def from_model(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            user_id=user.user_id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            is_active=bool(user.is_active),
+            created_at=user.created_at,
+            updated_at=user.updated_at,
         )
-    if not user.is_active:
+
+
+class PrincipalCache:
+    """
+    (email, 토큰 발급 시각) → AuthenticatedUser LRU + TTL 캐시
+
+    - 인증된 요청마다 나가던 users 조회를 TTL 동안 생략
+    - 사용자 정보/권한/비밀번호 변경, 비활성화 시 invalidate()로 즉시 제거
+    - 프로세스별 캐시이므로 다른 워커 프로세스에는 최대 TTL만큼 늦게 반영됨
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 60.0):
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> Optional[AuthenticatedUser]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: tuple, principal: AuthenticatedUser) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, principal)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def invalidate(self, user_ids=(), emails=()) -> int:
+        """사용자 ID 또는 이메일에 해당하는 항목 제거"""
+        user_ids, emails = set(user_ids), set(emails)
+        with self._lock:
+            stale = [
+                key for key, (_, principal) in self._data.items()
+                if principal.user_id in user_ids or principal.email in emails or key[0] in emails
+            ]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_principal(*users) -> None:
+    """사용자 정보/권한/비밀번호/활성 상태를 바꾼 뒤 호출 (User 모델 또는 스냅샷)"""
+    principal_cache.invalidate(
+        user_ids=[user.user_id for user in users],
+        emails=[user.email for user in users]
+    )
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> AuthenticatedUser:
+    payload = decode_token(token)
+    email = payload["sub"]
+    # iat가 없는 이전 토큰은 exp로 구분
+    cache_key = (email, payload.get("iat") or payload.get("exp"))
+
+    principal = principal_cache.get(cache_key)
+    if principal is None:
+        user = db.query(User).filter(User.email == email).first()
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        principal = AuthenticatedUser.from_model(user)
+        principal_cache.set(cache_key, principal)
+
+    if not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user"
         )
-    return user
+    return principal
 
-async def get_current_active_user(current_user: User = Depends(get_current_user)):
+async def get_current_active_user(current_user: AuthenticatedUser = Depends(get_current_user)):
     return current_user
 
-def check_permission(required_role: str):
-    async def permission_checker(current_user: User = Depends(get_current_active_user)):
-        role_hierarchy = {"staff": 1, "manager": 2, "admin": 3, "master": 4}
-        user_level = role_hierarchy.get(current_user.role, 0)
-        required_level = role_hierarchy.get(required_role, 0)
+ROLE_LEVELS = {"staff": 1, "manager": 2, "admin": 3, "master": 4}
+
+def has_role(user: AuthenticatedUser, required_role: str) -> bool:
+    """역할 계층 비교 (DB 조회 없음)"""
+    return ROLE_LEVELS.get(user.role, 0) >= ROLE_LEVELS.get(required_role, 0)
 
-        if user_level < required_level:
+def check_permission(required_role: str):
+    async def permission_checker(current_user: AuthenticatedUser = Depends(get_current_active_user)):
+        if not has_role(current_user, required_role):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions"
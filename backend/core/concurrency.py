@@ -0,0 +1,39 @@
+"""
+동기 DB 작업 실행 모델
+
+이 프로젝트의 DB 세션(core.database.SessionLocal)은 동기 SQLAlchemy Session이다.
+이벤트 루프를 막지 않기 위한 규칙:
+
+1. DB 세션을 사용하는 라우트 핸들러와 의존성은 `def`로 선언한다.
+   FastAPI가 스레드풀에서 실행하므로 느린 쿼리가 다른 요청을 막지 않는다.
+2. 반드시 `async def`여야 하는 코드(백그라운드 태스크, 스케줄러 등)에서
+   동기 DB 작업이 필요하면 `run_sync`로 스레드풀에 넘긴다.
+3. 스레드풀 크기는 THREADPOOL_SIZE로 조정한다. DB 커넥션 풀보다 훨씬 크면
+   스레드가 커넥션을 기다리며 쌓이기만 하므로 풀 크기와 함께 맞춘다.
+"""
+
+from typing import Any, Callable, TypeVar
+
+import anyio.to_thread
+from starlette.concurrency import run_in_threadpool
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+async def run_sync(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """동기 함수를 스레드풀에서 실행하고 결과를 기다림"""
+    return await run_in_threadpool(func, *args, **kwargs)
+
+
+def configure_threadpool(size: int = None) -> int:
+    """def 핸들러용 스레드풀 크기 설정 (이벤트 루프 안에서 호출)"""
+    size = size or settings.THREADPOOL_SIZE
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    limiter.total_tokens = size
+    logger.info(f"Threadpool size set to {size}")
+    return size
@@ -8,6 +8,34 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: Optional[str] = None
+    DATABASE_REPLICA_URL: Optional[str] = None  # 읽기 전용 리플리카 (리포트 조회용)
+
+    # Connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30  # 커넥션 대기 최대 시간 (초)
+    DB_POOL_RECYCLE: int = 1800  # 커넥션 재활용 주기 (초) - 프록시/Supabase idle 종료 대비
+    DB_POOL_PRE_PING: bool = True
+
+    # Statement timeout (ms, 0이면 비활성)
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_REPORT_STATEMENT_TIMEOUT_MS: int = 120000
+
+    # 동기 핸들러(def) 실행 스레드풀 크기
+    THREADPOOL_SIZE: int = 40
+
+    # Cache
+    CACHE_BACKEND: str = "auto"  # auto | redis | memory
+    REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_MAX_ENTRIES: int = 5000  # 메모리 캐시 최대 항목 수 (LRU)
+
+    # 예약 가능 시간 (company_info.business_hours가 없을 때의 기본 영업시간)
+    RESERVATION_OPEN_TIME: str = "09:00"
+    RESERVATION_CLOSE_TIME: str = "18:00"
+    RESERVATION_SLOT_MINUTES: int = 15
+    RESERVATION_DEFAULT_CAPACITY: int = 1  # 서비스별 동시 예약 가능 수 기본값
+    RESERVATION_MAX_RANGE_DAYS: int = 31
+    RESERVATION_BOOKING_MAX_RETRIES: int = 3  # 예약 생성/변경 직렬화 실패·교착 시 재시도 횟수
     
     # Supabase
     SUPABASE_URL: Optional[str] = None
@@ -30,11 +58,65 @@ class Settings(BaseSettings):
     KAKAO_REST_API_KEY: str = ""
     KAKAO_ADMIN_KEY: str = ""
     KAKAO_SENDER_KEY: str = ""
+    KAKAO_BIZ_BASE_URL: str = "https://bizmessage-api.kakao.com"
     
     # Aligo SMS API
     ALIGO_API_KEY: str = ""
     ALIGO_USER_ID: str = ""
     ALIGO_SENDER: str = ""
+    ALIGO_BASE_URL: str = "https://apis.aligo.in"  # 로컬 가짜 서버로 바꿔 테스트 가능
+
+    # 메시지 공급자 HTTP 클라이언트 (커넥션 풀/동시성/서킷 브레이커)
+    ALIGO_MAX_CONCURRENCY: int = 4  # 알리고 동시 요청 수 (커넥션 풀 크기)
+    ALIGO_RATE_LIMIT_PER_SECOND: float = 0  # 초당 요청 수 제한 (0이면 제한 없음)
+    KAKAO_MAX_CONCURRENCY: int = 8
+    KAKAO_RATE_LIMIT_PER_SECOND: float = 0
+    PROVIDER_TIMEOUT_SECONDS: float = 10.0
+    PROVIDER_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 서킷 열림
+    PROVIDER_CIRCUIT_RESET_SECONDS: float = 30.0  # 서킷 열린 뒤 시험 호출까지 대기
+
+    # 메시지 발송 대기열 (message_outbox → 백그라운드 발송)
+    MESSAGE_OUTBOX_WORKER_ENABLED: bool = True  # False면 이 프로세스에서는 발송하지 않음 (별도 워커 사용)
+    MESSAGE_OUTBOX_POLL_SECONDS: float = 2.0
+    MESSAGE_OUTBOX_BATCH_SIZE: int = 500  # 알리고 send_mass 최대 수신자 수
+    MESSAGE_OUTBOX_MAX_ATTEMPTS: int = 5
+    MESSAGE_OUTBOX_RETRY_BASE_SECONDS: int = 30  # 재시도 간격 30s → 60s → 120s ...
+    
+    # 유입고객 핵심 지표 추이 기간 (쿼리 수는 기간과 무관하게 2개)
+    LEAD_METRICS_TREND_MONTHS: int = 6
+    LEAD_METRICS_TREND_WEEKS: int = 8
+    
+    # 주기 작업 스케줄러 (job_leases로 노드 간 한 번만 실행, job_runs에 이력)
+    JOB_SCHEDULER_ENABLED: bool = True  # False면 이 프로세스에서는 실행하지 않음 (run_scheduler.py 사용)
+    JOB_SCHEDULER_POLL_SECONDS: float = 30.0
+    JOB_SCHEDULER_PROCESS_WORKERS: int = 1  # 무거운 작업용 프로세스 풀 크기 (0이면 스레드에서 실행)
+    JOB_MEMBERSHIP_UPDATE_CRON: str = "0 3 * * *"  # 분 시 일 월 요일
+    JOB_PACKAGE_EXPIRY_CRON: str = "0 9 * * *"
+    JOB_DAILY_REPORT_CRON: str = "0 8 * * *"
+
+    # 요청별 SQL 프로파일러 / 느린 쿼리 로그
+    QUERY_PROFILER_ENABLED: bool = True
+    SLOW_QUERY_MS: float = 200.0  # 이 시간 이상 걸린 문장은 경고 로그 (0이면 끔)
+    QUERY_PROFILER_MANY_QUERIES: int = 50  # 한 요청의 쿼리 수가 이 이상이면 경고 로그 (N+1 의심)
+    QUERY_PROFILER_TOP_STATEMENTS: int = 5  # 요청 로그에 붙일 느린 문장 수
+
+    # 서버 시작 시 create_all + 기본 관리자 생성 (기본은 배포 단계의 python scripts/init_db.py에서만)
+    DB_CREATE_ALL_ON_STARTUP: bool = False
+
+    # 인증 사용자 캐시 (get_current_user의 users 조회 생략, 0이면 끔)
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 60.0  # 다른 워커 프로세스에 권한 변경이 반영되는 최대 지연
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 1000
+
+    # 보고서 PDF 렌더링 (프로세스 풀 + report_renders 저장)
+    REPORT_RENDER_PROCESS_WORKERS: int = 1  # 렌더링 프로세스 수 (0이면 요청 스레드에서 렌더링)
+    REPORT_RENDER_TIMEOUT_SECONDS: float = 120.0
+    REPORT_RENDER_FINAL_AFTER_DAYS: int = 7  # 기간 종료 후 이 일수가 지나 만든 PDF는 확정본 (데이터 버전 확인 생략)
+
+    # 문진 템플릿 캐시 (이 시간 동안은 템플릿 변경 확인 쿼리도 생략)
+    QUESTIONNAIRE_TEMPLATE_CACHE_TTL_SECONDS: float = 60.0
+
+    # Prometheus 메트릭 (/metrics)
+    METRICS_TOKEN: str = ""  # 설정하면 Authorization: Bearer <token> 필요
     
     class Config:
         env_file = ".env"
@@ -9,6 +9,13 @@ from typing import Any, Dict
 
 class JSONFormatter(logging.Formatter):
     """JSON 형식 로그 포맷터"""
+
+    # logger.info(..., extra={...})로 넘기면 그대로 출력하는 필드
+    EXTRA_FIELDS = (
+        'user_id', 'request_id', 'ip_address',
+        'method', 'path', 'route', 'status_code', 'process_time',
+        'db_query_count', 'db_time_ms', 'db_statements', 'repeated_statements', 'fingerprint',
+    )
     
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
@@ -26,14 +33,11 @@ class JSONFormatter(logging.Formatter):
             log_data['exception'] = self.formatException(record.exc_info)
         
         # 추가 필드
-        if hasattr(record, 'user_id'):
-            log_data['user_id'] = record.user_id
-        if hasattr(record, 'request_id'):
-            log_data['request_id'] = record.request_id
-        if hasattr(record, 'ip_address'):
-            log_data['ip_address'] = record.ip_address
+        for field in self.EXTRA_FIELDS:
+            if hasattr(record, field):
+                log_data[field] = getattr(record, field)
         
-        return json.dumps(log_data, ensure_ascii=False)
+        return json.dumps(log_data, ensure_ascii=False, default=str)
 
 
 def setup_logging(
@@ -0,0 +1,209 @@
+"""
+Prometheus 텍스트 형식 메트릭 (/metrics)
+
+prometheus_client 없이 필요한 것만 구현한다.
+
+- 요청 지연 히스토그램: 라우트 템플릿(/api/v1/customers/{customer_id}) + 메서드 + 상태 코드 라벨
+  (실제 경로로 라벨을 만들면 고객 ID마다 시계열이 생기므로 매칭 안 된 요청은 "unmatched"로 묶음)
+- 처리 중 요청 수 게이지
+- 주기 작업 실행 시간 히스토그램 (services/job_scheduler.py에서 기록)
+- DB 커넥션 풀/캐시 적중률은 수집(scrape) 시점에 현재 값을 읽어서 출력
+
+요청 경로에서는 dict 조회 + bisect + 락 한 번만 하고 문자열 생성은 scrape 때 한다.
+(scripts/benchmark_metrics.py: 요청당 추가 비용 측정)
+"""
+import hmac
+import threading
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 1800.0)
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Iterable[str], values: Iterable, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """라벨별 누적 버킷 히스토그램 (스레드 안전)"""
+
+    def __init__(self, name: str, documentation: str, label_names: Tuple[str, ...], buckets=REQUEST_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # 라벨 값 → [버킷별 개수..., +Inf 개수], 합계
+        self._series: Dict[Tuple, List] = {}
+
+    def observe(self, seconds: float, *label_values) -> None:
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += seconds
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = [(labels, list(counts), total) for labels, (counts, total) in self._series.items()]
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for label_values, counts, total in sorted(series):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.label_names, label_values, le)} {cumulative}")
+            label_str = _labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{label_str} {_number(total)}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class Gauge:
+    """증감 게이지 (라벨 없음)"""
+
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: int = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {self.value}",
+        ]
+
+
+REQUEST_DURATION = Histogram(
+    "aibio_http_request_duration_seconds", "HTTP request duration by route template",
+    ("method", "route", "status"), REQUEST_BUCKETS
+)
+REQUESTS_IN_FLIGHT = Gauge("aibio_http_requests_in_flight", "HTTP requests currently being processed")
+JOB_DURATION = Histogram(
+    "aibio_job_duration_seconds", "Scheduled job run duration",
+    ("job", "status"), JOB_BUCKETS
+)
+
+
+def observe_request(method: str, route: Optional[str], status_code: int, seconds: float) -> None:
+    REQUEST_DURATION.observe(seconds, method, route or UNMATCHED_ROUTE, str(status_code))
+
+
+def observe_job(job_name: str, status: str, seconds: float) -> None:
+    JOB_DURATION.observe(seconds, job_name, status)
+
+
+# ----------------------------------------------------------------------
+# scrape 시점에 읽는 값
+# ----------------------------------------------------------------------
+def _simple(name: str, kind: str, documentation: str, samples: List[Tuple[str, float]]) -> List[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{labels} {_number(value)}" for labels, value in samples)
+    return lines
+
+
+def _pool_metrics() -> List[str]:
+    from core.database import engine, replica_engine, get_pool_status
+
+    engines = [("primary", engine)]
+    if replica_engine is not engine:
+        engines.append(("replica", replica_engine))
+    statuses = [(name, get_pool_status(target)) for name, target in engines]
+
+    gauges = (
+        ("size", "aibio_db_pool_size", "Configured connection pool size"),
+        ("checked_out", "aibio_db_pool_checked_out", "Connections currently checked out"),
+        ("checked_in", "aibio_db_pool_checked_in", "Idle connections in the pool"),
+        ("overflow", "aibio_db_pool_overflow", "Overflow connections currently open"),
+    )
+    counters = (
+        ("checkouts", "aibio_db_pool_checkouts_total", "Connection checkouts"),
+        ("waits", "aibio_db_pool_waits_total", "Checkouts that had to wait for a connection"),
+        ("timeouts", "aibio_db_pool_timeouts_total", "Checkouts that timed out"),
+    )
+    lines: List[str] = []
+    for kind, metrics in (("gauge", gauges), ("counter", counters)):
+        for key, name, documentation in metrics:
+            samples = [(_labels(("engine",), (engine_name,)), status[key])
+                       for engine_name, status in statuses if key in status]
+            if samples:
+                lines.extend(_simple(name, kind, documentation, samples))
+    return lines
+
+
+def _cache_metrics() -> List[str]:
+    from utils.cache import backend
+
+    stats = backend.stats.snapshot()
+    labels = _labels(("backend",), (backend.name,))
+    lines: List[str] = []
+    for key in ("hits", "misses", "sets", "evictions", "errors"):
+        lines.extend(_simple(f"aibio_cache_{key}_total", "counter", f"Cache {key}", [(labels, stats[key])]))
+    lines.extend(_simple("aibio_cache_hit_ratio", "gauge", "Cache hit ratio since process start",
+                         [(labels, stats["hit_rate"])]))
+    return lines
+
+
+COLLECTORS: List[Callable[[], List[str]]] = [_pool_metrics, _cache_metrics]
+
+
+def is_authorized(authorization: Optional[str]) -> bool:
+    """METRICS_TOKEN을 설정했으면 Authorization: Bearer <token> 필요"""
+    if not settings.METRICS_TOKEN:
+        return True
+    expected = f"Bearer {settings.METRICS_TOKEN}"
+    return hmac.compare_digest((authorization or "").encode(), expected.encode())
+
+
+def render() -> str:
+    """Prometheus 텍스트 형식 전체 출력"""
+    lines: List[str] = []
+    lines.extend(REQUEST_DURATION.render())
+    lines.extend(REQUESTS_IN_FLIGHT.render())
+    lines.extend(JOB_DURATION.render())
+    for collector in COLLECTORS:
+        try:
+            lines.extend(collector())
+        except Exception as e:
+            # 수집 하나가 실패해도 나머지 메트릭은 내보냄
+            logger.warning(f"메트릭 수집 실패 ({collector.__name__}): {e}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,289 @@
+"""
+요청별 SQL 프로파일러 / 느린 쿼리 로그
+
+SQLAlchemy before/after_cursor_execute 이벤트로 모든 엔진의 쿼리 시간을 잰다.
+
+- 요청 처리 중 실행된 쿼리는 contextvar로 현재 요청의 RequestQueryProfile에 모은다
+  (def 핸들러는 스레드풀에서 돌지만 contextvar가 복사되므로 같은 프로필 객체에 쌓임)
+- SQL은 리터럴/바인드 파라미터/IN 목록을 ?로 바꾼 fingerprint로 묶는다 → 같은 fingerprint가 한 요청에서
+  여러 번 나오면 N+1 의심
+- 요청이 끝나면 main.py의 요청 로그에 쿼리 수/DB 시간/가장 느린 문장을 붙이고 라우트별 누적 통계에 반영
+  (GET /api/v1/system/query-profile)
+- SLOW_QUERY_MS 이상 걸린 문장은 요청 밖(스케줄러/워커)에서도 경고 로그로 남긴다
+"""
+import hashlib
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\([^)]+\)s|%s|\$\d+|(?<![:\w]):\w+|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(VALUES\s*\([^)]*\))(?:\s*,\s*\([^)]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+_current: ContextVar[Optional["RequestQueryProfile"]] = ContextVar("request_query_profile", default=None)
+
+
+def normalize_sql(statement: str) -> str:
+    """리터럴/파라미터를 ?로 바꾸고 IN (...)/다중 VALUES를 하나로 접은 SQL"""
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _WHITESPACE.sub(" ", sql).strip()
+    sql = _IN_LIST.sub("(?...)", sql)
+    sql = _VALUES_LIST.sub(r"\1, ...", sql)
+    return sql
+
+
+def fingerprint(normalized_sql: str) -> str:
+    return hashlib.md5(normalized_sql.encode()).hexdigest()[:12]
+
+
+class StatementStats:
+    """fingerprint 하나의 누적 통계"""
+
+    __slots__ = ("fingerprint", "sql", "count", "total_ms", "max_ms")
+
+    def __init__(self, fingerprint_id: str, sql: str):
+        self.fingerprint = fingerprint_id
+        self.sql = sql
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, count: int, total_ms: float, max_ms: float) -> None:
+        self.count += count
+        self.total_ms += total_ms
+        self.max_ms = max(self.max_ms, max_ms)
+
+    def to_dict(self, sql_chars: int = 500) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "sql": self.sql[:sql_chars],
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+        }
+
+
+class RequestQueryProfile:
+    """요청 하나에서 실행된 쿼리"""
+
+    def __init__(self, method: str, path: str):
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.query_count = 0
+        self.db_time_ms = 0.0
+        self.statements: Dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        normalized = normalize_sql(statement)
+        key = fingerprint(normalized)
+        with self._lock:
+            self.query_count += 1
+            self.db_time_ms += elapsed_ms
+            stats = self.statements.get(key)
+            if stats is None:
+                stats = self.statements[key] = StatementStats(key, normalized)
+            stats.add(1, elapsed_ms, elapsed_ms)
+
+    @property
+    def label(self) -> str:
+        return f"{self.method} {self.route or self.path}"
+
+    def slowest(self, limit: int) -> List[StatementStats]:
+        return sorted(self.statements.values(), key=lambda s: s.max_ms, reverse=True)[:limit]
+
+    def repeated(self, min_count: int = 2) -> List[StatementStats]:
+        """같은 문장을 여러 번 실행 (N+1 의심)"""
+        return sorted(
+            (s for s in self.statements.values() if s.count >= min_count),
+            key=lambda s: s.count, reverse=True
+        )
+
+    def summary(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        """요청 로그에 붙일 요약 (쿼리 수/DB 시간/가장 느린 문장)"""
+        if limit is None:
+            limit = settings.QUERY_PROFILER_TOP_STATEMENTS
+        return {
+            "db_query_count": self.query_count,
+            "db_time_ms": round(self.db_time_ms, 2),
+            "db_statements": [s.to_dict(sql_chars=200) for s in self.slowest(limit)],
+        }
+
+
+class RouteStats:
+    """라우트별 누적 통계"""
+
+    def __init__(self, label: str):
+        self.label = label
+        self.requests = 0
+        self.total_queries = 0
+        self.max_queries = 0
+        self.total_db_ms = 0.0
+        self.max_db_ms = 0.0
+        self.statements: Dict[str, StatementStats] = {}
+
+    def add(self, profile: RequestQueryProfile, max_statements: int) -> None:
+        self.requests += 1
+        self.total_queries += profile.query_count
+        self.max_queries = max(self.max_queries, profile.query_count)
+        self.total_db_ms += profile.db_time_ms
+        self.max_db_ms = max(self.max_db_ms, profile.db_time_ms)
+        for key, stats in profile.statements.items():
+            merged = self.statements.get(key)
+            if merged is None:
+                if len(self.statements) >= max_statements:
+                    continue
+                merged = self.statements[key] = StatementStats(key, stats.sql)
+            merged.add(stats.count, stats.total_ms, stats.max_ms)
+
+    def to_dict(self, top_statements: int) -> Dict[str, Any]:
+        requests = self.requests or 1
+        return {
+            "route": self.label,
+            "requests": self.requests,
+            "avg_queries": round(self.total_queries / requests, 2),
+            "max_queries": self.max_queries,
+            "avg_db_ms": round(self.total_db_ms / requests, 2),
+            "max_db_ms": round(self.max_db_ms, 2),
+            "total_db_ms": round(self.total_db_ms, 2),
+            "top_statements": [
+                s.to_dict() for s in sorted(self.statements.values(), key=lambda s: s.total_ms, reverse=True)[:top_statements]
+            ],
+        }
+
+
+class QueryProfileStore:
+    """프로세스 내 라우트별 누적 통계 (스레드 안전)"""
+
+    SORT_KEYS = {
+        "db_time": lambda r: r.total_db_ms,
+        "avg_db_time": lambda r: r.total_db_ms / (r.requests or 1),
+        "queries": lambda r: r.total_queries / (r.requests or 1),
+        "max_queries": lambda r: r.max_queries,
+    }
+
+    def __init__(self, max_routes: int = 500, max_statements_per_route: int = 50):
+        self._lock = threading.Lock()
+        self.max_routes = max_routes
+        self.max_statements_per_route = max_statements_per_route
+        self.routes: Dict[str, RouteStats] = {}
+        self.started_at = time.time()
+
+    def add(self, profile: RequestQueryProfile) -> None:
+        if not profile.query_count:
+            return
+        with self._lock:
+            stats = self.routes.get(profile.label)
+            if stats is None:
+                if len(self.routes) >= self.max_routes:
+                    return
+                stats = self.routes[profile.label] = RouteStats(profile.label)
+            stats.add(profile, self.max_statements_per_route)
+
+    def top(self, limit: int = 20, sort: str = "db_time", top_statements: int = 5) -> Dict[str, Any]:
+        key = self.SORT_KEYS.get(sort, self.SORT_KEYS["db_time"])
+        with self._lock:
+            routes = sorted(self.routes.values(), key=key, reverse=True)[:limit]
+            return {
+                "since": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started_at)),
+                "sort": sort if sort in self.SORT_KEYS else "db_time",
+                "routes": [route.to_dict(top_statements) for route in routes],
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes.clear()
+            self.started_at = time.time()
+
+
+store = QueryProfileStore()
+
+
+# ----------------------------------------------------------------------
+# 요청 범위
+# ----------------------------------------------------------------------
+def start_request(method: str, path: str):
+    """요청 시작 - contextvar 토큰 반환 (finish_request에 전달)"""
+    return _current.set(RequestQueryProfile(method, path))
+
+
+def current_profile() -> Optional[RequestQueryProfile]:
+    return _current.get()
+
+
+def finish_request(token, route: Optional[str] = None) -> Optional[RequestQueryProfile]:
+    """요청 종료 - 라우트별 통계에 반영하고 쿼리가 많은 요청은 경고 로그"""
+    profile = _current.get()
+    _current.reset(token)
+    if profile is None:
+        return None
+    profile.route = route
+    store.add(profile)
+
+    if profile.query_count >= settings.QUERY_PROFILER_MANY_QUERIES:
+        repeated = [f"{s.count}x {s.sql[:120]}" for s in profile.repeated()[:3]]
+        logger.warning(
+            f"Many queries: {profile.label} - {profile.query_count} queries, {profile.db_time_ms:.1f}ms",
+            extra={"path": profile.path, **profile.summary(),
+                   "repeated_statements": repeated}
+        )
+    return profile
+
+
+# ----------------------------------------------------------------------
+# SQLAlchemy 이벤트
+# ----------------------------------------------------------------------
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get("query_start_time")
+    if not starts:
+        return
+    elapsed_ms = (time.perf_counter() - starts.pop()) * 1000
+    if not settings.QUERY_PROFILER_ENABLED:
+        return
+
+    profile = _current.get()
+    if profile is not None:
+        profile.record(statement, elapsed_ms)
+
+    if settings.SLOW_QUERY_MS and elapsed_ms >= settings.SLOW_QUERY_MS:
+        normalized = normalize_sql(statement)
+        logger.warning(
+            f"Slow query ({elapsed_ms:.1f}ms): {normalized[:300]}",
+            extra={
+                "path": profile.path if profile else None,
+                "db_time_ms": round(elapsed_ms, 2),
+                "fingerprint": fingerprint(normalized),
+            }
+        )
+
+
+@event.listens_for(Engine, "handle_error")
+def _discard_failed_query(exception_context):
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 버림
+    conn = exception_context.connection
+    if conn is not None:
+        starts = conn.info.get("query_start_time")
+        if starts:
+            starts.pop()
@@ -0,0 +1,121 @@
+"""
+DB 스키마 생성 / 마이그레이션 / 기본 관리자 계정
+
+배포의 release(pre-deploy) 단계에서 한 번 실행한다 (python scripts/init_db.py).
+1. create_all: 없는 테이블 생성 (새 DB의 기본 스키마)
+2. alembic upgrade head: 기존 테이블의 컬럼/인덱스/제약 변경
+3. 기본 관리자 계정
+API 프로세스 시작 시에는 실행하지 않으므로 서버리스/scale-to-zero 콜드 스타트에서
+전체 모델 import + create_all + 마이그레이션 + 관리자 조회가 빠진다.
+로컬 개발처럼 매번 자동으로 만들고 싶으면 DB_CREATE_ALL_ON_STARTUP=true.
+"""
+import importlib
+import os
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# create_all이 모든 테이블을 알도록 import할 모델 모듈
+MODEL_MODULES = (
+    "models.user",
+    "models.customer",
+    "models.service",
+    "models.payment",
+    "models.package",
+    "models.lead_management",
+    "models.notification",
+    "models.reservation",
+    "models.kit",
+    "models.customer_extended",
+    "models.staff_schedule",
+    "models.inbody",
+    "models.system",
+    "models.audit",
+    "models.questionnaire",
+    "models.daily_rollup",
+    "models.message_outbox",
+    "models.job_schedule",
+    "models.report_render",
+)
+
+DEFAULT_ADMIN_EMAIL = "admin@aibio.kr"
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_all_models() -> None:
+    for module in MODEL_MODULES:
+        importlib.import_module(module)
+
+
+def create_tables(bind=None) -> None:
+    """없는 테이블 생성 (기존 테이블/데이터는 그대로)"""
+    from core.database import Base, engine
+
+    import_all_models()
+    logger.info("Creating database tables if they don't exist...")
+    Base.metadata.create_all(bind=bind or engine)
+    logger.info("Database tables created/verified successfully")
+
+
+def run_migrations(bind=None) -> None:
+    """alembic upgrade head (PostgreSQL 전용 마이그레이션이므로 다른 DB는 건너뜀)
+
+    버전이 기록되지 않은 기존 DB는 처음 리비전부터 적용된다.
+    컬럼/인덱스 추가는 IF NOT EXISTS라 create_all이 이미 만든 것은 건너뛴다.
+    """
+    from alembic import command
+    from alembic.config import Config
+    from core.database import engine
+
+    bind = bind or engine
+    if bind.dialect.name != "postgresql":
+        logger.info(f"Skipping alembic migrations on {bind.dialect.name}")
+        return
+    # ini 파일 없이 구성 - env.py의 fileConfig가 앱 로거 설정을 덮어쓰지 않도록
+    config = Config()
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    config.set_main_option("sqlalchemy.url", bind.url.render_as_string(hide_password=False).replace("%", "%%"))
+    logger.info("Running alembic upgrade head...")
+    command.upgrade(config, "head")
+    logger.info("Database migrations applied")
+
+
+def ensure_admin_user(bind=None) -> bool:
+    """기본 관리자 계정이 없으면 생성 - 생성했으면 True"""
+    from sqlalchemy.orm import Session
+    from core.auth import get_password_hash
+    from core.database import engine
+    from models.user import User
+
+    with Session(bind or engine) as db:
+        if db.query(User.user_id).filter(User.email == DEFAULT_ADMIN_EMAIL).first():
+            return False
+        db.add(User(
+            email=DEFAULT_ADMIN_EMAIL,
+            password_hash=get_password_hash("admin123"),
+            name="관리자",
+            role="admin",
+            is_active=True
+        ))
+        db.commit()
+        logger.info("Admin user created successfully")
+        return True
+
+
+def init_schema(bind=None) -> None:
+    create_tables(bind)
+    run_migrations(bind)
+    ensure_admin_user(bind)
+
+
+def init_schema_on_startup() -> None:
+    """DB_CREATE_ALL_ON_STARTUP=true일 때만 서버 시작 시 스키마 생성"""
+    if not settings.DB_CREATE_ALL_ON_STARTUP:
+        return
+    try:
+        init_schema()
+    except Exception as e:
+        logger.error(f"Error initializing database: {e}")
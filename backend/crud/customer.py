@@ -108,7 +108,11 @@ class CRUDCustomer(CRUDBase[Customer, CustomerCreate, CustomerUpdate]):
             if existing:
                 raise ErrorResponses.already_exists("고객", "전화번호", obj_in.phone)
         
-        return self.create(db, obj_in=obj_in)
+        db_obj = self.model(**obj_in.model_dump())
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
     
     def update_with_duplicate_check(
         self,
@@ -3,7 +3,7 @@ import os
 # Add backend directory to Python path for Railway deployment
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
@@ -24,6 +24,9 @@ setup_logging(
 
 logger = get_logger(__name__)
 
+from core import query_profiler  # SQL 이벤트 리스너 등록
+from core import metrics
+
 # 배포 버전 정보
 # Railway가 주입하는 실제 환경변수들
 COMMIT_SHA = os.getenv("RAILWAY_GIT_COMMIT_SHA",
@@ -38,60 +41,39 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up AIBIO Center Management System...")
 
-    # Initialize database tables
-    try:
-        from core.database import engine, Base
-        from models.user import User
-        from models.customer import Customer
-        from models.service import ServiceUsage, ServiceType
-        from models.payment import Payment
-        from models.package import Package, PackagePurchase
-        from models.lead_management import LeadConsultationHistory, ReregistrationCampaign, CampaignTarget
-        from models.notification import Notification, NotificationSettings
-        from models.reservation import Reservation
-        from models.kit import KitType, KitManagement
-        from models.customer_extended import CustomerPreference, CustomerAnalytics, MarketingLead, KitReceipt
-        from models.staff_schedule import StaffSchedule
-        from models.inbody import InBodyRecord
-        from models.system import SystemSettings, CompanyInfo, NotificationPreferences
-        from models.audit import AuditLog
-        from models.questionnaire import QuestionnaireTemplate, Question, QuestionnaireResponse, Answer, QuestionnaireAnalysis
-
-        logger.info("Creating database tables if they don't exist...")
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created/verified successfully")
-
-        # Create admin user if doesn't exist
-        from sqlalchemy.orm import Session
-        from core.auth import get_password_hash
-        with Session(engine) as db:
-            admin = db.query(User).filter(User.email == "admin@aibio.kr").first()
-            if not admin:
-                admin_user = User(
-                    email="admin@aibio.kr",
-                    password_hash=get_password_hash("admin123"),
-                    name="관리자",
-                    role="admin",
-                    is_active=True
-                )
-                db.add(admin_user)
-                db.commit()
-                logger.info("Admin user created successfully")
-    except Exception as e:
-        logger.error(f"Error initializing database: {e}")
+    # 동기 DB 핸들러용 스레드풀 크기 설정
+    from core.concurrency import configure_threadpool
+    configure_threadpool()
+
+    # 테이블 생성/관리자 계정은 배포 단계(python scripts/init_db.py)에서 실행
+    # (DB_CREATE_ALL_ON_STARTUP=true면 여기서도 실행 - 로컬 개발용)
+    from core.schema import init_schema_on_startup
+    init_schema_on_startup()
+
+    # 주기 작업 스케줄러 시작 (회원 등급 갱신, 패키지 만료 알림, 일일 리포트)
+    from services.job_scheduler import start_job_scheduler
+    await start_job_scheduler()
 
-    # 회원 등급 스케줄러 시작
-    from services.membership_scheduler import start_membership_scheduler
-    await start_membership_scheduler()
+    # SMS/알림톡 발송 대기열 워커 시작
+    from services.message_outbox_service import start_message_outbox_worker
+    await start_message_outbox_worker()
 
     yield
 
     # Shutdown
     logger.info("Shutting down...")
 
-    # 회원 등급 스케줄러 중지
-    from services.membership_scheduler import stop_membership_scheduler
-    stop_membership_scheduler()
+    # 주기 작업 스케줄러 중지
+    from services.job_scheduler import stop_job_scheduler
+    stop_job_scheduler()
+
+    # 발송 대기열 워커 중지
+    from services.message_outbox_service import stop_message_outbox_worker
+    stop_message_outbox_worker()
+
+    # 보고서 렌더링 프로세스 풀 종료
+    from services.report_render_service import stop_report_render_service
+    stop_report_render_service()
 
 app = FastAPI(
     title="AIBIO Center Management API",
@@ -219,27 +201,43 @@ async def log_requests(request: Request, call_next):
         }
     )
 
-    # Process request
-    response = await call_next(request)
+    # Process request (요청 중 실행된 SQL 수/시간 수집)
+    profile_token = query_profiler.start_request(request.method, request.url.path)
+    metrics.REQUESTS_IN_FLIGHT.inc()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        metrics.REQUESTS_IN_FLIGHT.dec()
+        route = getattr(request.scope.get("route"), "path", None)
+        metrics.observe_request(request.method, route, status_code, time.time() - start_time)
+        profile = query_profiler.finish_request(profile_token, route)
 
     # Calculate processing time
     process_time = time.time() - start_time
 
     # Log response
+    db_summary = profile.summary() if profile else {}
     logger.info(
         f"Request completed: {request.method} {request.url.path} - {response.status_code}",
         extra={
             "request_id": request_id,
             "method": request.method,
             "path": request.url.path,
+            "route": profile.route if profile else None,
             "status_code": response.status_code,
-            "process_time": process_time
+            "process_time": process_time,
+            **db_summary
         }
     )
 
     # Add custom headers
     response.headers["X-Request-ID"] = request_id
     response.headers["X-Process-Time"] = str(process_time)
+    if profile:
+        response.headers["X-DB-Query-Count"] = str(profile.query_count)
+        response.headers["X-DB-Time"] = f"{profile.db_time_ms:.1f}"
 
     return response
 
@@ -263,6 +261,13 @@ async def health_check():
         "build_time": BUILD_TIME
     }
 
+# Prometheus metrics endpoint
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint(request: Request):
+    if not metrics.is_authorized(request.headers.get("authorization")):
+        return Response("Forbidden\n", status_code=403, media_type="text/plain")
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
+
 # Include routers
 from api.v1 import customers, customer_packages, dashboard, services, payments, packages, reports, auth, notifications, settings
 from api.v1.reservations import router as reservations_router
@@ -11,6 +11,10 @@ from .customer_extended import CustomerPreference, CustomerAnalytics, MarketingL
 from .lead_management import LeadConsultationHistory, ReregistrationCampaign, CampaignTarget
 from .staff_schedule import StaffSchedule
 from .inbody import InBodyRecord
+from .daily_rollup import DailyRevenue, DailyVisits, DailyNewCustomers
+from .message_outbox import MessageOutbox
+from .job_schedule import JobLease, JobRun
+from .report_render import ReportRender
 
 __all__ = [
     'Customer',
@@ -39,5 +43,12 @@ __all__ = [
     'ReregistrationCampaign',
     'CampaignTarget',
     'StaffSchedule',
-    'InBodyRecord'
+    'InBodyRecord',
+    'DailyRevenue',
+    'DailyVisits',
+    'DailyNewCustomers',
+    'MessageOutbox',
+    'JobLease',
+    'JobRun',
+    'ReportRender'
 ]
\ No newline at end of file
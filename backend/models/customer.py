@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text, DECIMAL
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, DECIMAL, Index, Computed, DDL, event
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -20,8 +20,21 @@ class Customer(Base):
     health_concerns = Column(Text)
     notes = Column(Text)
     assigned_staff = Column(String(50))
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    # 목록 keyset 페이지네이션 (기본 정렬: 최신 등록순, created_at NOT NULL이라 역방향 인덱스 스캔)
+    __table_args__ = (
+        Index('idx_customers_created_at_id', 'created_at', 'customer_id'),
+        # 검색 (pg_trgm) - 기존 DB는 alembic 3f2a9c1d7b4e로 생성
+        Index('idx_customers_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('idx_customers_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+        Index('idx_customers_phone_digits_trgm', 'phone_digits', postgresql_using='gin',
+              postgresql_ops={'phone_digits': 'gin_trgm_ops'}),
+        Index('idx_customers_name_chosung_trgm', 'name_chosung', postgresql_using='gin',
+              postgresql_ops={'name_chosung': 'gin_trgm_ops'}),
+        Index('idx_customers_name_prefix', 'name', postgresql_ops={'name': 'text_pattern_ops'}),
+    )
     
     # 확장 컬럼 - 개인 정보
     birth_year = Column(Integer)
@@ -43,6 +56,10 @@ class Customer(Base):
     average_visit_interval = Column(Integer)  # 평균 방문 주기 (일)
     total_revenue = Column(DECIMAL(10, 2), default=0)
     average_satisfaction = Column(DECIMAL(3, 2))  # 1.00 ~ 5.00
+
+    # 검색용 생성 컬럼 (DB가 자동 계산 - 직접 쓰지 않음)
+    phone_digits = Column(Text, Computed("regexp_replace(coalesce(phone, ''), '[^0-9]', '', 'g')", persisted=True))
+    name_chosung = Column(Text, Computed("korean_chosung(name)", persisted=True))  # 홍길동 → ㅎㄱㄷ
     
     # Enhanced service relationships (commented out - models not yet implemented)
     # service_sessions = relationship("ServiceSession", back_populates="customer")
@@ -129,3 +146,36 @@ class Customer(Base):
         
         return self.customer_status
     
+
+
+# 이름 초성 추출 함수 (name_chosung 생성 컬럼에서 사용 - 테이블보다 먼저 생성)
+KOREAN_CHOSUNG_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION korean_chosung(input text) RETURNS text
+LANGUAGE plpgsql IMMUTABLE PARALLEL SAFE AS $$
+DECLARE
+    initials text[] := ARRAY['ㄱ','ㄲ','ㄴ','ㄷ','ㄸ','ㄹ','ㅁ','ㅂ','ㅃ','ㅅ','ㅆ','ㅇ','ㅈ','ㅉ','ㅊ','ㅋ','ㅌ','ㅍ','ㅎ'];
+    result text := '';
+    ch text;
+    code int;
+BEGIN
+    IF input IS NULL THEN
+        RETURN NULL;
+    END IF;
+    FOR i IN 1..char_length(input) LOOP
+        ch := substr(input, i, 1);
+        code := ascii(ch);
+        IF code BETWEEN 44032 AND 55203 THEN
+            result := result || initials[(code - 44032) / 588 + 1];
+        ELSE
+            result := result || ch;
+        END IF;
+    END LOOP;
+    RETURN result;
+END;
+$$
+""")
+event.listen(
+    Customer.__table__, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+event.listen(Customer.__table__, "before_create", KOREAN_CHOSUNG_FUNCTION.execute_if(dialect="postgresql"))
@@ -6,7 +6,7 @@
 - KitReceipt: 키트 수령 정보
 """
 
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text, Boolean, DECIMAL, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, Boolean, DECIMAL, ForeignKey, Index
 from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -97,8 +97,16 @@ class MarketingLead(Base):
     converted_customer_id = Column(Integer, ForeignKey("customers.customer_id"))
     
     # 타임스탬프
-    created_at = Column(DateTime, server_default=func.now())
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    # 목록 keyset 페이지네이션 (기본 정렬: 최신 등록순, created_at NOT NULL이라 역방향 인덱스 스캔)
+    # 핵심 지표 방문상담 기간 조회
+    __table_args__ = (
+        Index('idx_marketing_leads_created_at_id', 'created_at', 'lead_id'),
+        Index('idx_marketing_leads_visit_consult_date', 'visit_consult_date', 'registration_date',
+              postgresql_where=visit_consult_date.isnot(None)),
+    )
     
     # Relationships
     converted_customer = relationship("Customer", back_populates="lead_source")
@@ -0,0 +1,42 @@
+"""
+대시보드용 일별 집계(롤업) 모델
+- DailyRevenue: 일별 매출
+- DailyVisits: 일별 방문
+- DailyNewCustomers: 일별 신규 고객
+
+원본 테이블(payments, service_usage, customers)에서 날짜 단위로 재계산되며,
+대시보드는 전체 이력 대신 조회 기간의 일수만큼의 행만 읽는다.
+"""
+
+from sqlalchemy import Column, Integer, Date, DateTime, Numeric
+from sqlalchemy.sql import func
+from core.database import Base
+
+
+class DailyRevenue(Base):
+    """일별 매출 집계"""
+    __tablename__ = "daily_revenue"
+
+    stat_date = Column(Date, primary_key=True)
+    total_amount = Column(Numeric(14, 2), nullable=False, default=0)
+    payment_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class DailyVisits(Base):
+    """일별 방문 집계"""
+    __tablename__ = "daily_visits"
+
+    stat_date = Column(Date, primary_key=True)
+    visit_count = Column(Integer, nullable=False, default=0)  # 방문 고객 수 (중복 제외)
+    usage_count = Column(Integer, nullable=False, default=0)  # 서비스 이용 건수
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class DailyNewCustomers(Base):
+    """일별 신규 고객 집계 (첫 방문일 기준)"""
+    __tablename__ = "daily_new_customers"
+
+    stat_date = Column(Date, primary_key=True)
+    new_customer_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
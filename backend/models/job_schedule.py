@@ -0,0 +1,43 @@
+"""백그라운드 작업 스케줄 (노드 간 실행 임대 / 실행 이력)"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Index
+from sqlalchemy.sql import func
+from core.database import Base
+
+
+class JobLease(Base):
+    """
+    작업별 다음 실행 시각과 실행 임대(lease)
+
+    next_run_at이 지난 작업을 UPDATE ... WHERE 조건으로 먼저 가져간 노드만 실행한다.
+    (API 워커/스케줄러 프로세스가 여러 개여도 한 번만 실행)
+    """
+    __tablename__ = "job_leases"
+
+    job_name = Column(String(100), primary_key=True)
+    cron = Column(String(100), nullable=False)
+    next_run_at = Column(DateTime, nullable=False)
+    locked_by = Column(String(100))
+    locked_until = Column(DateTime)
+    last_started_at = Column(DateTime)
+    last_finished_at = Column(DateTime)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+
+class JobRun(Base):
+    """작업 실행 이력"""
+    __tablename__ = "job_runs"
+
+    run_id = Column(Integer, primary_key=True, index=True)
+    job_name = Column(String(100), nullable=False)
+    node = Column(String(100))
+    status = Column(String(20), nullable=False, default="running")  # running, succeeded, failed, abandoned
+    started_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime)
+    duration_ms = Column(Integer)
+    rows_affected = Column(Integer)
+    result = Column(JSON)
+    error_message = Column(Text)
+
+    __table_args__ = (
+        Index("idx_job_runs_job_started", "job_name", "started_at"),
+    )
@@ -0,0 +1,46 @@
+"""메시지 발송 대기열 (SMS/알림톡 아웃박스)"""
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.sql import func
+from core.database import Base
+
+
+class MessageOutbox(Base):
+    """
+    발송할 메시지 - 요청 트랜잭션 안에서 INSERT만 하고, 실제 발송은 백그라운드 워커가 처리
+
+    status: pending → sending → sent / failed (실패 시 next_attempt_at 이후 pending으로 재시도)
+    """
+    __tablename__ = "message_outbox"
+
+    outbox_id = Column(Integer, primary_key=True, index=True)
+    channel = Column(String(20), nullable=False)  # sms, alimtalk
+    purpose = Column(String(50), nullable=False)  # reservation_confirmation, reservation_reminder, bulk_sms ...
+
+    phone_number = Column(String(20), nullable=False)
+    recipient_name = Column(String(100))
+    customer_id = Column(Integer, ForeignKey("customers.customer_id"))
+    reservation_id = Column(Integer, ForeignKey("reservations.reservation_id"))
+
+    # 발송 내용 (알림톡은 content에 발송 이력용 요약을 저장)
+    title = Column(String(100))
+    content = Column(Text, nullable=False)
+    template_code = Column(String(50))
+    template_args = Column(JSON)
+    fallback_message = Column(Text)  # 알림톡 실패 시 SMS 대체 문구
+
+    # 발송 상태
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False)
+    locked_at = Column(DateTime)
+    provider_message_id = Column(String(100))
+    error_code = Column(String(50))
+    error_message = Column(Text)
+
+    created_at = Column(DateTime, server_default=func.now())
+    sent_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("idx_message_outbox_status_next", "status", "next_attempt_at"),
+        Index("idx_message_outbox_reservation", "reservation_id", "purpose"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from core.database import Base
@@ -23,5 +23,10 @@ class Payment(Base):
     created_at = Column(DateTime, server_default=func.now())
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
+    # 목록 keyset 페이지네이션 (결제일 + id 순)
+    __table_args__ = (
+        Index('idx_payments_payment_date_id', 'payment_date', 'payment_id'),
+    )
+
     # Relationships
     customer = relationship("Customer", backref="payments")
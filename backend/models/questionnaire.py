@@ -1,7 +1,7 @@
 """
 문진 관련 데이터베이스 모델
 """
-from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, DateTime, Float, Boolean, Text, JSON, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from enum import Enum
@@ -95,6 +95,7 @@ class QuestionnaireResponse(Base):
     completed_at = Column(DateTime(timezone=True))
     is_completed = Column(Boolean, default=False)
     completion_rate = Column(Float, default=0.0)  # 완료율 (0-100)
+    answered_count = Column(Integer, nullable=False, default=0, server_default="0")  # 답변한 질문 수 (답변 추가 시 증가)
     
     # 디바이스 정보
     device_id = Column(String(100))
@@ -140,6 +141,10 @@ class Answer(Base):
     response = relationship("QuestionnaireResponse", back_populates="answers")
     question = relationship("Question", back_populates="answers")
 
+    __table_args__ = (
+        Index("idx_answers_response_question", "response_id", "question_id"),
+    )
+
 
 class QuestionnaireAnalysis(Base):
     """문진 분석 결과 (추후 AI 분석용)"""
@@ -0,0 +1,39 @@
+"""렌더링된 보고서 PDF (캐시 + 비동기 생성 작업)"""
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, LargeBinary, ForeignKey, Index
+from sqlalchemy.orm import deferred
+from sqlalchemy.sql import func
+from core.database import Base
+
+
+class ReportRender(Base):
+    """
+    (보고서 종류, 기간, 데이터 버전)별 PDF 한 건
+
+    같은 키로 다시 요청하면 집계/렌더링 없이 저장된 PDF를 돌려준다.
+    비동기 생성 요청도 같은 행을 쓴다: status pending → running → succeeded / failed
+    """
+    __tablename__ = "report_renders"
+
+    render_id = Column(Integer, primary_key=True, index=True)
+    report_type = Column(String(50), nullable=False)  # monthly_revenue, customer_analysis
+    period_key = Column(String(50), nullable=False)  # 2025-06, 2025-04-01~2025-06-30
+    period_end = Column(Date, nullable=False)
+    data_version = Column(String(64), nullable=False)
+    filename = Column(String(200), nullable=False)
+
+    status = Column(String(20), nullable=False, default="pending")
+    # 상태 조회 때는 PDF 본문을 읽지 않음
+    pdf = deferred(Column(LargeBinary))
+    size_bytes = Column(Integer)
+    duration_ms = Column(Integer)
+    error_message = Column(Text)
+    requested_by = Column(Integer, ForeignKey("users.user_id"))
+
+    created_at = Column(DateTime, server_default=func.now())
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+    __table_args__ = (
+        Index("uq_report_renders_key", "report_type", "period_key", "data_version", unique=True),
+        Index("idx_report_renders_period", "report_type", "period_key", "finished_at"),
+    )
@@ -1,62 +1,62 @@
-"""스케줄러 실행 스크립트"""
-import schedule
-import time
-from datetime import datetime
-from services.scheduled_tasks import ScheduledTasks
+"""
+주기 작업 스케줄러 실행 스크립트 (API 프로세스와 분리해서 실행할 때)
+
+API 서버는 JOB_SCHEDULER_ENABLED=false 로 두고 이 스크립트를 띄운다.
+job_leases로 실행 권한을 나누므로 여러 개를 띄워도 작업은 한 번만 실행된다.
+
+    python run_scheduler.py                              # 계속 실행
+    python run_scheduler.py --list                       # 등록 작업/최근 실행 이력
+    python run_scheduler.py --run package_expiry_check   # 지금 바로 한 번 실행
+"""
+import argparse
+import asyncio
+import json
+import os
+
+from core.database import SessionLocal
 from core.logging_config import setup_logging, get_logger
+from services.job_scheduler import JobScheduler, JobSchedulerWorker
 
-# 로깅 설정
-setup_logging()
 logger = get_logger(__name__)
 
 
-def run_package_expiry_check():
-    """패키지 만료 확인 작업 실행"""
-    logger.info("패키지 만료 확인 작업 시작")
-    ScheduledTasks.check_package_expiry()
-
-
-def run_daily_report():
-    """일일 리포트 작업 실행"""
-    logger.info("일일 리포트 작업 시작")
-    ScheduledTasks.send_daily_report()
-
-
-def setup_schedule():
-    """스케줄 설정"""
-    # 매일 오전 9시에 패키지 만료 확인
-    schedule.every().day.at("09:00").do(run_package_expiry_check)
-    
-    # 매일 오전 8시에 일일 리포트
-    schedule.every().day.at("08:00").do(run_daily_report)
-    
-    # 테스트를 위한 즉시 실행 (개발 중)
-    # run_package_expiry_check()
-    # run_daily_report()
-    
-    logger.info("스케줄러 설정 완료")
-    logger.info(f"다음 실행 시간: {schedule.next_run()}")
-
-
 def main():
     """메인 실행 함수"""
-    logger.info("알림 스케줄러 시작")
-    
-    # 스케줄 설정
-    setup_schedule()
-    
-    # 무한 루프로 스케줄 실행
-    while True:
+    parser = argparse.ArgumentParser(description="주기 작업 스케줄러")
+    parser.add_argument("--run", metavar="JOB", help="작업 하나를 실행 시각과 무관하게 바로 실행하고 종료")
+    parser.add_argument("--list", action="store_true", help="등록 작업과 최근 실행 이력 출력")
+    args = parser.parse_args()
+
+    setup_logging(log_level=os.getenv("LOG_LEVEL", "INFO"))
+    scheduler = JobScheduler()
+    scheduler.sync_jobs()
+
+    if args.list:
+        with SessionLocal() as db:
+            print(json.dumps(scheduler.status(db), ensure_ascii=False, indent=2, default=str))
+        return
+
+    if args.run:
+        job = scheduler.jobs.get(args.run)
+        if job is None:
+            raise SystemExit(f"등록되지 않은 작업: {args.run} (가능: {', '.join(scheduler.jobs)})")
         try:
-            schedule.run_pending()
-            time.sleep(60)  # 1분마다 체크
-        except KeyboardInterrupt:
-            logger.info("스케줄러 종료")
-            break
-        except Exception as e:
-            logger.error(f"스케줄러 오류: {str(e)}")
-            time.sleep(60)
+            result = scheduler.run_job(job, force=True)
+        finally:
+            scheduler.shutdown()
+        if result is None:
+            raise SystemExit(f"{args.run}: 다른 노드에서 실행 중")
+        print(json.dumps(result, ensure_ascii=False, indent=2, default=str))
+        return
+
+    logger.info("작업 스케줄러 시작 (standalone)")
+    worker = JobSchedulerWorker(scheduler)
+    try:
+        asyncio.run(worker.start())
+    except KeyboardInterrupt:
+        worker.stop()
+        logger.info("스케줄러 종료")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -136,6 +136,7 @@ class QuestionnaireResponse(QuestionnaireResponseBase):
     completed_at: Optional[datetime] = None
     is_completed: bool = False
     completion_rate: float = 0.0
+    answered_count: int = 0
     answers: List[Answer] = []
 
     class Config:
@@ -167,6 +168,14 @@ class QuestionnaireTemplate(QuestionnaireTemplateBase):
         from_attributes = True
 
 
+# 섹션별 진행 상태
+class SectionProgress(BaseModel):
+    """섹션별 답변 수"""
+    section: QuestionnaireSection
+    answered: int
+    total: int
+
+
 # 문진 진행 상태
 class QuestionnaireProgress(BaseModel):
     """문진 진행 상태"""
@@ -177,6 +186,7 @@ class QuestionnaireProgress(BaseModel):
     completion_rate: float
     next_question: Optional[Question] = None
     estimated_time_remaining: int  # 예상 남은 시간 (초)
+    sections: List[SectionProgress] = []
 
 
 # 문진 분석 결과
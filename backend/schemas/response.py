@@ -32,12 +32,13 @@ class PaginatedResponse(BaseModel, Generic[T]):
     """
     success: bool = True
     data: List[T]
-    total: int
-    page: int
+    total: Optional[int]  # count=none이면 None
+    page: Optional[int]  # 커서 모드에서는 None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int]
     has_next: bool
     has_prev: bool
+    next_cursor: Optional[str] = None  # 커서 모드에서 다음 페이지 커서
     message: Optional[str] = None
     timestamp: datetime = datetime.now()
     
@@ -45,24 +46,52 @@ class PaginatedResponse(BaseModel, Generic[T]):
     def create(
         cls,
         data: List[T],
-        total: int,
+        total: Optional[int],
         page: int,
         page_size: int,
         message: Optional[str] = None
     ) -> "PaginatedResponse[T]":
-        """페이지네이션 응답 생성 헬퍼"""
-        total_pages = (total + page_size - 1) // page_size
+        """페이지네이션 응답 생성 헬퍼 (total이 None이면 현재 페이지가 가득 찼는지로 다음 페이지 판단)"""
+        if total is None:
+            total_pages = None
+            has_next = len(data) >= page_size
+        else:
+            total_pages = (total + page_size - 1) // page_size
+            has_next = page < total_pages
         return cls(
             data=data,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
-            has_next=page < total_pages,
+            has_next=has_next,
             has_prev=page > 1,
             message=message
         )
 
+    @classmethod
+    def create_cursor(
+        cls,
+        data: List[T],
+        page_size: int,
+        next_cursor: Optional[str],
+        has_prev: bool,
+        total: Optional[int] = None,
+        message: Optional[str] = None
+    ) -> "PaginatedResponse[T]":
+        """커서 페이지네이션 응답 생성 헬퍼"""
+        return cls(
+            data=data,
+            total=total,
+            page=None,
+            page_size=page_size,
+            total_pages=(total + page_size - 1) // page_size if total is not None else None,
+            has_next=next_cursor is not None,
+            has_prev=has_prev,
+            next_cursor=next_cursor,
+            message=message
+        )
+
 
 class ErrorResponse(BaseModel):
     """
@@ -122,7 +151,7 @@ def error_response(
 
 def paginated_response(
     data: List[T],
-    total: int,
+    total: Optional[int],
     page: int = 1,
     page_size: int = 20,
     message: Optional[str] = None
@@ -134,4 +163,23 @@ def paginated_response(
         page=page,
         page_size=page_size,
         message=message
+    )
+
+
+def cursor_paginated_response(
+    data: List[T],
+    page_size: int,
+    next_cursor: Optional[str],
+    has_prev: bool = False,
+    total: Optional[int] = None,
+    message: Optional[str] = None
+) -> PaginatedResponse[T]:
+    """커서 페이지네이션 응답 생성"""
+    return PaginatedResponse.create_cursor(
+        data=data,
+        page_size=page_size,
+        next_cursor=next_cursor,
+        has_prev=has_prev,
+        total=total,
+        message=message
     )
\ No newline at end of file
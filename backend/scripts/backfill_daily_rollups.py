@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+대시보드 일별 집계(daily_revenue / daily_visits / daily_new_customers) 백필 스크립트
+
+사용법:
+    python scripts/backfill_daily_rollups.py                      # 전체 이력 재생성
+    python scripts/backfill_daily_rollups.py --start 2025-01-01   # 특정 날짜 이후만
+    python scripts/backfill_daily_rollups.py --start 2025-06-01 --end 2025-06-30
+"""
+
+import sys
+import os
+import argparse
+from datetime import date
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import engine, SessionLocal
+from models.daily_rollup import DailyRevenue, DailyVisits, DailyNewCustomers
+from services.daily_rollup_service import DailyRollupService
+
+
+def backfill_daily_rollups(start_date: date = None, end_date: date = None):
+    """일별 집계 테이블 생성 및 재계산"""
+    # 집계 테이블이 없으면 생성
+    for model in (DailyRevenue, DailyVisits, DailyNewCustomers):
+        model.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        counts = DailyRollupService(db).backfill(start_date, end_date)
+        db.commit()
+        for table_name, count in counts.items():
+            print(f"✅ {table_name}: {count}일 집계")
+    except Exception as e:
+        db.rollback()
+        print(f"❌ 백필 실패: {e}")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="대시보드 일별 집계 백필")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="종료일 (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    print("🚀 일별 집계 백필을 시작합니다...")
+    backfill_daily_rollups(args.start, args.end)
+    print("✨ 작업 완료!")
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+인증 사용자 캐시 벤치마크
+
+요청 하나의 인증 단계(세션 생성 → get_current_user → 세션 종료)를 반복하면서
+캐시를 끈 경우(매 요청 users 조회)와 켠 경우의 요청당 시간/쿼리 수를 비교한다.
+
+    python scripts/benchmark_auth_cache.py                      # DATABASE_URL의 활성 사용자로 측정
+    python scripts/benchmark_auth_cache.py --email admin@aibio.kr --requests 5000
+    python scripts/benchmark_auth_cache.py --sqlite --rtt-ms 1  # DB 없이 (원격 DB 왕복 1ms 가정)
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+import core.auth as auth
+from core.auth import PrincipalCache, create_access_token, get_current_user
+from models.user import User
+
+
+def _sqlite_session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    User.__table__.create(engine)
+    factory = sessionmaker(bind=engine)
+    with factory() as db:
+        db.add(User(email="bench@aibio.kr", password_hash="x", name="벤치", role="admin", is_active=True))
+        db.commit()
+    return engine, factory
+
+
+def run(factory, token: str, requests: int) -> List[float]:
+    timings = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        db = factory()
+        try:
+            get_current_user(token, db)
+        finally:
+            db.close()
+        timings.append((time.perf_counter() - started) * 1e6)
+    return timings
+
+
+def fmt(timings: List[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered):8.1f}µs  p95={p95:8.1f}µs  avg={statistics.mean(ordered):8.1f}µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 사용자 캐시 벤치마크")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--email", help="측정에 쓸 사용자 (기본: 첫 번째 활성 사용자)")
+    parser.add_argument("--sqlite", action="store_true", help="메모리 SQLite에 임시 사용자를 만들어 측정")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="쿼리마다 더할 네트워크 왕복 지연 (SQLite 모드용)")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        engine, factory = _sqlite_session_factory()
+    else:
+        from core.database import SessionLocal, engine
+        factory = SessionLocal
+
+    queries = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        queries["count"] += 1
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+
+    with factory() as db:
+        query = select(User.email).where(User.is_active == True)  # noqa: E712
+        if args.email:
+            query = query.where(User.email == args.email)
+        email = db.execute(query.limit(1)).scalar()
+    if email is None:
+        raise SystemExit("활성 사용자가 없습니다 (--email 확인 또는 --sqlite 사용)")
+    token = create_access_token({"sub": email})
+
+    results = {}
+    for label, ttl in (("no cache", 0), ("principal cache", 60)):
+        auth.principal_cache = PrincipalCache(ttl_seconds=ttl)
+        run(factory, token, 50)  # 워밍업 (커넥션 풀/첫 조회)
+        queries["count"] = 0
+        timings = run(factory, token, args.requests)
+        results[label] = timings
+        print(f"{label:16s} {fmt(timings)}  queries/request={queries['count'] / args.requests:.2f}")
+
+    saved = statistics.mean(results["no cache"]) - statistics.mean(results["principal cache"])
+    print(f"\n요청당 절약: {saved:.1f}µs (캐시 {auth.principal_cache.stats()})")
+
+
+if __name__ == "__main__":
+    main()
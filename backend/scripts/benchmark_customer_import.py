@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+고객 엑셀 가져오기 벤치마크 (합성 고객 50,000행)
+
+기존 방식(iterrows + ExcelHandler 행 단위 정규화)과
+새 방식(services.customer_import_service 컬럼 단위 정규화)을 비교한다.
+
+    python scripts/benchmark_customer_import.py
+    python scripts/benchmark_customer_import.py --rows 10000 --db
+
+--db: 실제 DB에 가져오기까지 측정 (전화번호 010-00xx-xxxx 대역 사용, 측정 후 삭제)
+      기존 방식의 DB 저장(행마다 조회 + 커밋)은 --legacy-db-rows 행만 실행해 전체 시간을 추정
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from services.customer_import_service import CustomerImportService, prepare_customer_frame, COLUMN_MAPPING
+from utils.excel import ExcelHandler
+
+REGIONS = ["서울", "경기", "인천", "부산", "대구", "광주"]
+SOURCES = ["지인소개", "검색", "인스타그램", "유튜브", "당근"]
+BENCH_PHONE_PREFIX = "01000"  # 010-00xx-xxxx: 실제로 발급되지 않는 대역
+
+
+def synthetic_ledger(count: int) -> pd.DataFrame:
+    """고객관리대장과 비슷한 형식이 섞인 합성 데이터"""
+    rng = random.Random(7)
+    start = datetime(2022, 1, 1)
+    rows = []
+    for i in range(count):
+        visit = start + timedelta(days=i % 1000)
+        phone = f"{BENCH_PHONE_PREFIX}{i:06d}"
+        rows.append({
+            "성함": f"고객{i}",
+            "연락처": rng.choice([phone, f"{phone[:3]}-{phone[3:7]}-{phone[7:]}", f"{phone[:3]} {phone[3:7]} {phone[7:]}"]),
+            "첫방문일": rng.choice([
+                visit,
+                visit.strftime("%Y-%m-%d"),
+                visit.strftime("%Y.%m.%d"),
+                f"{visit.year}년 {visit.month}월 {visit.day}일",
+                (visit - datetime(1899, 12, 30)).days,
+            ]),
+            "생년월일": rng.choice([rng.randint(1950, 2005), f"{rng.randint(1950, 2005)}-03-01", None]),
+            "거주지역": rng.choice(REGIONS),
+            "방문경로": rng.choice(SOURCES),
+            "비고(메모)": rng.choice(["", "상담 희망", None]),
+        })
+    return pd.DataFrame(rows)
+
+
+def legacy_normalize(df: pd.DataFrame):
+    """변경 전 import_customers_from_excel의 행 단위 정규화"""
+    records = []
+    for _, row in df.iterrows():
+        records.append({
+            'name': ExcelHandler.clean_string(row.get('이름')),
+            'phone': ExcelHandler.clean_phone(row.get('전화번호')),
+            'birth_year': ExcelHandler.parse_year(row.get('생년월일')),
+            'region': ExcelHandler.clean_string(row.get('지역')),
+            'referral_source': ExcelHandler.clean_string(row.get('유입경로')),
+            'notes': ExcelHandler.clean_string(row.get('메모')),
+            'first_visit_date': ExcelHandler.parse_date(row.get('첫방문일자')),
+        })
+    return records
+
+
+def timed(label: str, rows: int, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed:8.2f}s  ({rows / elapsed:,.0f} rows/s)")
+    return result, elapsed
+
+
+def cleanup(db) -> None:
+    from sqlalchemy import delete
+    from models.customer import Customer
+    from services.daily_rollup_service import DailyRollupService
+
+    dates = [row[0] for row in db.query(Customer.first_visit_date).filter(
+        Customer.phone.like(f"{BENCH_PHONE_PREFIX}%") | Customer.phone.like("010-00%")
+    ).distinct()]
+    db.execute(delete(Customer).where(
+        Customer.phone.like(f"{BENCH_PHONE_PREFIX}%") | Customer.phone.like("010-00%")
+    ))
+    DailyRollupService(db).refresh_new_customers(dates)
+    db.commit()
+
+
+def legacy_db_import(db, df: pd.DataFrame) -> None:
+    """변경 전 DB 저장 방식 (행마다 전화번호 조회 + 개별 커밋)"""
+    from models.customer import Customer
+    for record in legacy_normalize(df):
+        record = {k: v for k, v in record.items() if v is not None}
+        if record.get('phone') and db.query(Customer).filter(Customer.phone == record['phone']).first():
+            continue
+        db.add(Customer(**record))
+        db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고객 엑셀 가져오기 벤치마크")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--db", action="store_true", help="DB 저장까지 측정 (측정 데이터는 삭제)")
+    parser.add_argument("--legacy-db-rows", type=int, default=1000, help="기존 DB 저장 방식으로 실행할 행 수")
+    args = parser.parse_args()
+
+    df = synthetic_ledger(args.rows)
+    mapped = df.rename(columns=COLUMN_MAPPING)
+    print(f"🚀 고객 가져오기 벤치마크: {args.rows:,}행")
+
+    print("\n[정규화]")
+    legacy, legacy_seconds = timed("기존 (iterrows)", args.rows, lambda: legacy_normalize(mapped))
+    (frame, _), new_seconds = timed("신규 (컬럼 단위)", args.rows, lambda: prepare_customer_frame(mapped))
+    mismatches = sum(
+        1 for record, phone in zip(legacy, frame['phone']) if record['phone'] != phone
+    )
+    print(f"  → {legacy_seconds / new_seconds:.1f}배, 전화번호 결과 불일치 {mismatches}건")
+
+    if not args.db:
+        return
+
+    from core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        cleanup(db)
+        print("\n[DB 저장]")
+        sample = mapped.head(args.legacy_db_rows)
+        _, legacy_db_seconds = timed(f"기존 ({len(sample):,}행 실행)", len(sample), lambda: legacy_db_import(db, sample))
+        print(f"  → {args.rows:,}행 추정 {legacy_db_seconds * args.rows / max(len(sample), 1):,.0f}s")
+        cleanup(db)
+
+        service = CustomerImportService(db)
+        result, _ = timed("신규 (skip, 전체 신규)", args.rows, lambda: service.import_dataframe(df))
+        print(f"  → 신규 {result['inserted_count']:,} / 오류 {result['error_count']:,}")
+        result, _ = timed("신규 (update, 전체 기존)", args.rows, lambda: service.import_dataframe(df, on_duplicate="update"))
+        print(f"  → 갱신 {result['updated_count']:,} / 오류 {result['error_count']:,}")
+    finally:
+        cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
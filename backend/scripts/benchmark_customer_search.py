@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+고객 검색 벤치마크
+
+기존 목록 검색(contains = '%검색어%' LIKE 3개 OR)과
+새 검색(pg_trgm 인덱스 / phone_digits / 초성)을 같은 검색어로 비교한다.
+
+    python scripts/benchmark_customer_search.py
+    python scripts/benchmark_customer_search.py --terms 홍길 5678 ㅎㄱㄷ --repeat 50 --explain
+
+사전 조건: alembic upgrade head (3f2a9c1d7b4e 이상) 적용된 PostgreSQL
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, func, or_, and_
+
+from core.database import SessionLocal
+from models.customer import Customer
+from services.customer_search_service import CustomerSearchService, to_chosung
+
+
+def legacy_condition(search: str):
+    """변경 전 read_customers 검색 조건"""
+    return or_(
+        Customer.name.contains(search),
+        Customer.phone.contains(search),
+        and_(Customer.email.is_not(None), Customer.email.contains(search))
+    )
+
+
+def sample_terms(db, count: int) -> List[str]:
+    """실제 데이터에서 검색어 샘플링 (이름 앞 2자, 전화 뒷 4자리, 초성, 이메일 앞부분)"""
+    rows = db.execute(
+        select(Customer.name, Customer.phone, Customer.email).order_by(func.random()).limit(count)
+    ).all()
+    terms = []
+    for row in rows:
+        if row.name:
+            terms.append(row.name[:2])
+            terms.append(to_chosung(row.name))
+        if row.phone:
+            terms.append(row.phone[-4:])
+        if row.email:
+            terms.append(row.email.split("@")[0][:4])
+    random.shuffle(terms)
+    return terms
+
+
+def measure(func_: Callable[[], object], repeat: int) -> List[float]:
+    func_()  # 워밍업 (플랜 캐시/버퍼)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func_()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def fmt(timings: List[float]) -> str:
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"p50={statistics.median(ordered):7.2f}ms  p95={p95:7.2f}ms"
+
+
+def explain(db, stmt) -> None:
+    compiled = stmt.compile(db.get_bind())
+    plan = db.connection().exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}", compiled.params).scalars().all()
+    for line in plan[:8]:
+        print(f"      {line}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="고객 검색 벤치마크")
+    parser.add_argument("--terms", nargs="*", help="검색어 (미지정 시 DB에서 샘플링)")
+    parser.add_argument("--samples", type=int, default=3, help="샘플링할 고객 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--explain", action="store_true", help="EXPLAIN ANALYZE 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        total_customers = db.execute(select(func.count(Customer.customer_id))).scalar()
+        terms = args.terms or sample_terms(db, args.samples)
+        service = CustomerSearchService(db)
+        print(f"🚀 고객 {total_customers:,}명, 검색어 {len(terms)}개, 반복 {args.repeat}회")
+
+        def page_query(condition):
+            return (
+                select(Customer)
+                .where(condition)
+                .order_by(Customer.created_at.desc())
+                .limit(args.limit)
+            )
+
+        def count_query(condition):
+            return select(func.count()).select_from(Customer).where(condition)
+
+        summary = {"legacy": [], "new": []}
+        for term in terms:
+            legacy = legacy_condition(term)
+            new = CustomerSearchService.build_condition(term)
+
+            legacy_total = db.execute(count_query(legacy)).scalar()
+            new_total = db.execute(count_query(new)).scalar()
+            print(f"\n▶ '{term}'  (기존 {legacy_total}건 / 신규 {new_total}건)")
+
+            legacy_timings = measure(
+                lambda: (db.execute(count_query(legacy)).scalar(), db.execute(page_query(legacy)).all()),
+                args.repeat
+            )
+            new_timings = measure(
+                lambda: (db.execute(count_query(new)).scalar(), db.execute(page_query(new)).all()),
+                args.repeat
+            )
+            ranked_timings = measure(lambda: service.search(term, args.limit), args.repeat)
+            summary["legacy"].extend(legacy_timings)
+            summary["new"].extend(new_timings)
+
+            print(f"   기존 목록 검색 (count+page)  {fmt(legacy_timings)}")
+            print(f"   신규 목록 검색 (count+page)  {fmt(new_timings)}")
+            print(f"   /customers/search (랭킹)     {fmt(ranked_timings)}")
+
+            if args.explain:
+                print("   [기존 플랜]")
+                explain(db, page_query(legacy))
+                print("   [신규 플랜]")
+                explain(db, page_query(new))
+
+        if terms:
+            print("\n📊 전체")
+            print(f"   기존  {fmt(summary['legacy'])}")
+            print(f"   신규  {fmt(summary['new'])}")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
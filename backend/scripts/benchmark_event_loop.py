@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+이벤트 루프 블로킹 벤치마크
+
+느린 동기 DB 작업(분석 쿼리 등)이 섞인 부하에서 가벼운 요청의 p99 지연이
+유지되는지 측정한다.
+
+모드:
+    python scripts/benchmark_event_loop.py
+        내장 데모 앱으로 비교. 같은 블로킹 작업을
+        - async def 핸들러에서 직접 실행 (이전 방식)
+        - def 핸들러로 선언해 스레드풀에서 실행 (현재 방식)
+        으로 실행하면서 /ping 지연 분포를 비교한다.
+
+    python scripts/benchmark_event_loop.py --base-url http://localhost:8000 --token <JWT>
+        실행 중인 서버에 고객 분석(느린 요청) + /health(빠른 요청) 혼합 부하를 건다.
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import threading
+import time
+from typing import List, Dict
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label: str, latencies: List[float]) -> Dict[str, float]:
+    result = {
+        "count": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000 if latencies else 0.0,
+        "mean_ms": statistics.mean(latencies) * 1000 if latencies else 0.0,
+    }
+    print(
+        f"  {label:<28} n={result['count']:<5} "
+        f"p50={result['p50_ms']:7.1f}ms  p95={result['p95_ms']:7.1f}ms  "
+        f"p99={result['p99_ms']:7.1f}ms  max={result['max_ms']:7.1f}ms"
+    )
+    return result
+
+
+async def mixed_load(
+    base_url: str,
+    slow_path: str,
+    fast_path: str,
+    headers: Dict[str, str],
+    slow_concurrency: int,
+    duration: float
+) -> Dict[str, List[float]]:
+    """느린 요청을 slow_concurrency개 동시에 계속 보내면서 빠른 요청 지연 측정"""
+    fast_latencies: List[float] = []
+    slow_latencies: List[float] = []
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, timeout=60) as client:
+        async def slow_worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get(slow_path)
+                slow_latencies.append(time.perf_counter() - started)
+
+        async def fast_worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get(fast_path)
+                fast_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(
+            *(slow_worker() for _ in range(slow_concurrency)),
+            fast_worker()
+        )
+
+    return {"fast": fast_latencies, "slow": slow_latencies}
+
+
+def build_demo_app(work_seconds: float):
+    """블로킹 작업을 async/def 두 방식으로 노출하는 데모 앱"""
+    from fastapi import FastAPI
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/blocking-async")
+    async def blocking_async():
+        time.sleep(work_seconds)  # async def 안의 동기 DB 호출과 동일한 효과
+        return {"mode": "async"}
+
+    @app.get("/threaded")
+    def threaded():
+        time.sleep(work_seconds)  # def 핸들러 - 스레드풀에서 실행
+        return {"mode": "threadpool"}
+
+    return app
+
+
+def run_demo(args) -> None:
+    import uvicorn
+
+    app = build_demo_app(args.work_ms / 1000)
+    config = uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    print(f"🚀 데모 벤치마크: 블로킹 작업 {args.work_ms}ms x 동시 {args.concurrency}개, {args.duration}s")
+    try:
+        for label, path in (("async def (블로킹)", "/blocking-async"), ("def (스레드풀)", "/threaded")):
+            result = asyncio.run(mixed_load(base_url, path, "/ping", {}, args.concurrency, args.duration))
+            print(f"\n▶ {label}")
+            summarize("/ping (빠른 요청)", result["fast"])
+            summarize(f"{path} (느린 요청)", result["slow"])
+    finally:
+        server.should_exit = True
+        thread.join(timeout=5)
+
+
+def run_live(args) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+    print(f"🚀 서버 벤치마크: {args.base_url}{args.slow_path} x 동시 {args.concurrency}개, {args.duration}s")
+    result = asyncio.run(
+        mixed_load(args.base_url, args.slow_path, args.fast_path, headers, args.concurrency, args.duration)
+    )
+    summarize(f"{args.fast_path} (빠른 요청)", result["fast"])
+    summarize(f"{args.slow_path} (느린 요청)", result["slow"])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이벤트 루프 블로킹 벤치마크")
+    parser.add_argument("--base-url", default=None, help="실행 중인 서버 주소 (미지정 시 데모 모드)")
+    parser.add_argument("--token", default=None, help="인증 토큰")
+    parser.add_argument("--slow-path", default="/api/v1/customers/1/analytics")
+    parser.add_argument("--fast-path", default="/health")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--work-ms", type=int, default=200, help="데모 모드 블로킹 작업 시간")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    if args.base_url:
+        run_live(args)
+    else:
+        run_demo(args)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+결제 내보내기 벤치마크 (합성 결제 500,000건)
+
+기존 방식(전체 행 → pandas DataFrame → ExcelWriter)과
+스트리밍 방식(utils.export_stream의 write-only 엑셀 / 청크 CSV)을 비교한다.
+각 방식은 별도 프로세스에서 실행해 최대 RSS(메모리)를 따로 측정한다.
+
+    python scripts/benchmark_export.py
+    python scripts/benchmark_export.py --rows 100000 --modes stream_xlsx stream_csv
+    python scripts/benchmark_export.py --db          # 실제 DB 결제 테이블로 스트리밍 측정
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Iterator, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+MODES = ("legacy_pandas", "stream_xlsx", "stream_csv")
+METHODS = ["card", "transfer", "cash"]
+TYPES = ["package", "single", "additional"]
+STAFF = ["김직원", "이직원", "박직원", "최직원"]
+
+
+def synthetic_payments(count: int) -> Iterator[List]:
+    """결제 내보내기 행과 같은 모양의 합성 데이터"""
+    rng = random.Random(42)
+    start = date(2023, 1, 1)
+    created = datetime(2023, 1, 1, 9, 0, 0)
+    for i in range(count):
+        yield [
+            f"PAY-2025-{i + 1:06d}",
+            i + 1,
+            (start + timedelta(days=i % 900)).strftime("%Y-%m-%d"),
+            f"고객{i % 20000}",
+            f"010-{rng.randint(1000, 9999)}-{rng.randint(1000, 9999)}",
+            float(rng.choice([50000, 110000, 330000, 990000])),
+            rng.choice(METHODS),
+            rng.choice(TYPES),
+            "completed",
+            rng.choice(STAFF),
+            f"{rng.randint(10000000, 99999999)}",
+            "",
+            "브레인 패키지",
+            1,
+            "",
+            (created + timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"),
+        ]
+
+
+def _peak_rss_mb() -> float:
+    # Linux: KB 단위
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_mode(mode: str, rows: int, use_db: bool, queue) -> None:
+    from utils.export_stream import csv_chunks, xlsx_chunks
+
+    baseline = _peak_rss_mb()
+    columns = _payment_columns()
+    started = time.perf_counter()
+    size = 0
+
+    if use_db:
+        source = _db_rows()
+    else:
+        source = synthetic_payments(rows)
+
+    if mode == "legacy_pandas":
+        import io
+        import pandas as pd
+        headers = [column.header for column in columns]
+        df = pd.DataFrame([dict(zip(headers, row)) for row in source])
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine="openpyxl") as writer:
+            df.to_excel(writer, index=False, sheet_name="결제내역")
+        size = len(output.getvalue())
+    else:
+        chunks = xlsx_chunks(columns, source, "결제내역") if mode == "stream_xlsx" else csv_chunks(columns, source)
+        for chunk in chunks:
+            size += len(chunk)  # 네트워크로 보냈다고 가정하고 버림
+
+    queue.put({
+        "mode": mode,
+        "seconds": round(time.perf_counter() - started, 2),
+        "bytes": size,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+        "baseline_rss_mb": round(baseline, 1),
+    })
+
+
+def _payment_columns():
+    from utils.export_stream import ExportColumn
+    headers = [
+        "결제번호", "결제ID", "결제일", "고객명", "고객전화번호", "결제금액",
+        "결제방법", "결제유형", "결제상태", "담당직원", "승인번호",
+        "카드명의자", "구매항목", "구매차수", "메모", "생성일시"
+    ]
+    return [ExportColumn(header) for header in headers]
+
+
+def _db_rows() -> Iterator[List]:
+    from sqlalchemy import select
+    from models.payment import Payment
+    from models.customer import Customer
+    from utils.export_stream import iter_query_rows
+
+    query = select(
+        Payment.payment_number, Payment.payment_id, Payment.payment_date,
+        Customer.name, Customer.phone, Payment.amount, Payment.payment_method,
+        Payment.payment_type, Payment.payment_status, Payment.payment_staff,
+        Payment.transaction_id, Payment.card_holder_name, Payment.reference_type,
+        Payment.reference_id, Payment.notes, Payment.created_at
+    ).outerjoin(Customer, Payment.customer_id == Customer.customer_id).order_by(
+        Payment.payment_date.desc(), Payment.payment_id.desc()
+    )
+    for row in iter_query_rows(query):
+        yield list(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결제 내보내기 벤치마크")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--modes", nargs="*", default=list(MODES), choices=MODES)
+    parser.add_argument("--db", action="store_true", help="합성 데이터 대신 DB 결제 테이블 사용")
+    args = parser.parse_args()
+
+    source = "DB payments" if args.db else f"합성 결제 {args.rows:,}건"
+    print(f"🚀 내보내기 벤치마크: {source}")
+    context = multiprocessing.get_context("spawn")
+    for mode in args.modes:
+        queue = context.Queue()
+        process = context.Process(target=_run_mode, args=(mode, args.rows, args.db, queue))
+        process.start()
+        result = queue.get()
+        process.join()
+        print(
+            f"  {result['mode']:<14} {result['seconds']:8.2f}s  "
+            f"파일 {result['bytes'] / 1024 / 1024:7.1f}MB  "
+            f"최대 RSS {result['peak_rss_mb']:7.1f}MB (시작 {result['baseline_rss_mb']:.1f}MB)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 import 시간 벤치마크 (python -X importtime)
+
+새 프로세스에서 `import main`을 여러 번 실행해 가장 빠른 실행 기준으로
+- 전체 import 시간 (예산 초과 시 실패)
+- 자체 시간이 큰 모듈 상위 N개
+- 요청 처리 경로에서 빠져 있어야 하는 무거운 모듈(pandas, matplotlib, reportlab, numpy, openpyxl, requests)이
+  로드되었는지와 누가 불렀는지
+를 출력한다. CI에서 돌리면 무거운 모듈을 최상단에서 import하는 변경을 잡을 수 있다.
+
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --budget-ms 800 --runs 5 --top 20
+    python scripts/benchmark_import_time.py --module api.v1.reports
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "matplotlib", "reportlab", "numpy", "openpyxl", "requests")
+DEFAULT_BUDGET_MS = 1500
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    parent: Optional[str]
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """-X importtime 출력 → 모듈별 기록 (자식이 부모보다 먼저 출력되므로 부모는 뒤에서 채움)"""
+    rows = []
+    for line in stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append([module, int(self_us), int(cumulative_us), len(indent) // 2, None])
+
+    pending: Dict[int, List[list]] = {}
+    for row in rows:
+        depth = row[3]
+        for child in pending.pop(depth + 1, []):
+            child[4] = row[0]
+        pending.setdefault(depth, []).append(row)
+    return [ImportRecord(*row) for row in rows]
+
+
+def run_once(module: str) -> tuple:
+    env = {**os.environ, "JOB_SCHEDULER_ENABLED": "false", "MESSAGE_OUTBOX_WORKER_ENABLED": "false"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    return result.returncode, result.stderr
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 import 시간 벤치마크")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    best: Optional[List[ImportRecord]] = None
+    best_total = None
+    for _ in range(args.runs):
+        returncode, stderr = run_once(args.module)
+        if returncode != 0:
+            error = [line for line in stderr.splitlines() if not line.startswith("import time:")]
+            print(f"import {args.module} 실패:\n" + "\n".join(error[-10:]))
+            sys.exit(2)
+        records = parse_importtime(stderr)
+        total = sum(record.self_us for record in records)
+        if best_total is None or total < best_total:
+            best, best_total = records, total
+
+    total_ms = best_total / 1000
+    print(f"import {args.module}: {total_ms:.0f}ms (최소 / {args.runs}회)\n")
+
+    print(f"자체 시간 상위 {args.top}개")
+    for record in sorted(best, key=lambda r: r.self_us, reverse=True)[:args.top]:
+        print(f"  {record.self_us / 1000:8.1f}ms  {record.cumulative_us / 1000:8.1f}ms 누적  {record.module}")
+
+    loaded = [record for record in best if record.module in HEAVY_MODULES]
+    print("\n무거운 모듈")
+    for name in HEAVY_MODULES:
+        record = next((r for r in loaded if r.module == name), None)
+        if record:
+            print(f"  {name:12s} 로드됨 {record.cumulative_us / 1000:7.1f}ms (import: {record.parent})")
+        else:
+            print(f"  {name:12s} -")
+
+    failures = []
+    if total_ms > args.budget_ms:
+        failures.append(f"예산 초과: {total_ms:.0f}ms > {args.budget_ms:.0f}ms")
+    if loaded:
+        failures.append("시작 시 로드되면 안 되는 모듈: " + ", ".join(r.module for r in loaded))
+    print()
+    if failures:
+        print("FAIL - " + "; ".join(failures))
+        sys.exit(1)
+    print(f"OK (예산 {args.budget_ms:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
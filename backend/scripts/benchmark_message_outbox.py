@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+SMS 발송 경로 벤치마크 (로컬 가짜 알리고 서버)
+
+- legacy: 요청 처리 중 메시지마다 requests.post로 알리고 send 호출 (기존 예약 확인 SMS 방식)
+- outbox: 요청 처리 중에는 message_outbox INSERT + 커밋만, 워커가 send_mass로 묶어서 공용 클라이언트(커넥션 풀)로 발송
+
+요청 하나가 기다리는 시간(요청 경로 지연)과 전체 발송 시간/HTTP 호출 수를 비교한다.
+DB는 임시 SQLite 파일의 message_outbox 테이블만 사용한다.
+
+    python scripts/benchmark_message_outbox.py
+    python scripts/benchmark_message_outbox.py --messages 2000 --latency 0.3 --fail-rate 0.05
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from models.message_outbox import MessageOutbox
+from services.aligo_service import AligoSMSService
+from services.message_outbox_service import MessageOutboxDispatcher, enqueue_sms
+from scripts.fake_aligo_server import serve_in_thread
+
+
+def _message(i: int) -> str:
+    return f"[AIBIO 센터] 고객{i}님, 예약이 확정되었습니다. 문의: 02-2039-2783"
+
+
+def _percentile(values, ratio):
+    ordered = sorted(values)
+    return ordered[max(0, int(len(ordered) * ratio) - 1)]
+
+
+class _NoKeepAliveClient:
+    """호출마다 새 연결 (기존 requests.post 동작)"""
+
+    def request(self, method, url, **kwargs):
+        with httpx.Client(timeout=30) as client:
+            return client.request(method, url, **kwargs)
+
+    def close(self):
+        pass
+
+
+def run_legacy(base_url: str, count: int, state):
+    client = AligoSMSService()
+    client.base_url = base_url
+    client.client._client = _NoKeepAliveClient()  # 기존 코드처럼 매 호출 새 연결
+    before = sum(state.snapshot()["requests"].values())
+
+    latencies, failures = [], 0
+    started = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        result = client.send_sms(receiver=f"010-0000-{i:04d}", message=_message(i))
+        latencies.append(time.perf_counter() - t0)
+        failures += 0 if result["success"] else 1
+    total = time.perf_counter() - started
+    return {
+        "request_p50_ms": statistics.median(latencies) * 1000,
+        "request_p95_ms": _percentile(latencies, 0.95) * 1000,
+        "delivery_seconds": total,
+        "http_calls": sum(state.snapshot()["requests"].values()) - before,
+        "failed": failures,
+    }
+
+
+def run_outbox(base_url: str, count: int, state, batch_size: int):
+    db_path = os.path.join(tempfile.mkdtemp(), "outbox.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    MessageOutbox.__table__.create(engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    client = AligoSMSService()
+    client.base_url = base_url
+    dispatcher = MessageOutboxDispatcher(
+        session_factory=Session, sms_client=client, kakao_client=object(),
+        batch_size=batch_size, retry_base_seconds=0
+    )
+    before = sum(state.snapshot()["requests"].values())
+
+    # 요청 경로: 요청마다 INSERT + 커밋
+    latencies = []
+    started = time.perf_counter()
+    for i in range(count):
+        t0 = time.perf_counter()
+        db = Session()
+        enqueue_sms(db, f"010-0000-{i:04d}", _message(i), recipient_name=f"고객{i}")
+        db.commit()
+        db.close()
+        latencies.append(time.perf_counter() - t0)
+
+    # 워커: 비워질 때까지 (재시도 포함)
+    rounds = 0
+    while True:
+        stats = dispatcher.dispatch_once()
+        rounds += 1
+        if not stats["claimed"]:
+            break
+    total = time.perf_counter() - started
+
+    with Session() as db:
+        by_status = dict(db.execute(
+            select(MessageOutbox.status, func.count()).group_by(MessageOutbox.status)
+        ).all())
+    engine.dispose()
+    return {
+        "request_p50_ms": statistics.median(latencies) * 1000,
+        "request_p95_ms": _percentile(latencies, 0.95) * 1000,
+        "delivery_seconds": total,
+        "http_calls": sum(state.snapshot()["requests"].values()) - before,
+        "failed": by_status.get("failed", 0),
+        "status": by_status,
+        "rounds": rounds,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SMS 발송 경로 벤치마크")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.15, help="가짜 알리고 응답 지연 (초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    server, state, base_url = serve_in_thread(latency=args.latency, fail_rate=args.fail_rate)
+    print(f"🚀 메시지 {args.messages}건 / 알리고 응답 지연 {args.latency * 1000:.0f}ms / 실패율 {args.fail_rate}")
+
+    for name, runner in (("legacy", run_legacy), ("outbox", run_outbox)):
+        extra = (args.batch_size,) if name == "outbox" else ()
+        result = runner(base_url, args.messages, state, *extra)
+        print(
+            f"  {name:<7} 요청 경로 p50 {result['request_p50_ms']:7.2f}ms p95 {result['request_p95_ms']:7.2f}ms  "
+            f"전체 발송 {result['delivery_seconds']:7.2f}s  HTTP {result['http_calls']:5d}회  실패 {result['failed']}"
+            + (f"  {result['status']}" if "status" in result else "")
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
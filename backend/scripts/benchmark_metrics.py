@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+/metrics 계측 오버헤드 벤치마크
+
+요청마다 추가되는 작업(처리 중 게이지 증감 + 라우트 히스토그램 기록)의 비용을 잰다.
+목표: 요청당 50µs 미만.
+
+- record:      main.py 미들웨어가 요청마다 하는 기록만 반복 (라우트 40개 x 상태 코드 3개)
+- record x N:  스레드 N개가 동시에 기록 (락 경합 포함, 스레드풀 def 핸들러 상황)
+- asgi:        같은 미니 앱에 계측 미들웨어가 있을 때/없을 때 요청당 시간 차이
+- render:      채워진 히스토그램을 /metrics 텍스트로 만드는 시간 (scrape 1회)
+
+    python scripts/benchmark_metrics.py
+    python scripts/benchmark_metrics.py --iterations 500000 --threads 16
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from fastapi import FastAPI, Request
+
+from core import metrics
+
+ROUTES = [f"/api/v1/resource{i}/{{item_id}}" for i in range(40)]
+STATUSES = (200, 404, 500)
+BUDGET_US = 50.0
+
+
+def _record(iterations: int, offset: int = 0) -> None:
+    for i in range(offset, offset + iterations):
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        metrics.REQUESTS_IN_FLIGHT.dec()
+        metrics.observe_request("GET", ROUTES[i % len(ROUTES)], STATUSES[i % 3], 0.012)
+
+
+def bench_record(iterations: int) -> float:
+    started = time.perf_counter()
+    _record(iterations)
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def bench_record_threads(iterations: int, threads: int) -> float:
+    per_thread = iterations // threads
+    workers = [threading.Thread(target=_record, args=(per_thread, n * per_thread)) for n in range(threads)]
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    # 처리량 기준 (요청 하나당 벽시계 시간)
+    return (time.perf_counter() - started) / (per_thread * threads) * 1e6
+
+
+def _app(instrumented: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def middleware(request: Request, call_next):
+        if not instrumented:
+            return await call_next(request)
+        started = time.time()
+        metrics.REQUESTS_IN_FLIGHT.inc()
+        status_code = 500
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+        finally:
+            metrics.REQUESTS_IN_FLIGHT.dec()
+            route = getattr(request.scope.get("route"), "path", None)
+            metrics.observe_request(request.method, route, status_code, time.time() - started)
+        return response
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"item_id": item_id}
+
+    return app
+
+
+async def _asgi_per_request(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i in range(200):  # 워밍업
+            await client.get(f"/items/{i}")
+        started = time.perf_counter()
+        for i in range(requests):
+            await client.get(f"/items/{i}")
+        return (time.perf_counter() - started) / requests * 1e6
+
+
+def bench_asgi(requests: int, rounds: int = 3):
+    """계측 유무를 번갈아 여러 번 돌려 최솟값 비교 (잡음 제거)"""
+    plain, instrumented = [], []
+    for _ in range(rounds):
+        plain.append(asyncio.run(_asgi_per_request(_app(False), requests)))
+        instrumented.append(asyncio.run(_asgi_per_request(_app(True), requests)))
+    return min(plain), min(instrumented)
+
+
+def bench_render(repeat: int = 20) -> tuple:
+    metrics.render()  # 캐시/DB 모듈 import 제외
+    started = time.perf_counter()
+    for _ in range(repeat):
+        text = metrics.render()
+    return (time.perf_counter() - started) / repeat * 1000, len(text.splitlines())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/metrics 계측 오버헤드 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=3000, help="ASGI 비교에서 앱별 요청 수")
+    args = parser.parse_args()
+
+    print(f"record:            {bench_record(args.iterations):6.2f} µs/request")
+    print(f"record x {args.threads:<2} thread: {bench_record_threads(args.iterations, args.threads):6.2f} µs/request")
+
+    plain, instrumented = bench_asgi(args.requests)
+    overhead = instrumented - plain
+    print(f"asgi plain:        {plain:6.1f} µs/request")
+    print(f"asgi instrumented: {instrumented:6.1f} µs/request  ({overhead:+.1f} µs)")
+
+    render_ms, lines = bench_render()
+    print(f"render:            {render_ms:6.2f} ms/scrape ({lines} lines, {len(metrics.REQUEST_DURATION._series)} series)")
+
+    record_us = bench_record(args.iterations)
+    verdict = "OK" if record_us < BUDGET_US else "OVER BUDGET"
+    print(f"\n요청당 기록 비용 {record_us:.2f} µs (목표 < {BUDGET_US:.0f} µs): {verdict}")
+
+
+if __name__ == "__main__":
+    main()
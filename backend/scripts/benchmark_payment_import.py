@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+결제대장 엑셀 가져오기 벤치마크 (월별 12개 시트 합성 결제대장)
+
+기존 방식(시트마다 pd.read_excel로 헤더 탐색 후 다시 읽기)과
+새 방식(services.payment_import_service.PaymentWorkbook, read-only 1회 로드)의 읽기 시간을 비교하고
+--db 지정 시 실제 DB 가져오기(고객 매칭 + 중복 확인 + 배치 INSERT)까지 측정한다.
+
+    python scripts/benchmark_payment_import.py
+    python scripts/benchmark_payment_import.py --rows-per-sheet 3000 --db
+
+--db: 측정 후 생성한 결제/고객(이름 '벤치고객*')을 삭제
+"""
+
+import argparse
+import io
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+from openpyxl import Workbook
+
+from services.payment_import_service import PaymentWorkbook, PaymentImportService
+
+HEADERS = ["번호", "결제일자", "고객명", "고객전화번호", "결제 프로그램", "결제 금액", "승인번호", "결제 담당자", "카드 명의자명"]
+PROGRAMS = ["브레인 패키지 10회", "펄스 단일", "추가 세션", "레드 패키지 20회"]
+BENCH_NAME_PREFIX = "벤치고객"
+
+
+def synthetic_ledger(rows_per_sheet: int, customers: int) -> bytes:
+    """월별 시트(제목 2행 + 헤더)로 구성된 결제대장"""
+    rng = random.Random(11)
+    workbook = Workbook(write_only=True)
+    number = 0
+    for month in range(1, 13):
+        sheet = workbook.create_sheet(title=f"2024년 {month}월")
+        sheet.append([f"2024년 {month}월 결제대장"])
+        sheet.append([])
+        sheet.append(HEADERS)
+        start = date(2024, month, 1)
+        for _ in range(rows_per_sheet):
+            number += 1
+            customer = rng.randrange(customers)
+            sheet.append([
+                number,
+                start + timedelta(days=rng.randrange(28)),
+                f"{BENCH_NAME_PREFIX}{customer}",
+                f"010-00{customer // 10000:02d}-{customer % 10000:04d}",
+                rng.choice(PROGRAMS),
+                rng.choice([50000, 110000, 330000, 990000, -110000]),
+                rng.choice([f"{rng.randint(10000000, 99999999)}", "계좌이체", "현금"]),
+                rng.choice(["김직원", "이직원"]),
+                "",
+            ])
+    output = io.BytesIO()
+    workbook.save(output)
+    return output.getvalue()
+
+
+def legacy_read(contents: bytes):
+    """변경 전 import_all_sheets_from_excel의 읽기 (시트마다 헤더 탐색용 + 본문용 2회)"""
+    excel_file = io.BytesIO(contents)
+    frames = {}
+    for sheet_name in pd.ExcelFile(excel_file).sheet_names:
+        temp_df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+        for i in range(min(5, len(temp_df))):
+            if '결제일자' in str(temp_df.iloc[i].values) or '고객명' in str(temp_df.iloc[i].values):
+                frames[sheet_name] = pd.read_excel(excel_file, sheet_name=sheet_name, header=i)
+                break
+    return frames
+
+
+def new_read(contents: bytes):
+    workbook = PaymentWorkbook(contents, "ledger.xlsx")
+    try:
+        return {name: workbook.read_sheet(name, ('결제일자', '고객명')) for name in workbook.sheet_names}
+    finally:
+        workbook.close()
+
+
+def timed(label: str, func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<30} {elapsed:8.2f}s")
+    return result
+
+
+def cleanup(db) -> None:
+    from sqlalchemy import delete, select
+    from models.customer import Customer
+    from models.payment import Payment
+    from services.daily_rollup_service import DailyRollupService
+
+    bench_customers = select(Customer.customer_id).where(Customer.name.like(f"{BENCH_NAME_PREFIX}%"))
+    dates = db.execute(
+        select(Payment.payment_date).where(Payment.customer_id.in_(bench_customers)).distinct()
+    ).scalars().all()
+    db.execute(delete(Payment).where(Payment.customer_id.in_(bench_customers)))
+    db.execute(delete(Customer).where(Customer.name.like(f"{BENCH_NAME_PREFIX}%")))
+    DailyRollupService(db).refresh_revenue(dates)
+    db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="결제대장 가져오기 벤치마크")
+    parser.add_argument("--rows-per-sheet", type=int, default=1500)
+    parser.add_argument("--customers", type=int, default=3000)
+    parser.add_argument("--db", action="store_true", help="DB 가져오기까지 측정 (측정 데이터는 삭제)")
+    args = parser.parse_args()
+
+    contents = synthetic_ledger(args.rows_per_sheet, args.customers)
+    total = args.rows_per_sheet * 12
+    print(f"🚀 결제대장 12개 시트, {total:,}행 ({len(contents) / 1024 / 1024:.1f}MB)")
+
+    print("\n[워크북 읽기]")
+    timed("기존 (시트별 pd.read_excel x2)", lambda: legacy_read(contents))
+    sheets = timed("신규 (read-only 1회)", lambda: new_read(contents))
+
+    if not args.db:
+        return
+
+    from core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        cleanup(db)
+        print("\n[DB 가져오기]")
+        result = timed("신규 (첫 업로드)", lambda: PaymentImportService(db).import_sheets(sheets))
+        print(f"  → 저장 {sum(s['success'] for s in result['sheets']):,} / 중복 {sum(s['duplicate'] for s in result['sheets']):,}")
+        result = timed("신규 (같은 파일 재업로드)", lambda: PaymentImportService(db).import_sheets(sheets))
+        print(f"  → 저장 {sum(s['success'] for s in result['sheets']):,} / 중복 {sum(s['duplicate'] for s in result['sheets']):,}")
+    finally:
+        cleanup(db)
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
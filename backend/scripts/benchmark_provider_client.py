@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+메시지 공급자 클라이언트 벤치마크 (로컬 가짜 알리고/알림톡 서버)
+
+수신자 N명 캠페인을 발송 방식별로 보내고 초당 메시지 수를 비교한다.
+
+- alimtalk sequential: 건마다 새 연결로 순차 호출 (기존 방식)
+- alimtalk pooled:     공용 클라이언트 + 스레드 (동시성 = KAKAO_MAX_CONCURRENCY)
+- alimtalk async:      send_alimtalk_async + asyncio.gather (동시성 동일)
+- sms send_mass:       500명씩 묶어서 send_mass_async 병렬 호출
+
+    python scripts/benchmark_provider_client.py
+    python scripts/benchmark_provider_client.py --recipients 1000 --latency 0.1 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+from services.aligo_service import AligoSMSService
+from services.kakao_service import KakaoAlimtalkService
+from scripts.fake_aligo_server import serve_in_thread
+from utils.provider_client import ProviderClient
+
+TEMPLATE_CODE = "BENCH_001"
+
+
+class _NoKeepAliveClient:
+    """호출마다 새 연결 (기존 requests.post 동작)"""
+
+    def request(self, method, url, **kwargs):
+        with httpx.Client(timeout=30) as client:
+            return client.request(method, url, **kwargs)
+
+    def close(self):
+        pass
+
+
+def _phone(i: int) -> str:
+    return f"010-{i // 10000:04d}-{i % 10000:04d}"
+
+
+def _kakao(base_url: str, concurrency: int) -> KakaoAlimtalkService:
+    service = KakaoAlimtalkService()
+    service.admin_key = service.admin_key or "bench-admin-key"
+    service.client = ProviderClient("kakao", base_url, max_concurrency=concurrency, failure_threshold=50)
+    return service
+
+
+def _send_one(service: KakaoAlimtalkService, i: int):
+    return service.send_alimtalk(_phone(i), TEMPLATE_CODE, {"고객명": f"고객{i}"})
+
+
+def run_sequential(base_url: str, count: int, concurrency: int):
+    service = _kakao(base_url, concurrency)
+    service.client._client = _NoKeepAliveClient()
+    return service, [_send_one(service, i) for i in range(count)]
+
+
+def run_pooled(base_url: str, count: int, concurrency: int):
+    service = _kakao(base_url, concurrency)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda i: _send_one(service, i), range(count)))
+    return service, results
+
+
+def run_async(base_url: str, count: int, concurrency: int):
+    service = _kakao(base_url, concurrency)
+
+    async def campaign():
+        return await asyncio.gather(*(
+            service.send_alimtalk_async(_phone(i), TEMPLATE_CODE, {"고객명": f"고객{i}"})
+            for i in range(count)
+        ))
+
+    return service, asyncio.run(campaign())
+
+
+def run_send_mass(base_url: str, count: int, concurrency: int):
+    service = AligoSMSService()
+    service.client = ProviderClient("aligo", base_url, max_concurrency=concurrency, timeout=30)
+    receivers = [{"phone": _phone(i), "message": f"[AIBIO 센터] 고객{i}님 이벤트 안내", "name": f"고객{i}"}
+                 for i in range(count)]
+    batches = [receivers[i:i + 500] for i in range(0, count, 500)]
+
+    async def campaign():
+        return await asyncio.gather(*(service.send_mass_async(batch) for batch in batches))
+
+    results = asyncio.run(campaign())
+    # 배치 결과를 수신자 수만큼 펼쳐서 성공 건수 집계
+    expanded = [result for result, batch in zip(results, batches) for _ in batch]
+    return service, expanded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메시지 공급자 클라이언트 벤치마크")
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 서버 응답 지연 (초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    server, state, base_url = serve_in_thread(latency=args.latency, fail_rate=args.fail_rate)
+    print(f"🚀 캠페인 {args.recipients}명 / 응답 지연 {args.latency * 1000:.0f}ms / 동시성 {args.concurrency}")
+
+    runners = (
+        ("alimtalk sequential", run_sequential),
+        ("alimtalk pooled", run_pooled),
+        ("alimtalk async", run_async),
+        ("sms send_mass", run_send_mass),
+    )
+    for name, runner in runners:
+        before = sum(state.snapshot()["requests"].values())
+        started = time.perf_counter()
+        service, results = runner(base_url, args.recipients, args.concurrency)
+        elapsed = time.perf_counter() - started
+        sent = sum(1 for result in results if result.get("success"))
+        calls = sum(state.snapshot()["requests"].values()) - before
+        stats = service.client.stats()
+        latency = next(iter(stats["latency"].values()), {})
+        print(
+            f"  {name:<20} {elapsed:7.2f}s  {sent / elapsed:9.1f} msg/s  성공 {sent}/{len(results)}  "
+            f"HTTP {calls:5d}회  p50 {latency.get('p50_ms')}ms p95 {latency.get('p95_ms')}ms  "
+            f"서킷 {stats['circuit']['state']}"
+        )
+        service.client.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
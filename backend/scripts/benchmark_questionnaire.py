@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+태블릿 문진 흐름 벤치마크
+
+태블릿은 질문 하나를 답할 때마다 답변 제출(submit_answer) → 진행 상태(get_questionnaire_progress)를 부른다.
+임시 템플릿(질문 --questions개)과 응답을 만들어 모든 질문을 이 순서로 답하면서
+한 번 누를 때(tap)의 시간/쿼리 수를 템플릿 캐시 TTL별로 비교한다.
+
+- ttl=0:  매번 템플릿 버전(지문) 쿼리로 확인 (질문 변경이 즉시 반영되는 설정)
+- ttl=60: 기본값, TTL 동안 템플릿 관련 쿼리 없음
+
+    python scripts/benchmark_questionnaire.py --sqlite
+    python scripts/benchmark_questionnaire.py --sqlite --rtt-ms 1 --questions 80
+    python scripts/benchmark_questionnaire.py                 # DATABASE_URL에 임시 데이터를 만들고 끝나면 삭제
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, delete, event
+from sqlalchemy.orm import sessionmaker
+
+from api.v1.questionnaire import get_questionnaire_progress, submit_answer
+from core.auth import AuthenticatedUser
+from models.questionnaire import (
+    Answer, Question, QuestionnaireResponse, QuestionnaireSection, QuestionnaireTemplate, QuestionType
+)
+from schemas.questionnaire import SubmitAnswerRequest
+import services.questionnaire_template_service as template_service
+
+USER = AuthenticatedUser(user_id=0, email="bench@aibio.kr", name="벤치", role="staff", is_active=True)
+SECTIONS = list(QuestionnaireSection)
+
+
+def _sqlite_session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    for model in (QuestionnaireTemplate, Question, QuestionnaireResponse, Answer):
+        model.__table__.create(engine)
+    return engine, sessionmaker(bind=engine)
+
+
+def create_template(factory, questions: int) -> int:
+    with factory() as db:
+        template = QuestionnaireTemplate(name="벤치 문진", version="bench", is_active=True)
+        db.add(template)
+        db.flush()
+        for index in range(questions):
+            db.add(Question(
+                template_id=template.template_id,
+                section=SECTIONS[index * len(SECTIONS) // questions],
+                question_type=QuestionType.SCALE,
+                question_code=f"BENCH_{template.template_id}_{index:03d}",
+                question_text=f"질문 {index + 1}",
+                order_index=questions - index,  # 역순으로 넣어 정렬이 필요하게
+                is_required=index % 3 == 0,
+            ))
+        db.commit()
+        return template.template_id
+
+
+def run_flow(factory, template_id: int) -> tuple:
+    """새 응답을 만들고 모든 질문을 순서대로 답함 - (tap별 시간 목록, 응답 ID)"""
+    with factory() as db:
+        response = QuestionnaireResponse(customer_id=None, template_id=template_id, device_id="bench")
+        db.add(response)
+        db.commit()
+        response_id = response.response_id
+
+    timings: List[float] = []
+    while True:
+        started = time.perf_counter()
+        db = factory()
+        try:
+            progress = get_questionnaire_progress(response_id=response_id, db=db, current_user=USER)
+        finally:
+            db.close()
+        if progress.next_question is None:
+            break
+        db = factory()
+        try:
+            submit_answer(
+                response_id=response_id,
+                request=SubmitAnswerRequest(question_id=progress.next_question.question_id, answer=7),
+                db=db,
+                current_user=USER,
+            )
+        finally:
+            db.close()
+        timings.append((time.perf_counter() - started) * 1e6)
+    return timings, response_id
+
+
+def main():
+    parser = argparse.ArgumentParser(description="태블릿 문진 흐름 벤치마크")
+    parser.add_argument("--questions", type=int, default=60)
+    parser.add_argument("--rounds", type=int, default=5, help="TTL별로 문진을 처음부터 끝까지 반복할 횟수")
+    parser.add_argument("--sqlite", action="store_true", help="메모리 SQLite에서 측정")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="쿼리마다 더할 네트워크 왕복 지연 (SQLite 모드용)")
+    args = parser.parse_args()
+
+    if args.sqlite:
+        engine, factory = _sqlite_session_factory()
+    else:
+        from core.database import SessionLocal, engine
+        factory = SessionLocal
+
+    queries = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        queries["count"] += 1
+        if args.rtt_ms:
+            time.sleep(args.rtt_ms / 1000)
+
+    template_id = create_template(factory, args.questions)
+    response_ids = []
+    try:
+        for ttl in (0, 60):
+            template_service.template_cache = template_service.QuestionnaireTemplateCache(ttl_seconds=ttl)
+            # api.v1.questionnaire는 import 시점의 template_cache를 참조
+            sys.modules["api.v1.questionnaire"].template_cache = template_service.template_cache
+            _, response_id = run_flow(factory, template_id)  # 워밍업 (템플릿 적재)
+            response_ids.append(response_id)
+            queries["count"] = 0
+            timings = []
+            for _ in range(args.rounds):
+                round_timings, response_id = run_flow(factory, template_id)
+                timings.extend(round_timings)
+                response_ids.append(response_id)
+            taps = len(timings)
+            ordered = sorted(timings)
+            p95 = ordered[min(taps - 1, int(taps * 0.95))]
+            print(f"ttl={ttl:<3} tap(제출+진행) p50={statistics.median(ordered):8.1f}µs  p95={p95:8.1f}µs  "
+                  f"queries/tap={queries['count'] / taps:.2f}  {template_service.template_cache.stats()}")
+    finally:
+        with factory() as db:
+            db.execute(delete(Answer).where(Answer.response_id.in_(response_ids)))
+            db.execute(delete(QuestionnaireResponse).where(QuestionnaireResponse.response_id.in_(response_ids)))
+            db.execute(delete(Question).where(Question.template_id == template_id))
+            db.execute(delete(QuestionnaireTemplate).where(QuestionnaireTemplate.template_id == template_id))
+            db.commit()
+
+
+if __name__ == "__main__":
+    main()
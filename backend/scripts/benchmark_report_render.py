@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+보고서 PDF 렌더링 벤치마크
+
+DB 없이 월간 매출 보고서 데이터(31일 + 서비스 6종)로 PDF를 만들며 비교한다.
+
+- inline:  요청 스레드에서 렌더링 (REPORT_RENDER_PROCESS_WORKERS=0)
+- pool:    spawn 프로세스 풀에서 렌더링 (첫 호출은 워커 기동 + matplotlib import 포함)
+- 지연:    렌더링이 동시에 N개 도는 동안, 같은 프로세스의 가벼운 요청(1ms짜리 작업)이 얼마나 늦어지는지
+           inline이면 GIL을 렌더링이 잡고 있어 다른 요청이 밀리고, pool이면 거의 영향이 없어야 함
+
+    python scripts/benchmark_report_render.py
+    python scripts/benchmark_report_render.py --renders 8 --workers 2
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.report_render_service import ReportRenderService
+from utils.report_generator import render_report
+
+
+def sample_data() -> dict:
+    return {
+        'year': 2025,
+        'month': 6,
+        'total_revenue': 48_500_000.0,
+        'total_transactions': 412,
+        'daily_average': 1_616_666.0,
+        'month_over_month_growth': 4.2,
+        'year_over_year_growth': 12.5,
+        'daily_revenue': {f"{day}일": float(1_000_000 + day * 37_000) for day in range(1, 31)},
+        'service_revenue': {name: float(5_000_000 + i * 1_300_000) for i, name in
+                            enumerate(["브레인", "펄스", "림프", "레드", "AI바이크", "인바디"])},
+        'payment_methods': {
+            'card': {'count': 300, 'amount': 36_000_000.0, 'percentage': 74.2},
+            'transfer': {'count': 112, 'amount': 12_500_000.0, 'percentage': 25.8},
+        },
+    }
+
+
+def _light_request_latency(stop: threading.Event, samples: list) -> None:
+    """1ms 정도의 CPU 작업을 반복하며 실제 소요 시간 기록 (다른 API 요청 대용)"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        sum(i * i for i in range(20_000))
+        samples.append((time.perf_counter() - started) * 1000)
+        time.sleep(0.005)
+
+
+def run_concurrent(service: ReportRenderService, renders: int) -> tuple:
+    data = sample_data()
+    stop, samples = threading.Event(), []
+    ticker = threading.Thread(target=_light_request_latency, args=(stop, samples))
+    ticker.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=renders) as executor:
+        list(executor.map(lambda _: service.render('monthly_revenue', data), range(renders)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    ticker.join()
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return elapsed, statistics.median(ordered), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보고서 PDF 렌더링 벤치마크")
+    parser.add_argument("--renders", type=int, default=4, help="동시에 요청할 PDF 수")
+    parser.add_argument("--workers", type=int, default=1, help="프로세스 풀 크기")
+    args = parser.parse_args()
+
+    data = sample_data()
+    started = time.perf_counter()
+    pdf = render_report('monthly_revenue', data)
+    print(f"첫 렌더링 (import 포함):  {(time.perf_counter() - started) * 1000:7.0f} ms  ({len(pdf):,} bytes)")
+    started = time.perf_counter()
+    render_report('monthly_revenue', data)
+    print(f"렌더링 1회:               {(time.perf_counter() - started) * 1000:7.0f} ms")
+
+    baseline = []
+    stop = threading.Event()
+    ticker = threading.Thread(target=_light_request_latency, args=(stop, baseline))
+    ticker.start()
+    time.sleep(1)
+    stop.set()
+    ticker.join()
+    print(f"\n가벼운 요청 (렌더링 없음): p50={statistics.median(baseline):6.1f}ms")
+
+    for label, service in (("inline", ReportRenderService(process_workers=0)),
+                           (f"pool x{args.workers}", ReportRenderService(process_workers=args.workers))):
+        if service.process_workers:
+            service.render('monthly_revenue', data)  # 워커 기동
+        elapsed, p50, p95 = run_concurrent(service, args.renders)
+        print(f"{label:10s} PDF {args.renders}개 {elapsed * 1000:7.0f} ms  |  가벼운 요청 p50={p50:6.1f}ms p95={p95:6.1f}ms")
+        service.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+예약 가능 시간 벤치마크 (한 달, 빽빽한 예약)
+
+기존 방식(날짜별 조회 + 15분 슬롯마다 `slot_time not in existing_times` 목록 탐색, 소요 시간 무시)과
+services.reservation_availability_service 구간 스윕(소요 시간/수용 인원/직원 반영)을 비교한다.
+
+    python scripts/benchmark_reservation_availability.py
+    python scripts/benchmark_reservation_availability.py --per-day 400 --capacity 3
+    python scripts/benchmark_reservation_availability.py --db --service-type-id 1 --start 2025-06-01
+
+--db: 실제 DB의 예약으로 기존 엔드포인트 방식(날짜마다 쿼리) vs 기간 1회 조회를 측정
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import date, datetime, timedelta, time as datetime_time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.reservation_availability_service import compute_day, format_minutes
+
+OPEN, CLOSE = 9 * 60, 21 * 60
+DURATIONS = [30, 45, 60, 60, 90, 120]
+
+
+def synthetic_month(days: int, per_day: int, services: int, staff: int):
+    """날짜별 [(시작분, 종료분, 서비스, 직원)]"""
+    rng = random.Random(3)
+    month = {}
+    start = date(2025, 6, 1)
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        bookings = []
+        for _ in range(per_day):
+            begin = OPEN + rng.randrange(0, (CLOSE - OPEN) // 15) * 15
+            bookings.append((begin, begin + rng.choice(DURATIONS), rng.randrange(services), rng.randrange(staff)))
+        month[day] = bookings
+    return month
+
+
+def legacy_slots(bookings, service_id, staff_id):
+    """변경 전 get_available_slots (시작 시각이 정확히 같은 슬롯만 제외)"""
+    existing_times = [
+        datetime_time(begin // 60, begin % 60)
+        for begin, _, _, staff in bookings
+        if staff_id is None or staff == staff_id
+    ]
+    slots = []
+    current = OPEN
+    while current < CLOSE:
+        slot_time = datetime_time(current // 60, current % 60)
+        if slot_time not in existing_times:
+            slots.append(slot_time)
+        current += 15
+    return slots
+
+
+def engine_slots(month, service_id, staff_id, capacity, duration):
+    result = []
+    for day, bookings in month.items():
+        service_busy = [(b, e) for b, e, service, _ in bookings if service == service_id]
+        staff_busy = [(b, e) for b, e, _, staff in bookings if staff == staff_id] if staff_id is not None else None
+        result.append(compute_day(day, [(OPEN, CLOSE)], service_busy, capacity, duration, 15, staff_busy=staff_busy))
+    return result
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, timings
+
+
+def fmt(timings):
+    return f"p50={statistics.median(timings):8.2f}ms  max={max(timings):8.2f}ms"
+
+
+def run_db(args):
+    from sqlalchemy import and_
+    from core.database import SessionLocal
+    from models import Reservation
+    from services.reservation_availability_service import ReservationAvailabilityService
+
+    start = date.fromisoformat(args.start)
+    end = start + timedelta(days=args.days - 1)
+    db = SessionLocal()
+    try:
+        def legacy():
+            # 변경 전 엔드포인트를 날짜 수만큼 호출한 것과 같음
+            for offset in range(args.days):
+                day = start + timedelta(days=offset)
+                query = db.query(Reservation).filter(and_(
+                    Reservation.reservation_date == day,
+                    Reservation.status.in_(['pending', 'confirmed'])
+                ))
+                if args.staff_id:
+                    query = query.filter(Reservation.staff_id == args.staff_id)
+                existing = [r.reservation_time for r in query.all()]
+                current = datetime.combine(day, datetime_time(9, 0))
+                while current < datetime.combine(day, datetime_time(18, 0)):
+                    _ = current.time() not in existing
+                    current += timedelta(minutes=15)
+
+        def engine():
+            return ReservationAvailabilityService(db).get_availability(
+                start, end, args.service_type_id, staff_id=args.staff_id
+            )
+
+        _, legacy_timings = measure(legacy, args.repeat)
+        days, engine_timings = measure(engine, args.repeat)
+        print(f"\n[DB {start} ~ {end}, service_type_id={args.service_type_id}, staff_id={args.staff_id}]")
+        print(f"  기존 (날짜별 {args.days}회 조회)  {fmt(legacy_timings)}")
+        print(f"  신규 (기간 1회 조회)          {fmt(engine_timings)}")
+        print(f"  예약 가능 슬롯 합계 {sum(len(day.slots) for day in days):,}개")
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 가능 시간 벤치마크")
+    parser.add_argument("--days", type=int, default=31)
+    parser.add_argument("--per-day", type=int, default=60, help="하루 예약 수")
+    parser.add_argument("--services", type=int, default=6)
+    parser.add_argument("--staff", type=int, default=5)
+    parser.add_argument("--capacity", type=int, default=2)
+    parser.add_argument("--duration", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--db", action="store_true")
+    parser.add_argument("--service-type-id", type=int, default=1)
+    parser.add_argument("--staff-id", type=int)
+    parser.add_argument("--start", default=date.today().isoformat())
+    args = parser.parse_args()
+
+    month = synthetic_month(args.days, args.per_day, args.services, args.staff)
+    total = sum(len(bookings) for bookings in month.values())
+    print(f"🚀 {args.days}일, 예약 {total:,}건 (하루 {args.per_day}건, 서비스 {args.services}개, 직원 {args.staff}명)")
+
+    _, legacy_timings = measure(
+        lambda: [legacy_slots(bookings, 0, 0) for bookings in month.values()], args.repeat
+    )
+    days, engine_timings = measure(
+        lambda: engine_slots(month, 0, 0, args.capacity, args.duration), args.repeat
+    )
+    print(f"  기존 (목록 탐색, 시작 시각만 비교)  {fmt(legacy_timings)}")
+    print(f"  신규 (구간 스윕, 소요 시간 반영)    {fmt(engine_timings)}")
+    sample = days[0]
+    free = ", ".join(f"{format_minutes(s)}-{format_minutes(e)}" for s, e in sample.free[:6]) or "없음"
+    print(f"  {sample.day} 서비스0/직원0 빈 구간: {free} (시작 가능 {len(sample.slots)}개)")
+
+    if args.db:
+        run_db(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+로컬 가짜 알리고/카카오 알림톡 서버 (발송 대기열 워커 테스트용)
+
+실제 문자를 보내지 않고 요청만 기록한다. 응답 지연과 실패율을 흉내낼 수 있다.
+
+    python scripts/fake_aligo_server.py --port 8025 --latency 0.2 --fail-rate 0.1
+    ALIGO_BASE_URL=http://127.0.0.1:8025 KAKAO_BIZ_BASE_URL=http://127.0.0.1:8025 python scripts/run_message_outbox.py
+
+지원 경로: /send/, /send_mass/, /remain/, /list/ (알리고), /v2/sender/alimtalk (카카오)
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+
+class FakeProviderState:
+    """받은 요청 통계"""
+
+    def __init__(self, latency: float = 0.0, fail_rate: float = 0.0, seed: int = 7):
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = {}      # 경로별 HTTP 요청 수
+        self.recipients = 0     # 받은 수신자 수 (send_mass는 rec 개수)
+        self.next_id = 1
+
+    def record(self, path: str, recipients: int) -> int:
+        with self.lock:
+            self.requests[path] = self.requests.get(path, 0) + 1
+            self.recipients += recipients
+            message_id = self.next_id
+            self.next_id += 1
+            return message_id
+
+    def should_fail(self) -> bool:
+        with self.lock:
+            return self.rng.random() < self.fail_rate
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {"requests": dict(self.requests), "recipients": self.recipients}
+
+
+def _make_handler(state: FakeProviderState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def log_message(self, format, *args):  # 요청 로그 생략
+            pass
+
+        def _reply(self, status: int, body: dict) -> None:
+            payload = json.dumps(body, ensure_ascii=False).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+        def do_GET(self):
+            self._body()
+            self._reply(200, {"templates": []})
+
+        def do_POST(self):
+            raw = self._body()
+            if state.latency:
+                time.sleep(state.latency)
+
+            if self.path.startswith("/v2/sender/alimtalk"):
+                message_id = state.record("alimtalk", 1)
+                if state.should_fail():
+                    self._reply(500, {"code": "E500", "msg": "fake failure"})
+                else:
+                    self._reply(200, {"msgid": f"fake-kakao-{message_id}"})
+                return
+
+            form = {key: values[0] for key, values in parse_qs(raw.decode()).items()}
+            path = self.path.strip("/")
+            if path == "send_mass":
+                recipients = len(json.loads(form.get("rec") or "[]"))
+            elif path == "send":
+                recipients = len([r for r in form.get("receiver", "").split(",") if r])
+            else:
+                recipients = 0
+            message_id = state.record(path, recipients)
+
+            if path == "remain":
+                self._reply(200, {"result_code": "1", "SMS_CNT": 1000, "LMS_CNT": 500, "MMS_CNT": 100})
+            elif path == "list":
+                self._reply(200, {"result_code": "1", "list": [], "total_count": 0})
+            elif state.should_fail():
+                self._reply(200, {"result_code": "-101", "message": "fake failure"})
+            else:
+                self._reply(200, {
+                    "result_code": "1",
+                    "msg_id": str(message_id),
+                    "success_cnt": recipients,
+                    "error_cnt": 0,
+                    "msg_type": form.get("msg_type", "SMS"),
+                })
+
+    return Handler
+
+
+def serve_in_thread(port: int = 0, latency: float = 0.0, fail_rate: float = 0.0):
+    """백그라운드 스레드로 서버 시작 → (server, state, base_url)"""
+    state = FakeProviderState(latency, fail_rate)
+    server = ThreadingHTTPServer(("127.0.0.1", port), _make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 알리고/알림톡 서버")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="실패 응답 비율 (0~1)")
+    args = parser.parse_args()
+
+    server, state, base_url = serve_in_thread(args.port, args.latency, args.fail_rate)
+    print(f"📨 가짜 알리고 서버: {base_url} (지연 {args.latency}s, 실패율 {args.fail_rate})")
+    try:
+        while True:
+            time.sleep(10)
+            print(f"  {state.snapshot()}")
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,18 @@
+"""
+DB 테이블 생성 + alembic upgrade head + 기본 관리자 계정 (배포 release/pre-deploy 단계에서 한 번 실행)
+
+    cd backend && python scripts/init_db.py
+
+Procfile의 release, railway.json/railway.toml의 preDeployCommand로 실행되며 서버 시작 경로에는 없다.
+기존 테이블/데이터는 건드리지 않는다.
+"""
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.database import engine, Base
-from models import user, customer, service, payment, package, lead, kit, audit
+from core.logging_config import setup_logging
+from core.schema import init_schema
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
-print("Database tables created successfully!")
\ No newline at end of file
+setup_logging(log_level=os.getenv("LOG_LEVEL", "INFO"))
+init_schema()
+print("Database schema is up to date!")
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+예약 동시 생성 부하 테스트
+
+수백 건의 예약 요청을 동시에 같은 날짜/시간대로 몰아넣고, 끝난 뒤 DB에 이중 예약이 있는지 검사한다.
+- atomic: services.reservation_booking_service (advisory lock + 구간 겹침 확인 + 재시도)
+- legacy: 기존 crud 방식 (같은 시작 시각 SELECT 2번 → INSERT)
+
+    python scripts/load_test_reservations.py
+    python scripts/load_test_reservations.py --bookings 500 --workers 64 --staff-count 3
+    python scripts/load_test_reservations.py --mode legacy      # 기존 방식의 이중 예약 재현
+
+테스트용 고객(010-0000-0013)과 먼 미래 날짜(--date)에만 쓰고, 끝나면 지운다 (--keep 으로 유지).
+atomic 모드에서 이중 예약이 발견되면 종료 코드 1.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, time as datetime_time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, delete
+
+from core.database import SessionLocal
+from models.customer import Customer
+from models.reservation import Reservation, ReservationStatus
+from models.service import ServiceType
+from models.user import User
+from services.reservation_availability_service import (
+    ACTIVE_STATUSES,
+    DEFAULT_DURATION_MINUTES,
+    ReservationAvailabilityService,
+    format_minutes,
+    saturated_intervals,
+)
+from services.reservation_booking_service import ReservationBookingService, ReservationConflictError
+
+TEST_PHONE = "010-0000-0013"
+TEST_NAME = "예약부하테스트"
+MODES = ("atomic", "legacy")
+
+
+def _setup(db, service_type_id, staff_count):
+    customer = db.execute(select(Customer).where(Customer.phone == TEST_PHONE)).scalar()
+    if not customer:
+        customer = Customer(name=TEST_NAME, phone=TEST_PHONE, membership_level="basic", customer_status="active")
+        db.add(customer)
+        db.flush()
+
+    if service_type_id is None:
+        service_type_id = db.execute(
+            select(ServiceType.service_type_id).order_by(ServiceType.service_type_id).limit(1)
+        ).scalar()
+    if service_type_id is None:
+        raise SystemExit("service_types가 비어 있습니다")
+
+    staff_ids = db.execute(
+        select(User.user_id).order_by(User.user_id).limit(staff_count)
+    ).scalars().all() if staff_count else []
+    db.commit()
+    return customer.customer_id, service_type_id, list(staff_ids)
+
+
+def _cleanup(db, customer_id, day):
+    db.execute(delete(Reservation).where(
+        Reservation.customer_id == customer_id,
+        Reservation.reservation_date == day
+    ))
+    db.commit()
+
+
+def _book_atomic(db, values):
+    booking = ReservationBookingService(db)
+
+    def _work():
+        booking.reserve(
+            values["reservation_date"], values["reservation_time"], values["duration_minutes"],
+            values["service_type_id"], values["staff_id"]
+        )
+        db.add(Reservation(**values))
+        db.flush()
+
+    booking.run(_work)
+
+
+def _book_legacy(db, values):
+    """기존 crud.create_reservation의 확인 → INSERT 순서 그대로"""
+    same_service = db.execute(select(Reservation.reservation_id).where(
+        Reservation.reservation_date == values["reservation_date"],
+        Reservation.reservation_time == values["reservation_time"],
+        Reservation.service_type_id == values["service_type_id"],
+        Reservation.status.in_(ACTIVE_STATUSES)
+    ).limit(1)).first()
+    if same_service:
+        db.rollback()
+        raise ReservationConflictError("service")
+    if values["staff_id"]:
+        same_staff = db.execute(select(Reservation.reservation_id).where(
+            Reservation.reservation_date == values["reservation_date"],
+            Reservation.reservation_time == values["reservation_time"],
+            Reservation.staff_id == values["staff_id"],
+            Reservation.status.in_(ACTIVE_STATUSES)
+        ).limit(1)).first()
+        if same_staff:
+            db.rollback()
+            raise ReservationConflictError("staff")
+    db.add(Reservation(**values))
+    db.commit()
+
+
+def _find_double_bookings(db, day, service_type_id):
+    """활성 예약 중 서비스 수용 인원 초과 / 직원 중복 구간"""
+    capacity = ReservationAvailabilityService(db).service_capacity(service_type_id)
+    rows = db.execute(select(
+        Reservation.reservation_time, Reservation.duration_minutes,
+        Reservation.service_type_id, Reservation.staff_id
+    ).where(
+        Reservation.reservation_date == day,
+        Reservation.status.in_(ACTIVE_STATUSES)
+    )).all()
+
+    service_intervals, staff_intervals = [], {}
+    for row in rows:
+        start = row.reservation_time.hour * 60 + row.reservation_time.minute
+        interval = (start, start + (row.duration_minutes or DEFAULT_DURATION_MINUTES))
+        if row.service_type_id == service_type_id:
+            service_intervals.append(interval)
+        if row.staff_id:
+            staff_intervals.setdefault(row.staff_id, []).append(interval)
+
+    problems = [
+        f"서비스 {service_type_id} 수용 인원({capacity}) 초과 {format_minutes(s)}~{format_minutes(e)}"
+        for s, e in saturated_intervals(service_intervals, capacity + 1)
+    ]
+    for staff_id, intervals in staff_intervals.items():
+        problems.extend(
+            f"직원 {staff_id} 중복 {format_minutes(s)}~{format_minutes(e)}"
+            for s, e in saturated_intervals(intervals, 2)
+        )
+    return len(rows), problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 동시 생성 부하 테스트")
+    parser.add_argument("--bookings", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--mode", default="atomic", choices=MODES)
+    parser.add_argument("--date", type=date.fromisoformat, default=date(2099, 1, 5))
+    parser.add_argument("--service-type-id", type=int)
+    parser.add_argument("--staff-count", type=int, default=2, help="요청에 섞어 넣을 직원 수 (0이면 직원 없음)")
+    parser.add_argument("--slots", type=int, default=8, help="경합시킬 시작 시각 수 (10:00부터 15분 간격)")
+    parser.add_argument("--keep", action="store_true", help="생성한 예약을 지우지 않음")
+    args = parser.parse_args()
+
+    setup_db = SessionLocal()
+    customer_id, service_type_id, staff_ids = _setup(setup_db, args.service_type_id, args.staff_count)
+    _cleanup(setup_db, customer_id, args.date)
+
+    rng = random.Random(13)
+    requests = []
+    for _ in range(args.bookings):
+        minutes = 10 * 60 + rng.randrange(args.slots) * 15
+        requests.append({
+            "customer_id": customer_id,
+            "service_type_id": service_type_id,
+            "staff_id": rng.choice(staff_ids + [None]) if staff_ids else None,
+            "reservation_date": args.date,
+            "reservation_time": datetime_time(minutes // 60, minutes % 60),
+            "duration_minutes": rng.choice([30, 60, 90]),
+            "status": ReservationStatus.pending,
+            "internal_memo": "load_test_reservations",
+        })
+
+    book = _book_atomic if args.mode == "atomic" else _book_legacy
+    start_gate = threading.Event()
+    outcomes = Counter()
+    latencies = []
+    lock = threading.Lock()
+
+    def _fire(values):
+        start_gate.wait()
+        db = SessionLocal()
+        started = time.perf_counter()
+        try:
+            book(db, values)
+            outcome = "booked"
+        except ReservationConflictError:
+            outcome = "conflict"
+        except Exception as e:
+            outcome = f"error:{type(e).__name__}"
+            db.rollback()
+        finally:
+            db.close()
+        with lock:
+            outcomes[outcome] += 1
+            latencies.append(time.perf_counter() - started)
+
+    print(f"🚀 {args.mode}: 예약 {args.bookings}건 / 동시 {args.workers} / {args.date} 서비스 {service_type_id} 직원 {staff_ids or '-'}")
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(_fire, values) for values in requests]
+        time.sleep(0.2)  # 워커가 모두 대기 상태가 되도록
+        started = time.perf_counter()
+        start_gate.set()
+        for future in futures:
+            future.result()
+        elapsed = time.perf_counter() - started
+
+    active_count, problems = _find_double_bookings(setup_db, args.date, service_type_id)
+    latencies.sort()
+    print(f"  결과      {dict(outcomes)}")
+    print(f"  처리량    {args.bookings / elapsed:8.1f} 요청/s  ({elapsed:.2f}s)")
+    print(
+        f"  지연      p50 {statistics.median(latencies) * 1000:.1f}ms  "
+        f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.1f}ms  "
+        f"max {latencies[-1] * 1000:.1f}ms"
+    )
+    print(f"  활성 예약 {active_count}건")
+    if problems:
+        print(f"  ❌ 이중 예약 {len(problems)}건")
+        for problem in problems[:20]:
+            print(f"     - {problem}")
+    else:
+        print("  ✅ 이중 예약 없음")
+
+    if not args.keep:
+        _cleanup(setup_db, customer_id, args.date)
+    setup_db.close()
+
+    if problems and args.mode == "atomic":
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
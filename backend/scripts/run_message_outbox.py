@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+SMS/알림톡 발송 대기열 워커 (API 프로세스와 분리해서 실행할 때)
+
+API 서버는 MESSAGE_OUTBOX_WORKER_ENABLED=false 로 두고 이 스크립트를 한 개 이상 띄운다.
+FOR UPDATE SKIP LOCKED로 가져가므로 여러 개를 띄워도 같은 메시지를 중복 발송하지 않는다.
+
+    python scripts/run_message_outbox.py            # 계속 실행
+    python scripts/run_message_outbox.py --once     # 대기열을 한 번 비우고 종료
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.config import settings
+from core.logging_config import setup_logging, get_logger
+from services.message_outbox_service import MessageOutboxDispatcher
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SMS/알림톡 발송 대기열 워커")
+    parser.add_argument("--once", action="store_true", help="보낼 메시지가 없을 때까지 처리하고 종료")
+    parser.add_argument("--poll", type=float, default=settings.MESSAGE_OUTBOX_POLL_SECONDS)
+    args = parser.parse_args()
+
+    setup_logging(log_level=os.getenv("LOG_LEVEL", "INFO"))
+    dispatcher = MessageOutboxDispatcher()
+    logger.info("Message outbox worker started (standalone)")
+
+    while True:
+        try:
+            stats = dispatcher.dispatch_once()
+        except Exception as e:
+            logger.error(f"Error in message outbox worker: {e}")
+            time.sleep(args.poll * 5)
+            continue
+        if stats["claimed"] < dispatcher.batch_size:
+            if args.once:
+                break
+            time.sleep(args.poll)
+
+
+if __name__ == "__main__":
+    main()
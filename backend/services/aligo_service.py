@@ -1,41 +1,57 @@
-import requests
 import json
 from typing import Dict, Optional, List, Union
-from datetime import datetime
 import logging
+
+import httpx
+
 from core.config import settings
+from utils.provider_client import ProviderClient, CircuitOpenError, register_provider_client
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LMS_TITLE = "[AIBIO 센터]"
+
+
+def _error_result(e: Exception, label: str) -> Dict:
+    """호출 예외 → 발송 실패 결과"""
+    if isinstance(e, CircuitOpenError):
+        return {"success": False, "error_code": "CIRCUIT_OPEN", "error_message": str(e)}
+    if isinstance(e, httpx.HTTPError):
+        logger.error(f"알리고 API 요청 오류: {str(e)}")
+        return {"success": False, "error_code": "NETWORK_ERROR", "error_message": f"네트워크 오류: {str(e)}"}
+    logger.error(f"{label} 중 오류: {str(e)}")
+    return {"success": False, "error_code": "UNKNOWN_ERROR", "error_message": f"알 수 없는 오류: {str(e)}"}
+
+
 class AligoSMSService:
     """알리고 SMS 발송 서비스"""
     
     def __init__(self):
-        self.base_url = "https://apis.aligo.in"
         self.api_key = settings.ALIGO_API_KEY
         self.user_id = settings.ALIGO_USER_ID
         self.sender = settings.ALIGO_SENDER
-        
-    def send_sms(
-        self,
-        receiver: Union[str, List[str]],
-        message: str,
-        title: Optional[str] = None,
-        testmode_yn: str = "N"
-    ) -> Dict:
-        """
-        SMS/LMS 발송
-        
-        Args:
-            receiver: 수신자 전화번호 (단일 또는 리스트)
-            message: 메시지 내용
-            title: LMS 제목 (90자 이상 시 자동 LMS 발송)
-            testmode_yn: 테스트 모드 여부 (Y/N)
-            
-        Returns:
-            발송 결과 딕셔너리
-        """
-        
+        self.client = register_provider_client(ProviderClient(
+            "aligo",
+            settings.ALIGO_BASE_URL,
+            max_concurrency=settings.ALIGO_MAX_CONCURRENCY,
+            rate_per_second=settings.ALIGO_RATE_LIMIT_PER_SECOND,
+            timeout=settings.PROVIDER_TIMEOUT_SECONDS,
+            failure_threshold=settings.PROVIDER_CIRCUIT_FAILURE_THRESHOLD,
+            reset_seconds=settings.PROVIDER_CIRCUIT_RESET_SECONDS,
+        ))
+
+    @property
+    def base_url(self) -> str:
+        return self.client.base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self.client.base_url = value.rstrip("/")
+
+    # ------------------------------------------------------------------
+    # 요청/응답 변환 (동기/비동기 공용)
+    # ------------------------------------------------------------------
+    def _sms_request(self, receiver: Union[str, List[str]], message: str, title: Optional[str], testmode_yn: str):
         # 수신자 처리 (리스트인 경우 콤마로 구분)
         if isinstance(receiver, list):
             receiver_str = ",".join([r.replace("-", "") for r in receiver])
@@ -59,55 +75,110 @@ class AligoSMSService:
         }
         
         # LMS인 경우 제목 추가
-        if msg_type == "LMS" and title:
-            data["title"] = title
-        elif msg_type == "LMS" and not title:
-            data["title"] = "[AIBIO 센터]"
-            
-        try:
-            response = requests.post(
-                f"{self.base_url}/send/",
-                data=data,
-                timeout=10
-            )
-            
-            result = response.json()
-            
-            if result.get("result_code") == "1":
-                return {
-                    "success": True,
-                    "message_id": result.get("msg_id"),
-                    "success_cnt": result.get("success_cnt", receiver_cnt),
-                    "error_cnt": result.get("error_cnt", 0),
-                    "msg_type": result.get("msg_type", msg_type)
-                }
-            else:
-                logger.error(f"알리고 SMS 발송 실패: {result}")
-                return {
-                    "success": False,
-                    "error_code": result.get("result_code"),
-                    "error_message": result.get("message", "SMS 발송 실패")
-                }
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"알리고 API 요청 오류: {str(e)}")
+        if msg_type == "LMS":
+            data["title"] = title or DEFAULT_LMS_TITLE
+        return data, receiver_cnt, msg_type
+
+    @staticmethod
+    def _sms_result(result: Dict, receiver_cnt: int, msg_type: str) -> Dict:
+        if result.get("result_code") == "1":
             return {
-                "success": False,
-                "error_code": "NETWORK_ERROR",
-                "error_message": f"네트워크 오류: {str(e)}"
+                "success": True,
+                "message_id": result.get("msg_id"),
+                "success_cnt": result.get("success_cnt", receiver_cnt),
+                "error_cnt": result.get("error_cnt", 0),
+                "msg_type": result.get("msg_type", msg_type)
             }
-        except Exception as e:
-            logger.error(f"SMS 발송 중 오류: {str(e)}")
+        logger.error(f"알리고 SMS 발송 실패: {result}")
+        return {
+            "success": False,
+            "error_code": result.get("result_code"),
+            "error_message": result.get("message", "SMS 발송 실패")
+        }
+
+    def _mass_request(self, receivers: List[Dict[str, str]], testmode_yn: str, msg_type: str, title: Optional[str]) -> Dict:
+        # 수신자 데이터 포맷팅
+        rec_data = [
+            {"r": rec["phone"].replace("-", ""), "c": rec["message"], "n": rec.get("name", "")}
+            for rec in receivers
+        ]
+        data = {
+            "key": self.api_key,
+            "user_id": self.user_id,
+            "sender": self.sender.replace("-", ""),
+            "rec": json.dumps(rec_data),
+            "msg_type": msg_type,
+            "testmode_yn": testmode_yn
+        }
+        if msg_type == "LMS":
+            data["title"] = title or DEFAULT_LMS_TITLE
+        return data
+
+    @staticmethod
+    def _mass_result(result: Dict, receiver_cnt: int) -> Dict:
+        if result.get("result_code") == "1":
             return {
-                "success": False,
-                "error_code": "UNKNOWN_ERROR",
-                "error_message": f"알 수 없는 오류: {str(e)}"
+                "success": True,
+                "message_id": result.get("msg_id"),
+                "success_cnt": result.get("success_cnt", receiver_cnt),
+                "error_cnt": result.get("error_cnt", 0)
             }
+        return {
+            "success": False,
+            "error_code": result.get("result_code"),
+            "error_message": result.get("message", "대량 SMS 발송 실패")
+        }
+
+    # ------------------------------------------------------------------
+    # 발송
+    # ------------------------------------------------------------------
+    def send_sms(
+        self,
+        receiver: Union[str, List[str]],
+        message: str,
+        title: Optional[str] = None,
+        testmode_yn: str = "N"
+    ) -> Dict:
+        """
+        SMS/LMS 발송
+        
+        Args:
+            receiver: 수신자 전화번호 (단일 또는 리스트)
+            message: 메시지 내용
+            title: LMS 제목 (90자 이상 시 자동 LMS 발송)
+            testmode_yn: 테스트 모드 여부 (Y/N)
+            
+        Returns:
+            발송 결과 딕셔너리
+        """
+        data, receiver_cnt, msg_type = self._sms_request(receiver, message, title, testmode_yn)
+        try:
+            response = self.client.request("POST", "/send/", data=data)
+            return self._sms_result(response.json(), receiver_cnt, msg_type)
+        except Exception as e:
+            return _error_result(e, "SMS 발송")
+
+    async def send_sms_async(
+        self,
+        receiver: Union[str, List[str]],
+        message: str,
+        title: Optional[str] = None,
+        testmode_yn: str = "N"
+    ) -> Dict:
+        """SMS/LMS 발송 (비동기 - 결과 형식은 send_sms와 같음)"""
+        data, receiver_cnt, msg_type = self._sms_request(receiver, message, title, testmode_yn)
+        try:
+            response = await self.client.arequest("POST", "/send/", data=data)
+            return self._sms_result(response.json(), receiver_cnt, msg_type)
+        except Exception as e:
+            return _error_result(e, "SMS 발송")
     
     def send_mass(
         self,
         receivers: List[Dict[str, str]],
-        testmode_yn: str = "N"
+        testmode_yn: str = "N",
+        msg_type: str = "SMS",
+        title: Optional[str] = None
     ) -> Dict:
         """
         대량 SMS 발송 (개별 메시지)
@@ -115,59 +186,33 @@ class AligoSMSService:
         Args:
             receivers: [{"phone": "010-1234-5678", "message": "안녕하세요", "name": "홍길동"}]
             testmode_yn: 테스트 모드 여부
+            msg_type: SMS 또는 LMS (한 번의 요청은 같은 타입만 가능)
+            title: LMS 제목
             
         Returns:
             발송 결과
         """
-        
-        # 수신자 데이터 포맷팅
-        rec_data = []
-        for idx, rec in enumerate(receivers):
-            rec_data.append({
-                "r": rec["phone"].replace("-", ""),
-                "c": rec["message"],
-                "n": rec.get("name", "")
-            })
-            
-        data = {
-            "key": self.api_key,
-            "user_id": self.user_id,
-            "sender": self.sender.replace("-", ""),
-            "rec": json.dumps(rec_data),
-            "msg_type": "SMS",  # 대량 발송은 기본 SMS
-            "testmode_yn": testmode_yn
-        }
-        
+        data = self._mass_request(receivers, testmode_yn, msg_type, title)
         try:
-            response = requests.post(
-                f"{self.base_url}/send_mass/",
-                data=data,
-                timeout=30
-            )
-            
-            result = response.json()
-            
-            if result.get("result_code") == "1":
-                return {
-                    "success": True,
-                    "message_id": result.get("msg_id"),
-                    "success_cnt": result.get("success_cnt", len(receivers)),
-                    "error_cnt": result.get("error_cnt", 0)
-                }
-            else:
-                return {
-                    "success": False,
-                    "error_code": result.get("result_code"),
-                    "error_message": result.get("message", "대량 SMS 발송 실패")
-                }
-                
+            response = self.client.request("POST", "/send_mass/", data=data, timeout=30)
+            return self._mass_result(response.json(), len(receivers))
         except Exception as e:
-            logger.error(f"대량 SMS 발송 중 오류: {str(e)}")
-            return {
-                "success": False,
-                "error_code": "UNKNOWN_ERROR",
-                "error_message": str(e)
-            }
+            return _error_result(e, "대량 SMS 발송")
+
+    async def send_mass_async(
+        self,
+        receivers: List[Dict[str, str]],
+        testmode_yn: str = "N",
+        msg_type: str = "SMS",
+        title: Optional[str] = None
+    ) -> Dict:
+        """대량 SMS 발송 (비동기)"""
+        data = self._mass_request(receivers, testmode_yn, msg_type, title)
+        try:
+            response = await self.client.arequest("POST", "/send_mass/", data=data, timeout=30)
+            return self._mass_result(response.json(), len(receivers))
+        except Exception as e:
+            return _error_result(e, "대량 SMS 발송")
     
     def get_remain_sms(self) -> Dict:
         """SMS 잔여건수 조회"""
@@ -179,11 +224,7 @@ class AligoSMSService:
         
         try:
             logger.info(f"알리고 잔여건수 조회 시작: user_id={self.user_id}")
-            response = requests.post(
-                f"{self.base_url}/remain/",
-                data=data,
-                timeout=10
-            )
+            response = self.client.request("POST", "/remain/", data=data)
             
             result = response.json()
             logger.info(f"알리고 잔여건수 조회 응답: {result}")
@@ -238,11 +279,7 @@ class AligoSMSService:
             data["start_date"] = start_date
             
         try:
-            response = requests.post(
-                f"{self.base_url}/list/",
-                data=data,
-                timeout=10
-            )
+            response = self.client.request("POST", "/list/", data=data)
             
             result = response.json()
             
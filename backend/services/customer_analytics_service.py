@@ -0,0 +1,227 @@
+"""
+고객 분석 서비스
+고객 상세 페이지의 분석 데이터를 단일 CTE 쿼리로 조회하고 캐싱한다.
+"""
+from typing import Dict, Any, Optional, Set
+from datetime import date, timedelta
+from sqlalchemy import text, event
+from sqlalchemy.orm import Session
+
+from models.payment import Payment
+from models.service import ServiceUsage
+from models.reservation import Reservation
+from utils.cache import CacheService
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 지원 기간 (API period 파라미터 → 일수)
+PERIOD_DAYS = {
+    "30d": 30,
+    "90d": 90,
+    "180d": 180,
+    "6months": 180,
+    "1y": 365
+}
+DEFAULT_PERIOD_DAYS = 90
+CACHE_EXPIRE_SECONDS = 600
+
+DAY_NAMES = ['일요일', '월요일', '화요일', '수요일', '목요일', '금요일', '토요일']
+
+# 고객 1명의 분석 데이터 전체를 한 번의 왕복으로 조회
+ANALYTICS_QUERY = text("""
+    WITH usage AS (
+        SELECT service_date, service_type_id
+        FROM service_usage
+        WHERE customer_id = :customer_id
+    ),
+    basic AS (
+        SELECT
+            COUNT(DISTINCT service_date) AS total_visits,
+            MIN(service_date) AS first_visit,
+            MAX(service_date) AS last_visit
+        FROM usage
+    ),
+    services AS (
+        SELECT st.service_type_id, st.service_name, COUNT(*) AS usage_count
+        FROM usage u
+        JOIN service_types st ON u.service_type_id = st.service_type_id
+        WHERE u.service_date >= :since
+        GROUP BY st.service_type_id, st.service_name
+    ),
+    revenue AS (
+        SELECT TO_CHAR(payment_date, 'YYYY-MM') AS month, SUM(amount) AS revenue
+        FROM payments
+        WHERE customer_id = :customer_id
+            AND payment_date >= :since
+        GROUP BY TO_CHAR(payment_date, 'YYYY-MM')
+    ),
+    day_pattern AS (
+        SELECT EXTRACT(DOW FROM service_date)::int AS dow, COUNT(*) AS cnt
+        FROM usage
+        GROUP BY EXTRACT(DOW FROM service_date)
+        ORDER BY cnt DESC
+        LIMIT 1
+    ),
+    reservation_stats AS (
+        SELECT
+            COUNT(*) FILTER (WHERE status = 'cancelled') AS cancelled_count,
+            COUNT(*) FILTER (WHERE status = 'no_show') AS no_show_count,
+            COUNT(*) AS total_reservations
+        FROM reservations
+        WHERE customer_id = :customer_id
+            AND reservation_date >= :since
+    )
+    SELECT
+        b.total_visits,
+        b.first_visit,
+        b.last_visit,
+        r.cancelled_count,
+        r.no_show_count,
+        r.total_reservations,
+        (SELECT dow FROM day_pattern) AS preferred_dow,
+        (
+            SELECT COALESCE(json_agg(json_build_object(
+                'service_type_id', s.service_type_id,
+                'service_name', s.service_name,
+                'usage_count', s.usage_count
+            ) ORDER BY s.usage_count DESC), '[]'::json)
+            FROM services s
+        ) AS services,
+        (
+            SELECT COALESCE(json_agg(json_build_object(
+                'month', rv.month,
+                'revenue', rv.revenue
+            ) ORDER BY rv.month), '[]'::json)
+            FROM revenue rv
+        ) AS revenue_by_month
+    FROM basic b
+    CROSS JOIN reservation_stats r
+""")
+
+
+def _cache_key(customer_id: int, period_days: int) -> str:
+    return f"aibio:customer_analytics:{customer_id}:{period_days}"
+
+
+def _cache_tag(customer_id: int) -> str:
+    return f"customer_analytics:{customer_id}"
+
+
+def invalidate_customer_analytics(customer_id: Optional[int]) -> None:
+    """고객의 분석 캐시 전체(모든 기간) 삭제"""
+    if customer_id is None:
+        return
+    CacheService.invalidate_tags(_cache_tag(customer_id))
+
+
+class CustomerAnalyticsService:
+    """고객 분석 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_analytics(self, customer_id: int, period: str = "90d") -> Dict[str, Any]:
+        """고객 분석 데이터 (캐시 우선)"""
+        period_days = PERIOD_DAYS.get(period, DEFAULT_PERIOD_DAYS)
+        cache_key = _cache_key(customer_id, period_days)
+
+        cached = CacheService.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._compute(customer_id, period_days)
+        CacheService.set(cache_key, result, CACHE_EXPIRE_SECONDS, tags=[_cache_tag(customer_id)])
+        return result
+
+    def _compute(self, customer_id: int, period_days: int) -> Dict[str, Any]:
+        since = date.today() - timedelta(days=period_days)
+        row = self.db.execute(ANALYTICS_QUERY, {"customer_id": customer_id, "since": since}).first()
+
+        total_visits = row.total_visits or 0
+
+        # 평균 방문 주기 계산
+        if total_visits > 1:
+            days_between = (row.last_visit - row.first_visit).days
+            avg_interval = days_between / (total_visits - 1)
+        else:
+            avg_interval = 0
+
+        # 서비스별 카운트 (이용 횟수 내림차순)
+        service_counts = {}
+        total_sessions = 0
+        for service in row.services:
+            service_counts[service["service_name"]] = service["usage_count"]
+            total_sessions += service["usage_count"]
+        most_used_service = row.services[0]["service_name"] if row.services else None
+
+        # 월별 매출 데이터
+        revenue_by_month = [
+            {"month": item["month"], "revenue": float(item["revenue"])}
+            for item in row.revenue_by_month
+        ]
+        total_revenue = sum(item["revenue"] for item in revenue_by_month)
+
+        # 예약 취소율 및 노쇼율
+        cancellation_rate = 0
+        no_show_rate = 0
+        if row.total_reservations:
+            cancellation_rate = (row.cancelled_count / row.total_reservations) * 100
+            no_show_rate = (row.no_show_count / row.total_reservations) * 100
+
+        # 1970-01-01 같은 기본값은 None으로 처리
+        first_visit = row.first_visit.isoformat() if row.first_visit and row.first_visit.year > 1970 else None
+        last_visit = row.last_visit.isoformat() if row.last_visit and row.last_visit.year > 1970 else None
+
+        return {
+            "visit_summary": {
+                "total_visits": total_visits,
+                "first_visit": first_visit,
+                "last_visit": last_visit,
+                "visit_frequency": total_visits,
+                "average_interval_days": int(avg_interval) if avg_interval > 0 else 0
+            },
+            "service_summary": {
+                "most_used_service": most_used_service or "정보 없음",
+                "service_counts": service_counts,
+                "total_sessions": total_sessions
+            },
+            "revenue_summary": {
+                "total_revenue": total_revenue,
+                "average_per_visit": total_revenue / total_visits if total_visits > 0 else 0,
+                "revenue_by_month": revenue_by_month
+            },
+            "patterns": {
+                # service_date가 DATE이므로 시간 정보 없음
+                "preferred_time": "정보 없음",
+                "preferred_day": DAY_NAMES[row.preferred_dow] if row.preferred_dow is not None else "정보 없음",
+                "cancellation_rate": round(cancellation_rate, 1),
+                "no_show_rate": round(no_show_rate, 1)
+            }
+        }
+
+
+# ----------------------------------------------------------------------
+# 캐시 무효화: 결제/서비스 이용/예약이 변경되어 커밋되면 해당 고객 캐시 삭제
+# ----------------------------------------------------------------------
+_TRACKED_MODELS = (Payment, ServiceUsage, Reservation)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_customers(session, flush_context):
+    changed: Set[int] = session.info.setdefault("analytics_dirty_customers", set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, _TRACKED_MODELS) and obj.customer_id is not None:
+            changed.add(obj.customer_id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_customers(session):
+    changed = session.info.pop("analytics_dirty_customers", None)
+    for customer_id in changed or ():
+        invalidate_customer_analytics(customer_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_customers(session):
+    session.info.pop("analytics_dirty_customers", None)
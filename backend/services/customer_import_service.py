@@ -0,0 +1,396 @@
+"""
+고객 엑셀 일괄 가져오기 서비스
+
+행 단위 iterrows + 행마다 전화번호 조회/커밋 대신
+1. pandas 컬럼 단위로 전화번호/날짜/문자열 정규화
+2. 기존 전화번호를 한 번에 조회해 dict로 보관
+3. INSERT ... ON CONFLICT (phone) 를 배치 단위로 실행
+4. 실패한 배치만 행 단위(SAVEPOINT)로 다시 시도해 행별 오류 보고
+"""
+import re
+from datetime import date
+from typing import Any, Dict, List, Tuple
+
+import pandas as pd
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models.customer import Customer
+from services.daily_rollup_service import DailyRollupService
+from utils.excel import ExcelHandler
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+IMPORT_BATCH_SIZE = 1000
+PHONE_LOOKUP_CHUNK = 5000
+MAX_IMPORT_ROWS = 50000
+ON_DUPLICATE_MODES = ("skip", "update")
+
+# 엑셀 헤더 별칭 → 표준 헤더
+COLUMN_MAPPING = {
+    '성함': '이름',
+    '연락처': '전화번호',
+    '거주지역': '지역',
+    '방문경로': '유입경로',
+    '비고(메모)': '메모',
+    '담당자': '담당직원',
+    '첫방문일': '첫방문일자',
+    '첫 방문일': '첫방문일자',
+    '최초방문일': '첫방문일자',
+    '최초 방문일': '첫방문일자',
+    '첫방문': '첫방문일자',
+    '가입일': '첫방문일자',
+    '호소문제': '건강고민'
+}
+REQUIRED_COLUMNS = ['이름', '전화번호']
+
+# 표준 헤더 → 모델 필드 (문자열 컬럼)
+STRING_FIELDS = {
+    'name': '이름',
+    'email': '이메일',
+    'gender': '성별',
+    'address': '주소',
+    'region': '지역',
+    'referral_source': '유입경로',
+    'notes': '메모',
+    'health_concerns': '건강고민',
+    'assigned_staff': '담당직원',
+}
+IMPORT_FIELDS = list(STRING_FIELDS) + ['phone', 'birth_year', 'first_visit_date']
+FIELD_LABELS = {**STRING_FIELDS, 'phone': '전화번호', 'birth_year': '생년월일', 'first_visit_date': '첫방문일자'}
+
+# 엑셀 일련번호 기준일 (1900 윤년 버그 보정 포함 - ExcelHandler.parse_date와 동일)
+EXCEL_EPOCH = "1899-12-30"
+YEAR_PATTERN = r"((?:19|20)\d{2})"
+
+
+def _column(df: pd.DataFrame, header: str) -> pd.Series:
+    if header in df.columns:
+        return df[header]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def _is_blank(values: pd.Series) -> pd.Series:
+    return values.isna() | (values.astype(str).str.strip() == "")
+
+
+def _or_none(values: pd.Series) -> pd.Series:
+    """빈 문자열/결측값 → None (DB에 NULL로 저장)"""
+    present = (values.notna() & (values != "")).fillna(False).astype(bool)
+    return values.astype(object).where(present, None)
+
+
+def clean_strings(values: pd.Series) -> pd.Series:
+    """ExcelHandler.clean_string의 컬럼 버전"""
+    return _or_none(values.astype("string").str.strip())
+
+
+def normalize_phones(values: pd.Series) -> pd.Series:
+    """ExcelHandler.clean_phone의 컬럼 버전 (010 번호는 하이픈 형식으로)"""
+    text = values.astype("string")
+    # 숫자 셀로 읽힌 전화번호(01012345678.0)의 소수점 제거
+    text = text.str.replace(r"\.0$", "", regex=True)
+    digits = text.str.replace(r"[^0-9]", "", regex=True)
+
+    is_mobile = digits.str.startswith("010")
+    length = digits.str.len()
+    eleven = is_mobile & (length == 11)
+    ten = is_mobile & (length == 10)
+
+    result = digits.copy()
+    result[eleven] = digits[eleven].str[:3] + "-" + digits[eleven].str[3:7] + "-" + digits[eleven].str[7:]
+    result[ten] = digits[ten].str[:3] + "-" + digits[ten].str[3:6] + "-" + digits[ten].str[6:]
+    return _or_none(result)
+
+
+def _normalize_date_strings(values: pd.Series) -> pd.Series:
+    """'2024년 1월 5일', '2024.01.05', '2024/1/5' → '2024-1-5'"""
+    text = values.astype("string").str.strip()
+    text = text.str.replace("년", "-", regex=False).str.replace("월", "-", regex=False).str.replace("일", "", regex=False)
+    text = text.str.replace(r"[./\s]+", "-", regex=True).str.replace(r"-+", "-", regex=True).str.strip("-")
+    return text
+
+
+def parse_dates(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    날짜 컬럼 파싱 → (date 또는 None 시리즈, 값은 있는데 파싱 실패한 행 mask)
+
+    일반적인 형식(날짜 셀, 엑셀 일련번호, YYYY-MM-DD, YYYYMMDD)은 컬럼 단위로 처리하고
+    남은 행만 ExcelHandler.parse_date로 한 건씩 처리한다.
+    """
+    parsed = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    present = ~_is_blank(values)
+    if not present.any():
+        return parsed.astype(object).where(parsed.notna(), None), present & False
+
+    kinds = values.map(type)
+    is_datetime = present & kinds.map(lambda t: issubclass(t, date))
+    is_number = present & kinds.map(lambda t: issubclass(t, (int, float)) and not issubclass(t, bool))
+    is_text = present & ~is_datetime & ~is_number
+
+    if is_datetime.any():
+        parsed[is_datetime] = pd.to_datetime(values[is_datetime], errors="coerce")
+
+    if is_number.any():
+        serial = pd.to_numeric(values[is_number], errors="coerce")
+        serial = serial.where((serial >= 1) & (serial < 2958466))
+        parsed[is_number] = pd.to_datetime(serial, unit="D", origin=EXCEL_EPOCH, errors="coerce")
+
+    if is_text.any():
+        text = _normalize_date_strings(values[is_text])
+        result = pd.to_datetime(text, format="%Y-%m-%d", errors="coerce")
+        remaining = result.isna()
+        if remaining.any():
+            result[remaining] = pd.to_datetime(text[remaining], format="ISO8601", errors="coerce")
+            remaining = result.isna()
+        if remaining.any():
+            result[remaining] = pd.to_datetime(text[remaining], format="%Y%m%d", errors="coerce")
+        parsed[is_text] = result
+
+    # 나머지(드문 형식)는 기존 파서로 개별 처리
+    leftover = present & parsed.isna()
+    for index in leftover[leftover].index:
+        value = ExcelHandler.parse_date(values[index])
+        if value is not None:
+            parsed[index] = pd.Timestamp(value)
+
+    failed = present & parsed.isna()
+    dates = parsed.dt.date.astype(object).where(parsed.notna(), None)
+    return dates, failed
+
+
+def parse_years(values: pd.Series) -> pd.Series:
+    """ExcelHandler.parse_year의 컬럼 버전 (숫자 연도, 날짜, 문자열 속 4자리 연도)"""
+    present = ~_is_blank(values)
+    years = pd.Series(pd.NA, index=values.index, dtype="Int64")
+    if not present.any():
+        return years.astype(object).where(years.notna(), None)
+
+    kinds = values.map(type)
+    is_datetime = present & kinds.map(lambda t: issubclass(t, date))
+    is_number = present & kinds.map(lambda t: issubclass(t, (int, float)) and not issubclass(t, bool))
+    is_text = present & ~is_datetime & ~is_number
+
+    if is_number.any():
+        numbers = pd.to_numeric(values[is_number], errors="coerce")
+        years[is_number] = (numbers.where((numbers >= 1900) & (numbers <= 2100)) // 1).astype("Int64")
+    if is_datetime.any():
+        years[is_datetime] = pd.to_datetime(values[is_datetime], errors="coerce").dt.year.astype("Int64")
+    if is_text.any():
+        extracted = values[is_text].astype("string").str.extract(YEAR_PATTERN, expand=False)
+        years[is_text] = pd.to_numeric(extracted, errors="coerce").astype("Int64")
+
+    return years.astype(object).where(years.notna(), None)
+
+
+def prepare_customer_frame(df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    """엑셀 DataFrame → 모델 필드 DataFrame (+ 첫방문일 파싱 실패 mask)"""
+    frame = pd.DataFrame(index=df.index)
+    for field, header in STRING_FIELDS.items():
+        frame[field] = clean_strings(_column(df, header))
+    frame['phone'] = normalize_phones(_column(df, '전화번호'))
+    frame['birth_year'] = parse_years(_column(df, '생년월일'))
+
+    first_visit = _column(df, '첫방문일자')
+    if '등록일' in df.columns:
+        first_visit = first_visit.where(~_is_blank(first_visit), df['등록일'])
+    frame['first_visit_date'], date_failed = parse_dates(first_visit)
+    return frame[IMPORT_FIELDS], date_failed
+
+
+def _string_limits() -> Dict[str, int]:
+    limits = {}
+    for field in IMPORT_FIELDS:
+        length = getattr(Customer.__table__.c[field].type, "length", None)
+        if length:
+            limits[field] = length
+    return limits
+
+
+class CustomerImportService:
+    """고객 엑셀 일괄 가져오기"""
+
+    def __init__(self, db: Session, batch_size: int = IMPORT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def import_dataframe(self, df: pd.DataFrame, on_duplicate: str = "skip") -> Dict[str, Any]:
+        """
+        on_duplicate
+          - skip: 이미 등록된 전화번호는 오류로 보고하고 건너뜀 (기존 동작)
+          - update: 엑셀에 값이 있는 항목만 기존 고객 정보에 덮어씀
+        """
+        if on_duplicate not in ON_DUPLICATE_MODES:
+            raise ValueError(f"on_duplicate must be one of {ON_DUPLICATE_MODES}")
+
+        df = df.rename(columns=COLUMN_MAPPING)
+        missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+        if missing:
+            raise ValueError(f"필수 컬럼이 누락되었습니다: {', '.join(missing)}")
+
+        frame, date_failed = prepare_customer_frame(df)
+        errors: List[Dict[str, Any]] = []
+        valid = pd.Series(True, index=frame.index)
+
+        def reject(mask: pd.Series, reason) -> None:
+            nonlocal valid
+            mask = mask & valid
+            for index in mask[mask].index:
+                errors.append(self._error(index, frame.loc[index], reason(index) if callable(reason) else reason))
+            valid &= ~mask
+
+        reject(frame['name'].isna(), "이름이 없습니다")
+        for field, limit in _string_limits().items():
+            too_long = frame[field].map(lambda v: v is not None and len(str(v)) > limit)
+            reject(too_long, f"{FIELD_LABELS[field]} 길이 초과 (최대 {limit}자)")
+
+        # 엑셀 파일 내 중복 - 처음 나온 (유효한) 행만 가져옴
+        has_phone = frame['phone'].notna()
+        phone_counts = frame.loc[has_phone, 'phone'].value_counts()
+        file_duplicate_count = int((phone_counts > 1).sum())
+        valid_phones = frame['phone'].where(valid & has_phone)
+        first_row = frame.index.to_series()[valid & has_phone].groupby(valid_phones).first()
+        reject(
+            has_phone & valid_phones.duplicated(keep='first'),
+            lambda index: f"엑셀 파일 내 중복된 전화번호 {frame.at[index, 'phone']} (행 {first_row[frame.at[index, 'phone']] + 2}과 중복)"
+        )
+
+        existing = self._fetch_existing(frame.loc[valid & has_phone, 'phone'].tolist())
+        is_existing = frame['phone'].isin(list(existing))
+        if on_duplicate == "skip":
+            reject(
+                is_existing,
+                lambda index: f"전화번호 {frame.at[index, 'phone']}는 이미 등록됨 (고객: {existing[frame.at[index, 'phone']]['name']})"
+            )
+
+        rows = frame[valid]
+        inserted_count = 0
+        updated_count = 0
+        affected_dates = set()
+
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows.iloc[start:start + self.batch_size]
+            saved = self._save_batch(batch, on_duplicate, errors)
+            for index in saved:
+                if is_existing[index]:
+                    updated_count += 1
+                    affected_dates.add(existing[frame.at[index, 'phone']]['first_visit_date'])
+                else:
+                    inserted_count += 1
+                affected_dates.add(frame.at[index, 'first_visit_date'])
+        affected_dates.discard(None)
+
+        # 대시보드 일별 신규 고객 집계 갱신 (같은 트랜잭션)
+        DailyRollupService(self.db).refresh_new_customers(affected_dates)
+        self.db.commit()
+
+        errors.sort(key=lambda error: error["row"])
+        warnings = []
+        if file_duplicate_count:
+            warnings.append(f"엑셀 파일 내 중복된 전화번호 {file_duplicate_count}개 발견")
+        date_issue_count = int(date_failed.sum())
+        if date_issue_count:
+            warnings.append(f"첫방문일 파싱 실패: {date_issue_count}건")
+
+        logger.info(
+            f"고객 엑셀 가져오기 완료 - 전체 {len(frame)}, 신규 {inserted_count}, "
+            f"갱신 {updated_count}, 오류 {len(errors)}"
+        )
+        result = {
+            "message": "엑셀 가져오기 완료",
+            "total_rows": len(frame),
+            "success_count": inserted_count + updated_count,
+            "inserted_count": inserted_count,
+            "updated_count": updated_count,
+            "error_count": len(errors),
+            "errors": [f"행 {error['row']}: {error['reason']}" for error in errors[:10]],
+            "error_rows": errors,
+        }
+        if warnings:
+            result["warnings"] = warnings
+        if date_issue_count:
+            result["first_visit_date_issues"] = True
+        return result
+
+    @staticmethod
+    def _error(index, row: pd.Series, reason: str) -> Dict[str, Any]:
+        # 엑셀 행 번호 (헤더 1행 + 0부터 시작하는 index)
+        return {"row": int(index) + 2, "name": row['name'], "phone": row['phone'], "reason": reason}
+
+    def _fetch_existing(self, phones: List[str]) -> Dict[str, Dict[str, Any]]:
+        """전화번호 → 기존 고객 정보 (청크 단위 IN 조회)"""
+        existing = {}
+        unique_phones = list(dict.fromkeys(phones))
+        for start in range(0, len(unique_phones), PHONE_LOOKUP_CHUNK):
+            chunk = unique_phones[start:start + PHONE_LOOKUP_CHUNK]
+            rows = self.db.execute(
+                select(Customer.phone, Customer.customer_id, Customer.name, Customer.first_visit_date)
+                .where(Customer.phone.in_(chunk))
+            ).all()
+            for row in rows:
+                existing[row.phone] = {
+                    "customer_id": row.customer_id,
+                    "name": row.name,
+                    "first_visit_date": row.first_visit_date,
+                }
+        return existing
+
+    def _upsert_statement(self, on_duplicate: str):
+        dialect = self.db.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(Customer.__table__)
+        if on_duplicate == "update":
+            # 엑셀에서 비어 있는 항목은 기존 값 유지
+            return stmt.on_conflict_do_update(
+                index_elements=[Customer.phone],
+                set_={
+                    **{
+                        field: func.coalesce(stmt.excluded[field], Customer.__table__.c[field])
+                        for field in IMPORT_FIELDS if field != 'phone'
+                    },
+                    "updated_at": func.now(),
+                }
+            )
+        # 조회 이후 다른 요청이 같은 번호를 등록한 경우 대비
+        return stmt.on_conflict_do_nothing(index_elements=[Customer.phone])
+
+    def _saved_indexes(self, batch: pd.DataFrame, result, errors: List[Dict[str, Any]]) -> List[Any]:
+        """RETURNING에 포함된 행만 저장된 것으로 처리 (DO NOTHING으로 건너뛴 행은 중복 오류로 보고)"""
+        returned = {row.phone for row in result}
+        saved = []
+        for index, phone in batch['phone'].items():
+            # 전화번호가 없는 행은 충돌 대상이 아니므로 항상 저장됨
+            if pd.isna(phone) or phone in returned:
+                saved.append(index)
+            else:
+                errors.append(self._error(index, batch.loc[index], f"전화번호 {phone}는 이미 등록됨"))
+        return saved
+
+    def _save_batch(self, batch: pd.DataFrame, on_duplicate: str, errors: List[Dict[str, Any]]) -> List[Any]:
+        """배치 저장 → 저장된 행 index 목록 (배치 실패 시 행 단위로 재시도해 오류 행만 제외)"""
+        stmt = self._upsert_statement(on_duplicate).returning(Customer.customer_id, Customer.phone)
+        records = batch.to_dict(orient="records")
+        try:
+            with self.db.begin_nested():
+                # ORM bulk 경로 대신 Core executemany (드라이버에서 다중 VALUES로 묶임)
+                result = self.db.connection().execute(stmt, records).all()
+            return self._saved_indexes(batch, result, errors)
+        except Exception as e:
+            logger.warning(f"고객 가져오기 배치 실패, 행 단위로 재시도: {self._db_error_message(e)}")
+
+        saved = []
+        for index, record in zip(batch.index, records):
+            try:
+                with self.db.begin_nested():
+                    result = self.db.connection().execute(stmt, [record]).all()
+                saved.extend(self._saved_indexes(batch.loc[[index]], result, errors))
+            except Exception as e:
+                errors.append(self._error(index, batch.loc[index], f"데이터베이스 저장 실패 - {self._db_error_message(e)}"))
+        return saved
+
+    @staticmethod
+    def _db_error_message(error: Exception) -> str:
+        message = str(getattr(error, "orig", None) or error)
+        return re.sub(r"\s+", " ", message).strip()[:200]
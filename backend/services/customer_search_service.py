@@ -0,0 +1,146 @@
+"""
+고객 검색 서비스
+pg_trgm 인덱스를 타는 이름/이메일 검색, 숫자만 남긴 전화번호 검색, 한글 초성 검색
+(인덱스/생성 컬럼: alembic 3f2a9c1d7b4e)
+"""
+import re
+from typing import Dict, Any, List
+
+from sqlalchemy import select, or_, case, func
+from sqlalchemy.orm import Session
+
+from models.customer import Customer
+
+# 한글 음절 초성 (가 = U+AC00, 초성 하나당 588자)
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+CHOSUNG_SET = set(CHOSUNG)
+
+PHONE_QUERY = re.compile(r"^[\d\s\-]+$")
+MIN_PHONE_DIGITS = 2
+
+
+def to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (DB korean_chosung 함수와 동일 규칙)"""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            result.append(CHOSUNG[(code - HANGUL_BASE) // 588])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def detect_mode(query: str) -> str:
+    """검색어 종류: phone(숫자) / chosung(초성 포함) / text"""
+    if PHONE_QUERY.match(query) and len(re.sub(r"\D", "", query)) >= MIN_PHONE_DIGITS:
+        return "phone"
+    if any(ch in CHOSUNG_SET for ch in query):
+        return "chosung"
+    return "text"
+
+
+class CustomerSearchService:
+    """고객 검색 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def build_condition(search: str):
+        """목록/건수/내보내기에서 공통으로 쓰는 검색 WHERE 조건"""
+        query = search.strip()
+        mode = detect_mode(query)
+
+        if mode == "phone":
+            digits = escape_like(re.sub(r"\D", "", query))
+            return Customer.phone_digits.like(f"%{digits}%", escape="\\")
+
+        if mode == "chosung":
+            chosung = escape_like(to_chosung(query.replace(" ", "")))
+            return Customer.name_chosung.like(f"%{chosung}%", escape="\\")
+
+        # 전화번호는 phone 모드(phone_digits)에서만 - 인덱스 없는 phone LIKE가 섞이면 trigram 인덱스를 못 탐
+        pattern = f"%{escape_like(query)}%"
+        return or_(
+            Customer.name.ilike(pattern, escape="\\"),
+            Customer.email.ilike(pattern, escape="\\")
+        )
+
+    def _score(self, query: str, mode: str):
+        """관련도 점수 (정확 일치 > 앞부분 일치 > 부분 일치/유사도)"""
+        if mode == "phone":
+            digits = re.sub(r"\D", "", query)
+            return case(
+                (Customer.phone_digits == digits, 1.0),
+                (Customer.phone_digits.endswith(digits, autoescape=True), 0.9),  # 뒷자리 검색
+                (Customer.phone_digits.startswith(digits, autoescape=True), 0.8),
+                else_=0.5
+            )
+
+        if mode == "chosung":
+            chosung = to_chosung(query.replace(" ", ""))
+            return case(
+                (Customer.name_chosung == chosung, 1.0),
+                (Customer.name_chosung.startswith(chosung, autoescape=True), 0.9),
+                else_=0.6
+            )
+
+        return case(
+            (Customer.name == query, 1.0),
+            (Customer.name.startswith(query, autoescape=True), 0.9),
+            else_=func.greatest(
+                func.similarity(Customer.name, query),
+                func.similarity(func.coalesce(Customer.email, ""), query)
+            )
+        )
+
+    def search(self, search: str, limit: int = 20) -> Dict[str, Any]:
+        """관련도순 고객 검색"""
+        query = search.strip()
+        mode = detect_mode(query)
+        if not query:
+            return {"query": search, "mode": mode, "items": []}
+
+        condition = self.build_condition(query)
+        if mode == "text":
+            # 오타/띄어쓰기 차이도 찾도록 trigram 유사도(%) 조건 추가
+            condition = or_(condition, Customer.name.op("%")(query))
+
+        score = self._score(query, mode).label("score")
+        rows = self.db.execute(
+            select(
+                Customer.customer_id,
+                Customer.name,
+                Customer.phone,
+                Customer.email,
+                Customer.membership_level,
+                Customer.customer_status,
+                Customer.last_visit_date,
+                score
+            )
+            .where(condition)
+            .order_by(score.desc(), Customer.last_visit_date.desc().nulls_last(), Customer.customer_id)
+            .limit(limit)
+        ).all()
+
+        items: List[Dict[str, Any]] = [
+            {
+                "customer_id": row.customer_id,
+                "name": row.name,
+                "phone": row.phone,
+                "email": row.email,
+                "membership_level": row.membership_level,
+                "customer_status": row.customer_status,
+                "last_visit_date": row.last_visit_date.isoformat() if row.last_visit_date else None,
+                "score": round(float(row.score or 0), 3)
+            }
+            for row in rows
+        ]
+        return {"query": search, "mode": mode, "items": items}
@@ -0,0 +1,267 @@
+"""
+일별 집계(롤업) 서비스
+대시보드 통계를 위한 daily_revenue / daily_visits / daily_new_customers 테이블 관리
+"""
+import hashlib
+from typing import Iterable, Optional, Dict, List
+from datetime import date
+from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select, delete, exists, func, and_, text
+from sqlalchemy.dialects import postgresql, sqlite
+
+from models.payment import Payment
+from models.service import ServiceUsage
+from models.customer import Customer
+from models.daily_rollup import DailyRevenue, DailyVisits, DailyNewCustomers
+from services.revenue_report_service import RevenueWindow
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _rollup_lock_key(table_name: str, day: date) -> int:
+    """(집계 테이블, 날짜) → pg_advisory_xact_lock용 signed 64bit 키"""
+    digest = hashlib.blake2b(f"rollup:{table_name}:{day.isoformat()}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+class DailyRollupService:
+    """일별 집계 서비스
+
+    각 집계는 날짜 단위로 원본 테이블에서 다시 계산된다(멱등).
+    결제 생성/수정/삭제, 서비스 이용 등록, 고객 생성 시 해당 날짜만 갱신하므로
+    호출 비용은 그 날짜의 원본 행 수에 비례한다. 커밋은 호출자가 담당한다.
+
+    같은 날짜를 동시에 갱신하는 트랜잭션은 (집계 테이블, 날짜) advisory lock으로 줄을 세운다.
+    나중에 락을 잡은 쪽이 먼저 커밋된 원본까지 보고 다시 계산하므로 갱신이 유실되지 않는다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _revenue_source():
+        return (
+            DailyRevenue,
+            [DailyRevenue.stat_date, DailyRevenue.total_amount, DailyRevenue.payment_count],
+            select(
+                Payment.payment_date,
+                func.coalesce(func.sum(Payment.amount), 0),
+                func.count(Payment.payment_id)
+            ).group_by(Payment.payment_date),
+            Payment.payment_date
+        )
+
+    @staticmethod
+    def _visits_source():
+        return (
+            DailyVisits,
+            [DailyVisits.stat_date, DailyVisits.visit_count, DailyVisits.usage_count],
+            select(
+                ServiceUsage.service_date,
+                func.count(func.distinct(ServiceUsage.customer_id)),
+                func.count(ServiceUsage.usage_id)
+            ).group_by(ServiceUsage.service_date),
+            ServiceUsage.service_date
+        )
+
+    @staticmethod
+    def _new_customers_source():
+        return (
+            DailyNewCustomers,
+            [DailyNewCustomers.stat_date, DailyNewCustomers.new_customer_count],
+            select(
+                Customer.first_visit_date,
+                func.count(Customer.customer_id)
+            ).group_by(Customer.first_visit_date),
+            Customer.first_visit_date
+        )
+
+    def refresh_revenue(self, dates: Iterable[Optional[date]]) -> None:
+        """지정 날짜들의 매출 집계 재계산"""
+        self._rebuild(*self._revenue_source(), dates=dates)
+
+    def refresh_visits(self, dates: Iterable[Optional[date]]) -> None:
+        """지정 날짜들의 방문 집계 재계산"""
+        self._rebuild(*self._visits_source(), dates=dates)
+
+    def refresh_new_customers(self, dates: Iterable[Optional[date]]) -> None:
+        """지정 날짜들의 신규 고객 집계 재계산"""
+        self._rebuild(*self._new_customers_source(), dates=dates)
+
+    def backfill(self, start_date: Optional[date] = None, end_date: Optional[date] = None) -> Dict[str, int]:
+        """기간 전체 집계 재생성 (기간 미지정 시 전체 이력)"""
+        counts = {
+            "daily_revenue": self._rebuild(*self._revenue_source(), start_date=start_date, end_date=end_date),
+            "daily_visits": self._rebuild(*self._visits_source(), start_date=start_date, end_date=end_date),
+            "daily_new_customers": self._rebuild(*self._new_customers_source(), start_date=start_date, end_date=end_date),
+        }
+        logger.info(f"일별 집계 백필 완료: {counts}")
+        return counts
+
+    def _rebuild(
+        self,
+        rollup_model,
+        target_columns: List,
+        source_query,
+        source_date_column,
+        dates: Optional[Iterable[Optional[date]]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> int:
+        """원본 GROUP BY 결과를 집계 행에 upsert (INSERT ... SELECT ... ON CONFLICT 한 번)
+
+        원본 행이 모두 없어진 날짜의 집계 행은 삭제한다.
+        """
+        target_filters = [rollup_model.stat_date.is_not(None)]
+        source_filters = [source_date_column.is_not(None)]
+
+        if dates is not None:
+            date_list = sorted({d for d in dates if d is not None})
+            if not date_list:
+                return 0
+            self._lock(rollup_model, date_list)
+            target_filters.append(rollup_model.stat_date.in_(date_list))
+            source_filters.append(source_date_column.in_(date_list))
+        if start_date:
+            target_filters.append(rollup_model.stat_date >= start_date)
+            source_filters.append(source_date_column >= start_date)
+        if end_date:
+            target_filters.append(rollup_model.stat_date <= end_date)
+            source_filters.append(source_date_column <= end_date)
+
+        insert = sqlite.insert if self.db.get_bind().dialect.name == "sqlite" else postgresql.insert
+        stmt = insert(rollup_model).from_select(target_columns, source_query.where(and_(*source_filters)))
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[rollup_model.stat_date],
+            set_={
+                **{column.key: stmt.excluded[column.key] for column in target_columns[1:]},
+                "updated_at": func.now(),
+            }
+        )
+        result = self.db.execute(stmt)
+        self.db.execute(
+            delete(rollup_model).where(
+                and_(*target_filters),
+                ~exists().where(source_date_column == rollup_model.stat_date)
+            )
+        )
+        return result.rowcount or 0
+
+    def _lock(self, rollup_model, date_list: List[date]) -> None:
+        """(집계 테이블, 날짜) 트랜잭션 advisory lock - PostgreSQL에서만, 정렬 순서로 잡아 교착 방지"""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        for key in sorted(_rollup_lock_key(rollup_model.__tablename__, d) for d in date_list):
+            self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": key})
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def get_revenue_window(self, start_date: date, end_date: date) -> RevenueWindow:
+        """기간 일별 매출 집계를 RevenueWindow로 (결제수단 구분 없음 - 보고서와 같은 월/일 계산 사용)"""
+        rows = self.db.execute(
+            select(DailyRevenue.stat_date, DailyRevenue.payment_count, DailyRevenue.total_amount).where(
+                DailyRevenue.stat_date.between(start_date, end_date)
+            )
+        ).all()
+        return RevenueWindow(start_date, end_date, [
+            (stat_date, None, payment_count or 0, float(total_amount or 0))
+            for stat_date, payment_count, total_amount in rows
+        ])
+
+    def get_revenue_by_date(self, start_date: date, end_date: date) -> Dict[date, float]:
+        """기간 내 일별 매출 {날짜: 매출}"""
+        return self.get_revenue_window(start_date, end_date).daily(start_date, end_date)
+
+    def sum_revenue(self, start_date: date, end_date: date) -> float:
+        """기간 매출 합계"""
+        total = self.db.execute(
+            select(func.sum(DailyRevenue.total_amount)).where(
+                DailyRevenue.stat_date.between(start_date, end_date)
+            )
+        ).scalar()
+        return float(total or 0)
+
+    def get_visit_count(self, target_date: date) -> int:
+        """특정 일자 방문 고객 수"""
+        count = self.db.execute(
+            select(DailyVisits.visit_count).where(DailyVisits.stat_date == target_date)
+        ).scalar()
+        return count or 0
+
+    def count_new_customers(self, start_date: date, end_date: Optional[date] = None) -> int:
+        """기간 신규 고객 수"""
+        query = select(func.sum(DailyNewCustomers.new_customer_count)).where(
+            DailyNewCustomers.stat_date >= start_date
+        )
+        if end_date:
+            query = query.where(DailyNewCustomers.stat_date <= end_date)
+        return int(self.db.execute(query).scalar() or 0)
+
+    def get_monthly_revenue(self, year: int) -> Dict[int, float]:
+        """연도별 월 매출 {월: 매출}"""
+        window = self.get_revenue_window(date(year, 1, 1), date(year, 12, 31))
+        return {month: revenue for _, month, revenue, _ in window.monthly()}
+
+
+# ----------------------------------------------------------------------
+# 자동 갱신: 결제/서비스 이용/고객이 ORM으로 변경되면 커밋 직전 같은 트랜잭션에서 해당 날짜 재계산
+# (예약 완료, 패키지 사용, 엑셀 처리 등 어느 쓰기 경로든 누락되지 않도록)
+# Core INSERT/UPDATE/raw SQL은 flush를 거치지 않으므로 호출자가 refresh_*를 직접 부른다.
+# ----------------------------------------------------------------------
+# 모델 → (refresh 종류, 날짜 속성, 집계 값에 영향을 주는 속성)
+_TRACKED_MODELS = {
+    Payment: ("revenue", "payment_date", ("amount",)),
+    ServiceUsage: ("visits", "service_date", ("customer_id",)),
+    Customer: ("new_customers", "first_visit_date", ()),
+}
+
+
+def _affected_dates(obj, date_attr: str, value_attrs, modified: bool) -> List[date]:
+    """객체 변경으로 집계가 바뀌는 날짜 (수정이면 변경 전/후 날짜 모두)"""
+    attrs = inspect(obj).attrs
+    history = attrs[date_attr].history
+    if modified and not history.has_changes() and not any(attrs[name].history.has_changes() for name in value_attrs):
+        return []
+    return list(history.sum())
+
+
+def _load_previous_date(target, value, oldvalue, initiator):
+    """active_history용 - 커밋 후 만료된 날짜를 바꿔도 이전 날짜가 history에 남도록"""
+
+
+for _model, (_, _date_attr, _) in _TRACKED_MODELS.items():
+    event.listen(getattr(_model, _date_attr), "set", _load_previous_date, active_history=True)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_rollup_dates(session, flush_context):
+    for objects, modified in ((session.new, False), (session.dirty, True), (session.deleted, False)):
+        for obj in objects:
+            tracked = _TRACKED_MODELS.get(type(obj))
+            if tracked is None:
+                continue
+            kind, date_attr, value_attrs = tracked
+            dates = _affected_dates(obj, date_attr, value_attrs, modified)
+            if dates:
+                session.info.setdefault("rollup_dates", {}).setdefault(kind, set()).update(dates)
+
+
+@event.listens_for(Session, "before_commit")
+def _refresh_rollup_dates(session):
+    session.flush()  # before_commit은 커밋 전 마지막 flush보다 먼저 호출됨
+    pending = session.info.pop("rollup_dates", None)
+    if not pending:
+        return
+    rollup = DailyRollupService(session)
+    for kind, dates in pending.items():
+        getattr(rollup, f"refresh_{kind}")(dates)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rollup_dates(session):
+    session.info.pop("rollup_dates", None)
@@ -0,0 +1,437 @@
+"""
+백그라운드 작업 스케줄러
+
+회원 등급 갱신, 패키지 만료 알림, 일일 리포트 같은 주기 작업을 한 곳에서 실행한다.
+
+- cron 형식(분 시 일 월 요일)으로 실행 시각 지정
+- job_leases 테이블로 실행 권한을 나눠 가짐: next_run_at이 지난 작업을 조건부 UPDATE로 먼저 가져간 노드만 실행
+  → uvicorn 워커/서버가 여러 개여도 작업은 한 번만 실행되고, 모든 노드가 내려가 있던 동안 놓친 작업은
+    다음 기동 시 한 번 실행
+- 실행마다 job_runs에 상태/소요 시간/처리 행 수/결과를 기록
+- 무거운 작업(process=True)은 별도 프로세스 풀에서 실행해 API 요청 처리와 CPU/GIL을 다투지 않음
+
+API 프로세스에서는 JOB_SCHEDULER_ENABLED=false로 두고 run_scheduler.py를 별도로 띄울 수도 있다.
+"""
+import asyncio
+import importlib
+import os
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core import metrics
+from core.concurrency import run_sync
+from core.config import settings
+from core.database import SessionLocal
+from core.logging_config import get_logger
+from models.job_schedule import JobLease, JobRun
+
+logger = get_logger(__name__)
+
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+STATUS_ABANDONED = "abandoned"
+
+
+class CronSpec:
+    """5필드 cron 식 (분 시 일 월 요일) - *, */n, a-b, a-b/n, 목록(,) 지원, 요일 0=일요일"""
+
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 6))
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expression!r}")
+        self.expression = expression
+        parsed = [self._parse(part, low, high) for part, (_, low, high) in zip(parts, self.FIELDS)]
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+        # 일/요일이 둘 다 지정되면 cron처럼 둘 중 하나만 맞아도 실행
+        self.day_restricted = parts[2] != "*"
+        self.weekday_restricted = parts[4] != "*"
+
+    @staticmethod
+    def _parse(part: str, low: int, high: int) -> Set[int]:
+        values: Set[int] = set()
+        for item in part.split(","):
+            step = 1
+            if "/" in item:
+                item, step_text = item.split("/", 1)
+                step = int(step_text)
+            if item == "*":
+                start, end = low, high
+            elif "-" in item:
+                start, end = (int(v) for v in item.split("-", 1))
+            else:
+                start = end = int(item)
+            if start < low or end > high or start > end or step < 1:
+                raise ValueError(f"cron 필드 범위 오류: {part!r}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, day: date) -> bool:
+        day_ok = day.day in self.days
+        weekday_ok = (day.weekday() + 1) % 7 in self.weekdays
+        if self.day_restricted and self.weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """moment 이후(초과) 첫 실행 시각"""
+        start = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        for _ in range(366 * 5):
+            if day.month in self.months and self._day_matches(day):
+                for hour in sorted(self.hours):
+                    for minute in sorted(self.minutes):
+                        candidate = datetime(day.year, day.month, day.day, hour, minute)
+                        if candidate >= start:
+                            return candidate
+            day += timedelta(days=1)
+        raise ValueError(f"실행 시각을 찾을 수 없는 cron 식: {self.expression!r}")
+
+
+@dataclass(frozen=True)
+class Job:
+    """
+    등록 작업
+
+    target은 "모듈:속성" 경로 - 프로세스 풀 자식 프로세스에서도 import로 찾을 수 있게 함수 대신 경로로 둔다.
+    작업 함수는 인자 없이 호출되고 dict(rows_affected 포함 가능)를 돌려준다.
+    """
+    name: str
+    cron: str
+    target: str
+    process: bool = False  # True면 프로세스 풀에서 실행
+    lease_seconds: int = 3600  # 실행 중 노드가 죽었을 때 다른 노드가 이어받기까지
+
+    @property
+    def spec(self) -> CronSpec:
+        return CronSpec(self.cron)
+
+
+def resolve_target(target: str) -> Callable[[], Any]:
+    module_name, attribute = target.split(":", 1)
+    obj: Any = importlib.import_module(module_name)
+    for name in attribute.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def run_target(target: str) -> Any:
+    """작업 실행 (프로세스 풀에서는 이 함수가 자식 프로세스에서 실행됨)"""
+    return resolve_target(target)()
+
+
+def default_jobs() -> List[Job]:
+    return [
+        Job("membership_update", settings.JOB_MEMBERSHIP_UPDATE_CRON,
+            "services.scheduled_tasks:ScheduledTasks.update_memberships", process=True),
+        Job("package_expiry_check", settings.JOB_PACKAGE_EXPIRY_CRON,
+            "services.scheduled_tasks:ScheduledTasks.check_package_expiry"),
+        Job("daily_report", settings.JOB_DAILY_REPORT_CRON,
+            "services.scheduled_tasks:ScheduledTasks.send_daily_report"),
+    ]
+
+
+def _node_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _rows_affected(result: Any) -> Optional[int]:
+    if isinstance(result, dict) and isinstance(result.get("rows_affected"), int):
+        return result["rows_affected"]
+    return None
+
+
+def _jsonable(result: Any) -> Any:
+    from fastapi.encoders import jsonable_encoder
+    return jsonable_encoder(result) if result is not None else None
+
+
+class JobScheduler:
+    """임대 획득 → 실행 → 이력 기록 (동기 메서드, 이벤트 루프에서는 JobSchedulerWorker가 감쌈)"""
+
+    def __init__(
+        self,
+        jobs: Optional[List[Job]] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        node_id: Optional[str] = None,
+        process_workers: Optional[int] = None,
+    ):
+        self.jobs = {job.name: job for job in (jobs if jobs is not None else default_jobs())}
+        self.session_factory = session_factory
+        self.node_id = node_id or _node_id()
+        self.process_workers = process_workers if process_workers is not None else settings.JOB_SCHEDULER_PROCESS_WORKERS
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    # ------------------------------------------------------------------
+    # 1. 작업 등록 (job_leases 행 생성 / cron 변경 반영)
+    # ------------------------------------------------------------------
+    def sync_jobs(self, now: Optional[datetime] = None) -> None:
+        now = now or datetime.now()
+        db = self.session_factory()
+        try:
+            leases = {lease.job_name: lease for lease in db.execute(select(JobLease)).scalars()}
+            for job in self.jobs.values():
+                lease = leases.get(job.name)
+                if lease is None:
+                    try:
+                        with db.begin_nested():
+                            db.add(JobLease(job_name=job.name, cron=job.cron, next_run_at=job.spec.next_after(now)))
+                    except IntegrityError:
+                        pass  # 다른 노드가 먼저 등록
+                elif lease.cron != job.cron:
+                    lease.cron = job.cron
+                    lease.next_run_at = job.spec.next_after(now)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 2. 임대 획득
+    # ------------------------------------------------------------------
+    def due_jobs(self, now: Optional[datetime] = None) -> List[Job]:
+        """실행 시각이 지났고 다른 노드가 잡고 있지 않은 작업"""
+        now = now or datetime.now()
+        db = self.session_factory()
+        try:
+            names = db.execute(
+                select(JobLease.job_name).where(
+                    JobLease.job_name.in_(list(self.jobs)),
+                    JobLease.next_run_at <= now,
+                    (JobLease.locked_until.is_(None)) | (JobLease.locked_until < now),
+                )
+            ).scalars().all()
+            return [self.jobs[name] for name in names]
+        finally:
+            db.close()
+
+    def acquire(self, job: Job, now: Optional[datetime] = None, force: bool = False) -> Optional[int]:
+        """
+        실행 권한을 가져오고 실행 이력(running) 행을 만든다 → run_id (다른 노드가 가져갔으면 None)
+
+        조건부 UPDATE 한 문장으로 판정하므로 여러 노드가 동시에 시도해도 한 노드만 성공한다.
+        force=True면 실행 시각과 무관하게 (수동 실행) 가져온다.
+        """
+        now = now or datetime.now()
+        db = self.session_factory()
+        try:
+            conditions = [
+                JobLease.job_name == job.name,
+                (JobLease.locked_until.is_(None)) | (JobLease.locked_until < now),
+            ]
+            if not force:
+                conditions.append(JobLease.next_run_at <= now)
+            claimed = db.execute(
+                update(JobLease).where(*conditions).values(
+                    locked_by=self.node_id,
+                    locked_until=now + timedelta(seconds=job.lease_seconds),
+                    last_started_at=now,
+                    next_run_at=job.spec.next_after(now),
+                ).execution_options(synchronize_session=False)
+            ).rowcount
+            if claimed != 1:
+                db.rollback()
+                return None
+
+            # 임대를 가진 노드가 없던 동안 running으로 남은 이력은 중단된 실행
+            db.execute(
+                update(JobRun).where(JobRun.job_name == job.name, JobRun.status == STATUS_RUNNING)
+                .values(status=STATUS_ABANDONED, finished_at=now)
+                .execution_options(synchronize_session=False)
+            )
+            run = JobRun(job_name=job.name, node=self.node_id, status=STATUS_RUNNING, started_at=now)
+            db.add(run)
+            db.flush()
+            run_id = run.run_id
+            db.commit()
+            return run_id
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 3. 실행 결과 기록 / 임대 반납
+    # ------------------------------------------------------------------
+    def finish(self, job: Job, run_id: int, started: float, result: Any = None, error: Optional[BaseException] = None) -> Dict[str, Any]:
+        finished_at = datetime.now()
+        values = {
+            "status": STATUS_FAILED if error else STATUS_SUCCEEDED,
+            "finished_at": finished_at,
+            "duration_ms": int((time.perf_counter() - started) * 1000),
+            "rows_affected": _rows_affected(result),
+            "result": _jsonable(result),
+            "error_message": f"{type(error).__name__}: {error}" if error else None,
+        }
+        db = self.session_factory()
+        try:
+            db.execute(update(JobRun).where(JobRun.run_id == run_id).values(**values))
+            db.execute(
+                update(JobLease).where(JobLease.job_name == job.name, JobLease.locked_by == self.node_id)
+                .values(locked_until=None, last_finished_at=finished_at)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+        finally:
+            db.close()
+
+        metrics.observe_job(job.name, values["status"], values["duration_ms"] / 1000)
+        log = logger.error if error else logger.info
+        log(f"Job {job.name} {values['status']} in {values['duration_ms']}ms (rows={values['rows_affected']})")
+        return {"job_name": job.name, "run_id": run_id, **values}
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # fork 대신 spawn: 부모의 DB 커넥션/스레드 상태를 물려받지 않음
+            self._pool = ProcessPoolExecutor(max_workers=max(1, self.process_workers), mp_context=get_context("spawn"))
+        return self._pool
+
+    def run_job(self, job: Job, force: bool = False) -> Optional[Dict[str, Any]]:
+        """동기 실행 (스크립트/수동 실행용) - 임대를 못 얻으면 None"""
+        run_id = self.acquire(job, force=force)
+        if run_id is None:
+            return None
+        started = time.perf_counter()
+        try:
+            if job.process and self.process_workers > 0:
+                result = self.pool.submit(run_target, job.target).result()
+            else:
+                result = run_target(job.target)
+        except Exception as e:
+            return self.finish(job, run_id, started, error=e)
+        return self.finish(job, run_id, started, result=result)
+
+    async def run_job_async(self, job: Job, force: bool = False) -> Optional[Dict[str, Any]]:
+        """이벤트 루프에서 실행 - DB 작업은 스레드풀, 무거운 작업은 프로세스 풀"""
+        run_id = await run_sync(self.acquire, job, None, force)
+        if run_id is None:
+            return None
+        started = time.perf_counter()
+        try:
+            if job.process and self.process_workers > 0:
+                result = await asyncio.get_running_loop().run_in_executor(self.pool, run_target, job.target)
+            else:
+                result = await run_sync(run_target, job.target)
+        except Exception as e:
+            return await run_sync(self.finish, job, run_id, started, None, e)
+        return await run_sync(self.finish, job, run_id, started, result)
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # 상태 조회
+    # ------------------------------------------------------------------
+    def status(self, db: Session, recent_runs: int = 20) -> Dict[str, Any]:
+        leases = {lease.job_name: lease for lease in db.execute(select(JobLease)).scalars()}
+        runs = db.execute(select(JobRun).order_by(JobRun.started_at.desc()).limit(recent_runs)).scalars().all()
+        jobs = []
+        for job in self.jobs.values():
+            lease = leases.get(job.name)
+            jobs.append({
+                "name": job.name,
+                "cron": job.cron,
+                "process": job.process,
+                "next_run_at": lease.next_run_at if lease else None,
+                "locked_by": lease.locked_by if lease else None,
+                "locked_until": lease.locked_until if lease else None,
+                "last_started_at": lease.last_started_at if lease else None,
+                "last_finished_at": lease.last_finished_at if lease else None,
+            })
+        return {
+            "jobs": jobs,
+            "recent_runs": [
+                {
+                    "run_id": run.run_id,
+                    "job_name": run.job_name,
+                    "node": run.node,
+                    "status": run.status,
+                    "started_at": run.started_at,
+                    "finished_at": run.finished_at,
+                    "duration_ms": run.duration_ms,
+                    "rows_affected": run.rows_affected,
+                    "error_message": run.error_message,
+                }
+                for run in runs
+            ],
+        }
+
+
+class JobSchedulerWorker:
+    """실행 시각이 된 작업을 주기적으로 확인하는 백그라운드 루프 (FastAPI lifespan 또는 run_scheduler.py)"""
+
+    def __init__(self, scheduler: Optional[JobScheduler] = None, poll_seconds: Optional[float] = None):
+        self.scheduler = scheduler
+        self.poll_seconds = poll_seconds or settings.JOB_SCHEDULER_POLL_SECONDS
+        self.is_running = False
+        self._running: Set[str] = set()
+
+    async def start(self):
+        """스케줄러 시작"""
+        self.scheduler = self.scheduler or JobScheduler()
+        self.is_running = True
+        logger.info(f"Job scheduler started ({self.scheduler.node_id})")
+
+        try:
+            await run_sync(self.scheduler.sync_jobs)
+        except Exception as e:
+            logger.error(f"Error registering scheduled jobs: {e}")
+
+        while self.is_running:
+            try:
+                for job in await run_sync(self.scheduler.due_jobs):
+                    if job.name not in self._running:
+                        asyncio.create_task(self._run(job))
+            except Exception as e:
+                logger.error(f"Error in job scheduler: {e}")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def _run(self, job: Job):
+        self._running.add(job.name)
+        try:
+            await self.scheduler.run_job_async(job)
+        except Exception as e:
+            logger.error(f"Error running job {job.name}: {e}")
+        finally:
+            self._running.discard(job.name)
+
+    def stop(self):
+        """스케줄러 중지"""
+        self.is_running = False
+        if self.scheduler is not None:
+            self.scheduler.shutdown()
+        logger.info("Job scheduler stopped")
+
+
+# 싱글톤 인스턴스
+job_scheduler_worker = JobSchedulerWorker()
+
+
+async def start_job_scheduler():
+    """스케줄러 시작 (FastAPI startup에서 호출, JOB_SCHEDULER_ENABLED=false면 시작하지 않음)"""
+    if not settings.JOB_SCHEDULER_ENABLED:
+        logger.info("Job scheduler disabled in this process")
+        return
+    asyncio.create_task(job_scheduler_worker.start())
+
+
+def stop_job_scheduler():
+    """스케줄러 중지 (FastAPI shutdown에서 호출)"""
+    job_scheduler_worker.stop()
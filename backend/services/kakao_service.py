@@ -1,11 +1,14 @@
-import requests
 import json
 import hashlib
 import time
 from typing import Dict, Optional, List
 from datetime import datetime
 import logging
+
+import httpx
+
 from core.config import settings
+from utils.provider_client import ProviderClient, CircuitOpenError, register_provider_client
 
 logger = logging.getLogger(__name__)
 
@@ -15,13 +18,25 @@ class KakaoAlimtalkService:
     def __init__(self):
         # 카카오 비즈니스 API 설정
         self.base_url = "https://kapi.kakao.com"
-        self.biz_url = "https://bizmessage-api.kakao.com"
+        self.client = register_provider_client(ProviderClient(
+            "kakao",
+            settings.KAKAO_BIZ_BASE_URL,
+            max_concurrency=settings.KAKAO_MAX_CONCURRENCY,
+            rate_per_second=settings.KAKAO_RATE_LIMIT_PER_SECOND,
+            timeout=settings.PROVIDER_TIMEOUT_SECONDS,
+            failure_threshold=settings.PROVIDER_CIRCUIT_FAILURE_THRESHOLD,
+            reset_seconds=settings.PROVIDER_CIRCUIT_RESET_SECONDS,
+        ))
         
         # 인증 정보 (환경변수에서 가져옴)
         self.rest_api_key = settings.KAKAO_REST_API_KEY
         self.admin_key = settings.KAKAO_ADMIN_KEY
         self.sender_key = settings.KAKAO_SENDER_KEY
         self.sender_number = settings.BUSINESS_PHONE  # 발신번호
+
+    @property
+    def biz_url(self) -> str:
+        return self.client.base_url
         
     def _get_headers(self, use_admin_key: bool = False) -> Dict[str, str]:
         """API 요청 헤더 생성"""
@@ -35,29 +50,15 @@ class KakaoAlimtalkService:
                 "Authorization": f"KakaoAK {self.rest_api_key}",
                 "Content-Type": "application/json"
             }
-    
-    def send_alimtalk(
+
+    def _alimtalk_request(
         self,
         phone_number: str,
         template_code: str,
         template_args: Dict[str, str],
-        reserved_time: Optional[str] = None,
-        fallback_message: Optional[str] = None
+        reserved_time: Optional[str],
+        fallback_message: Optional[str]
     ) -> Dict:
-        """
-        알림톡 발송
-        
-        Args:
-            phone_number: 수신자 전화번호 (010-1234-5678 형식)
-            template_code: 승인된 템플릿 코드
-            template_args: 템플릿 변수 딕셔너리
-            reserved_time: 예약 발송 시간 (YYYYMMDDHHMISS)
-            fallback_message: 알림톡 실패 시 SMS 대체 발송 메시지
-            
-        Returns:
-            발송 결과 딕셔너리
-        """
-        
         # 전화번호 형식 정규화 (하이픈 제거)
         phone_number = phone_number.replace("-", "")
         
@@ -78,35 +79,32 @@ class KakaoAlimtalkService:
         if fallback_message:
             data["fallback_type"] = "SMS"
             data["fallback_msg"] = fallback_message
+        return data
+
+    @staticmethod
+    def _alimtalk_result(response: httpx.Response) -> Dict:
+        response_data = response.json()
         
-        try:
-            # API 요청
-            response = requests.post(
-                f"{self.biz_url}/v2/sender/alimtalk",
-                headers=self._get_headers(use_admin_key=True),
-                json=data,
-                timeout=10
-            )
-            
-            response_data = response.json()
-            
-            if response.status_code == 200:
-                return {
-                    "success": True,
-                    "message_id": response_data.get("msgid"),
-                    "status": "sent",
-                    "sent_at": datetime.now()
-                }
-            else:
-                logger.error(f"카카오 알림톡 발송 실패: {response_data}")
-                return {
-                    "success": False,
-                    "error_code": response_data.get("code"),
-                    "error_message": response_data.get("msg", "알림톡 발송 실패"),
-                    "status": "failed"
-                }
-                
-        except requests.exceptions.RequestException as e:
+        if response.status_code == 200:
+            return {
+                "success": True,
+                "message_id": response_data.get("msgid"),
+                "status": "sent",
+                "sent_at": datetime.now()
+            }
+        logger.error(f"카카오 알림톡 발송 실패: {response_data}")
+        return {
+            "success": False,
+            "error_code": response_data.get("code"),
+            "error_message": response_data.get("msg", "알림톡 발송 실패"),
+            "status": "failed"
+        }
+
+    @staticmethod
+    def _error_result(e: Exception) -> Dict:
+        if isinstance(e, CircuitOpenError):
+            return {"success": False, "error_code": "CIRCUIT_OPEN", "error_message": str(e), "status": "failed"}
+        if isinstance(e, httpx.HTTPError):
             logger.error(f"카카오 API 요청 오류: {str(e)}")
             return {
                 "success": False,
@@ -114,26 +112,76 @@ class KakaoAlimtalkService:
                 "error_message": f"네트워크 오류: {str(e)}",
                 "status": "failed"
             }
+        logger.error(f"알림톡 발송 중 오류: {str(e)}")
+        return {
+            "success": False,
+            "error_code": "UNKNOWN_ERROR",
+            "error_message": f"알 수 없는 오류: {str(e)}",
+            "status": "failed"
+        }
+    
+    def send_alimtalk(
+        self,
+        phone_number: str,
+        template_code: str,
+        template_args: Dict[str, str],
+        reserved_time: Optional[str] = None,
+        fallback_message: Optional[str] = None
+    ) -> Dict:
+        """
+        알림톡 발송
+        
+        Args:
+            phone_number: 수신자 전화번호 (010-1234-5678 형식)
+            template_code: 승인된 템플릿 코드
+            template_args: 템플릿 변수 딕셔너리
+            reserved_time: 예약 발송 시간 (YYYYMMDDHHMISS)
+            fallback_message: 알림톡 실패 시 SMS 대체 발송 메시지
+            
+        Returns:
+            발송 결과 딕셔너리
+        """
+        data = self._alimtalk_request(phone_number, template_code, template_args, reserved_time, fallback_message)
+        try:
+            response = self.client.request(
+                "POST", "/v2/sender/alimtalk",
+                headers=self._get_headers(use_admin_key=True),
+                json=data
+            )
+            return self._alimtalk_result(response)
         except Exception as e:
-            logger.error(f"알림톡 발송 중 오류: {str(e)}")
-            return {
-                "success": False,
-                "error_code": "UNKNOWN_ERROR",
-                "error_message": f"알 수 없는 오류: {str(e)}",
-                "status": "failed"
-            }
+            return self._error_result(e)
+
+    async def send_alimtalk_async(
+        self,
+        phone_number: str,
+        template_code: str,
+        template_args: Dict[str, str],
+        reserved_time: Optional[str] = None,
+        fallback_message: Optional[str] = None
+    ) -> Dict:
+        """알림톡 발송 (비동기 - 결과 형식은 send_alimtalk와 같음)"""
+        data = self._alimtalk_request(phone_number, template_code, template_args, reserved_time, fallback_message)
+        try:
+            response = await self.client.arequest(
+                "POST", "/v2/sender/alimtalk",
+                headers=self._get_headers(use_admin_key=True),
+                json=data
+            )
+            return self._alimtalk_result(response)
+        except Exception as e:
+            return self._error_result(e)
     
     def get_template_list(self) -> List[Dict]:
         """승인된 템플릿 목록 조회"""
         try:
-            response = requests.get(
-                f"{self.biz_url}/v2/sender/alimtalk/template/list",
+            response = self.client.request(
+                "GET", "/v2/sender/alimtalk/template/list",
                 headers=self._get_headers(use_admin_key=True),
                 params={
                     "sender_key": self.sender_key,
                     "status": "APR"  # 승인된 템플릿만
-                },
-                timeout=10
+                }
             )
             
             if response.status_code == 200:
@@ -149,13 +197,12 @@ class KakaoAlimtalkService:
     def get_message_result(self, message_id: str) -> Dict:
         """발송 결과 조회"""
         try:
-            response = requests.get(
-                f"{self.biz_url}/v2/sender/alimtalk/result",
+            response = self.client.request(
+                "GET", "/v2/sender/alimtalk/result",
                 headers=self._get_headers(use_admin_key=True),
                 params={
                     "msgid": message_id
-                },
-                timeout=10
+                }
             )
             
             if response.status_code == 200:
@@ -0,0 +1,250 @@
+"""
+유입고객 핵심 지표 서비스
+대상 월 지표와 월별/주간 추이를 테이블당 한 번의 generate_series 집계 쿼리로 조회하고 캐싱한다.
+추이 기간(개월/주)이 늘어나도 쿼리 수는 2개로 같다.
+"""
+from typing import Dict, Any, List
+from datetime import date, timedelta
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text, event
+from sqlalchemy.orm import Session
+
+from models.customer_extended import MarketingLead
+from models.payment import Payment
+from utils.cache import CacheService
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_EXPIRE_SECONDS = 600
+CACHE_TAG = "lead_key_metrics"
+MAX_TREND_MONTHS = 60
+MAX_TREND_WEEKS = 260
+
+# 주간 버킷 i: [대상 월 1일 - 7i, 대상 월 1일 - 7i + 6] (기존 화면과 같은 기준)
+# 날짜 d의 버킷 번호 = (대상일 - d + 6) / 7 (정수 나눗셈)
+
+# 방문상담 수 / 그중 등록(전환) 수
+LEAD_FUNNEL_QUERY = text("""
+    WITH leads AS (
+        SELECT visit_consult_date AS d, registration_date IS NOT NULL AS converted
+        FROM marketing_leads
+        WHERE visit_consult_date BETWEEN :range_start AND :range_end
+    ),
+    monthly AS (
+        SELECT date_trunc('month', d)::date AS bucket,
+               COUNT(*) AS visits,
+               COUNT(*) FILTER (WHERE converted) AS conversions
+        FROM leads
+        WHERE d BETWEEN :month_from AND :month_to
+        GROUP BY 1
+    ),
+    weekly AS (
+        SELECT (:target - d + 6) / 7 AS bucket,
+               COUNT(*) AS visits,
+               COUNT(*) FILTER (WHERE converted) AS conversions
+        FROM leads
+        WHERE d BETWEEN :week_from AND :week_to
+        GROUP BY 1
+    )
+    SELECT 'month' AS grain, s.bucket::date AS bucket_start,
+           COALESCE(m.visits, 0) AS visits, COALESCE(m.conversions, 0) AS conversions
+    FROM generate_series(CAST(:month_from AS date), CAST(:target AS date), interval '1 month') AS s(bucket)
+    LEFT JOIN monthly m ON m.bucket = s.bucket::date
+    UNION ALL
+    SELECT 'week', CAST(:target AS date) - 7 * s.i,
+           COALESCE(w.visits, 0), COALESCE(w.conversions, 0)
+    FROM generate_series(0, :weeks - 1) AS s(i)
+    LEFT JOIN weekly w ON w.bucket = s.i
+""")
+
+# 결제 고객 수(중복 제외) / 매출
+PAYMENT_QUERY = text("""
+    WITH paid AS (
+        SELECT payment_date AS d, customer_id, amount
+        FROM payments
+        WHERE payment_date BETWEEN :range_start AND :range_end
+    ),
+    monthly AS (
+        SELECT date_trunc('month', d)::date AS bucket,
+               COUNT(DISTINCT customer_id) AS customers,
+               SUM(amount) AS revenue
+        FROM paid
+        WHERE d BETWEEN :month_from AND :month_to
+        GROUP BY 1
+    ),
+    weekly AS (
+        SELECT (:target - d + 6) / 7 AS bucket,
+               COUNT(DISTINCT customer_id) AS customers,
+               SUM(amount) AS revenue
+        FROM paid
+        WHERE d BETWEEN :week_from AND :week_to
+        GROUP BY 1
+    )
+    SELECT 'month' AS grain, s.bucket::date AS bucket_start,
+           COALESCE(m.customers, 0) AS customers, COALESCE(m.revenue, 0) AS revenue
+    FROM generate_series(CAST(:month_from AS date), CAST(:target AS date), interval '1 month') AS s(bucket)
+    LEFT JOIN monthly m ON m.bucket = s.bucket::date
+    UNION ALL
+    SELECT 'week', CAST(:target AS date) - 7 * s.i,
+           COALESCE(w.customers, 0), COALESCE(w.revenue, 0)
+    FROM generate_series(0, :weeks - 1) AS s(i)
+    LEFT JOIN weekly w ON w.bucket = s.i
+""")
+
+
+def _rate(numerator: int, denominator: int) -> float:
+    return round(numerator / denominator * 100, 1) if denominator > 0 else 0
+
+
+def _cache_key(target: date, months: int, weeks: int) -> str:
+    return f"aibio:lead_key_metrics:{target:%Y-%m}:{months}:{weeks}"
+
+
+def invalidate_lead_key_metrics() -> None:
+    """핵심 지표 캐시 전체 삭제 (추이에 여러 달이 걸리므로 대상 월 구분 없이 삭제)"""
+    CacheService.invalidate_tags(CACHE_TAG)
+
+
+class LeadMetricsService:
+    """유입고객 핵심 지표 서비스"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_key_metrics(self, target: date, months: int = None, weeks: int = None) -> Dict[str, Any]:
+        """핵심 지표 (캐시 우선) - target은 대상 월 1일"""
+        months = min(max(1, months or settings.LEAD_METRICS_TREND_MONTHS), MAX_TREND_MONTHS)
+        weeks = min(max(1, weeks or settings.LEAD_METRICS_TREND_WEEKS), MAX_TREND_WEEKS)
+        cache_key = _cache_key(target, months, weeks)
+
+        cached = CacheService.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._compute(target, months, weeks)
+        CacheService.set(cache_key, result, CACHE_EXPIRE_SECONDS, tags=[CACHE_TAG])
+        return result
+
+    def _compute(self, target: date, months: int, weeks: int) -> Dict[str, Any]:
+        month_from = target - relativedelta(months=months - 1)
+        month_to = target + relativedelta(months=1) - timedelta(days=1)
+        week_from = target - timedelta(weeks=weeks - 1)
+        week_to = target + timedelta(days=6)
+        params = {
+            "target": target,
+            "weeks": weeks,
+            "month_from": month_from,
+            "month_to": month_to,
+            "week_from": week_from,
+            "week_to": week_to,
+            "range_start": min(month_from, week_from),
+            "range_end": max(month_to, week_to),
+        }
+
+        funnel = {(row.grain, row.bucket_start): row for row in self.db.execute(LEAD_FUNNEL_QUERY, params)}
+        paid = {(row.grain, row.bucket_start): row for row in self.db.execute(PAYMENT_QUERY, params)}
+
+        monthly_trends = [
+            {"month": key[1].strftime("%Y-%m"), **self._bucket(funnel[key], paid[key], with_average=True)}
+            for key in sorted(k for k in funnel if k[0] == "month")
+        ]
+        weekly_trends = [
+            {
+                "week": f"{key[1]:%Y-%m-%d} ~ {key[1] + timedelta(days=6):%Y-%m-%d}",
+                **self._bucket(funnel[key], paid[key], with_average=False)
+            }
+            for key in sorted(k for k in funnel if k[0] == "week")
+        ]
+        return self._format(target, monthly_trends, weekly_trends)
+
+    @staticmethod
+    def _bucket(funnel_row, paid_row, with_average: bool) -> Dict[str, Any]:
+        visits = int(funnel_row.visits)
+        conversions = int(funnel_row.conversions)
+        customers = int(paid_row.customers)
+        revenue = float(paid_row.revenue or 0)
+        bucket = {
+            "visit_consults": visits,
+            "conversions": conversions,
+            "conversion_rate": _rate(conversions, visits),
+            "payment_customers": customers,
+            "revenue": revenue,
+        }
+        if with_average:
+            bucket["avg_payment_amount"] = round(revenue / customers, 0) if customers > 0 else 0
+        return bucket
+
+    @staticmethod
+    def _format(target: date, monthly_trends: List[Dict[str, Any]], weekly_trends: List[Dict[str, Any]]) -> Dict[str, Any]:
+        # 대상 월 = 월별 추이의 마지막 버킷
+        current = monthly_trends[-1]
+        visit_consult_count = current["visit_consults"]
+        converted_from_visit = current["conversions"]
+        conversion_rate = current["conversion_rate"]
+        total_payment_customers = current["payment_customers"]
+        total_revenue = current["revenue"]
+        avg_payment_amount = current["avg_payment_amount"]
+
+        return {
+            "target_month": target.strftime("%Y년 %m월"),
+            "key_metrics": {
+                "new_visit_consults": visit_consult_count,
+                "converted_customers": converted_from_visit,
+                "conversion_rate": conversion_rate,
+                "total_payment_customers": total_payment_customers,
+                "total_revenue": total_revenue,
+                "avg_payment_amount": avg_payment_amount
+            },
+            "formulas": {
+                "formula1": {
+                    "description": "신규 방문상담 수 × 전환율 = 결제 고객 수",
+                    "calculation": f"{visit_consult_count} × {conversion_rate}% = {converted_from_visit}명",
+                    "values": {
+                        "visit_consults": visit_consult_count,
+                        "conversion_rate": conversion_rate,
+                        "result": converted_from_visit
+                    }
+                },
+                "formula2": {
+                    "description": "결제 고객 수 × 평균 결제 객단가 = 매출액",
+                    "calculation": f"{total_payment_customers}명 × {avg_payment_amount:,}원 = {total_revenue:,}원",
+                    "values": {
+                        "payment_customers": total_payment_customers,
+                        "avg_amount": avg_payment_amount,
+                        "result": total_revenue
+                    }
+                }
+            },
+            # 오래된 순
+            "monthly_trends": monthly_trends,
+            "weekly_trends": weekly_trends
+        }
+
+
+# ----------------------------------------------------------------------
+# 캐시 무효화: 리드/결제가 변경되어 커밋되면 핵심 지표 캐시 삭제
+# ----------------------------------------------------------------------
+_TRACKED_MODELS = (MarketingLead, Payment)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_metric_changes(session, flush_context):
+    if session.info.get("lead_metrics_dirty"):
+        return
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, _TRACKED_MODELS):
+            session.info["lead_metrics_dirty"] = True
+            return
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_metric_changes(session):
+    if session.info.pop("lead_metrics_dirty", None):
+        invalidate_lead_key_metrics()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_metric_changes(session):
+    session.info.pop("lead_metrics_dirty", None)
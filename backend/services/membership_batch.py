@@ -0,0 +1,175 @@
+"""
+회원 등급 및 상태 일괄 재계산 엔진
+고객별 반복 쿼리(N+1) 대신 그룹 집계 쿼리 몇 개로 전체 고객을 재계산한다.
+"""
+
+import json
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import select, update, func, case
+from sqlalchemy.orm import Session
+
+from models.customer import Customer
+from models.payment import Payment
+from models.reservation import Reservation, ReservationStatus
+from models.system import SystemSettings
+from utils.membership_calculator import MembershipCalculator
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class MembershipBatchUpdater:
+    """회원 등급/상태/방문/매출 통계 일괄 재계산
+
+    1. 고객 기본 컬럼 조회 (ORM 객체 생성 없음)
+    2. 결제 집계 (총 매출, 최근 1년 매출) - GROUP BY customer_id 1회
+    3. 완료 예약 집계 (최근 방문일, 방문 횟수) - GROUP BY customer_id 1회
+    4. MembershipCalculator로 메모리에서 등급/상태 계산
+    5. 변경된 행만 chunk_size 단위 bulk UPDATE + chunk별 커밋
+    """
+
+    def __init__(self, db: Session, chunk_size: int = 1000):
+        self.db = db
+        self.chunk_size = chunk_size
+
+    def load_criteria(self) -> Optional[Dict[str, Any]]:
+        """회원 등급 기준 조회"""
+        setting_value = self.db.execute(
+            select(SystemSettings.setting_value).where(
+                SystemSettings.setting_key == "membership_criteria"
+            )
+        ).scalar()
+        return json.loads(setting_value) if setting_value else None
+
+    def run(self, criteria: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        전체 고객 재계산 실행
+
+        Args:
+            criteria: 등급 기준 (없으면 system_settings에서 조회)
+
+        Returns:
+            단계별 소요 시간과 변경 건수를 담은 리포트
+        """
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        def mark(phase: str, since: float) -> float:
+            now = time.perf_counter()
+            timings[phase] = round(now - since, 4)
+            return now
+
+        if criteria is None:
+            criteria = self.load_criteria()
+        if criteria is None:
+            logger.warning("No membership criteria found in settings")
+            return {"total_customers": 0, "rows_changed": 0, "timings": timings, "skipped": True}
+
+        today = date.today()
+        one_year_ago = today - timedelta(days=365)
+
+        # 1. 고객 기본 정보
+        t = time.perf_counter()
+        customers = self.db.execute(
+            select(
+                Customer.customer_id,
+                Customer.customer_status,
+                Customer.membership_level,
+                Customer.last_visit_date,
+                Customer.total_visits,
+                Customer.total_revenue
+            )
+        ).all()
+        t = mark("load_customers", t)
+
+        # 2. 결제 집계
+        payment_rows = self.db.execute(
+            select(
+                Payment.customer_id,
+                func.coalesce(func.sum(Payment.amount), 0).label("total_revenue"),
+                func.coalesce(
+                    func.sum(case((Payment.payment_date >= one_year_ago, Payment.amount), else_=0)),
+                    0
+                ).label("annual_revenue")
+            ).where(Payment.customer_id.is_not(None)).group_by(Payment.customer_id)
+        ).all()
+        payments = {row.customer_id: row for row in payment_rows}
+        t = mark("aggregate_payments", t)
+
+        # 3. 완료 예약 집계 (실제 방문 기준)
+        visit_rows = self.db.execute(
+            select(
+                Reservation.customer_id,
+                func.max(Reservation.reservation_date).label("last_visit_date"),
+                func.count(Reservation.reservation_id).label("visit_count")
+            ).where(Reservation.status == ReservationStatus.completed).group_by(Reservation.customer_id)
+        ).all()
+        visits = {row.customer_id: row for row in visit_rows}
+        t = mark("aggregate_reservations", t)
+
+        # 4. 메모리 계산
+        changes: List[Dict[str, Any]] = []
+        status_changes = 0
+        level_changes = 0
+
+        for customer in customers:
+            payment = payments.get(customer.customer_id)
+            visit = visits.get(customer.customer_id)
+
+            total_revenue = Decimal(payment.total_revenue) if payment else Decimal("0")
+            annual_revenue = Decimal(payment.annual_revenue) if payment else Decimal("0")
+            total_visits = visit.visit_count if visit else 0
+            # 완료 예약이 없으면 기존 최근 방문일 유지
+            last_visit_date = visit.last_visit_date if visit else customer.last_visit_date
+
+            customer_status = MembershipCalculator.calculate_customer_status(last_visit_date)
+            # Customer.update_membership_level과 동일하게 연매출이 없으면 총매출 기준
+            membership_level = MembershipCalculator.calculate_membership_level(
+                annual_revenue or total_revenue, total_visits, criteria
+            )
+
+            new_values = {
+                "customer_status": customer_status,
+                "membership_level": membership_level,
+                "last_visit_date": last_visit_date,
+                "total_visits": total_visits,
+                "total_revenue": total_revenue,
+            }
+            old_values = {
+                "customer_status": customer.customer_status,
+                "membership_level": customer.membership_level,
+                "last_visit_date": customer.last_visit_date,
+                "total_visits": customer.total_visits or 0,
+                "total_revenue": Decimal(customer.total_revenue or 0),
+            }
+            if new_values == old_values:
+                continue
+
+            if customer_status != customer.customer_status:
+                status_changes += 1
+            if membership_level != customer.membership_level:
+                level_changes += 1
+            changes.append({"customer_id": customer.customer_id, **new_values})
+        t = mark("compute", t)
+
+        # 5. 변경분 bulk UPDATE (chunk 단위 커밋으로 긴 트랜잭션 방지)
+        for offset in range(0, len(changes), self.chunk_size):
+            chunk = changes[offset:offset + self.chunk_size]
+            self.db.execute(update(Customer), chunk)
+            self.db.commit()
+        mark("write", t)
+
+        timings["total"] = round(time.perf_counter() - started, 4)
+        report = {
+            "total_customers": len(customers),
+            "rows_changed": len(changes),
+            "status_changes": status_changes,
+            "level_changes": level_changes,
+            "timings": timings,
+        }
+        logger.info(f"Customer membership batch update completed: {report}")
+        return report
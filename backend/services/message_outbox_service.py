@@ -0,0 +1,416 @@
+"""
+SMS/알림톡 발송 대기열 (transactional outbox)
+
+요청 처리 중에는 message_outbox에 INSERT만 하고(업무 데이터와 같은 트랜잭션), 실제 발송은 백그라운드 워커가 한다.
+요청 응답 시간이 문자 서비스 응답 속도/장애와 무관해지고, 커밋되지 않은 예약에 문자가 나가는 일도 없다.
+
+워커 한 번의 처리 (dispatch_once):
+1. pending(재시도 시각 도래) + 오래 잡혀 있는 sending 행을 FOR UPDATE SKIP LOCKED로 가져와 sending 표시,
+   attempts 증가 후 커밋 (여러 프로세스가 동시에 돌아도 같은 메시지를 중복 발송하지 않음, HTTP 호출 중에는 DB 커넥션을 잡지 않음)
+   attempts를 가져갈 때 올리므로 발송 중 워커가 죽어 다시 가져가는 횟수도 MESSAGE_OUTBOX_MAX_ATTEMPTS로 제한된다.
+2. SMS는 (SMS/LMS, 제목)이 같은 것끼리 알리고 send_mass 한 번으로, 알림톡은 건별 발송 (keep-alive 세션 재사용)
+3. 결과 반영 - 성공: sent / 실패: 지수 백오프로 재시도, MESSAGE_OUTBOX_MAX_ATTEMPTS에 도달하면 failed
+   알림톡은 kakao_message_logs에 이력을 남기고, 예약 확인/리마인더는 reservations 발송 플래그를 갱신
+"""
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.orm import Session
+
+from core.concurrency import run_sync
+from core.config import settings
+from core.database import SessionLocal
+from core.logging_config import get_logger
+from models.message_outbox import MessageOutbox
+from models.reservation import KakaoMessageLog, Reservation
+
+logger = get_logger(__name__)
+
+CHANNEL_SMS = "sms"
+CHANNEL_ALIMTALK = "alimtalk"
+
+STATUS_PENDING = "pending"
+STATUS_SENDING = "sending"
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+
+PURPOSE_RESERVATION_CONFIRMATION = "reservation_confirmation"
+PURPOSE_RESERVATION_REMINDER = "reservation_reminder"
+PURPOSE_RESERVATION_CHANGE = "reservation_change"
+PURPOSE_RESERVATION_CANCELLATION = "reservation_cancellation"
+PURPOSE_BULK_SMS = "bulk_sms"
+
+# 발송 성공 시 켜는 예약 플래그
+RESERVATION_FLAGS = {
+    PURPOSE_RESERVATION_CONFIRMATION: "confirmation_sent",
+    PURPOSE_RESERVATION_REMINDER: "reminder_sent",
+}
+
+LMS_THRESHOLD = 90  # 알리고 send_sms와 같은 기준 (초과 시 LMS)
+DEFAULT_LMS_TITLE = "[AIBIO 센터]"
+STALE_LOCK_SECONDS = 300  # sending 상태로 이보다 오래 남은 행은 워커가 죽은 것으로 보고 다시 가져감
+
+
+def enqueue_sms(
+    db: Session,
+    phone_number: str,
+    message: str,
+    purpose: str = PURPOSE_BULK_SMS,
+    title: Optional[str] = None,
+    recipient_name: Optional[str] = None,
+    customer_id: Optional[int] = None,
+    reservation_id: Optional[int] = None,
+) -> MessageOutbox:
+    """SMS/LMS 발송 예약 (커밋은 호출한 쪽 트랜잭션에서)"""
+    item = MessageOutbox(
+        channel=CHANNEL_SMS,
+        purpose=purpose,
+        phone_number=phone_number,
+        recipient_name=recipient_name,
+        customer_id=customer_id,
+        reservation_id=reservation_id,
+        title=title,
+        content=message,
+        status=STATUS_PENDING,
+        attempts=0,
+        next_attempt_at=datetime.now(),
+    )
+    db.add(item)
+    return item
+
+
+def enqueue_alimtalk(
+    db: Session,
+    phone_number: str,
+    template_code: str,
+    template_args: Dict[str, str],
+    content: str,
+    purpose: str,
+    fallback_message: Optional[str] = None,
+    recipient_name: Optional[str] = None,
+    customer_id: Optional[int] = None,
+    reservation_id: Optional[int] = None,
+) -> MessageOutbox:
+    """알림톡 발송 예약 - content는 발송 이력(kakao_message_logs)에 남길 요약"""
+    item = MessageOutbox(
+        channel=CHANNEL_ALIMTALK,
+        purpose=purpose,
+        phone_number=phone_number,
+        recipient_name=recipient_name,
+        customer_id=customer_id,
+        reservation_id=reservation_id,
+        content=content,
+        template_code=template_code,
+        template_args=template_args,
+        fallback_message=fallback_message,
+        status=STATUS_PENDING,
+        attempts=0,
+        next_attempt_at=datetime.now(),
+    )
+    db.add(item)
+    return item
+
+
+def queued_reservation_ids(db: Session, purpose: str, reservation_ids: List[int]) -> set:
+    """아직 발송 대기/진행 중인 메시지가 있는 예약 ID (같은 메시지 중복 등록 방지)"""
+    if not reservation_ids:
+        return set()
+    rows = db.execute(
+        select(MessageOutbox.reservation_id).where(
+            MessageOutbox.purpose == purpose,
+            MessageOutbox.reservation_id.in_(reservation_ids),
+            MessageOutbox.status.in_([STATUS_PENDING, STATUS_SENDING])
+        )
+    ).scalars()
+    return set(rows)
+
+
+def _sms_type(message: str) -> str:
+    return "LMS" if len(message) > LMS_THRESHOLD else "SMS"
+
+
+class MessageOutboxDispatcher:
+    """대기열 한 묶음 발송 (동기 - 워커/스크립트에서 호출)"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        sms_client=None,
+        kakao_client=None,
+        batch_size: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        retry_base_seconds: Optional[int] = None,
+    ):
+        if sms_client is None:
+            from services.aligo_service import aligo_service as sms_client
+        if kakao_client is None:
+            from services.kakao_service import kakao_service as kakao_client
+        self.session_factory = session_factory
+        self.sms_client = sms_client
+        self.kakao_client = kakao_client
+        self.batch_size = batch_size or settings.MESSAGE_OUTBOX_BATCH_SIZE
+        self.max_attempts = max_attempts or settings.MESSAGE_OUTBOX_MAX_ATTEMPTS
+        self.retry_base_seconds = settings.MESSAGE_OUTBOX_RETRY_BASE_SECONDS if retry_base_seconds is None else retry_base_seconds
+
+    def dispatch_once(self) -> Dict[str, int]:
+        """한 묶음 가져와 발송하고 결과 반영. {"claimed", "sent", "retry", "failed"}"""
+        items = self._claim()
+        stats = {"claimed": len(items), "sent": 0, "retry": 0, "failed": 0}
+        if not items:
+            return stats
+
+        results = self._send(items)
+        for outcome in self._record(items, results):
+            stats[outcome] += 1
+        logger.info(f"메시지 발송 처리: {stats}")
+        return stats
+
+    # ------------------------------------------------------------------
+    # 1. 가져오기
+    # ------------------------------------------------------------------
+    def _claim(self) -> List[Dict[str, Any]]:
+        db = self.session_factory()
+        try:
+            now = datetime.now()
+            stale_before = now - timedelta(seconds=STALE_LOCK_SECONDS)
+            rows = db.execute(
+                select(MessageOutbox).where(or_(
+                    and_(MessageOutbox.status == STATUS_PENDING, MessageOutbox.next_attempt_at <= now),
+                    and_(MessageOutbox.status == STATUS_SENDING, MessageOutbox.locked_at < stale_before),
+                )).order_by(MessageOutbox.outbox_id).limit(self.batch_size).with_for_update(skip_locked=True)
+            ).scalars().all()
+            if not rows:
+                db.rollback()
+                return []
+
+            items, exhausted = [], []
+            for row in rows:
+                attempts = (row.attempts or 0) + 1
+                if attempts > self.max_attempts:
+                    # 발송 중 워커가 죽어(또는 결과 반영 실패로) 계속 다시 잡히는 메시지
+                    exhausted.append(row.outbox_id)
+                    continue
+                items.append({
+                    "outbox_id": row.outbox_id,
+                    "channel": row.channel,
+                    "purpose": row.purpose,
+                    "phone_number": row.phone_number,
+                    "recipient_name": row.recipient_name,
+                    "customer_id": row.customer_id,
+                    "reservation_id": row.reservation_id,
+                    "title": row.title,
+                    "content": row.content,
+                    "template_code": row.template_code,
+                    "template_args": row.template_args,
+                    "fallback_message": row.fallback_message,
+                    "attempts": attempts,  # 이번 발송 회차
+                })
+            if items:
+                db.execute(
+                    update(MessageOutbox)
+                    .where(MessageOutbox.outbox_id.in_([item["outbox_id"] for item in items]))
+                    .values(status=STATUS_SENDING, locked_at=now, attempts=MessageOutbox.attempts + 1)
+                )
+            if exhausted:
+                db.execute(
+                    update(MessageOutbox)
+                    .where(MessageOutbox.outbox_id.in_(exhausted))
+                    .values(
+                        status=STATUS_FAILED,
+                        locked_at=None,
+                        error_code="STALE_LOCK",
+                        error_message="발송 중 처리가 중단되어 재시도 한도를 넘었습니다"
+                    )
+                )
+                logger.warning(f"발송 중 중단이 반복된 메시지 실패 처리: {exhausted}")
+            db.commit()
+            return items
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # ------------------------------------------------------------------
+    # 2. 발송 (DB 커넥션 없이)
+    # ------------------------------------------------------------------
+    def _send(self, items: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        results: Dict[int, Dict[str, Any]] = {}
+
+        sms_groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        alimtalk_items: List[Dict[str, Any]] = []
+        for item in items:
+            if item["channel"] == CHANNEL_SMS:
+                msg_type = _sms_type(item["content"])
+                title = (item["title"] or DEFAULT_LMS_TITLE) if msg_type == "LMS" else ""
+                sms_groups[(msg_type, title)].append(item)
+            else:
+                alimtalk_items.append(item)
+
+        # 알림톡은 건별 API라 공급자 동시성 한도만큼 병렬 발송
+        if alimtalk_items:
+            provider = getattr(self.kakao_client, "client", None)
+            workers = min(len(alimtalk_items), getattr(provider, "max_concurrency", 1))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alimtalk") as pool:
+                    sent = list(pool.map(self._send_alimtalk, alimtalk_items))
+            else:
+                sent = [self._send_alimtalk(item) for item in alimtalk_items]
+            for item, result in zip(alimtalk_items, sent):
+                results[item["outbox_id"]] = result
+
+        for (msg_type, title), group in sms_groups.items():
+            if len(group) == 1:
+                item = group[0]
+                result = self.sms_client.send_sms(
+                    receiver=item["phone_number"],
+                    message=item["content"],
+                    title=title or None
+                )
+            else:
+                result = self.sms_client.send_mass(
+                    [{"phone": item["phone_number"], "message": item["content"], "name": item["recipient_name"] or ""}
+                     for item in group],
+                    msg_type=msg_type,
+                    title=title or None
+                )
+            # 대량 발송은 수신자별 결과를 주지 않으므로 요청 결과를 묶음 전체에 적용
+            for item in group:
+                results[item["outbox_id"]] = result
+        return results
+
+    def _send_alimtalk(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return self.kakao_client.send_alimtalk(
+                phone_number=item["phone_number"],
+                template_code=item["template_code"],
+                template_args=item["template_args"] or {},
+                fallback_message=item["fallback_message"]
+            )
+        except Exception as e:
+            return {"success": False, "error_code": "UNKNOWN_ERROR", "error_message": str(e)}
+
+    # ------------------------------------------------------------------
+    # 3. 결과 반영
+    # ------------------------------------------------------------------
+    def _record(self, items: List[Dict[str, Any]], results: Dict[int, Dict[str, Any]]) -> List[str]:
+        now = datetime.now()
+        updates, logs, outcomes = [], [], []
+        flagged: Dict[str, List[int]] = defaultdict(list)
+
+        for item in items:
+            result = results.get(item["outbox_id"]) or {"success": False, "error_message": "발송 결과 없음"}
+            attempts = item["attempts"]  # 가져갈 때 이미 증가
+            if result.get("success"):
+                outcome = STATUS_SENT
+                values = {
+                    "status": STATUS_SENT,
+                    "sent_at": now,
+                    "provider_message_id": str(result["message_id"]) if result.get("message_id") else None,
+                    "error_code": None,
+                    "error_message": None,
+                }
+                flag = RESERVATION_FLAGS.get(item["purpose"])
+                if flag and item["reservation_id"]:
+                    flagged[flag].append(item["reservation_id"])
+            elif attempts < self.max_attempts:
+                outcome = "retry"
+                values = {
+                    "status": STATUS_PENDING,
+                    "next_attempt_at": now + timedelta(seconds=self.retry_base_seconds * 2 ** (attempts - 1)),
+                }
+            else:
+                outcome = STATUS_FAILED
+                values = {"status": STATUS_FAILED}
+
+            if outcome != STATUS_SENT:
+                values["error_code"] = str(result.get("error_code") or "")[:50] or None
+                values["error_message"] = result.get("error_message")
+            updates.append({"outbox_id": item["outbox_id"], "locked_at": None, **values})
+            outcomes.append(outcome)
+
+            # 알림톡 이력은 최종 결과(성공 또는 재시도 포기)만 남긴다
+            if item["channel"] == CHANNEL_ALIMTALK and outcome != "retry":
+                logs.append(KakaoMessageLog(
+                    reservation_id=item["reservation_id"],
+                    customer_id=item["customer_id"],
+                    template_code=item["template_code"],
+                    phone_number=item["phone_number"],
+                    message_type="alimtalk",
+                    status="success" if outcome == STATUS_SENT else "failed",
+                    message_id=values.get("provider_message_id"),
+                    content=item["content"],
+                    variables_used=item["template_args"],
+                    sent_at=now if outcome == STATUS_SENT else None,
+                    error_code=values.get("error_code"),
+                    error_message=values.get("error_message")
+                ))
+
+        db = self.session_factory()
+        try:
+            db.execute(update(MessageOutbox), updates)
+            for flag, reservation_ids in flagged.items():
+                db.execute(
+                    update(Reservation)
+                    .where(Reservation.reservation_id.in_(reservation_ids))
+                    .values({flag: True})
+                )
+            db.add_all(logs)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+        return outcomes
+
+
+class MessageOutboxWorker:
+    """대기열을 주기적으로 비우는 백그라운드 루프 (FastAPI lifespan 또는 scripts/run_message_outbox.py)"""
+
+    def __init__(self, dispatcher: Optional[MessageOutboxDispatcher] = None, poll_seconds: Optional[float] = None):
+        self.dispatcher = dispatcher
+        self.poll_seconds = poll_seconds or settings.MESSAGE_OUTBOX_POLL_SECONDS
+        self.is_running = False
+
+    async def start(self):
+        """워커 시작"""
+        self.dispatcher = self.dispatcher or MessageOutboxDispatcher()
+        self.is_running = True
+        logger.info("Message outbox worker started")
+
+        while self.is_running:
+            try:
+                stats = await run_sync(self.dispatcher.dispatch_once)
+                # 꽉 찬 묶음이면 남은 메시지가 있으므로 바로 다음 묶음 처리
+                if stats["claimed"] < self.dispatcher.batch_size:
+                    await asyncio.sleep(self.poll_seconds)
+            except Exception as e:
+                logger.error(f"Error in message outbox worker: {e}")
+                await asyncio.sleep(self.poll_seconds * 5)
+
+    def stop(self):
+        """워커 중지"""
+        self.is_running = False
+        logger.info("Message outbox worker stopped")
+
+
+# 싱글톤 인스턴스
+message_outbox_worker = MessageOutboxWorker()
+
+
+async def start_message_outbox_worker():
+    """워커 시작 (FastAPI startup에서 호출, MESSAGE_OUTBOX_WORKER_ENABLED=false면 시작하지 않음)"""
+    if not settings.MESSAGE_OUTBOX_WORKER_ENABLED:
+        logger.info("Message outbox worker disabled in this process")
+        return
+    asyncio.create_task(message_outbox_worker.start())
+
+
+def stop_message_outbox_worker():
+    """워커 중지 (FastAPI shutdown에서 호출)"""
+    message_outbox_worker.stop()
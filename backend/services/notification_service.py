@@ -1,8 +1,9 @@
 """알림 서비스"""
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+import hashlib
+from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, func, and_, or_, insert, text
 from models.notification import Notification, NotificationSettings, NotificationType, NotificationPriority
 from models.user import User
 from models.package import PackagePurchase
@@ -15,6 +16,17 @@ from core.logging_config import get_logger
 logger = get_logger(__name__)
 
 
+def _enum_value(value: Any) -> Any:
+    """모델/스키마 Enum, 문자열 → 값 문자열"""
+    return getattr(value, "value", value)
+
+
+def _bulk_lock_key(day: date) -> int:
+    """알림 일괄 생성 중복 검사용 pg_advisory_xact_lock 키 (날짜별)"""
+    digest = hashlib.blake2b(f"notifications:bulk:{day.isoformat()}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
 class NotificationService:
     """알림 서비스"""
     
@@ -44,21 +56,77 @@ class NotificationService:
     def create_bulk_notifications(
         self,
         user_ids: List[int],
-        notification_data: NotificationCreate
-    ) -> List[Notification]:
-        """여러 사용자에게 알림 생성"""
-        notifications = []
-        
-        for user_id in user_ids:
-            data = notification_data.model_dump()
-            data['user_id'] = user_id
-            notification = Notification(**data)
-            notifications.append(notification)
-            self.db.add(notification)
-        
+        notification_data: NotificationCreate,
+        dedupe: bool = True
+    ) -> Dict[str, int]:
+        """여러 사용자에게 같은 알림 생성 → {"requested", "created", "skipped"}"""
+        data = notification_data.model_dump()
+        rows = [{**data, "user_id": user_id} for user_id in user_ids]
+        return self.bulk_insert_notifications(rows, dedupe=dedupe)
+
+    def bulk_insert_notifications(self, rows: List[Dict[str, Any]], dedupe: bool = True) -> Dict[str, int]:
+        """
+        알림 여러 건을 한 번의 INSERT(executemany)로 생성하고 커밋
+
+        dedupe=True면 오늘 이미 만든 (user_id, type, related_id) 알림과 목록 안의 중복은 건너뛴다.
+        related_id가 없는 알림은 중복 검사하지 않는다.
+        왕복 수는 건수와 무관하게 일정 (advisory lock, 기존 알림 조회, INSERT, 커밋).
+        """
+        requested = len(rows)
+        rows = [self._normalize(row) for row in rows]
+        if dedupe and rows:
+            rows = self._skip_duplicates(rows)
+
+        if rows:
+            self.db.execute(insert(Notification), rows)
         self.db.commit()
-        logger.info(f"{len(notifications)}개의 알림 생성")
-        return notifications
+
+        result = {"requested": requested, "created": len(rows), "skipped": requested - len(rows)}
+        logger.info(f"알림 일괄 생성: {result}")
+        return result
+
+    @staticmethod
+    def _normalize(row: Dict[str, Any]) -> Dict[str, Any]:
+        """스키마 Enum/문자열 → 모델 Enum"""
+        row = dict(row)
+        row["type"] = NotificationType(_enum_value(row["type"]))
+        if row.get("priority") is not None:
+            row["priority"] = NotificationPriority(_enum_value(row["priority"]))
+        return row
+
+    def _skip_duplicates(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        today = date.today()
+        keyed = [row for row in rows if row.get("related_id") is not None]
+        if not keyed:
+            return rows
+
+        # 스케줄러가 여러 프로세스에서 동시에 돌아도 같은 알림을 두 번 만들지 않도록 (트랜잭션 끝까지 유지)
+        if self.db.get_bind().dialect.name == "postgresql":
+            self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _bulk_lock_key(today)})
+
+        existing = {
+            (user_id, notification_type, related_id)
+            for user_id, notification_type, related_id in self.db.execute(
+                select(Notification.user_id, Notification.type, Notification.related_id).where(
+                    Notification.created_at >= datetime.combine(today, datetime.min.time()),
+                    Notification.created_at < datetime.combine(today + timedelta(days=1), datetime.min.time()),
+                    Notification.related_id.in_({row["related_id"] for row in keyed}),
+                    Notification.type.in_({row["type"] for row in keyed}),
+                )
+            )
+        }
+
+        unique = []
+        for row in rows:
+            if row.get("related_id") is None:
+                unique.append(row)
+                continue
+            key = (row.get("user_id"), row["type"], row["related_id"])
+            if key in existing:
+                continue
+            existing.add(key)
+            unique.append(row)
+        return unique
     
     def get_user_notifications(
         self,
@@ -0,0 +1,476 @@
+"""
+결제대장 엑셀 일괄 가져오기 서비스
+
+- 워크북은 한 번만 읽음 (xlsx: openpyxl read-only 스트리밍, xls: pandas로 시트별 1회)
+- 헤더 행은 각 시트의 앞 5행을 읽는 중에 찾음 (시트를 다시 읽지 않음)
+- 고객은 파일에 나온 전화번호/이름으로 한 번에 조회해 dict로 매칭, 없는 고객은 한 번에 생성
+- 중복은 (결제일, 고객, 금액, 승인번호) 집합으로 판단 (기존 결제도 같은 기간만 미리 조회)
+- 결제는 다중 VALUES INSERT로 배치 저장, 실패한 배치만 행 단위(SAVEPOINT)로 재시도
+"""
+import io
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import pandas as pd
+from openpyxl import load_workbook
+from sqlalchemy import select, func, text
+from sqlalchemy.orm import Session
+
+from models.customer import Customer
+from models.payment import Payment
+from services.customer_analytics_service import invalidate_customer_analytics
+from services.lead_metrics_service import invalidate_lead_key_metrics
+from services.daily_rollup_service import DailyRollupService
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+HEADER_SCAN_ROWS = 5
+INSERT_BATCH_SIZE = 500
+LOOKUP_CHUNK = 5000
+MAX_ERRORS = 10
+
+PREFERRED_SHEETS = ['2025년 5월', '전체 결제대장', '전체매출']
+SKIP_SHEETS_ALL = ['전체매출']  # 전체 시트 가져오기에서 제외 (월별 시트 합계)
+
+PAYMENT_COLUMNS = (
+    "customer_id", "payment_date", "amount", "payment_method", "payment_type",
+    "payment_status", "payment_staff", "transaction_id", "card_holder_name",
+    "reference_type", "notes"
+)
+# DB에서 enum 타입인 컬럼 (CAST 필요)
+ENUM_COLUMNS = {"payment_method", "payment_type", "payment_status"}
+
+TRANSFER_VALUES = {'계좌이체', '무통장입금', '이체'}
+CASH_VALUES = {'현금', 'CASH'}
+OTHER_VALUES = {'제로페이', 'ZEROPAY'}
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, float) and pd.isna(value):
+        return True
+    return isinstance(value, str) and not value.strip()
+
+
+def cell_text(value: Any) -> str:
+    """셀 값 → 문자열 (빈 값은 '', 숫자 셀의 .0 제거)"""
+    if _is_empty(value):
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value).strip()
+
+
+def parse_korean_date(date_value) -> Optional[date]:
+    """한국어 날짜 형식 파싱 (예: 2025.05.27 또는 2025-05-27)"""
+    if _is_empty(date_value):
+        return None
+
+    # pandas Timestamp나 datetime 객체인 경우
+    if isinstance(date_value, datetime):
+        return date_value.date()
+    if isinstance(date_value, date):
+        return date_value
+
+    date_str = str(date_value).strip()
+    for fmt in ['%Y.%m.%d', '%Y-%m-%d', '%Y/%m/%d', '%Y-%m-%d %H:%M:%S']:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+
+    return None
+
+
+def clean_phone_number(phone) -> str:
+    """전화번호 형식 정리"""
+    if _is_empty(phone):
+        return ""
+
+    phone = re.sub(r'\D', '', cell_text(phone))
+
+    # 한국 휴대폰 번호 형식으로 변환
+    if len(phone) == 11 and phone.startswith('010'):
+        return f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"
+    elif len(phone) == 10:
+        return f"{phone[:3]}-{phone[3:6]}-{phone[6:]}"
+
+    return phone
+
+
+def parse_amount(amount: Any) -> float:
+    """금액 파싱"""
+    if _is_empty(amount):
+        return 0.0
+
+    if isinstance(amount, str):
+        amount = amount.replace(',', '').replace('원', '').strip()
+
+    try:
+        return float(amount)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _first(record: Dict[str, Any], *keys: str) -> Any:
+    """여러 컬럼명 후보 중 처음으로 값이 있는 셀"""
+    for key in keys:
+        value = record.get(key)
+        if not _is_empty(value):
+            return value
+    return None
+
+
+# ----------------------------------------------------------------------
+# 워크북 읽기
+# ----------------------------------------------------------------------
+class PaymentWorkbook:
+    """업로드된 결제대장 워크북 (한 번만 로드)"""
+
+    def __init__(self, contents: bytes, filename: str):
+        self._xls_frames: Optional[Dict[str, pd.DataFrame]] = None
+        if filename.lower().endswith('.xls'):
+            # openpyxl은 xls를 읽지 못하므로 모든 시트를 한 번에 읽음
+            self._xls_frames = pd.read_excel(io.BytesIO(contents), sheet_name=None, header=None)
+            self.sheet_names = list(self._xls_frames)
+            self._workbook = None
+        else:
+            self._workbook = load_workbook(io.BytesIO(contents), read_only=True, data_only=True)
+            self.sheet_names = list(self._workbook.sheetnames)
+
+    def close(self) -> None:
+        if self._workbook is not None:
+            self._workbook.close()
+
+    def _rows(self, sheet_name: str) -> Iterator[Sequence[Any]]:
+        if self._xls_frames is not None:
+            yield from self._xls_frames[sheet_name].itertuples(index=False, name=None)
+        else:
+            yield from self._workbook[sheet_name].iter_rows(values_only=True)
+
+    def read_sheet(self, sheet_name: str, header_tokens: Sequence[str]) -> Optional[List[Tuple[int, Dict[str, Any]]]]:
+        """
+        앞 5행 중 header_tokens 중 하나가 포함된 행을 헤더로 보고
+        [(엑셀 행 번호, {헤더: 값})] 반환 (헤더가 없으면 None)
+        """
+        rows = self._rows(sheet_name)
+        headers = None
+        header_row = 0
+        for row_number, values in enumerate(rows, start=1):
+            if row_number > HEADER_SCAN_ROWS:
+                return None
+            texts = [cell_text(value) for value in values]
+            if any(token in cell for cell in texts for token in header_tokens):
+                headers = texts
+                header_row = row_number
+                break
+        if headers is None:
+            return None
+
+        records = []
+        for row_number, values in enumerate(rows, start=header_row + 1):
+            record = {header: value for header, value in zip(headers, values) if header}
+            if all(_is_empty(value) for value in record.values()):
+                continue
+            records.append((row_number, record))
+        return records
+
+
+# ----------------------------------------------------------------------
+# 행 변환
+# ----------------------------------------------------------------------
+@dataclass
+class PaymentRow:
+    sheet: str
+    row_number: int
+    customer_name: str
+    customer_phone: str
+    referral_source: str
+    payment_date: date
+    amount: Decimal
+    payment_method: str
+    payment_type: str
+    payment_status: str
+    payment_staff: str
+    transaction_id: str
+    card_holder_name: str
+    reference_type: Optional[str]
+    customer_id: Optional[int] = None
+
+    @property
+    def dedupe_key(self) -> Tuple[date, int, Decimal, str]:
+        return (self.payment_date, self.customer_id, self.amount, self.transaction_id)
+
+    def to_params(self) -> Dict[str, Any]:
+        return {
+            "customer_id": self.customer_id,
+            "payment_date": self.payment_date,
+            "amount": float(self.amount),
+            "payment_method": self.payment_method,
+            "payment_type": self.payment_type,
+            "payment_status": self.payment_status,
+            "payment_staff": self.payment_staff,
+            "transaction_id": self.transaction_id,
+            "card_holder_name": self.card_holder_name,
+            "reference_type": self.reference_type,
+            "notes": f"엑셀 업로드 ({self.sheet})",
+        }
+
+
+def _to_decimal(value: float) -> Decimal:
+    try:
+        return Decimal(str(value)).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return Decimal("0.00")
+
+
+def build_payment_row(sheet: str, row_number: int, record: Dict[str, Any]) -> Optional[PaymentRow]:
+    """엑셀 행 → PaymentRow (고객명/결제일 없는 행은 None)"""
+    customer_name = cell_text(record.get('고객명'))
+    payment_date = parse_korean_date(_first(record, '결제일자', '날짜'))
+    if not customer_name or not payment_date:
+        return None
+
+    amount = _to_decimal(parse_amount(_first(record, '결제 금액', '결제금액', '금액')))
+
+    # 승인번호 칸에 결제 수단이 적힌 경우가 많음
+    approval = cell_text(record.get('승인번호'))
+    if approval in TRANSFER_VALUES:
+        payment_method = 'transfer'
+    elif approval in CASH_VALUES:
+        payment_method = 'cash'
+    elif approval in OTHER_VALUES:
+        payment_method = 'other'
+    else:
+        payment_method = 'card'  # 빈 값/숫자 승인번호는 카드
+    transaction_id = '' if approval == '계좌이체' else approval
+
+    program = cell_text(_first(record, '결제 프로그램', '프로그램명')).replace('\n', ' ').strip()
+    program_lower = program.lower()
+    if '패키지' in program_lower:
+        payment_type = 'package'
+    elif '추가' in program_lower:
+        payment_type = 'additional'
+    elif '환불' in program_lower:
+        payment_type = 'refund'
+    else:
+        payment_type = 'single'
+
+    reference_type = program or None
+    if reference_type and len(reference_type) > 50:
+        reference_type = reference_type[:47] + "..."
+
+    return PaymentRow(
+        sheet=sheet,
+        row_number=row_number,
+        customer_name=customer_name,
+        customer_phone=clean_phone_number(record.get('고객전화번호')),
+        referral_source=cell_text(record.get('유입')) or '엑셀업로드',
+        payment_date=payment_date,
+        amount=amount,
+        payment_method=payment_method,
+        payment_type=payment_type,
+        # 음수 금액은 환불/취소
+        payment_status='refunded' if amount < 0 else 'completed',
+        payment_staff=cell_text(_first(record, '결제 담당자', '담당자')),
+        transaction_id=transaction_id,
+        card_holder_name=cell_text(_first(record, '카드 명의자명', '카드명의자')),
+        reference_type=reference_type,
+    )
+
+
+# ----------------------------------------------------------------------
+# 가져오기
+# ----------------------------------------------------------------------
+class PaymentImportService:
+    """결제대장 일괄 가져오기"""
+
+    def __init__(self, db: Session, batch_size: int = INSERT_BATCH_SIZE):
+        self.db = db
+        self.batch_size = batch_size
+
+    def import_sheets(self, sheets: Dict[str, List[Tuple[int, Dict[str, Any]]]]) -> Dict[str, Any]:
+        """
+        {시트명: [(행 번호, 행)]} 가져오기 → 시트별 결과
+
+        시트별 결과: total(고객명/결제일 있는 행), success, duplicate, error
+        """
+        stats = {sheet: {"sheet": sheet, "total": 0, "success": 0, "duplicate": 0, "error": 0} for sheet in sheets}
+        errors: List[str] = []
+
+        rows: List[PaymentRow] = []
+        for sheet, records in sheets.items():
+            for row_number, record in records:
+                try:
+                    row = build_payment_row(sheet, row_number, record)
+                except Exception as e:
+                    stats[sheet]["error"] += 1
+                    errors.append(f"{sheet} 행 {row_number}: {e}")
+                    continue
+                if row is not None:
+                    stats[sheet]["total"] += 1
+                    rows.append(row)
+
+        self._resolve_customers(rows)
+
+        seen = self._existing_payment_keys(rows)
+        pending: List[PaymentRow] = []
+        for row in rows:
+            key = row.dedupe_key
+            if key in seen:
+                stats[row.sheet]["duplicate"] += 1
+                continue
+            seen.add(key)
+            pending.append(row)
+
+        saved = self._insert_payments(pending, stats, errors)
+
+        if saved:
+            DailyRollupService(self.db).refresh_revenue({row.payment_date for row in saved})
+        self.db.commit()
+
+        # Core INSERT는 ORM flush 이벤트를 거치지 않으므로 분석 캐시를 직접 무효화
+        for customer_id in {row.customer_id for row in saved}:
+            invalidate_customer_analytics(customer_id)
+        if saved:
+            invalidate_lead_key_metrics()
+
+        logger.info(
+            f"결제 엑셀 가져오기 완료 - 시트 {len(sheets)}, 행 {len(rows)}, 저장 {len(saved)}, "
+            f"중복 {sum(s['duplicate'] for s in stats.values())}, 오류 {len(errors)}"
+        )
+        return {"sheets": list(stats.values()), "errors": errors}
+
+    def _resolve_customers(self, rows: List[PaymentRow]) -> None:
+        """전화번호 우선, 없으면 이름으로 고객 매칭 (파일 단위 1회 조회), 없는 고객은 일괄 생성"""
+        phones = {row.customer_phone for row in rows if row.customer_phone}
+        names = {row.customer_name for row in rows}
+
+        by_phone: Dict[str, int] = {}
+        for chunk in _chunks(sorted(phones), LOOKUP_CHUNK):
+            for customer_id, phone in self.db.execute(
+                select(Customer.customer_id, Customer.phone).where(Customer.phone.in_(chunk))
+            ):
+                by_phone[phone] = customer_id
+
+        by_name: Dict[str, int] = {}
+        for chunk in _chunks(sorted(names), LOOKUP_CHUNK):
+            # 동명이인은 먼저 등록된 고객
+            for name, customer_id in self.db.execute(
+                select(Customer.name, func.min(Customer.customer_id))
+                .where(Customer.name.in_(chunk))
+                .group_by(Customer.name)
+            ):
+                by_name[name] = customer_id
+
+        new_by_phone: Dict[str, Customer] = {}
+        new_by_name: Dict[str, Customer] = {}
+        unresolved: List[Tuple[PaymentRow, Customer]] = []
+        today = datetime.now().strftime('%Y-%m-%d')
+        for row in rows:
+            customer_id = by_phone.get(row.customer_phone) if row.customer_phone else None
+            if customer_id is None:
+                customer_id = by_name.get(row.customer_name)
+            if customer_id is not None:
+                row.customer_id = customer_id
+                continue
+
+            # 같은 파일 안에서 새로 만든 고객도 같은 규칙(전화번호 → 이름)으로 재사용
+            customer = new_by_phone.get(row.customer_phone) if row.customer_phone else None
+            customer = customer or new_by_name.get(row.customer_name)
+            if customer is None:
+                customer = Customer(
+                    name=row.customer_name,
+                    phone=row.customer_phone or None,
+                    referral_source=row.referral_source,
+                    customer_status='active',
+                    notes=f"엑셀 업로드 ({today})"
+                )
+                self.db.add(customer)
+                if row.customer_phone:
+                    new_by_phone[row.customer_phone] = customer
+                new_by_name.setdefault(row.customer_name, customer)
+            unresolved.append((row, customer))
+
+        if unresolved:
+            self.db.flush()
+            for row, customer in unresolved:
+                row.customer_id = customer.customer_id
+
+    def _existing_payment_keys(self, rows: List[PaymentRow]) -> Set[Tuple[date, int, Decimal, str]]:
+        """파일의 고객/기간에 해당하는 기존 결제 중복 키"""
+        if not rows:
+            return set()
+        start = min(row.payment_date for row in rows)
+        end = max(row.payment_date for row in rows)
+        customer_ids = sorted({row.customer_id for row in rows})
+
+        keys = set()
+        for chunk in _chunks(customer_ids, LOOKUP_CHUNK):
+            result = self.db.execute(
+                select(Payment.payment_date, Payment.customer_id, Payment.amount, Payment.transaction_id)
+                .where(
+                    Payment.customer_id.in_(chunk),
+                    Payment.payment_date.between(start, end)
+                )
+            )
+            for payment_date, customer_id, amount, transaction_id in result:
+                keys.add((payment_date, customer_id, _to_decimal(amount), transaction_id or ''))
+        return keys
+
+    def _insert_payments(
+        self,
+        rows: List[PaymentRow],
+        stats: Dict[str, Dict[str, Any]],
+        errors: List[str]
+    ) -> List[PaymentRow]:
+        saved = []
+        for batch in _chunks(rows, self.batch_size):
+            try:
+                with self.db.begin_nested():
+                    self._execute_insert(batch)
+                saved.extend(batch)
+                continue
+            except Exception as e:
+                logger.warning(f"결제 가져오기 배치 실패, 행 단위로 재시도: {getattr(e, 'orig', e)}")
+
+            for row in batch:
+                try:
+                    with self.db.begin_nested():
+                        self._execute_insert([row])
+                    saved.append(row)
+                except Exception as e:
+                    stats[row.sheet]["error"] += 1
+                    errors.append(f"{row.sheet} 행 {row.row_number}: {str(getattr(e, 'orig', e)).strip()[:200]}")
+
+        for row in saved:
+            stats[row.sheet]["success"] += 1
+        return saved
+
+    def _execute_insert(self, batch: List[PaymentRow]) -> None:
+        """다중 VALUES INSERT 한 번 (enum 컬럼은 CAST)"""
+        params: Dict[str, Any] = {}
+        values_sql = []
+        for index, row in enumerate(batch):
+            placeholders = []
+            row_params = row.to_params()
+            for column in PAYMENT_COLUMNS:
+                key = f"{column}_{index}"
+                params[key] = row_params[column]
+                placeholders.append(f"CAST(:{key} AS {column})" if column in ENUM_COLUMNS else f":{key}")
+            values_sql.append(f"({', '.join(placeholders)})")
+
+        self.db.execute(
+            text(f"INSERT INTO payments ({', '.join(PAYMENT_COLUMNS)}) VALUES {', '.join(values_sql)}"),
+            params
+        )
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,163 @@
+"""
+문진 템플릿 캐시 (프로세스 내)
+
+태블릿은 답변을 누를 때마다 답변 제출/진행 상태 API를 부르는데, 템플릿과 질문은 거의 바뀌지 않는다.
+템플릿별로 질문을 order_index 순으로 정렬한 스냅샷(필수 질문 집합, 섹션별 질문 목록 포함)을 만들어 두고
+진행률/다음 질문/필수 답변 확인을 메모리에서 계산한다.
+
+- 버전(지문): 템플릿 version/updated_at/is_active + 질문 수/최대 ID/최종 수정 시각
+- TTL(QUESTIONNAIRE_TEMPLATE_CACHE_TTL_SECONDS) 안에서는 쿼리 없이 스냅샷 사용
+- TTL이 지나면 지문만 다시 읽어 같으면 그대로 쓰고, 다르면 질문을 다시 읽음
+  (템플릿은 scripts/init_questionnaire_data.py 같은 다른 프로세스에서 바뀌므로 무효화만으로는 알 수 없음)
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from core.config import settings
+from core.logging_config import get_logger
+from models.questionnaire import Question, QuestionnaireTemplate
+from schemas.questionnaire import (
+    Question as QuestionSchema,
+    QuestionnaireSection,
+    QuestionnaireTemplate as QuestionnaireTemplateSchema,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class TemplateSnapshot:
+    """템플릿 + 정렬된 질문 (읽기 전용)"""
+    template: QuestionnaireTemplateSchema
+    fingerprint: tuple
+    questions_by_id: Dict[int, QuestionSchema] = field(repr=False)
+    required_ids: FrozenSet[int] = field(repr=False)
+    sections: Dict[QuestionnaireSection, Tuple[int, ...]] = field(repr=False)  # 섹션 → 질문 ID (순서대로)
+
+    @classmethod
+    def build(cls, template: QuestionnaireTemplate, fingerprint: tuple) -> "TemplateSnapshot":
+        schema = QuestionnaireTemplateSchema.model_validate(template)
+        schema.questions.sort(key=lambda question: question.order_index)
+        sections: Dict[QuestionnaireSection, List[int]] = {}
+        for question in schema.questions:
+            sections.setdefault(question.section, []).append(question.question_id)
+        return cls(
+            template=schema,
+            fingerprint=fingerprint,
+            questions_by_id={question.question_id: question for question in schema.questions},
+            required_ids=frozenset(q.question_id for q in schema.questions if q.is_required),
+            sections={section: tuple(ids) for section, ids in sections.items()},
+        )
+
+    @property
+    def total_questions(self) -> int:
+        return len(self.template.questions)
+
+    def next_question(self, answered_ids: Iterable[int]) -> Optional[QuestionSchema]:
+        """순서상 아직 답하지 않은 첫 질문"""
+        answered = set(answered_ids)
+        return next((q for q in self.template.questions if q.question_id not in answered), None)
+
+    def missing_required(self, answered_ids: Iterable[int]) -> List[int]:
+        return sorted(self.required_ids.difference(answered_ids))
+
+    def section_progress(self, answered_ids: Iterable[int]) -> List[dict]:
+        answered = set(answered_ids)
+        return [
+            {"section": section, "answered": len(answered.intersection(ids)), "total": len(ids)}
+            for section, ids in self.sections.items()
+        ]
+
+
+def _fingerprint(db: Session, template_id: int) -> Optional[tuple]:
+    """템플릿 버전 지문 (쿼리 1개) - 템플릿이 없으면 None"""
+    questions = (
+        select(
+            func.count(Question.question_id).label("count"),
+            func.max(Question.question_id).label("max_id"),
+            func.max(func.coalesce(Question.updated_at, Question.created_at)).label("modified_at"),
+        )
+        .where(Question.template_id == template_id)
+        .subquery()
+    )
+    row = db.execute(
+        select(
+            QuestionnaireTemplate.version,
+            QuestionnaireTemplate.updated_at,
+            QuestionnaireTemplate.is_active,
+            questions,
+        ).where(QuestionnaireTemplate.template_id == template_id)
+    ).first()
+    return tuple(row) if row is not None else None
+
+
+class QuestionnaireTemplateCache:
+    """template_id → (다음 확인 시각, TemplateSnapshot)"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._data: Dict[int, Tuple[float, TemplateSnapshot]] = {}
+        self.ttl_seconds = settings.QUESTIONNAIRE_TEMPLATE_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.hits = 0
+        self.revalidations = 0
+        self.loads = 0
+
+    def get(self, db: Session, template_id: int) -> Optional[TemplateSnapshot]:
+        """템플릿 스냅샷 (없으면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(template_id)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1]
+
+        fingerprint = _fingerprint(db, template_id)
+        if fingerprint is None:
+            self.invalidate(template_id)
+            return None
+        if entry is not None and entry[1].fingerprint == fingerprint:
+            snapshot = entry[1]
+            with self._lock:
+                self.revalidations += 1
+        else:
+            snapshot = self._load(db, template_id, fingerprint)
+        with self._lock:
+            self._data[template_id] = (now + self.ttl_seconds, snapshot)
+        return snapshot
+
+    def _load(self, db: Session, template_id: int, fingerprint: tuple) -> TemplateSnapshot:
+        template = db.execute(
+            select(QuestionnaireTemplate)
+            .options(selectinload(QuestionnaireTemplate.questions))
+            .where(QuestionnaireTemplate.template_id == template_id)
+        ).scalar_one()
+        snapshot = TemplateSnapshot.build(template, fingerprint)
+        with self._lock:
+            self.loads += 1
+        logger.info(f"문진 템플릿 {template_id} 캐시 적재: 질문 {snapshot.total_questions}개")
+        return snapshot
+
+    def invalidate(self, template_id: Optional[int] = None) -> None:
+        with self._lock:
+            if template_id is None:
+                self._data.clear()
+            else:
+                self._data.pop(template_id, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "templates": len(self._data),
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "loads": self.loads,
+            }
+
+
+template_cache = QuestionnaireTemplateCache()
@@ -0,0 +1,294 @@
+"""
+보고서 PDF용 데이터 집계 / 데이터 버전
+
+- *_data: 보고서에 들어갈 집계 데이터 (reports API의 PDF 생성 엔드포인트에서 옮겨옴)
+- *_version: 보고서에 쓰이는 행들의 개수/합계/최종 수정 시각을 한 번의 쿼리로 읽어 만든 해시.
+  값이 같으면 집계 결과도 같으므로 services/report_render_service.py가 캐시 키로 사용한다.
+"""
+import hashlib
+from datetime import date
+from typing import Any, Dict
+
+from sqlalchemy import desc, func, or_, select
+from sqlalchemy.orm import Session
+
+from models.customer import Customer
+from models.payment import Payment
+from models.service import ServiceType, ServiceUsage
+from services.revenue_report_service import growth_rate, month_range, monthly_revenue_window, previous_month
+
+# 보고서 레이아웃/집계 방식을 바꾸면 올려서 기존 캐시를 무효화
+REPORT_FORMAT_VERSION = 1
+
+
+def _digest(*parts) -> str:
+    raw = repr((REPORT_FORMAT_VERSION,) + parts)
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def _payment_stats(*conditions):
+    """결제 개수/합계/최종 수정 시각 스칼라 서브쿼리"""
+    where = or_(*conditions) if len(conditions) > 1 else conditions[0]
+    return (
+        select(func.count(Payment.payment_id), func.sum(Payment.amount), func.max(Payment.updated_at))
+        .where(where)
+    )
+
+
+def monthly_revenue_data(db: Session, year: int, month: int) -> Dict[str, Any]:
+    """월간 매출 보고서 데이터"""
+    # Calculate date range
+    start_date, end_date = month_range(year, month)
+
+    # 전년 동월 ~ 당월 결제를 (결제일, 결제수단)으로 한 번 집계 → 당월/전월/전년 동월/일별/결제수단별 계산
+    window = monthly_revenue_window(db, year, month)
+    total_revenue, total_transactions = window.month_total(year, month)
+
+    # Calculate daily average
+    days_in_month = (end_date - start_date).days + 1
+    daily_average = total_revenue / days_in_month if days_in_month > 0 else 0
+
+    # Month-over-month / year-over-year growth
+    prev_month_revenue, _ = window.month_total(*previous_month(year, month))
+    mom_growth = growth_rate(total_revenue, prev_month_revenue)
+    yoy_revenue, _ = window.month_total(year - 1, month)
+    yoy_growth = growth_rate(total_revenue, yoy_revenue)
+
+    daily_revenue = {f"{day.day}일": amount for day, amount in window.daily(start_date, end_date).items()}
+    
+    # Get service revenue breakdown
+    service_usage_stmt = (
+        select(
+            ServiceType.service_name,
+            func.count(ServiceUsage.usage_id).label('usage_count')
+        )
+        .join(ServiceType, ServiceUsage.service_type_id == ServiceType.service_type_id)
+        .where(
+            (ServiceUsage.service_date >= start_date) &
+            (ServiceUsage.service_date <= end_date)
+        )
+        .group_by(ServiceType.service_name)
+    )
+    
+    service_result = db.execute(service_usage_stmt)
+    service_data = service_result.all()
+    
+    # Estimate revenue distribution based on service usage
+    total_usage = sum(row.usage_count for row in service_data)
+    service_revenue = {}
+    if total_usage > 0 and total_revenue > 0:
+        for row in service_data:
+            service_revenue[row.service_name] = float(total_revenue * row.usage_count / total_usage)
+    
+    # Get payment method stats
+    payment_methods = {}
+    for method, stats in window.by_method(start_date, end_date).items():
+        payment_methods[method] = {
+            'count': stats['count'],
+            'amount': stats['amount'],
+            'percentage': stats['amount'] / total_revenue * 100 if total_revenue > 0 else 0
+        }
+    
+    # Prepare report data
+    report_data = {
+        'year': year,
+        'month': month,
+        'total_revenue': float(total_revenue),
+        'total_transactions': total_transactions,
+        'daily_average': float(daily_average),
+        'month_over_month_growth': mom_growth,
+        'year_over_year_growth': yoy_growth,
+        'daily_revenue': daily_revenue,
+        'service_revenue': service_revenue,
+        'payment_methods': payment_methods
+    }
+
+    return report_data
+
+
+def monthly_revenue_version(db: Session, year: int, month: int) -> str:
+    """월간 매출 보고서 데이터 버전 (당월/전월/전년 동월 결제 + 당월 서비스 이용)"""
+    start_date, end_date = month_range(year, month)
+    prev_month_start = date(*previous_month(year, month), 1)
+    yoy_start, yoy_end = month_range(year - 1, month)
+
+    payments = _payment_stats(
+        Payment.payment_date.between(prev_month_start, end_date),
+        Payment.payment_date.between(yoy_start, yoy_end),
+    ).subquery()
+    usages = (
+        select(func.count(ServiceUsage.usage_id).label("count"), func.max(ServiceUsage.usage_id).label("max_id"))
+        .where(ServiceUsage.service_date.between(start_date, end_date))
+        .subquery()
+    )
+    row = db.execute(select(payments, usages)).one()
+    return _digest("monthly_revenue", year, month, *tuple(row))
+
+
+def customer_analysis_data(db: Session, start_date: date, end_date: date) -> Dict[str, Any]:
+    """고객 분석 보고서 데이터"""
+    # Get total customers
+    total_customers_result = db.execute(
+        select(func.count(Customer.customer_id))
+    )
+    total_customers = total_customers_result.scalar() or 0
+    
+    # Get new customers in period
+    new_customers_result = db.execute(
+        select(func.count(Customer.customer_id))
+        .where(
+            (Customer.first_visit_date >= start_date) &
+            (Customer.first_visit_date <= end_date)
+        )
+    )
+    new_customers = new_customers_result.scalar() or 0
+    
+    # Get returning customers (had services before the period)
+    returning_customers_result = db.execute(
+        select(func.count(func.distinct(ServiceUsage.customer_id)))
+        .where(
+            (ServiceUsage.service_date >= start_date) &
+            (ServiceUsage.service_date <= end_date) &
+            (ServiceUsage.customer_id.in_(
+                select(Customer.customer_id)
+                .where(Customer.first_visit_date < start_date)
+            ))
+        )
+    )
+    returning_customers = returning_customers_result.scalar() or 0
+    
+    # Get average visits per customer
+    avg_visits_stmt = (
+        select(
+            func.count(ServiceUsage.usage_id).label('total_visits'),
+            func.count(func.distinct(ServiceUsage.customer_id)).label('unique_customers')
+        )
+        .where(
+            (ServiceUsage.service_date >= start_date) &
+            (ServiceUsage.service_date <= end_date)
+        )
+    )
+    
+    avg_visits_result = db.execute(avg_visits_stmt)
+    avg_data = avg_visits_result.one()
+    avg_visits = avg_data.total_visits / avg_data.unique_customers if avg_data.unique_customers > 0 else 0
+    
+    # Get average purchase amount
+    avg_purchase_stmt = (
+        select(func.avg(Payment.amount))
+        .where(
+            (Payment.payment_date >= start_date) &
+            (Payment.payment_date <= end_date)
+        )
+    )
+    
+    avg_purchase_result = db.execute(avg_purchase_stmt)
+    avg_purchase_amount = avg_purchase_result.scalar() or 0
+    
+    # Get region distribution
+    region_stmt = (
+        select(
+            Customer.region,
+            func.count(Customer.customer_id).label('count')
+        )
+        .where(Customer.region.is_not(None))
+        .group_by(Customer.region)
+        .order_by(desc('count'))
+        .limit(10)
+    )
+    
+    region_result = db.execute(region_stmt)
+    region_data = region_result.all()
+    
+    region_distribution = {row.region: row.count for row in region_data}
+    
+    # Get referral sources
+    referral_stmt = (
+        select(
+            Customer.referral_source,
+            func.count(Customer.customer_id).label('count')
+        )
+        .where(
+            (Customer.first_visit_date >= start_date) &
+            (Customer.first_visit_date <= end_date) &
+            (Customer.referral_source.is_not(None))
+        )
+        .group_by(Customer.referral_source)
+        .order_by(desc('count'))
+    )
+    
+    referral_result = db.execute(referral_stmt)
+    referral_data = referral_result.all()
+    
+    referral_sources = {row.referral_source: row.count for row in referral_data}
+    
+    # Get top customers
+    top_customers_stmt = (
+        select(
+            Customer.name,
+            Customer.customer_id,
+            func.count(ServiceUsage.usage_id).label('visits'),
+            func.sum(Payment.amount).label('total_amount')
+        )
+        .join(ServiceUsage, Customer.customer_id == ServiceUsage.customer_id, isouter=True)
+        .join(Payment, Customer.customer_id == Payment.customer_id, isouter=True)
+        .where(
+            (ServiceUsage.service_date >= start_date) &
+            (ServiceUsage.service_date <= end_date) &
+            (Payment.payment_date >= start_date) &
+            (Payment.payment_date <= end_date)
+        )
+        .group_by(Customer.customer_id, Customer.name)
+        .order_by(desc('total_amount'))
+        .limit(10)
+    )
+    
+    top_result = db.execute(top_customers_stmt)
+    top_data = top_result.all()
+    
+    top_customers = [
+        {
+            'name': row.name,
+            'visits': row.visits,
+            'total_amount': float(row.total_amount) if row.total_amount else 0
+        }
+        for row in top_data
+    ]
+    
+    # Prepare report data
+    report_data = {
+        'start_date': start_date.strftime('%Y-%m-%d'),
+        'end_date': end_date.strftime('%Y-%m-%d'),
+        'total_customers': total_customers,
+        'new_customers': new_customers,
+        'returning_customers': returning_customers,
+        'avg_visits': avg_visits,
+        'avg_purchase_amount': float(avg_purchase_amount),
+        'region_distribution': region_distribution,
+        'referral_sources': referral_sources,
+        'top_customers': top_customers
+    }
+
+    return report_data
+
+
+def customer_analysis_version(db: Session, start_date: date, end_date: date) -> str:
+    """고객 분석 보고서 데이터 버전 (전체 고객 + 기간 내 서비스 이용/결제)"""
+    customers = select(
+        func.count(Customer.customer_id).label("count"), func.max(Customer.updated_at).label("updated_at")
+    ).subquery()
+    usages = (
+        select(func.count(ServiceUsage.usage_id).label("count"), func.max(ServiceUsage.usage_id).label("max_id"))
+        .where(ServiceUsage.service_date.between(start_date, end_date))
+        .subquery()
+    )
+    payments = _payment_stats(Payment.payment_date.between(start_date, end_date)).subquery()
+    row = db.execute(select(customers, usages, payments)).one()
+    return _digest("customer_analysis", start_date, end_date, *tuple(row))
+
+
+# 보고서 종류 → (데이터 집계, 데이터 버전)
+REPORT_BUILDERS = {
+    "monthly_revenue": (monthly_revenue_data, monthly_revenue_version),
+    "customer_analysis": (customer_analysis_data, customer_analysis_version),
+}
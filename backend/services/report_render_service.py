@@ -0,0 +1,373 @@
+"""
+보고서 PDF 렌더링 서비스
+
+월간 매출/고객 분석 PDF는 집계 쿼리 여러 개 + matplotlib 차트 + reportlab 문서로 수 초가 걸린다.
+
+- 렌더링은 spawn 프로세스 풀에서 실행 (utils.report_generator.render_report)
+  → API 프로세스의 GIL/스레드를 잡지 않고, 요청 스레드는 결과만 기다림
+- 완성된 PDF는 report_renders 테이블에 (보고서 종류, 기간, 데이터 버전) 키로 저장
+  데이터 버전(services/report_data_service.py)이 같으면 집계/렌더링 없이 저장된 PDF를 돌려줌
+- 기간이 끝나고 REPORT_RENDER_FINAL_AFTER_DAYS가 지난 뒤 만든 PDF는 확정본으로 보고
+  데이터 버전 조회 없이 바로 돌려줌 (지난달 보고서) - refresh=True면 다시 확인
+- 이번 달처럼 오래 걸릴 수 있는 보고서는 submit → 백그라운드 run_job → 다운로드 링크로 받을 수 있음
+"""
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from multiprocessing import get_context
+from typing import Callable, Optional, Tuple
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, undefer
+
+from core.config import settings
+from core.database import ReadSessionLocal, SessionLocal
+from core.logging_config import get_logger
+from models.report_render import ReportRender
+from services.report_data_service import REPORT_BUILDERS
+from services.revenue_report_service import month_range
+from utils.report_generator import render_report
+
+logger = get_logger(__name__)
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_SUCCEEDED = "succeeded"
+STATUS_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ReportRequest:
+    """렌더링할 보고서 - params는 report_data_service 집계 함수의 인자"""
+    report_type: str
+    params: Tuple[Tuple[str, object], ...]
+    period_key: str
+    period_end: date
+    filename: str
+
+    @property
+    def kwargs(self) -> dict:
+        return dict(self.params)
+
+
+def monthly_revenue_request(year: int, month: int) -> ReportRequest:
+    _, end_date = month_range(year, month)
+    return ReportRequest(
+        report_type="monthly_revenue",
+        params=(("year", year), ("month", month)),
+        period_key=f"{year}-{month:02d}",
+        period_end=end_date,
+        filename=f"monthly_revenue_{year}_{month:02d}.pdf",
+    )
+
+
+def customer_analysis_request(start_date: date, end_date: date) -> ReportRequest:
+    return ReportRequest(
+        report_type="customer_analysis",
+        params=(("start_date", start_date), ("end_date", end_date)),
+        period_key=f"{start_date}~{end_date}",
+        period_end=end_date,
+        filename=f"customer_analysis_{start_date}_{end_date}.pdf",
+    )
+
+
+@dataclass
+class RenderedReport:
+    pdf: bytes
+    filename: str
+    data_version: str
+    cache_hit: bool
+
+
+def _report_session() -> Session:
+    """집계용 읽기 세션 (core.database.get_report_db와 같은 설정)"""
+    db = ReadSessionLocal()
+    db.info["statement_timeout_ms"] = settings.DB_REPORT_STATEMENT_TIMEOUT_MS
+    return db
+
+
+class ReportRenderService:
+    """보고서 캐시 조회 → 집계 → 프로세스 풀 렌더링 → 저장"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        report_session_factory: Callable[[], Session] = _report_session,
+        process_workers: Optional[int] = None,
+    ):
+        self.session_factory = session_factory
+        self.report_session_factory = report_session_factory
+        self.process_workers = process_workers if process_workers is not None else settings.REPORT_RENDER_PROCESS_WORKERS
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # 렌더링 (프로세스 풀)
+    # ------------------------------------------------------------------
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                # fork 대신 spawn: 부모의 DB 커넥션/스레드 상태를 물려받지 않음
+                self._pool = ProcessPoolExecutor(max_workers=self.process_workers, mp_context=get_context("spawn"))
+            return self._pool
+
+    def render(self, report_type: str, data: dict) -> bytes:
+        if self.process_workers <= 0:
+            return render_report(report_type, data)
+        try:
+            return self.pool.submit(render_report, report_type, data).result(
+                timeout=settings.REPORT_RENDER_TIMEOUT_SECONDS
+            )
+        except BrokenProcessPool:
+            # 워커 프로세스가 죽으면 풀을 버리고 다음 요청에서 새로 만듦
+            self.shutdown()
+            raise
+
+    def shutdown(self) -> None:
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    # ------------------------------------------------------------------
+    # 캐시 조회
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _final_render(db: Session, request: ReportRequest) -> Optional[ReportRender]:
+        """기간 종료 + 유예 기간 이후에 만든 PDF (확정본)"""
+        finalized_after = datetime.combine(
+            request.period_end + timedelta(days=settings.REPORT_RENDER_FINAL_AFTER_DAYS + 1), datetime.min.time()
+        )
+        if datetime.now() < finalized_after:
+            return None
+        return db.execute(
+            select(ReportRender)
+            .where(
+                ReportRender.report_type == request.report_type,
+                ReportRender.period_key == request.period_key,
+                ReportRender.status == STATUS_SUCCEEDED,
+                ReportRender.finished_at >= finalized_after,
+            )
+            .order_by(ReportRender.finished_at.desc())
+            .limit(1)
+        ).scalar_one_or_none()
+
+    @staticmethod
+    def _by_version(db: Session, request: ReportRequest, data_version: str) -> Optional[ReportRender]:
+        return db.execute(
+            select(ReportRender).where(
+                ReportRender.report_type == request.report_type,
+                ReportRender.period_key == request.period_key,
+                ReportRender.data_version == data_version,
+            )
+        ).scalar_one_or_none()
+
+    def _data_version(self, request: ReportRequest, report_db: Optional[Session] = None) -> str:
+        version_fn = REPORT_BUILDERS[request.report_type][1]
+        if report_db is not None:
+            return version_fn(report_db, **request.kwargs)
+        db = self.report_session_factory()
+        try:
+            return version_fn(db, **request.kwargs)
+        finally:
+            db.close()
+
+    def _build_and_render(self, request: ReportRequest, report_db: Session) -> Tuple[bytes, int]:
+        started = time.perf_counter()
+        data = REPORT_BUILDERS[request.report_type][0](report_db, **request.kwargs)
+        pdf = self.render(request.report_type, data)
+        duration_ms = int((time.perf_counter() - started) * 1000)
+        logger.info(f"보고서 렌더링 {request.report_type} {request.period_key}: {duration_ms}ms, {len(pdf):,} bytes")
+        return pdf, duration_ms
+
+    @staticmethod
+    def _drop_superseded(db: Session, keep: ReportRender) -> None:
+        """같은 보고서/기간의 이전 버전 PDF 삭제 (진행 중인 작업은 유지)"""
+        db.execute(
+            delete(ReportRender).where(
+                ReportRender.report_type == keep.report_type,
+                ReportRender.period_key == keep.period_key,
+                ReportRender.render_id != keep.render_id,
+                ReportRender.status.in_((STATUS_SUCCEEDED, STATUS_FAILED)),
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # 동기 요청: 캐시에 있으면 바로, 없으면 렌더링 후 저장
+    # ------------------------------------------------------------------
+    def get_or_render(self, request: ReportRequest, report_db: Session, refresh: bool = False) -> RenderedReport:
+        db = self.session_factory()
+        try:
+            if not refresh:
+                final = self._final_render(db, request)
+                if final is not None:
+                    return RenderedReport(final.pdf, final.filename, final.data_version, True)
+
+            data_version = self._data_version(request, report_db)
+            row = self._by_version(db, request, data_version)
+            if row is not None and row.status == STATUS_SUCCEEDED and not refresh:
+                return RenderedReport(row.pdf, row.filename, data_version, True)
+
+            pdf, duration_ms = self._build_and_render(request, report_db)
+            self._store(db, request, data_version, pdf, duration_ms)
+            return RenderedReport(pdf, request.filename, data_version, False)
+        finally:
+            db.close()
+
+    def _store(self, db: Session, request: ReportRequest, data_version: str, pdf: bytes, duration_ms: int) -> None:
+        now = datetime.now()
+        values = dict(
+            filename=request.filename, status=STATUS_SUCCEEDED, pdf=pdf, size_bytes=len(pdf),
+            duration_ms=duration_ms, error_message=None, started_at=now, finished_at=now,
+        )
+        try:
+            row = self._by_version(db, request, data_version)
+            if row is None:
+                row = ReportRender(
+                    report_type=request.report_type, period_key=request.period_key,
+                    period_end=request.period_end, data_version=data_version, **values
+                )
+                db.add(row)
+            else:
+                for key, value in values.items():
+                    setattr(row, key, value)
+            db.flush()
+            self._drop_superseded(db, row)
+            db.commit()
+        except IntegrityError:
+            # 동시에 같은 보고서를 렌더링한 요청이 먼저 저장 - 그 결과를 사용
+            db.rollback()
+        except Exception as e:
+            # 저장 실패해도 만든 PDF는 응답으로 돌려줌
+            db.rollback()
+            logger.warning(f"보고서 PDF 저장 실패 ({request.report_type} {request.period_key}): {e}")
+
+    # ------------------------------------------------------------------
+    # 비동기 작업: submit → (BackgroundTasks) run_job → 상태 조회/다운로드
+    # ------------------------------------------------------------------
+    def submit(self, request: ReportRequest, report_db: Session, requested_by: Optional[int] = None) -> Tuple[ReportRender, bool]:
+        """
+        작업 등록 - (행, 새로 실행해야 하는지)
+
+        이미 만든 PDF가 있거나 같은 작업이 진행 중이면 그 행을 그대로 돌려준다.
+        """
+        db = self.session_factory()
+        try:
+            final = self._final_render(db, request)
+            if final is not None:
+                return final, False
+
+            data_version = self._data_version(request, report_db)
+            row = self._by_version(db, request, data_version)
+            if row is not None and not self._needs_run(row):
+                return row, False
+
+            if row is None:
+                row = ReportRender(
+                    report_type=request.report_type, period_key=request.period_key,
+                    period_end=request.period_end, data_version=data_version,
+                    filename=request.filename, status=STATUS_PENDING, requested_by=requested_by
+                )
+                db.add(row)
+            else:
+                # 실패했거나 멈춘 작업 재시도
+                row.status = STATUS_PENDING
+                row.error_message = None
+                row.started_at = None
+                row.finished_at = None
+                row.requested_by = requested_by
+            try:
+                db.commit()
+            except IntegrityError:
+                db.rollback()
+                return self._by_version(db, request, data_version), False
+            db.refresh(row)
+            return row, True
+        finally:
+            db.close()
+
+    @staticmethod
+    def _needs_run(row: ReportRender) -> bool:
+        if row.status == STATUS_FAILED:
+            return True
+        if row.status == STATUS_RUNNING and row.started_at is not None:
+            # 렌더링 제한 시간의 두 배가 지나도 running이면 프로세스가 죽은 것으로 봄
+            stale_after = timedelta(seconds=settings.REPORT_RENDER_TIMEOUT_SECONDS * 2)
+            return datetime.now() - row.started_at > stale_after
+        return False
+
+    def run_job(self, render_id: int, request: ReportRequest) -> None:
+        """pending 작업 실행 (BackgroundTasks에서 호출 - 스레드풀)"""
+        db = self.session_factory()
+        try:
+            claimed = db.execute(
+                update(ReportRender)
+                .where(ReportRender.render_id == render_id, ReportRender.status == STATUS_PENDING)
+                .values(status=STATUS_RUNNING, started_at=datetime.now())
+            ).rowcount
+            db.commit()
+            if not claimed:
+                return
+
+            report_db = self.report_session_factory()
+            try:
+                pdf, duration_ms = self._build_and_render(request, report_db)
+            finally:
+                report_db.close()
+
+            row = db.get(ReportRender, render_id)
+            row.status = STATUS_SUCCEEDED
+            row.pdf = pdf
+            row.size_bytes = len(pdf)
+            row.duration_ms = duration_ms
+            row.finished_at = datetime.now()
+            db.flush()
+            self._drop_superseded(db, row)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"보고서 작업 {render_id} 실패 ({request.report_type} {request.period_key}): {e}")
+            db.execute(
+                update(ReportRender)
+                .where(ReportRender.render_id == render_id)
+                .values(status=STATUS_FAILED, error_message=str(e)[:1000], finished_at=datetime.now())
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    @staticmethod
+    def get(db: Session, render_id: int, with_pdf: bool = False) -> Optional[ReportRender]:
+        query = select(ReportRender).where(ReportRender.render_id == render_id)
+        if with_pdf:
+            query = query.options(undefer(ReportRender.pdf))
+        return db.execute(query).scalar_one_or_none()
+
+
+def render_status(row: ReportRender) -> dict:
+    """작업 상태 응답"""
+    return {
+        "render_id": row.render_id,
+        "report_type": row.report_type,
+        "period": row.period_key,
+        "status": row.status,
+        "size_bytes": row.size_bytes,
+        "duration_ms": row.duration_ms,
+        "error_message": row.error_message,
+        "created_at": row.created_at,
+        "finished_at": row.finished_at,
+        "status_url": f"/api/v1/reports/renders/{row.render_id}",
+        "download_url": f"/api/v1/reports/renders/{row.render_id}/download" if row.status == STATUS_SUCCEEDED else None,
+    }
+
+
+report_render_service = ReportRenderService()
+
+
+def stop_report_render_service():
+    report_render_service.shutdown()
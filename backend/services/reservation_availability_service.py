@@ -0,0 +1,361 @@
+"""
+예약 가능 시간 계산 엔진
+
+하루(또는 여러 날)의 예약을 한 번에 읽어 자원별 구간 집합을 만들고 정렬된 구간 스윕으로 빈 시간을 구한다.
+- 영업시간: company_info.business_hours / holidays (없으면 RESERVATION_OPEN_TIME ~ RESERVATION_CLOSE_TIME)
+- 서비스(룸/기기): 같은 서비스 예약이 동시 수용 인원(capacity) 이상 겹치는 구간은 불가
+- 직원: staff_schedules.schedule_data 시간표에 이름이 있는 시간만 근무, 담당 예약과 겹치는 구간은 불가
+- 예약 길이: reservations.duration_minutes, 새 예약은 service_types.default_duration
+
+구간은 자정 기준 분(minute) 단위 [start, end) 로 다룬다.
+"""
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date, time, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import select, or_
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.logging_config import get_logger
+from models.reservation import Reservation, ReservationStatus
+from models.service import ServiceType
+from models.staff_schedule import StaffSchedule
+from models.system import CompanyInfo, SystemSettings
+from models.user import User
+
+logger = get_logger(__name__)
+
+Interval = Tuple[int, int]
+
+ACTIVE_STATUSES = [ReservationStatus.pending, ReservationStatus.confirmed]
+DEFAULT_DURATION_MINUTES = 60
+CAPACITY_SETTING_KEY = "reservation_service_capacity"  # {"<service_type_id>": 동시 수용 인원}
+
+WEEKDAY_KEYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+WEEKDAY_KR = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+# ----------------------------------------------------------------------
+# 구간 연산 (입력/출력 모두 정렬된 [start, end) 목록)
+# ----------------------------------------------------------------------
+def merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if start >= end:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def intersect_intervals(a: Sequence[Interval], b: Sequence[Interval]) -> List[Interval]:
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        start = max(a[i][0], b[j][0])
+        end = min(a[i][1], b[j][1])
+        if start < end:
+            result.append((start, end))
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+    return result
+
+
+def subtract_intervals(base: Sequence[Interval], remove: Sequence[Interval]) -> List[Interval]:
+    result = []
+    j = 0
+    for start, end in base:
+        while j < len(remove) and remove[j][1] <= start:
+            j += 1
+        k = j
+        cursor = start
+        while k < len(remove) and remove[k][0] < end:
+            if remove[k][0] > cursor:
+                result.append((cursor, remove[k][0]))
+            cursor = max(cursor, remove[k][1])
+            k += 1
+        if cursor < end:
+            result.append((cursor, end))
+    return result
+
+
+def saturated_intervals(intervals: Iterable[Interval], capacity: int) -> List[Interval]:
+    """동시에 capacity개 이상 겹치는 구간 (시작/종료 이벤트 스윕)"""
+    events = []
+    for start, end in intervals:
+        if start < end:
+            events.append((start, 1))
+            events.append((end, -1))
+    # 같은 시각이면 종료(-1)를 먼저 처리 → 10:00 종료/10:00 시작은 겹치지 않음
+    events.sort()
+
+    result: List[Interval] = []
+    active = 0
+    saturated_from = None
+    for point, delta in events:
+        active += delta
+        if active >= capacity and saturated_from is None:
+            saturated_from = point
+        elif active < capacity and saturated_from is not None:
+            if point > saturated_from:
+                result.append((saturated_from, point))
+            saturated_from = None
+    return merge_intervals(result)
+
+
+def slot_starts(free: Sequence[Interval], duration: int, step: int, origin: int) -> List[int]:
+    """free 구간 안에 duration 길이가 통째로 들어가는 시작 시각 (origin부터 step 간격 격자)"""
+    starts = []
+    for start, end in free:
+        offset = (start - origin) % step
+        current = start if offset == 0 else start + (step - offset)
+        while current + duration <= end:
+            starts.append(current)
+            current += step
+    return starts
+
+
+def _to_minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
+
+
+def _parse_clock(value: Any) -> Optional[int]:
+    """'09:00' / '9:30' → 분"""
+    if not value:
+        return None
+    match = re.match(r"^\s*(\d{1,2}):(\d{2})", str(value))
+    if not match:
+        return None
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def format_minutes(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+# ----------------------------------------------------------------------
+# 엔진
+# ----------------------------------------------------------------------
+@dataclass
+class DayAvailability:
+    day: date
+    business_hours: List[Interval] = field(default_factory=list)
+    free: List[Interval] = field(default_factory=list)
+    slots: List[int] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "date": self.day,
+            "business_hours": [{"start": format_minutes(s), "end": format_minutes(e)} for s, e in self.business_hours],
+            "free_intervals": [{"start": format_minutes(s), "end": format_minutes(e)} for s, e in self.free],
+            "slots": [format_minutes(start) for start in self.slots],
+        }
+
+
+def compute_day(
+    day: date,
+    business_hours: List[Interval],
+    service_busy: List[Interval],
+    capacity: int,
+    duration: int,
+    step: int,
+    staff_hours: Optional[List[Interval]] = None,
+    staff_busy: Optional[List[Interval]] = None,
+    default_origin: int = 9 * 60,
+) -> DayAvailability:
+    """하루치 빈 시간 계산 (DB 접근 없음)
+
+    staff_hours가 None이면 근무표 제한 없음, staff_busy가 None이면 직원 조건 없음
+    """
+    free = list(business_hours)
+    if staff_hours is not None:
+        free = intersect_intervals(free, staff_hours)
+    free = subtract_intervals(free, saturated_intervals(service_busy, capacity))
+    if staff_busy is not None:
+        free = subtract_intervals(free, merge_intervals(staff_busy))
+
+    origin = business_hours[0][0] if business_hours else default_origin
+    return DayAvailability(
+        day=day,
+        business_hours=business_hours,
+        free=free,
+        slots=slot_starts(free, duration, step, origin)
+    )
+
+
+class ReservationAvailabilityService:
+    """예약 가능 시간 조회"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_availability(
+        self,
+        start_date: date,
+        end_date: date,
+        service_type_id: int,
+        staff_id: Optional[int] = None,
+        duration_minutes: Optional[int] = None,
+        slot_minutes: Optional[int] = None,
+    ) -> List[DayAvailability]:
+        """start_date ~ end_date (포함) 날짜별 예약 가능 시간"""
+        days = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+        step = slot_minutes or settings.RESERVATION_SLOT_MINUTES
+        duration = duration_minutes or self._service_duration(service_type_id)
+        capacity = self.service_capacity(service_type_id)
+
+        business_hours = self._business_hours(days)
+        service_busy, staff_busy = self._busy_intervals(start_date, end_date, service_type_id, staff_id)
+        staff_hours = self._staff_working_hours(staff_id, days) if staff_id else {}
+
+        default_open = _parse_clock(settings.RESERVATION_OPEN_TIME)
+        return [
+            compute_day(
+                day,
+                business_hours.get(day, []),
+                service_busy.get(day, []),
+                capacity,
+                duration,
+                step,
+                staff_hours=staff_hours.get(day),
+                staff_busy=staff_busy.get(day, []) if staff_id else None,
+                default_origin=default_open,
+            )
+            for day in days
+        ]
+
+    # ------------------------------------------------------------------
+    # 데이터 로드 (기간 전체를 한 번에)
+    # ------------------------------------------------------------------
+    def _service_duration(self, service_type_id: int) -> int:
+        duration = self.db.execute(
+            select(ServiceType.default_duration).where(ServiceType.service_type_id == service_type_id)
+        ).scalar()
+        return duration or DEFAULT_DURATION_MINUTES
+
+    def service_capacity(self, service_type_id: int) -> int:
+        """서비스 동시 수용 인원 (system_settings → RESERVATION_DEFAULT_CAPACITY)"""
+        value = self.db.execute(
+            select(SystemSettings.setting_value).where(SystemSettings.setting_key == CAPACITY_SETTING_KEY)
+        ).scalar()
+        capacities = {}
+        if value:
+            try:
+                capacities = json.loads(value)
+            except ValueError:
+                logger.warning(f"{CAPACITY_SETTING_KEY} 설정 값이 올바른 JSON이 아닙니다")
+        return max(1, int(capacities.get(str(service_type_id), settings.RESERVATION_DEFAULT_CAPACITY)))
+
+    def _business_hours(self, days: List[date]) -> Dict[date, List[Interval]]:
+        default_hours = [(_parse_clock(settings.RESERVATION_OPEN_TIME), _parse_clock(settings.RESERVATION_CLOSE_TIME))]
+        company = self.db.execute(
+            select(CompanyInfo.business_hours, CompanyInfo.holidays).limit(1)
+        ).first()
+        configured = (company.business_hours if company else None) or {}
+        holidays = set((company.holidays if company else None) or [])
+
+        hours = {}
+        for day in days:
+            if day.isoformat() in holidays:
+                hours[day] = []
+                continue
+            day_hours = configured.get(WEEKDAY_KEYS[day.weekday()])
+            if not configured or day_hours is None:
+                hours[day] = default_hours
+                continue
+            if not isinstance(day_hours, dict) or day_hours.get("closed"):
+                hours[day] = []  # 휴무
+                continue
+            opening = _parse_clock(day_hours.get("open"))
+            closing = _parse_clock(day_hours.get("close"))
+            hours[day] = [(opening, closing)] if opening is not None and closing is not None else []
+        return hours
+
+    def _busy_intervals(
+        self,
+        start_date: date,
+        end_date: date,
+        service_type_id: int,
+        staff_id: Optional[int]
+    ) -> Tuple[Dict[date, List[Interval]], Dict[date, List[Interval]]]:
+        """기간 내 활성 예약 → (서비스 점유 구간, 직원 점유 구간) 날짜별"""
+        resource_filter = Reservation.service_type_id == service_type_id
+        if staff_id:
+            resource_filter = or_(resource_filter, Reservation.staff_id == staff_id)
+
+        rows = self.db.execute(
+            select(
+                Reservation.reservation_date,
+                Reservation.reservation_time,
+                Reservation.duration_minutes,
+                Reservation.service_type_id,
+                Reservation.staff_id,
+            ).where(
+                Reservation.reservation_date.between(start_date, end_date),
+                Reservation.status.in_(ACTIVE_STATUSES),
+                resource_filter
+            )
+        ).all()
+
+        service_busy: Dict[date, List[Interval]] = {}
+        staff_busy: Dict[date, List[Interval]] = {}
+        for row in rows:
+            start = _to_minutes(row.reservation_time)
+            interval = (start, start + (row.duration_minutes or DEFAULT_DURATION_MINUTES))
+            if row.service_type_id == service_type_id:
+                service_busy.setdefault(row.reservation_date, []).append(interval)
+            if staff_id and row.staff_id == staff_id:
+                staff_busy.setdefault(row.reservation_date, []).append(interval)
+        return service_busy, staff_busy
+
+    def _staff_working_hours(self, staff_id: int, days: List[date]) -> Dict[date, List[Interval]]:
+        """
+        근무표 시간표(time_table: {"10": {"월": "수경/예림"}})에서 직원 이름이 있는 시간대
+
+        근무표가 없는 주는 제한하지 않는다 (결과 dict에 날짜 없음).
+        """
+        staff_name = self.db.execute(select(User.name).where(User.user_id == staff_id)).scalar()
+        if not staff_name:
+            return {}
+        # 근무표에는 보통 이름만 적음 (김수경 → 수경)
+        aliases = {staff_name}
+        if len(staff_name) == 3:
+            aliases.add(staff_name[1:])
+
+        week_starts = sorted({day - timedelta(days=day.weekday()) for day in days})
+        schedules = self.db.execute(
+            select(StaffSchedule.week_start_date, StaffSchedule.schedule_data).where(
+                StaffSchedule.week_start_date.in_(week_starts),
+                StaffSchedule.is_active == True
+            )
+        ).all()
+        tables = {}
+        for week_start, schedule_data in schedules:
+            try:
+                tables[week_start] = json.loads(schedule_data).get("time_table") or {}
+            except (TypeError, ValueError):
+                logger.warning(f"근무표 JSON 파싱 실패 (week_start={week_start})")
+
+        hours: Dict[date, List[Interval]] = {}
+        for day in days:
+            table = tables.get(day - timedelta(days=day.weekday()))
+            if table is None:
+                continue
+            weekday = WEEKDAY_KR[day.weekday()]
+            working = []
+            for hour, cells in table.items():
+                if not str(hour).isdigit():
+                    continue
+                cell = str((cells or {}).get(weekday) or "")
+                if any(alias in cell for alias in aliases):
+                    working.append((int(hour) * 60, int(hour) * 60 + 60))
+            hours[day] = merge_intervals(working)
+        return hours
@@ -0,0 +1,174 @@
+"""
+예약 생성/변경 원자화
+
+기존에는 "같은 시각 예약 SELECT → 없으면 INSERT" 라서 동시 요청 두 개가 모두 SELECT를 통과하면 이중 예약이 생겼다.
+- 같은 트랜잭션 안에서 (날짜, 서비스) / (날짜, 직원) 단위 pg_advisory_xact_lock을 먼저 잡고 겹침을 확인한다.
+  락은 커밋/롤백 시 자동 해제되며, 키를 정렬해서 잡으므로 교착이 생기지 않는다.
+- 겹침은 시작 시각 일치가 아니라 소요 시간 구간 [시작, 시작+duration) 으로 판단한다.
+  서비스는 동시 수용 인원(capacity)까지 허용, 직원은 한 번에 하나.
+- 직원 겹침은 DB EXCLUDE 제약(reservations_staff_no_overlap)으로도 막는다 (락을 거치지 않는 경로 대비).
+- 직렬화 실패(40001)/교착(40P01)은 RESERVATION_BOOKING_MAX_RETRIES 만큼 재시도한다.
+"""
+import hashlib
+import random
+import time
+from datetime import date, time as datetime_time
+from typing import Callable, List, Optional, TypeVar
+
+from sqlalchemy import select, text, or_
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.logging_config import get_logger
+from models.reservation import Reservation
+from services.reservation_availability_service import (
+    ACTIVE_STATUSES,
+    DEFAULT_DURATION_MINUTES,
+    Interval,
+    ReservationAvailabilityService,
+    intersect_intervals,
+    saturated_intervals,
+)
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_SQLSTATES = {"40001", "40P01"}  # serialization_failure, deadlock_detected
+EXCLUSION_VIOLATION = "23P01"
+
+SERVICE_CONFLICT_MESSAGE = "해당 시간에 이미 같은 서비스의 예약이 있습니다"
+STAFF_CONFLICT_MESSAGE = "해당 직원은 이미 다른 예약이 있습니다"
+
+
+class ReservationConflictError(Exception):
+    """요청한 시간이 다른 예약과 겹침 (API에서 409로 변환)"""
+
+
+def _sqlstate(exc: DBAPIError) -> Optional[str]:
+    orig = getattr(exc, "orig", None)
+    return getattr(orig, "pgcode", None) or getattr(orig, "sqlstate", None)
+
+
+def advisory_lock_key(day: date, kind: str, resource_id: int) -> int:
+    """(날짜, 자원) → pg_advisory_xact_lock용 signed 64bit 키"""
+    digest = hashlib.blake2b(
+        f"reservation:{kind}:{resource_id}:{day.isoformat()}".encode(), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _to_interval(start: datetime_time, duration: Optional[int]) -> Interval:
+    begin = start.hour * 60 + start.minute
+    return begin, begin + (duration or DEFAULT_DURATION_MINUTES)
+
+
+def _overlaps(a: Interval, b: Interval) -> bool:
+    return a[0] < b[1] and b[0] < a[1]
+
+
+class ReservationBookingService:
+    """락 → 겹침 확인 → 쓰기를 한 트랜잭션으로 묶는 예약 경로"""
+
+    def __init__(self, db: Session, max_retries: Optional[int] = None):
+        self.db = db
+        self.max_retries = settings.RESERVATION_BOOKING_MAX_RETRIES if max_retries is None else max_retries
+
+    def run(self, work: Callable[[], T]) -> T:
+        """work()를 실행하고 커밋. 직렬화 실패/교착이면 롤백 후 work()부터 다시 실행
+
+        work 안에서 발생한 예외는 롤백 후 그대로 전달한다 (HTTPException 포함).
+        """
+        attempt = 0
+        while True:
+            try:
+                result = work()
+                self.db.commit()
+                return result
+            except DBAPIError as e:
+                self.db.rollback()
+                state = _sqlstate(e)
+                if state == EXCLUSION_VIOLATION:
+                    raise ReservationConflictError(STAFF_CONFLICT_MESSAGE) from e
+                if state in RETRYABLE_SQLSTATES and attempt < self.max_retries:
+                    attempt += 1
+                    logger.warning(f"예약 트랜잭션 재시도 {attempt}/{self.max_retries} (SQLSTATE {state})")
+                    time.sleep(random.uniform(0.01, 0.05) * attempt)
+                    continue
+                raise
+            except Exception:
+                self.db.rollback()
+                raise
+
+    def reserve(
+        self,
+        reservation_date: date,
+        reservation_time: datetime_time,
+        duration_minutes: Optional[int],
+        service_type_id: int,
+        staff_id: Optional[int] = None,
+        exclude_reservation_id: Optional[int] = None,
+    ) -> None:
+        """자원 락을 잡고 겹침을 확인 (겹치면 ReservationConflictError)
+
+        run()에 넘기는 work 안에서, INSERT/UPDATE 직전에 호출해야 한다.
+        """
+        self._lock(reservation_date, service_type_id, staff_id)
+        message = self.find_conflict(
+            reservation_date, reservation_time, duration_minutes,
+            service_type_id, staff_id, exclude_reservation_id
+        )
+        if message:
+            raise ReservationConflictError(message)
+
+    def find_conflict(
+        self,
+        reservation_date: date,
+        reservation_time: datetime_time,
+        duration_minutes: Optional[int],
+        service_type_id: int,
+        staff_id: Optional[int] = None,
+        exclude_reservation_id: Optional[int] = None,
+    ) -> Optional[str]:
+        """겹치는 예약이 있으면 사유 메시지, 없으면 None"""
+        requested = _to_interval(reservation_time, duration_minutes)
+
+        resource_filter = Reservation.service_type_id == service_type_id
+        if staff_id:
+            resource_filter = or_(resource_filter, Reservation.staff_id == staff_id)
+        query = select(
+            Reservation.reservation_time,
+            Reservation.duration_minutes,
+            Reservation.service_type_id,
+            Reservation.staff_id,
+        ).where(
+            Reservation.reservation_date == reservation_date,
+            Reservation.status.in_(ACTIVE_STATUSES),
+            resource_filter
+        )
+        if exclude_reservation_id:
+            query = query.where(Reservation.reservation_id != exclude_reservation_id)
+
+        service_busy: List[Interval] = []
+        for row in self.db.execute(query):
+            interval = _to_interval(row.reservation_time, row.duration_minutes)
+            if staff_id and row.staff_id == staff_id and _overlaps(interval, requested):
+                return STAFF_CONFLICT_MESSAGE
+            if row.service_type_id == service_type_id:
+                service_busy.append(interval)
+
+        capacity = ReservationAvailabilityService(self.db).service_capacity(service_type_id)
+        if intersect_intervals(saturated_intervals(service_busy, capacity), [requested]):
+            return SERVICE_CONFLICT_MESSAGE
+        return None
+
+    def _lock(self, reservation_date: date, service_type_id: int, staff_id: Optional[int]) -> None:
+        """(날짜, 서비스) / (날짜, 직원) 트랜잭션 advisory lock - PostgreSQL에서만"""
+        if self.db.get_bind().dialect.name != "postgresql":
+            return
+        keys = [advisory_lock_key(reservation_date, "service", service_type_id)]
+        if staff_id:
+            keys.append(advisory_lock_key(reservation_date, "staff", staff_id))
+        for key in sorted(keys):
+            self.db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": key})
@@ -0,0 +1,115 @@
+"""
+월간 매출 집계 (한 번 읽고 메모리에서 계산)
+
+월간 매출 보고서는 당월 합계/건수, 전월, 전년 동월, 일별, 결제수단별 값을 각각 쿼리해서
+겹치는 기간의 payments를 여러 번 읽었다. 여기서는 기간 전체를 (결제일, 결제수단)으로
+한 번만 GROUP BY 하고, 필요한 값은 그 결과(하루 x 결제수단 수만큼의 행)에서 계산한다.
+13개월이라도 수백~수천 행이므로 pandas 없이 dict 집계로 충분하다. (pandas import 비용 제외)
+
+- load_revenue_window: payments 원본 기준 (보고서 / 리포트 요약 / 월별 매출 차트)
+- DailyRollupService.get_revenue_window: daily_revenue 집계 기준 (대시보드 - 결제수단 없음)
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from models.payment import Payment
+
+
+def month_range(year: int, month: int) -> Tuple[date, date]:
+    """해당 월의 첫날, 마지막 날"""
+    start_date = date(year, month, 1)
+    if month == 12:
+        end_date = date(year + 1, 1, 1) - timedelta(days=1)
+    else:
+        end_date = date(year, month + 1, 1) - timedelta(days=1)
+    return start_date, end_date
+
+
+def previous_month(year: int, month: int) -> Tuple[int, int]:
+    return (year, month - 1) if month > 1 else (year - 1, 12)
+
+
+def growth_rate(current: float, previous: float) -> float:
+    """증감률(%) - 비교 기간 매출이 없으면 0"""
+    return (current - previous) / previous * 100 if previous > 0 else 0
+
+
+@dataclass
+class RevenueWindow:
+    """기간 매출 (결제일, 결제수단)별 건수/금액 - 월/일/결제수단별 값은 메모리에서 계산"""
+    start_date: date
+    end_date: Optional[date]
+    rows: List[Tuple[date, Optional[str], int, float]]  # (결제일, 결제수단, 건수, 금액)
+
+    def _rows_between(self, start_date: date, end_date: Optional[date] = None):
+        for row in self.rows:
+            if row[0] >= start_date and (end_date is None or row[0] <= end_date):
+                yield row
+
+    def total(self, start_date: date, end_date: Optional[date] = None) -> Tuple[float, int]:
+        """기간 (매출, 건수)"""
+        amount, count = 0.0, 0
+        for _, _, row_count, row_amount in self._rows_between(start_date, end_date):
+            amount += row_amount
+            count += row_count
+        return amount, count
+
+    def month_total(self, year: int, month: int) -> Tuple[float, int]:
+        return self.total(*month_range(year, month))
+
+    def daily(self, start_date: date, end_date: date) -> Dict[date, float]:
+        """결제가 있는 날만 {날짜: 매출} (날짜순)"""
+        by_date: Dict[date, float] = defaultdict(float)
+        for payment_date, _, _, amount in self._rows_between(start_date, end_date):
+            by_date[payment_date] += amount
+        return dict(sorted(by_date.items()))
+
+    def by_method(self, start_date: date, end_date: date) -> Dict[Optional[str], Dict[str, float]]:
+        """결제수단별 {'count', 'amount'}"""
+        methods: Dict[Optional[str], Dict[str, float]] = {}
+        for _, method, count, amount in self._rows_between(start_date, end_date):
+            stats = methods.setdefault(method, {'count': 0, 'amount': 0.0})
+            stats['count'] += count
+            stats['amount'] += amount
+        return methods
+
+    def monthly(self) -> List[Tuple[int, int, float, int]]:
+        """결제가 있는 달만 (연, 월, 매출, 건수) (월순)"""
+        months: Dict[Tuple[int, int], List] = {}
+        for payment_date, _, count, amount in self.rows:
+            stats = months.setdefault((payment_date.year, payment_date.month), [0.0, 0])
+            stats[0] += amount
+            stats[1] += count
+        return [(year, month, amount, count) for (year, month), (amount, count) in sorted(months.items())]
+
+
+def load_revenue_window(db: Session, start_date: date, end_date: Optional[date] = None) -> RevenueWindow:
+    """payments를 (결제일, 결제수단)으로 한 번 집계 (end_date가 없으면 start_date 이후 전체)"""
+    query = (
+        select(
+            Payment.payment_date,
+            Payment.payment_method,
+            func.count(Payment.payment_id),
+            func.sum(Payment.amount)
+        )
+        .where(Payment.payment_date >= start_date)
+        .group_by(Payment.payment_date, Payment.payment_method)
+    )
+    if end_date is not None:
+        query = query.where(Payment.payment_date <= end_date)
+    rows = [
+        (payment_date, method, count, float(amount or 0))
+        for payment_date, method, count, amount in db.execute(query)
+    ]
+    return RevenueWindow(start_date, end_date, rows)
+
+
+def monthly_revenue_window(db: Session, year: int, month: int) -> RevenueWindow:
+    """월간 매출 보고서용 13개월 (전년 동월 1일 ~ 당월 말일) - 전월/전년 동월 비교 포함"""
+    _, end_date = month_range(year, month)
+    return load_revenue_window(db, date(year - 1, month, 1), end_date)
@@ -1,13 +1,19 @@
-"""스케줄된 작업"""
+"""
+스케줄된 작업
+
+services/job_scheduler.py의 JOBS에 등록되어 실행된다. 각 작업은 자기 DB 세션을 만들고
+결과 dict(rows_affected 포함)를 돌려주며, 실패하면 예외를 올려 실행 이력에 남긴다.
+"""
 from datetime import datetime, timedelta, date
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_
+from sqlalchemy import select, and_, or_
 from core.database import SessionLocal
 from models.package import PackagePurchase
 from sqlalchemy.orm import selectinload
 from models.notification import NotificationType, NotificationPriority
 from schemas.notification import NotificationCreate
 from services.notification_service import NotificationService
+from services.membership_batch import MembershipBatchUpdater
 from core.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -18,110 +24,71 @@ class ScheduledTasks:
     
     @staticmethod
     def check_package_expiry():
-        """패키지 만료 확인 및 알림 생성"""
+        """패키지 만료 확인 및 알림 생성 (패키지 수와 무관하게 조회 2회 + 일괄 INSERT 1회)"""
         db = SessionLocal()
         try:
             notification_service = NotificationService(db)
             today = date.today()
-            
-            # 7일 후 만료 예정 패키지
             seven_days_later = today + timedelta(days=7)
-            query_7days = select(PackagePurchase).where(
-                and_(
-                    PackagePurchase.expiry_date == seven_days_later,
-                    PackagePurchase.remaining_sessions > 0
-                )
-            ).options(selectinload(PackagePurchase.customer))
-            packages_7days = db.execute(query_7days).scalars().all()
-            
-            for package in packages_7days:
-                notification_data = NotificationCreate(
-                    user_id=1,  # TODO: 실제 담당 직원 ID로 변경
-                    type=NotificationType.PACKAGE,
-                    title="패키지 만료 7일 전",
-                    message=f"{package.customer.name}님의 {package.package_name} 패키지가 7일 후 만료됩니다. (잔여: {package.remaining_sessions}회)",
-                    priority=NotificationPriority.MEDIUM,
-                    action_url=f"/packages?customer_id={package.customer_id}",
-                    related_id=package.purchase_id
-                )
-                notification_service.create_notification(notification_data)
-                logger.info(f"패키지 만료 7일 전 알림 생성: {package.purchase_id}")
-            
-            # 3일 후 만료 예정 패키지
             three_days_later = today + timedelta(days=3)
-            query_3days = select(PackagePurchase).where(
-                and_(
-                    PackagePurchase.expiry_date == three_days_later,
-                    PackagePurchase.remaining_sessions > 0
-                )
-            ).options(selectinload(PackagePurchase.customer))
-            packages_3days = db.execute(query_3days).scalars().all()
-            
-            for package in packages_3days:
-                notification_data = NotificationCreate(
-                    user_id=1,  # TODO: 실제 담당 직원 ID로 변경
-                    type=NotificationType.PACKAGE,
-                    title="패키지 만료 3일 전 ⚠️",
-                    message=f"{package.customer.name}님의 {package.package_name} 패키지가 3일 후 만료됩니다! (잔여: {package.remaining_sessions}회)",
-                    priority=NotificationPriority.HIGH,
-                    action_url=f"/packages?customer_id={package.customer_id}",
-                    related_id=package.purchase_id
-                )
-                notification_service.create_notification(notification_data)
-                logger.info(f"패키지 만료 3일 전 알림 생성: {package.purchase_id}")
-            
-            # 오늘 만료되는 패키지
-            query_today = select(PackagePurchase).where(
-                and_(
-                    PackagePurchase.expiry_date == today,
-                    PackagePurchase.remaining_sessions > 0
-                )
-            ).options(selectinload(PackagePurchase.customer))
-            packages_today = db.execute(query_today).scalars().all()
-            
-            for package in packages_today:
-                notification_data = NotificationCreate(
-                    user_id=1,  # TODO: 실제 담당 직원 ID로 변경
-                    type=NotificationType.PACKAGE,
-                    title="패키지 오늘 만료 🚨",
-                    message=f"{package.customer.name}님의 {package.package_name} 패키지가 오늘 만료됩니다! (잔여: {package.remaining_sessions}회)",
-                    priority=NotificationPriority.HIGH,
-                    action_url=f"/packages?customer_id={package.customer_id}",
-                    related_id=package.purchase_id
-                )
-                notification_service.create_notification(notification_data)
-                logger.info(f"패키지 당일 만료 알림 생성: {package.purchase_id}")
-            
-            # 잔여 횟수 3회 이하 패키지
-            query_low_sessions = select(PackagePurchase).where(
+
+            # 만료 7일 전/3일 전/당일 + 잔여 횟수 3회 이하 패키지를 한 번에 조회
+            query = select(PackagePurchase).where(
                 and_(
                     PackagePurchase.remaining_sessions > 0,
-                    PackagePurchase.remaining_sessions <= 3,
-                    PackagePurchase.expiry_date > today
+                    or_(
+                        PackagePurchase.expiry_date.in_([today, three_days_later, seven_days_later]),
+                        and_(
+                            PackagePurchase.remaining_sessions <= 3,
+                            PackagePurchase.expiry_date > today
+                        )
+                    )
                 )
-            ).options(selectinload(PackagePurchase.customer))
-            packages_low = db.execute(query_low_sessions).scalars().all()
-            
-            for package in packages_low:
-                # 이미 최근에 알림을 보냈는지 확인 (중복 방지)
-                # TODO: 구현 필요
-                
-                notification_data = NotificationCreate(
+            ).options(selectinload(PackagePurchase.customer), selectinload(PackagePurchase.package))
+            packages = db.execute(query).scalars().all()
+
+            rows = []
+            for package in packages:
+                name = f"{package.customer.name}님의 {package.package.package_name} 패키지"
+                remaining = package.remaining_sessions
+
+                # 같은 패키지는 하루 한 건만 (만료 알림에 잔여 횟수가 포함되므로 만료 알림 우선)
+                if package.expiry_date == today:
+                    title = "패키지 오늘 만료 🚨"
+                    message = f"{name}가 오늘 만료됩니다! (잔여: {remaining}회)"
+                    priority = NotificationPriority.HIGH
+                elif package.expiry_date == three_days_later:
+                    title = "패키지 만료 3일 전 ⚠️"
+                    message = f"{name}가 3일 후 만료됩니다! (잔여: {remaining}회)"
+                    priority = NotificationPriority.HIGH
+                elif package.expiry_date == seven_days_later:
+                    title = "패키지 만료 7일 전"
+                    message = f"{name}가 7일 후 만료됩니다. (잔여: {remaining}회)"
+                    priority = NotificationPriority.MEDIUM
+                else:
+                    title = "패키지 잔여 횟수 부족"
+                    message = f"{name} 잔여 횟수가 {remaining}회 남았습니다."
+                    priority = NotificationPriority.MEDIUM
+
+                rows.append(NotificationCreate(
                     user_id=1,  # TODO: 실제 담당 직원 ID로 변경
                     type=NotificationType.PACKAGE,
-                    title="패키지 잔여 횟수 부족",
-                    message=f"{package.customer.name}님의 {package.package_name} 패키지 잔여 횟수가 {package.remaining_sessions}회 남았습니다.",
-                    priority=NotificationPriority.MEDIUM,
+                    title=title,
+                    message=message,
+                    priority=priority,
                     action_url=f"/packages?customer_id={package.customer_id}",
                     related_id=package.purchase_id
-                )
-                notification_service.create_notification(notification_data)
-                logger.info(f"패키지 잔여 횟수 부족 알림 생성: {package.purchase_id}")
-            
-            logger.info("패키지 만료 확인 작업 완료")
+                ).model_dump())
+
+            # 같은 날 다시 실행되면 이미 만든 알림은 건너뜀
+            result = notification_service.bulk_insert_notifications(rows)
+            logger.info(f"패키지 만료 확인 작업 완료: 대상 {len(packages)}건, 생성 {result['created']}건, 중복 {result['skipped']}건")
+            return {"packages": len(packages), **result, "rows_affected": result["created"]}
             
         except Exception as e:
+            db.rollback()
             logger.error(f"패키지 만료 확인 중 오류: {str(e)}")
+            raise
         finally:
             db.close()
     
@@ -163,10 +130,28 @@ class ScheduledTasks:
                 action_url="/reports"
             )
             
-            notification_service.create_bulk_notifications(admin_ids, notification_data)
+            result = notification_service.create_bulk_notifications(admin_ids, notification_data)
             logger.info(f"일일 매출 리포트 알림 생성: {yesterday}")
+            return {"revenue": float(yesterday_revenue), "payments": payment_count, "rows_affected": result["created"]}
             
         except Exception as e:
+            db.rollback()
             logger.error(f"일일 리포트 생성 중 오류: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+    @staticmethod
+    def update_memberships():
+        """전체 고객 회원 등급/상태 재계산 (그룹 집계 기반 일괄 처리)"""
+        db = SessionLocal()
+        try:
+            logger.info("Starting customer membership update...")
+            report = MembershipBatchUpdater(db).run()
+            return {**report, "rows_affected": report["rows_changed"]}
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error in update_all_customers: {e}")
+            raise
         finally:
             db.close()
\ No newline at end of file
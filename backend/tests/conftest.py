@@ -0,0 +1,68 @@
+"""
+단위 테스트 공용 fixture
+
+실행 중인 서버 없이 메모리 SQLite에 전체 스키마를 만들어 서비스/엔드포인트 함수를 직접 호출한다.
+PostgreSQL 전용 타입(JSONB, ARRAY)과 계산 컬럼/검색에 쓰는 함수는 SQLite용으로 대신 등록한다.
+"""
+
+import os
+import re
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.database import Base
+from services.customer_search_service import to_chosung  # models 패키지를 거쳐 모든 모델이 등록됨
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb(element, compiler, **kw):
+    return "JSON"
+
+
+@compiles(ARRAY, "sqlite")
+def _compile_array(element, compiler, **kw):
+    return "JSON"
+
+
+def _register_functions(dbapi_connection, connection_record):
+    """PostgreSQL 함수 대체 (customers 계산 컬럼, 고객 검색)"""
+    dbapi_connection.create_function(
+        "regexp_replace", 4,
+        lambda value, pattern, replacement, flags: re.sub(pattern, replacement, value or ""),
+        deterministic=True
+    )
+    dbapi_connection.create_function(
+        "korean_chosung", 1, lambda value: to_chosung(value) if value is not None else None, deterministic=True
+    )
+
+
+@pytest.fixture
+def engine():
+    """테스트마다 새 메모리 DB (연결 하나를 공유해 여러 세션이 같은 DB를 봄)"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    event.listen(engine, "connect", _register_functions)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
@@ -0,0 +1,143 @@
+"""
+일별 집계(롤업) 자동 갱신 테스트
+
+결제/서비스 이용/고객이 어느 경로로 바뀌든 커밋 시 해당 날짜의 집계가 원본과 같아야 한다.
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+from sqlalchemy import select
+
+from api.v1.customer_packages import use_package_session
+from models.customer import Customer
+from models.daily_rollup import DailyNewCustomers, DailyRevenue, DailyVisits
+from models.package import PackagePurchase
+from models.payment import Payment
+from models.service import ServiceUsage
+from services.customer_import_service import CustomerImportService
+
+pytestmark = pytest.mark.unit
+
+DAY1 = date(2026, 3, 2)
+DAY2 = date(2026, 3, 3)
+
+
+def _revenue(db):
+    return {row.stat_date: (row.total_amount, row.payment_count) for row in db.scalars(select(DailyRevenue))}
+
+
+def _visits(db):
+    return {row.stat_date: (row.visit_count, row.usage_count) for row in db.scalars(select(DailyVisits))}
+
+
+def _new_customers(db):
+    return {row.stat_date: row.new_customer_count for row in db.scalars(select(DailyNewCustomers))}
+
+
+@pytest.fixture
+def customer(db):
+    customer = Customer(name="홍길동", phone="010-1234-5678", first_visit_date=DAY1)
+    db.add(customer)
+    db.commit()
+    return customer
+
+
+class TestPaymentRollup:
+    """결제 → 일별 매출"""
+
+    def test_create_update_delete(self, db, customer):
+        payment = Payment(customer_id=customer.customer_id, payment_date=DAY1, amount=Decimal("50000"))
+        db.add_all([payment, Payment(customer_id=customer.customer_id, payment_date=DAY1, amount=Decimal("30000"))])
+        db.commit()
+        assert _revenue(db) == {DAY1: (Decimal("80000"), 2)}
+
+        # 커밋 후(만료된 상태) 날짜를 바꿔도 이전 날짜가 다시 계산됨
+        payment.payment_date = DAY2
+        db.commit()
+        assert _revenue(db) == {DAY1: (Decimal("30000"), 1), DAY2: (Decimal("50000"), 1)}
+
+        payment.amount = Decimal("70000")
+        db.commit()
+        assert _revenue(db)[DAY2] == (Decimal("70000"), 1)
+
+        # 원본이 없어진 날짜의 집계 행은 삭제
+        db.delete(payment)
+        db.commit()
+        assert _revenue(db) == {DAY1: (Decimal("30000"), 1)}
+
+    def test_rollback_discards_pending_dates(self, db, customer):
+        db.add(Payment(customer_id=customer.customer_id, payment_date=DAY1, amount=Decimal("10000")))
+        db.flush()
+        db.rollback()
+        db.add(Payment(customer_id=customer.customer_id, payment_date=DAY2, amount=Decimal("20000")))
+        db.commit()
+        assert _revenue(db) == {DAY2: (Decimal("20000"), 1)}
+
+
+class TestServiceUsageRollup:
+    """서비스 이용 → 일별 방문"""
+
+    def test_visits_count_distinct_customers(self, db, customer):
+        other = Customer(name="김철수", phone="010-2222-3333")
+        db.add(other)
+        db.flush()
+        db.add_all([
+            ServiceUsage(customer_id=customer.customer_id, service_date=DAY1),
+            ServiceUsage(customer_id=customer.customer_id, service_date=DAY1),
+            ServiceUsage(customer_id=other.customer_id, service_date=DAY1),
+        ])
+        db.commit()
+        assert _visits(db) == {DAY1: (2, 3)}
+
+    def test_date_change_moves_visit(self, db, customer):
+        usage = ServiceUsage(customer_id=customer.customer_id, service_date=DAY1)
+        db.add(usage)
+        db.commit()
+
+        usage.service_date = DAY2
+        db.commit()
+        assert _visits(db) == {DAY2: (1, 1)}
+
+    def test_package_session_use(self, db, customer):
+        purchase = PackagePurchase(
+            customer_id=customer.customer_id, purchase_date=DAY1, total_sessions=10, used_sessions=0, remaining_sessions=10
+        )
+        db.add(purchase)
+        db.commit()
+
+        use_package_session(customer.customer_id, purchase.purchase_id, service_type="브레인", session_details=None, db=db)
+        assert _visits(db) == {date.today(): (1, 1)}
+
+
+class TestNewCustomerRollup:
+    """고객 → 일별 신규 고객 (첫 방문일 기준)"""
+
+    def test_create_and_change_first_visit_date(self, db, customer):
+        assert _new_customers(db) == {DAY1: 1}
+
+        customer.first_visit_date = DAY2
+        db.commit()
+        assert _new_customers(db) == {DAY2: 1}
+
+    def test_unrelated_update_does_not_refresh(self, db, customer):
+        db.execute(DailyNewCustomers.__table__.update().values(new_customer_count=99))
+        db.commit()
+
+        customer.memo = "메모만 수정"
+        db.commit()
+        assert _new_customers(db) == {DAY1: 99}
+
+    def test_excel_import(self, db, customer):
+        # Core INSERT 경로 - 가져오기 서비스가 직접 refresh
+        frame = pd.DataFrame({
+            "이름": ["김영희", "박민수", "중복"],
+            "연락처": ["010-1111-2222", "010-3333-4444", customer.phone],
+            "첫방문일": [DAY1.isoformat(), DAY2.isoformat(), DAY2.isoformat()],
+        })
+        result = CustomerImportService(db).import_dataframe(frame)
+
+        assert result["inserted_count"] == 2
+        assert _new_customers(db) == {DAY1: 2, DAY2: 1}
@@ -0,0 +1,182 @@
+"""
+커서(keyset) 페이지네이션 경계 테스트
+
+페이지를 끝까지 넘겼을 때 정렬 값이 같은 행(동점)과 NULL 구간을 건너도
+누락/중복 없이 전체 정렬 결과와 같아야 한다.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from api.v1.payments import router as payments_router
+from core.database import get_db
+from models.customer import Customer
+from models.payment import Payment
+from utils.pagination import KeysetPage, encode_cursor
+
+pytestmark = pytest.mark.unit
+
+BASE_DATE = date(2026, 3, 1)
+
+
+@pytest.fixture
+def payments(db):
+    # 날짜 3개에 7건 - 같은 날짜(동점)는 id로 순서가 정해짐
+    offsets = [0, 2, 1, 2, 0, 1, 2]
+    db.add_all([
+        Payment(payment_date=BASE_DATE + timedelta(days=offset), amount=Decimal(1000 * (index + 1)))
+        for index, offset in enumerate(offsets)
+    ])
+    db.commit()
+    rows = db.execute(select(Payment.payment_id, Payment.payment_date)).all()
+    return sorted(rows, key=lambda row: (row.payment_date, row.payment_id), reverse=True)
+
+
+def _walk(db, keyset: KeysetPage, query, limit: int, sort_attr: str, id_attr: str):
+    """첫 페이지부터 next_cursor가 없을 때까지 (페이지 목록)"""
+    pages, cursor = [], None
+    while True:
+        rows = db.execute(keyset.apply(query, cursor, limit)).all()
+        rows, cursor = keyset.page(
+            rows, limit, get_sort_value=lambda row: getattr(row, sort_attr), get_id=lambda row: getattr(row, id_attr)
+        )
+        pages.append([getattr(row, id_attr) for row in rows])
+        if cursor is None:
+            return pages
+        assert len(pages) < 20, "커서가 진행하지 않음"
+
+
+class TestKeysetPage:
+    """NOT NULL 정렬 컬럼"""
+
+    @pytest.mark.parametrize("limit", [1, 2, 3, 7, 10])
+    def test_pages_cover_all_rows_in_order(self, db, payments, limit):
+        keyset = KeysetPage(Payment.payment_date, Payment.payment_id, descending=True)
+        query = select(Payment.payment_id, Payment.payment_date)
+
+        pages = _walk(db, keyset, query, limit, "payment_date", "payment_id")
+        assert [payment_id for page in pages for payment_id in page] == [row.payment_id for row in payments]
+        assert all(len(page) == limit for page in pages[:-1])
+
+    def test_exact_multiple_has_no_empty_last_page(self, db, payments):
+        db.delete(db.get(Payment, payments[-1].payment_id))
+        db.commit()
+        keyset = KeysetPage(Payment.payment_date, Payment.payment_id, descending=True)
+
+        pages = _walk(db, keyset, select(Payment.payment_id, Payment.payment_date), 3, "payment_date", "payment_id")
+        assert [len(page) for page in pages] == [3, 3]
+
+    def test_ascending(self, db, payments):
+        keyset = KeysetPage(Payment.payment_date, Payment.payment_id, descending=False)
+
+        pages = _walk(db, keyset, select(Payment.payment_id, Payment.payment_date), 2, "payment_date", "payment_id")
+        assert [payment_id for page in pages for payment_id in page] == [row.payment_id for row in reversed(payments)]
+
+    def test_id_only(self, db, payments):
+        keyset = KeysetPage(None, Payment.payment_id, descending=True)
+
+        pages = _walk(db, keyset, select(Payment.payment_id), 3, "payment_id", "payment_id")
+        assert [payment_id for page in pages for payment_id in page] == sorted(
+            (row.payment_id for row in payments), reverse=True
+        )
+
+    def test_not_null_column_uses_plain_row_comparison(self):
+        # NULLS LAST / OR IS NULL이 붙으면 (정렬 컬럼, id) 인덱스 범위 스캔을 쓰지 못함
+        keyset = KeysetPage(Payment.payment_date, Payment.payment_id, descending=True)
+        cursor = encode_cursor(keyset.sort_key, BASE_DATE, 10)
+
+        assert keyset.nullable is False
+        assert "NULL" not in str(keyset.condition(cursor)).upper()
+        assert all("NULLS" not in str(clause).upper() for clause in keyset.order_by())
+
+
+class TestNullableKeysetPage:
+    """NULL을 가질 수 있는 정렬 컬럼 - NULL은 항상 마지막"""
+
+    @pytest.fixture
+    def customers(self, db):
+        visits = [BASE_DATE, None, BASE_DATE + timedelta(days=1), None, BASE_DATE, None]
+        db.add_all([
+            Customer(name=f"고객{index}", phone=f"010-0000-000{index}", last_visit_date=visit)
+            for index, visit in enumerate(visits)
+        ])
+        db.commit()
+        rows = db.execute(select(Customer.customer_id, Customer.last_visit_date)).all()
+        dated = sorted(
+            (row for row in rows if row.last_visit_date), key=lambda row: (row.last_visit_date, row.customer_id), reverse=True
+        )
+        undated = sorted(
+            (row for row in rows if row.last_visit_date is None), key=lambda row: row.customer_id, reverse=True
+        )
+        return dated + undated
+
+    @pytest.mark.parametrize("limit", [1, 2, 3, 4, 6])
+    def test_pages_cross_null_boundary(self, db, customers, limit):
+        keyset = KeysetPage(Customer.last_visit_date, Customer.customer_id, descending=True)
+        assert keyset.nullable is True
+
+        pages = _walk(
+            db, keyset, select(Customer.customer_id, Customer.last_visit_date), limit, "last_visit_date", "customer_id"
+        )
+        assert [customer_id for page in pages for customer_id in page] == [row.customer_id for row in customers]
+
+
+class TestCursorValidation:
+    """잘못된 커서"""
+
+    def test_cursor_from_other_sort_is_rejected(self):
+        cursor = encode_cursor("payment_date:asc", BASE_DATE, 1)
+        keyset = KeysetPage(Payment.payment_date, Payment.payment_id, descending=True)
+
+        with pytest.raises(HTTPException) as error:
+            keyset.condition(cursor)
+        assert error.value.status_code == 400
+
+    def test_garbage_cursor_is_rejected(self):
+        keyset = KeysetPage(Payment.payment_date, Payment.payment_id, descending=True)
+
+        with pytest.raises(HTTPException) as error:
+            keyset.condition("not-a-cursor")
+        assert error.value.status_code == 400
+
+
+class TestPaymentsEndpoint:
+    """결제 목록 커서 모드"""
+
+    @pytest.fixture
+    def client(self, session_factory):
+        app = FastAPI()
+        app.include_router(payments_router, prefix="/api/v1/payments")
+
+        def _get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = _get_db
+        return TestClient(app)
+
+    def test_cursor_pages(self, client, payments):
+        seen, cursor, totals = [], None, []
+        while True:
+            params = {"pagination": "cursor", "limit": 3, "count": "exact"}
+            if cursor:
+                params["cursor"] = cursor
+            body = client.get("/api/v1/payments/", params=params).json()
+            seen.extend(item["payment_id"] for item in body["items"])
+            totals.append(body["total"])
+            cursor = body["next_cursor"]
+            assert body["has_next"] is (cursor is not None)
+            if cursor is None:
+                break
+
+        assert seen == [row.payment_id for row in payments]
+        # 전체 건수는 첫 페이지에서만 계산
+        assert totals == [7, None, None]
@@ -0,0 +1,192 @@
+"""
+메시지 발송 대기열(outbox) 테스트
+
+가져가기(claim) → 발송 → 결과 반영 흐름과 재시도/재시도 한도를 확인한다.
+"""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from models.message_outbox import MessageOutbox
+from models.reservation import KakaoMessageLog, Reservation
+from services.message_outbox_service import (
+    PURPOSE_RESERVATION_CONFIRMATION,
+    STALE_LOCK_SECONDS,
+    STATUS_FAILED,
+    STATUS_PENDING,
+    STATUS_SENDING,
+    STATUS_SENT,
+    MessageOutboxDispatcher,
+    enqueue_alimtalk,
+    enqueue_sms,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSmsClient:
+    def __init__(self, success=True):
+        self.success = success
+        self.calls = []
+
+    def _result(self):
+        if self.success:
+            return {"success": True, "message_id": "MSG-1"}
+        return {"success": False, "error_code": "-101", "error_message": "발송 실패"}
+
+    def send_sms(self, receiver, message, title=None):
+        self.calls.append(("send_sms", [receiver]))
+        return self._result()
+
+    def send_mass(self, receivers, msg_type="SMS", title=None):
+        self.calls.append(("send_mass", [receiver["phone"] for receiver in receivers]))
+        return self._result()
+
+
+class FakeKakaoClient:
+    def __init__(self, success=True):
+        self.success = success
+        self.calls = []
+
+    def send_alimtalk(self, phone_number, template_code, template_args, fallback_message=None):
+        self.calls.append(phone_number)
+        if self.success:
+            return {"success": True, "message_id": "KAKAO-1"}
+        return {"success": False, "error_code": "TEMPLATE", "error_message": "템플릿 오류"}
+
+
+@pytest.fixture
+def sms():
+    return FakeSmsClient()
+
+
+@pytest.fixture
+def dispatcher(session_factory, sms):
+    return MessageOutboxDispatcher(
+        session_factory=session_factory,
+        sms_client=sms,
+        kakao_client=FakeKakaoClient(),
+        batch_size=10,
+        max_attempts=2,
+        retry_base_seconds=60,
+    )
+
+
+def _rows(db):
+    db.expire_all()
+    return db.scalars(select(MessageOutbox).order_by(MessageOutbox.outbox_id)).all()
+
+
+class TestDispatch:
+    """발송 성공"""
+
+    def test_sent_marks_row_and_reservation_flag(self, db, dispatcher):
+        reservation = Reservation(
+            customer_id=1, service_type_id=1, reservation_date=date(2026, 3, 2), reservation_time=time(10, 0)
+        )
+        db.add(reservation)
+        db.flush()
+        enqueue_sms(db, "010-1111-2222", "예약이 확정되었습니다", purpose=PURPOSE_RESERVATION_CONFIRMATION,
+                    reservation_id=reservation.reservation_id)
+        db.commit()
+
+        assert dispatcher.dispatch_once() == {"claimed": 1, "sent": 1, "retry": 0, "failed": 0}
+
+        row = _rows(db)[0]
+        assert (row.status, row.attempts, row.provider_message_id, row.locked_at) == (STATUS_SENT, 1, "MSG-1", None)
+        assert db.get(Reservation, reservation.reservation_id).confirmation_sent is True
+
+    def test_sms_batch_uses_single_mass_request(self, db, dispatcher, sms):
+        for index in range(3):
+            enqueue_sms(db, f"010-0000-000{index}", "공지")
+        db.commit()
+
+        dispatcher.dispatch_once()
+        assert sms.calls == [("send_mass", ["010-0000-0000", "010-0000-0001", "010-0000-0002"])]
+        assert {row.status for row in _rows(db)} == {STATUS_SENT}
+
+    def test_empty_queue(self, dispatcher):
+        assert dispatcher.dispatch_once() == {"claimed": 0, "sent": 0, "retry": 0, "failed": 0}
+
+
+class TestRetry:
+    """발송 실패 재시도"""
+
+    def test_failure_backs_off_then_fails_at_max_attempts(self, db, dispatcher, sms):
+        sms.success = False
+        enqueue_sms(db, "010-1111-2222", "안내")
+        db.commit()
+
+        assert dispatcher.dispatch_once()["retry"] == 1
+        row = _rows(db)[0]
+        assert (row.status, row.attempts, row.error_code) == (STATUS_PENDING, 1, "-101")
+        assert row.next_attempt_at > datetime.now() + timedelta(seconds=30)
+
+        # 재시도 시각 전에는 가져가지 않음
+        assert dispatcher.dispatch_once()["claimed"] == 0
+
+        row.next_attempt_at = datetime.now() - timedelta(seconds=1)
+        db.commit()
+        assert dispatcher.dispatch_once()["failed"] == 1
+        row = _rows(db)[0]
+        assert (row.status, row.attempts) == (STATUS_FAILED, 2)
+        assert len(sms.calls) == 2
+
+    def test_final_alimtalk_failure_is_logged(self, db, session_factory):
+        dispatcher = MessageOutboxDispatcher(
+            session_factory=session_factory, sms_client=FakeSmsClient(), kakao_client=FakeKakaoClient(success=False),
+            max_attempts=1
+        )
+        enqueue_alimtalk(db, "010-1111-2222", "RESERVATION_CONFIRM", {"name": "홍길동"}, "예약 확정 안내",
+                         purpose=PURPOSE_RESERVATION_CONFIRMATION)
+        db.commit()
+
+        assert dispatcher.dispatch_once()["failed"] == 1
+        log = db.scalars(select(KakaoMessageLog)).one()
+        assert (log.status, log.error_code) == ("failed", "TEMPLATE")
+
+
+class TestClaim:
+    """가져가기 - 발송 중인 행과 중단된 행"""
+
+    def _sending(self, db, locked_seconds_ago: int, attempts: int) -> MessageOutbox:
+        item = enqueue_sms(db, "010-1111-2222", "안내")
+        item.status = STATUS_SENDING
+        item.attempts = attempts
+        item.locked_at = datetime.now() - timedelta(seconds=locked_seconds_ago)
+        db.commit()
+        return item
+
+    def test_recently_locked_row_is_not_claimed(self, db, dispatcher, sms):
+        self._sending(db, locked_seconds_ago=10, attempts=1)
+
+        assert dispatcher.dispatch_once()["claimed"] == 0
+        assert sms.calls == []
+
+    def test_stale_row_is_reclaimed_and_counted(self, db, dispatcher):
+        self._sending(db, locked_seconds_ago=STALE_LOCK_SECONDS + 60, attempts=0)
+
+        assert dispatcher.dispatch_once()["sent"] == 1
+        row = _rows(db)[0]
+        assert (row.status, row.attempts) == (STATUS_SENT, 1)
+
+    def test_claim_increments_attempts_before_sending(self, db, dispatcher):
+        enqueue_sms(db, "010-1111-2222", "안내")
+        db.commit()
+
+        items = dispatcher._claim()
+        assert items[0]["attempts"] == 1
+        row = _rows(db)[0]
+        assert (row.status, row.attempts) == (STATUS_SENDING, 1)
+        assert row.locked_at is not None
+
+    def test_stale_reclaims_are_bounded_by_max_attempts(self, db, dispatcher, sms):
+        # 발송 중 워커가 죽는 일이 max_attempts번 반복된 메시지
+        self._sending(db, locked_seconds_ago=STALE_LOCK_SECONDS + 60, attempts=2)
+
+        assert dispatcher.dispatch_once()["claimed"] == 0
+        row = _rows(db)[0]
+        assert (row.status, row.error_code, row.locked_at) == (STATUS_FAILED, "STALE_LOCK", None)
+        assert sms.calls == []
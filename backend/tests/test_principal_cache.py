@@ -0,0 +1,139 @@
+"""
+인증 사용자(principal) 캐시 무효화 테스트
+
+권한 변경/비활성화 직후의 요청은 캐시된 이전 권한이 아니라 바뀐 상태로 처리되어야 한다.
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.auth import router as auth_router
+from api.v1.master import router as master_router
+from api.v1.settings.profile import router as profile_router
+from api.v1.settings.users import router as users_router
+from core.auth import AuthenticatedUser, check_permission, create_access_token, get_current_user, principal_cache
+from core.database import get_db
+from models.user import User
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(auth_router, prefix="/api/v1/auth")
+    app.include_router(master_router, prefix="/api/v1/master")
+    app.include_router(profile_router, prefix="/api/v1/settings")
+    app.include_router(users_router, prefix="/api/v1/settings/users")
+
+    @app.get("/me")
+    def me(current_user: AuthenticatedUser = Depends(get_current_user)):
+        return {"role": current_user.role, "is_active": current_user.is_active}
+
+    @app.get("/admin-only")
+    def admin_only(current_user: AuthenticatedUser = Depends(check_permission("admin"))):
+        return {"ok": True}
+
+    def _get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    principal_cache.clear()
+    yield TestClient(app)
+    principal_cache.clear()
+
+
+@pytest.fixture
+def users(db):
+    master = User(email="master@aibio.kr", password_hash="-", name="마스터", role="master", is_active=True)
+    staff = User(email="staff@aibio.kr", password_hash="-", name="직원", role="staff", is_active=True)
+    db.add_all([master, staff])
+    db.commit()
+    return master, staff
+
+
+def _headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.email})}"}
+
+
+class TestPrincipalCache:
+    """캐시 적중과 무효화"""
+
+    def test_principal_is_cached_between_requests(self, client, db, users):
+        _, staff = users
+        headers = _headers(staff)
+        assert client.get("/me", headers=headers).json()["role"] == "staff"
+
+        # 무효화 없이 DB만 바꾸면 TTL 동안 캐시된 값을 사용
+        staff.role = "admin"
+        db.commit()
+        assert client.get("/me", headers=headers).json()["role"] == "staff"
+        assert principal_cache.stats()["hits"] >= 1
+
+    def test_role_change_takes_effect_immediately(self, client, users):
+        master, staff = users
+        headers = _headers(staff)
+        assert client.get("/admin-only", headers=headers).status_code == 403
+
+        response = client.put(
+            f"/api/v1/master/users/{staff.user_id}/role", params={"new_role": "admin"}, headers=_headers(master)
+        )
+        assert response.status_code == 200
+        assert client.get("/admin-only", headers=headers).status_code == 200
+
+    def test_role_downgrade_takes_effect_immediately(self, client, db, users):
+        master, staff = users
+        staff.role = "admin"
+        db.commit()
+        headers = _headers(staff)
+        assert client.get("/admin-only", headers=headers).status_code == 200
+
+        client.put(f"/api/v1/master/users/{staff.user_id}/role", params={"new_role": "staff"}, headers=_headers(master))
+        assert client.get("/admin-only", headers=headers).status_code == 403
+
+    def test_deactivated_user_is_rejected(self, client, users):
+        master, staff = users
+        headers = _headers(staff)
+        assert client.get("/me", headers=headers).status_code == 200
+
+        response = client.delete(f"/api/v1/settings/users/{staff.user_id}", headers=_headers(master))
+        assert response.status_code == 200
+        response = client.get("/me", headers=headers)
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Inactive user"
+
+    def test_invalidate_by_user_id_and_email(self, users):
+        master, staff = users
+        principal_cache.set((master.email, 1), AuthenticatedUser.from_model(master))
+        principal_cache.set((staff.email, 1), AuthenticatedUser.from_model(staff))
+
+        assert principal_cache.invalidate(user_ids=[staff.user_id]) == 1
+        assert principal_cache.get((staff.email, 1)) is None
+        assert principal_cache.invalidate(emails=[master.email]) == 1
+        assert principal_cache.stats()["size"] == 0
+
+
+class TestSnapshotHandlers:
+    """스냅샷을 받는 핸들러 - 수정은 다시 읽은 행으로"""
+
+    def test_me_returns_snapshot(self, client, users):
+        _, staff = users
+        response = client.get("/api/v1/auth/me", headers=_headers(staff))
+        assert response.status_code == 200
+        assert (response.json()["email"], response.json()["role"]) == (staff.email, "staff")
+
+    def test_profile_update_is_visible_on_next_request(self, client, db, users):
+        _, staff = users
+        headers = _headers(staff)
+        assert client.get("/api/v1/settings/profile", headers=headers).json()["name"] == "직원"
+
+        response = client.put("/api/v1/settings/profile", json={"name": "새이름"}, headers=headers)
+        assert response.status_code == 200
+        assert client.get("/api/v1/settings/profile", headers=headers).json()["name"] == "새이름"
+        db.expire_all()
+        assert db.get(User, staff.user_id).name == "새이름"
@@ -0,0 +1,190 @@
+"""
+문진 answered_count / 진행 상태 테스트
+
+answered_count는 새 답변일 때만 SQL UPDATE 안에서 증가하고,
+진행 상태는 템플릿 캐시와 answered_count로 계산된다.
+"""
+
+import pytest
+from fastapi import HTTPException
+
+from api.v1.questionnaire import complete_questionnaire, get_questionnaire_progress, submit_answer
+from core.auth import AuthenticatedUser
+from models.questionnaire import (
+    Question, QuestionnaireResponse, QuestionnaireSection, QuestionnaireTemplate, QuestionType
+)
+from schemas.questionnaire import CompleteQuestionnaireRequest, SubmitAnswerRequest
+from services.questionnaire_template_service import template_cache
+
+pytestmark = pytest.mark.unit
+
+USER = AuthenticatedUser(user_id=1, email="staff@aibio.kr", name="직원", role="staff", is_active=True)
+
+
+@pytest.fixture(autouse=True)
+def _reset_template_cache():
+    # 테스트마다 DB가 새로 만들어져 같은 template_id가 재사용되므로 캐시를 비움
+    template_cache.invalidate()
+    yield
+    template_cache.invalidate()
+
+
+@pytest.fixture
+def template(db):
+    """질문 4개 (order_index를 역순으로 넣어 정렬 확인), 필수 질문은 1, 3번째"""
+    template = QuestionnaireTemplate(name="기본 문진", version="1.0", is_active=True)
+    db.add(template)
+    db.flush()
+    second_section = list(QuestionnaireSection)[1]
+    sections = [QuestionnaireSection.BASIC, QuestionnaireSection.BASIC, second_section, second_section]
+    questions = [
+        Question(
+            template_id=template.template_id,
+            section=section,
+            question_type=QuestionType.SCALE,
+            question_code=f"Q{index}",
+            question_text=f"질문 {index + 1}",
+            order_index=4 - index,
+            is_required=index % 2 == 0,
+        )
+        for index, section in enumerate(sections)
+    ]
+    db.add_all(questions)
+    db.commit()
+    # 화면 순서(order_index 오름차순)
+    return template, sorted(questions, key=lambda question: question.order_index)
+
+
+@pytest.fixture
+def response_id(db, template):
+    response = QuestionnaireResponse(template_id=template[0].template_id, device_id="tablet")
+    db.add(response)
+    db.commit()
+    return response.response_id
+
+
+def _submit(session_factory, response_id, question_id, answer=5):
+    with session_factory() as db:
+        return submit_answer(
+            response_id=response_id,
+            request=SubmitAnswerRequest(question_id=question_id, answer=answer),
+            db=db,
+            current_user=USER,
+        )
+
+
+def _progress(session_factory, response_id):
+    with session_factory() as db:
+        return get_questionnaire_progress(response_id=response_id, db=db, current_user=USER)
+
+
+def _response(session_factory, response_id) -> QuestionnaireResponse:
+    with session_factory() as db:
+        return db.get(QuestionnaireResponse, response_id)
+
+
+class TestAnsweredCount:
+    """answered_count 증가"""
+
+    def test_new_answers_increment_and_reanswer_does_not(self, session_factory, template, response_id):
+        _, questions = template
+        _submit(session_factory, response_id, questions[0].question_id)
+        _submit(session_factory, response_id, questions[1].question_id)
+        _submit(session_factory, response_id, questions[0].question_id, answer=9)  # 같은 질문 수정
+
+        response = _response(session_factory, response_id)
+        assert response.answered_count == 2
+        assert response.completion_rate == 50.0
+
+    def test_increment_happens_in_sql(self, session_factory, template, response_id):
+        # 먼저 읽어 둔 세션의 answered_count(0)가 아니라 DB 값 기준으로 증가
+        _, questions = template
+        stale = session_factory()
+        try:
+            assert stale.get(QuestionnaireResponse, response_id).answered_count == 0
+            _submit(session_factory, response_id, questions[0].question_id)
+            submit_answer(
+                response_id=response_id,
+                request=SubmitAnswerRequest(question_id=questions[1].question_id, answer=3),
+                db=stale,
+                current_user=USER,
+            )
+        finally:
+            stale.close()
+
+        assert _response(session_factory, response_id).answered_count == 2
+
+
+class TestProgress:
+    """진행 상태"""
+
+    def test_initial_progress(self, session_factory, template, response_id):
+        _, questions = template
+        progress = _progress(session_factory, response_id)
+
+        assert (progress.answered_questions, progress.total_questions, progress.completion_rate) == (0, 4, 0)
+        assert progress.next_question.question_id == questions[0].question_id
+        assert progress.estimated_time_remaining == 4 * 30
+        assert [(section.answered, section.total) for section in progress.sections] == [(0, 2), (0, 2)]
+
+    def test_progress_follows_order_and_sections(self, session_factory, template, response_id):
+        _, questions = template
+        # 순서를 건너뛰어 답해도 다음 질문은 아직 답하지 않은 첫 질문
+        _submit(session_factory, response_id, questions[1].question_id)
+        _submit(session_factory, response_id, questions[2].question_id)
+
+        progress = _progress(session_factory, response_id)
+        assert (progress.answered_questions, progress.completion_rate) == (2, 50.0)
+        assert progress.next_question.question_id == questions[0].question_id
+        assert progress.current_section == questions[0].section
+        assert [(section.answered, section.total) for section in progress.sections] == [(1, 2), (1, 2)]
+
+    def test_all_answered(self, session_factory, template, response_id):
+        _, questions = template
+        for question in questions:
+            _submit(session_factory, response_id, question.question_id)
+
+        progress = _progress(session_factory, response_id)
+        assert (progress.answered_questions, progress.completion_rate) == (4, 100.0)
+        assert progress.next_question is None
+        assert progress.estimated_time_remaining == 0
+
+    def test_unknown_response(self, session_factory, template):
+        with pytest.raises(HTTPException) as error:
+            _progress(session_factory, 999)
+        assert error.value.status_code == 404
+
+
+class TestComplete:
+    """완료 처리 - 필수 질문 확인"""
+
+    def _complete(self, session_factory, response_id, force=False):
+        with session_factory() as db:
+            return complete_questionnaire(
+                response_id=response_id,
+                request=CompleteQuestionnaireRequest(response_id=response_id, force_complete=force),
+                db=db,
+                current_user=USER,
+            )
+
+    def test_missing_required_is_rejected(self, session_factory, template, response_id):
+        _, questions = template
+        required = [question for question in questions if question.is_required]
+        _submit(session_factory, response_id, required[0].question_id)
+
+        with pytest.raises(HTTPException) as error:
+            self._complete(session_factory, response_id)
+        assert error.value.status_code == 400
+
+        _submit(session_factory, response_id, required[1].question_id)
+        self._complete(session_factory, response_id)
+        response = _response(session_factory, response_id)
+        assert (response.is_completed, response.completion_rate, response.answered_count) == (True, 100.0, 2)
+
+    def test_completed_response_rejects_answers(self, session_factory, template, response_id):
+        _, questions = template
+        self._complete(session_factory, response_id, force=True)
+
+        with pytest.raises(HTTPException) as error:
+            _submit(session_factory, response_id, questions[0].question_id)
+        assert error.value.status_code == 400
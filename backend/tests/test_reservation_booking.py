@@ -0,0 +1,172 @@
+"""
+예약 겹침 → 409 변환 테스트
+
+예약 생성/수정 엔드포인트는 겹치는 예약이 있으면 409를 돌려주고 아무것도 쓰지 않아야 한다.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+
+from api.v1.reservations.crud import router
+from core.auth import AuthenticatedUser, get_current_user
+from core.database import get_db
+from models.customer import Customer
+from models.reservation import Reservation
+from models.service import ServiceType
+from models.user import User
+from services.reservation_booking_service import (
+    SERVICE_CONFLICT_MESSAGE,
+    STAFF_CONFLICT_MESSAGE,
+    ReservationBookingService,
+    ReservationConflictError,
+)
+
+pytestmark = pytest.mark.unit
+
+DAY = "2026-03-02"
+
+
+class _FakeDBError(Exception):
+    def __init__(self, pgcode):
+        super().__init__(pgcode)
+        self.pgcode = pgcode
+
+
+def _db_error(pgcode: str) -> DBAPIError:
+    return DBAPIError("INSERT INTO reservations ...", {}, _FakeDBError(pgcode))
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1/reservations")
+
+    def _get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_current_user] = lambda: AuthenticatedUser(
+        user_id=1, email="staff@aibio.kr", name="직원", role="staff", is_active=True
+    )
+    return TestClient(app)
+
+
+@pytest.fixture
+def seed(db):
+    staff = User(email="staff@aibio.kr", password_hash="-", name="직원", role="staff")
+    customers = [Customer(name="고객1", phone="010-1111-1111"), Customer(name="고객2", phone="010-2222-2222")]
+    services = [ServiceType(service_name="브레인", default_duration=60), ServiceType(service_name="펄스", default_duration=60)]
+    db.add_all([staff, *customers, *services])
+    db.commit()
+    return {
+        "staff_id": staff.user_id,
+        "customer_ids": [customer.customer_id for customer in customers],
+        "service_ids": [service.service_type_id for service in services],
+    }
+
+
+def _payload(seed, customer=0, service=0, time="10:00:00", staff=False, duration=60):
+    return {
+        "customer_id": seed["customer_ids"][customer],
+        "service_type_id": seed["service_ids"][service],
+        "staff_id": seed["staff_id"] if staff else None,
+        "reservation_date": DAY,
+        "reservation_time": time,
+        "duration_minutes": duration,
+    }
+
+
+def _reservation_count(db) -> int:
+    return len(db.scalars(select(Reservation.reservation_id)).all())
+
+
+class TestCreateReservationConflict:
+    """예약 생성"""
+
+    def test_overlapping_service_returns_409(self, client, db, seed):
+        assert client.post("/api/v1/reservations/", json=_payload(seed), params={"send_confirmation": False}).status_code == 200
+
+        response = client.post(
+            "/api/v1/reservations/", json=_payload(seed, customer=1, time="10:30:00"), params={"send_confirmation": False}
+        )
+        assert response.status_code == 409
+        assert response.json()["detail"] == SERVICE_CONFLICT_MESSAGE
+        assert _reservation_count(db) == 1
+
+    def test_overlapping_staff_returns_409(self, client, db, seed):
+        client.post("/api/v1/reservations/", json=_payload(seed, staff=True), params={"send_confirmation": False})
+
+        response = client.post(
+            "/api/v1/reservations/",
+            json=_payload(seed, customer=1, service=1, time="10:45:00", staff=True),
+            params={"send_confirmation": False}
+        )
+        assert response.status_code == 409
+        assert response.json()["detail"] == STAFF_CONFLICT_MESSAGE
+
+    def test_adjacent_interval_is_allowed(self, client, db, seed):
+        client.post("/api/v1/reservations/", json=_payload(seed), params={"send_confirmation": False})
+
+        response = client.post(
+            "/api/v1/reservations/", json=_payload(seed, customer=1, time="11:00:00"), params={"send_confirmation": False}
+        )
+        assert response.status_code == 200
+        assert _reservation_count(db) == 2
+
+
+class TestUpdateReservationConflict:
+    """예약 수정"""
+
+    def test_moving_into_conflict_returns_409(self, client, db, seed):
+        client.post("/api/v1/reservations/", json=_payload(seed), params={"send_confirmation": False})
+        second = client.post(
+            "/api/v1/reservations/", json=_payload(seed, customer=1, time="13:00:00"), params={"send_confirmation": False}
+        ).json()
+
+        response = client.put(f"/api/v1/reservations/{second['reservation_id']}", json={"reservation_time": "10:15:00"})
+        assert response.status_code == 409
+        db.expire_all()
+        assert str(db.get(Reservation, second["reservation_id"]).reservation_time) == "13:00:00"
+
+    def test_moving_within_own_slot_is_allowed(self, client, seed):
+        created = client.post("/api/v1/reservations/", json=_payload(seed), params={"send_confirmation": False}).json()
+
+        response = client.put(f"/api/v1/reservations/{created['reservation_id']}", json={"reservation_time": "10:30:00"})
+        assert response.status_code == 200
+
+
+class TestBookingRun:
+    """트랜잭션 실행/재시도"""
+
+    def test_exclusion_violation_becomes_conflict(self, db):
+        def work():
+            raise _db_error("23P01")
+
+        with pytest.raises(ReservationConflictError, match=STAFF_CONFLICT_MESSAGE):
+            ReservationBookingService(db).run(work)
+
+    def test_serialization_failure_is_retried(self, db):
+        calls = []
+
+        def work():
+            calls.append(1)
+            if len(calls) < 3:
+                raise _db_error("40001")
+            return "ok"
+
+        assert ReservationBookingService(db, max_retries=3).run(work) == "ok"
+        assert len(calls) == 3
+
+    def test_retries_are_bounded(self, db):
+        def work():
+            raise _db_error("40P01")
+
+        with pytest.raises(DBAPIError):
+            ReservationBookingService(db, max_retries=1).run(work)
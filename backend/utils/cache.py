@@ -1,128 +1,428 @@
 """
-Redis 캐싱 유틸리티
+캐싱 유틸리티
 API 응답 성능 최적화를 위한 캐싱 시스템
+
+백엔드:
+- RedisCacheBackend: Redis 사용 (SCAN 기반 패턴 삭제, 태그 Set 기반 무효화)
+- MemoryCacheBackend: 프로세스 내 LRU + TTL 캐시 (Redis가 없을 때)
+
+CACHE_BACKEND=auto(기본)이면 Redis 연결을 시도하고 실패하면 메모리 캐시를 사용한다.
 """
 
 import json
-import redis
-from typing import Any, Optional
-from datetime import timedelta
-from functools import wraps
+import time
+import fnmatch
 import hashlib
-import pickle
-
-# Redis 클라이언트 초기화 (개발환경에서는 메모리 캐시 사용)
-try:
-    redis_client = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-    redis_client.ping()
-    REDIS_AVAILABLE = True
-except:
-    # Redis가 없는 경우 간단한 메모리 캐시 사용
-    REDIS_AVAILABLE = False
-    memory_cache = {}
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Optional, Iterable, Dict, List, Tuple
+from functools import wraps
+
+from core.config import settings
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "aibio"
+TAG_PREFIX = f"{KEY_PREFIX}:tag:"
+
+
+class CacheStats:
+    """캐시 적중/실패/제거 카운터"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.sets = 0
+        self.deletes = 0
+        self.evictions = 0    # 용량 초과로 제거
+        self.expirations = 0  # TTL 만료로 제거
+        self.errors = 0
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "sets": self.sets,
+                "deletes": self.deletes,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "errors": self.errors,
+            }
+
+
+class CacheBackend:
+    """캐시 백엔드 인터페이스 (값은 JSON 문자열로 저장)"""
+
+    name = "base"
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: str, expire: int, tags: Iterable[str] = ()) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> int:
+        raise NotImplementedError
+
+    def delete_pattern(self, pattern: str) -> int:
+        raise NotImplementedError
+
+    def invalidate_tags(self, *tags: str) -> int:
+        raise NotImplementedError
+
+    def info(self) -> dict:
+        return {"backend": self.name, **self.stats.snapshot()}
+
+
+class MemoryCacheBackend(CacheBackend):
+    """프로세스 내 LRU + TTL 캐시
+
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 만료된 항목은 조회 시점에 제거
+    """
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 5000):
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = threading.RLock()
+        self._data: "OrderedDict[str, Tuple[float, str, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, set] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.stats.incr("misses")
+                return None
+            expires_at, value, _ = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.stats.incr("expirations")
+                self.stats.incr("misses")
+                return None
+            self._data.move_to_end(key)
+            self.stats.incr("hits")
+            return value
+
+    def set(self, key: str, value: str, expire: int, tags: Iterable[str] = ()) -> None:
+        tags = tuple(tags)
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (time.monotonic() + expire, value, tags)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._data) > self.max_entries:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.stats.incr("evictions")
+        self.stats.incr("sets")
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            deleted = sum(1 for key in keys if self._remove(key))
+        self.stats.incr("deletes", deleted)
+        return deleted
+
+    def delete_pattern(self, pattern: str) -> int:
+        with self._lock:
+            keys = [key for key in self._data if fnmatch.fnmatchcase(key, pattern)]
+        return self.delete(*keys)
+
+    def invalidate_tags(self, *tags: str) -> int:
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys |= self._tags.pop(tag, set())
+        return self.delete(*keys)
+
+    def _remove(self, key: str) -> bool:
+        entry = self._data.pop(key, None)
+        if entry is None:
+            return False
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        return True
+
+    def info(self) -> dict:
+        with self._lock:
+            size = len(self._data)
+        return {**super().info(), "size": size, "max_entries": self.max_entries}
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 캐시
+
+    - 패턴 삭제는 KEYS 대신 SCAN으로 (대량 키에서 Redis 블로킹 방지)
+    - 태그별 Set(aibio:tag:<tag>)에 키를 모아 두고 태그 단위로 삭제
+    """
+
+    name = "redis"
+    SCAN_COUNT = 500
+
+    def __init__(self, client):
+        super().__init__()
+        self.client = client
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.client.get(key)
+        self.stats.incr("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key: str, value: str, expire: int, tags: Iterable[str] = ()) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.setex(key, expire, value)
+        for tag in tags:
+            tag_key = TAG_PREFIX + tag
+            pipe.sadd(tag_key, key)
+            # 태그 Set은 가장 긴 항목보다 조금 더 유지
+            pipe.expire(tag_key, expire + 60)
+        pipe.execute()
+        self.stats.incr("sets")
+
+    def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        deleted = self.client.delete(*keys)
+        self.stats.incr("deletes", deleted)
+        return deleted
+
+    def delete_pattern(self, pattern: str) -> int:
+        deleted = 0
+        batch: List[str] = []
+        for key in self.client.scan_iter(match=pattern, count=self.SCAN_COUNT):
+            batch.append(key)
+            if len(batch) >= self.SCAN_COUNT:
+                deleted += self.delete(*batch)
+                batch = []
+        if batch:
+            deleted += self.delete(*batch)
+        return deleted
+
+    def invalidate_tags(self, *tags: str) -> int:
+        deleted = 0
+        for tag in tags:
+            tag_key = TAG_PREFIX + tag
+            keys = self.client.smembers(tag_key)
+            if keys:
+                deleted += self.delete(*keys)
+            self.client.delete(tag_key)
+        return deleted
+
+    def info(self) -> dict:
+        return {**super().info(), "size": self.client.dbsize()}
+
+
+def _create_backend() -> CacheBackend:
+    """설정에 따라 캐시 백엔드 생성 (auto: Redis 실패 시 메모리)"""
+    if settings.CACHE_BACKEND in ("auto", "redis"):
+        try:
+            import redis
+            client = redis.Redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+            client.ping()
+            return RedisCacheBackend(client)
+        except Exception as e:
+            if settings.CACHE_BACKEND == "redis":
+                logger.error(f"Redis 연결 실패, 메모리 캐시 사용: {e}")
+    return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+
+
+backend: CacheBackend = _create_backend()
+REDIS_AVAILABLE = isinstance(backend, RedisCacheBackend)
+
 
 class CacheService:
     """캐싱 서비스 클래스"""
-    
+
     @staticmethod
     def _generate_key(prefix: str, *args, **kwargs) -> str:
-        """캐시 키 생성"""
-        key_data = f"{prefix}:{args}:{sorted(kwargs.items())}"
-        return f"aibio:{hashlib.md5(key_data.encode()).hexdigest()}"
-    
+        """캐시 키 생성 (prefix는 패턴 삭제를 위해 해시하지 않음)"""
+        key_data = f"{args}:{sorted(kwargs.items())}"
+        return f"{KEY_PREFIX}:{prefix}:{hashlib.md5(key_data.encode()).hexdigest()}"
+
     @staticmethod
     def get(key: str) -> Optional[Any]:
         """캐시에서 데이터 조회"""
         try:
-            if REDIS_AVAILABLE:
-                data = redis_client.get(key)
-                if data:
-                    return json.loads(data)
-            else:
-                return memory_cache.get(key)
+            data = backend.get(key)
+            if data is not None:
+                return json.loads(data)
         except Exception as e:
-            print(f"캐시 조회 실패: {e}")
+            backend.stats.incr("errors")
+            logger.warning(f"캐시 조회 실패: {e}")
         return None
-    
+
     @staticmethod
-    def set(key: str, value: Any, expire: int = 300) -> bool:
+    def set(key: str, value: Any, expire: int = 300, tags: Iterable[str] = ()) -> bool:
         """캐시에 데이터 저장 (기본 5분)"""
         try:
-            if REDIS_AVAILABLE:
-                redis_client.setex(key, expire, json.dumps(value, ensure_ascii=False, default=str))
-            else:
-                memory_cache[key] = value
-                # 메모리 캐시는 단순하게 구현 (실제로는 TTL 구현 필요)
+            backend.set(key, json.dumps(value, ensure_ascii=False, default=str), expire, tags)
             return True
         except Exception as e:
-            print(f"캐시 저장 실패: {e}")
+            backend.stats.incr("errors")
+            logger.warning(f"캐시 저장 실패: {e}")
         return False
-    
+
     @staticmethod
     def delete(key: str) -> bool:
         """캐시에서 데이터 삭제"""
         try:
-            if REDIS_AVAILABLE:
-                redis_client.delete(key)
-            else:
-                memory_cache.pop(key, None)
+            backend.delete(key)
             return True
         except Exception as e:
-            print(f"캐시 삭제 실패: {e}")
+            backend.stats.incr("errors")
+            logger.warning(f"캐시 삭제 실패: {e}")
         return False
-    
+
     @staticmethod
     def clear_pattern(pattern: str) -> int:
-        """패턴에 맞는 캐시 키들 삭제"""
+        """패턴(glob)에 맞는 캐시 키들 삭제"""
         try:
-            if REDIS_AVAILABLE:
-                keys = redis_client.keys(pattern)
-                if keys:
-                    return redis_client.delete(*keys)
-            else:
-                keys_to_delete = [k for k in memory_cache.keys() if pattern in k]
-                for key in keys_to_delete:
-                    del memory_cache[key]
-                return len(keys_to_delete)
+            return backend.delete_pattern(pattern)
         except Exception as e:
-            print(f"캐시 패턴 삭제 실패: {e}")
+            backend.stats.incr("errors")
+            logger.warning(f"캐시 패턴 삭제 실패: {e}")
         return 0
 
-def cached(expire: int = 300, key_prefix: str = "api"):
-    """API 응답 캐싱 데코레이터"""
+    @staticmethod
+    def invalidate_tags(*tags: str) -> int:
+        """태그가 붙은 캐시 키들 삭제"""
+        try:
+            return backend.invalidate_tags(*tags)
+        except Exception as e:
+            backend.stats.incr("errors")
+            logger.warning(f"캐시 태그 삭제 실패: {e}")
+        return 0
+
+    @staticmethod
+    def stats() -> dict:
+        """캐시 백엔드 통계"""
+        try:
+            return backend.info()
+        except Exception as e:
+            logger.warning(f"캐시 통계 조회 실패: {e}")
+            return {"backend": backend.name, **backend.stats.snapshot()}
+
+
+# 캐시 키에서 제외할 인자 (DB 세션, 인증 사용자 등 요청마다 새로 만들어지는 객체)
+# 사용자별로 결과가 달라지는 함수는 exclude를 직접 지정한다
+DEFAULT_EXCLUDE_ARGS = ("db", "current_user")
+
+
+def _call_arguments(signature: inspect.Signature, exclude: Iterable[str], args, kwargs) -> dict:
+    """함수 인자를 이름 기준으로 정리 (제외 대상 인자 제거)"""
+    bound = signature.bind_partial(*args, **kwargs)
+    bound.apply_defaults()
+    return {name: value for name, value in bound.arguments.items() if name not in exclude}
+
+
+def _to_jsonable(value: Any) -> Any:
+    from fastapi.encoders import jsonable_encoder
+    return jsonable_encoder(value)
+
+
+def cached(
+    expire: int = 300,
+    key_prefix: str = "api",
+    tags: Iterable[str] = (),
+    exclude: Iterable[str] = DEFAULT_EXCLUDE_ARGS
+):
+    """API 응답 캐싱 데코레이터 (def / async def 모두 지원)
+
+    캐시 키는 인자 이름과 값으로 만들며 exclude에 있는 인자(기본: db, current_user)는 제외한다.
+    """
+    exclude = tuple(exclude)
+    tags = tuple(tags)
+
     def decorator(func):
+        signature = inspect.signature(func)
+
+        def make_key(args, kwargs) -> str:
+            arguments = _call_arguments(signature, exclude, args, kwargs)
+            return CacheService._generate_key(f"{key_prefix}:{func.__name__}", **arguments)
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                cache_key = make_key(args, kwargs)
+                cached_result = CacheService.get(cache_key)
+                if cached_result is not None:
+                    return cached_result
+
+                result = _to_jsonable(await func(*args, **kwargs))
+                CacheService.set(cache_key, result, expire, tags)
+                return result
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # 캐시 키 생성
-            cache_key = CacheService._generate_key(key_prefix, func.__name__, *args, **kwargs)
-            
+            cache_key = make_key(args, kwargs)
+
             # 캐시에서 조회
             cached_result = CacheService.get(cache_key)
             if cached_result is not None:
                 return cached_result
-            
-            # 캐시 미스 시 함수 실행
-            result = func(*args, **kwargs)
-            
-            # 결과 캐싱
-            CacheService.set(cache_key, result, expire)
-            
+
+            # 캐시 미스 시 함수 실행 후 결과 캐싱
+            result = _to_jsonable(func(*args, **kwargs))
+            CacheService.set(cache_key, result, expire, tags)
             return result
         return wrapper
     return decorator
 
-def cache_invalidate(pattern: str):
-    """캐시 무효화 데코레이터"""
+
+def cache_invalidate(pattern: Optional[str] = None, tags: Iterable[str] = ()):
+    """캐시 무효화 데코레이터 (함수 실행 후 패턴/태그에 해당하는 캐시 삭제)"""
+    tags = tuple(tags)
+
+    def invalidate():
+        if pattern:
+            CacheService.clear_pattern(f"{KEY_PREFIX}:*{pattern}*")
+        if tags:
+            CacheService.invalidate_tags(*tags)
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                result = await func(*args, **kwargs)
+                invalidate()
+                return result
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             result = func(*args, **kwargs)
-            # 함수 실행 후 관련 캐시 삭제
-            CacheService.clear_pattern(f"aibio:*{pattern}*")
+            invalidate()
             return result
         return wrapper
     return decorator
 
+
 # 자주 사용되는 캐시 설정들
 CACHE_SETTINGS = {
     'dashboard_stats': {'expire': 300, 'key_prefix': 'dashboard'},  # 5분
@@ -131,4 +431,4 @@ CACHE_SETTINGS = {
     'payment_stats': {'expire': 900, 'key_prefix': 'payments'},     # 15분
     'package_stats': {'expire': 1800, 'key_prefix': 'packages'},    # 30분
     'reports': {'expire': 3600, 'key_prefix': 'reports'},           # 1시간
-}
\ No newline at end of file
+}
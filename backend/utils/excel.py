@@ -182,20 +182,35 @@ class ExcelHandler:
     @staticmethod
     async def read_excel_file(file: UploadFile) -> pd.DataFrame:
         """엑셀 파일 읽기"""
-        # 파일 확장자 검증
-        if not file.filename:
+        ExcelHandler._validate_extension(file.filename)
+        contents = await file.read()
+        return ExcelHandler._read_excel_contents(contents)
+
+    @staticmethod
+    def read_excel_upload(file: UploadFile, max_rows: Optional[int] = None) -> pd.DataFrame:
+        """엑셀 파일 읽기 (동기 버전 - 스레드풀에서 실행되는 def 핸들러용)"""
+        ExcelHandler._validate_extension(file.filename)
+        contents = file.file.read()
+        return ExcelHandler._read_excel_contents(contents, max_rows)
+
+    @staticmethod
+    def _validate_extension(filename: Optional[str]) -> None:
+        """파일 확장자 검증"""
+        if not filename:
             raise HTTPException(status_code=400, detail="파일명이 없습니다")
 
-        file_ext = '.' + file.filename.split('.')[-1].lower() if '.' in file.filename else ''
+        file_ext = '.' + filename.split('.')[-1].lower() if '.' in filename else ''
         if file_ext not in ExcelHandler.ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
                 detail=f"지원하지 않는 파일 형식입니다. {', '.join(ExcelHandler.ALLOWED_EXTENSIONS)}만 가능합니다"
             )
 
+    @staticmethod
+    def _read_excel_contents(contents: bytes, max_rows: Optional[int] = None) -> pd.DataFrame:
+        """업로드된 바이트에서 DataFrame 생성 (크기/행 수 검증 포함)"""
+        max_rows = max_rows or ExcelHandler.MAX_ROWS
         try:
-            # 파일 크기 확인을 위해 먼저 읽기
-            contents = await file.read()
             file_size = len(contents)
 
             # 파일 크기 제한 확인
@@ -213,10 +228,10 @@ class ExcelHandler:
             df = pd.read_excel(io.BytesIO(contents))
 
             # 행 수 제한 확인
-            if len(df) > ExcelHandler.MAX_ROWS:
+            if len(df) > max_rows:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"데이터가 너무 많습니다. 최대 {ExcelHandler.MAX_ROWS}행까지만 가능합니다"
+                    detail=f"데이터가 너무 많습니다. 최대 {max_rows}행까지만 가능합니다"
                 )
 
             # 빈 데이터프레임 확인
@@ -0,0 +1,173 @@
+"""
+스트리밍 내보내기 (Excel/CSV)
+
+전체 행을 DataFrame으로 모으지 않고 서버 사이드 커서(yield_per)로 읽으면서 바로 쓴다.
+- CSV: 일정 행마다 바이트 청크를 응답으로 흘려보냄
+- Excel: openpyxl write-only 워크북(행을 임시 파일에 기록) → 완성된 파일을 청크로 전송
+  (openpyxl은 엑셀 내보내기 때만 import - 콜드 스타트에서 제외)
+
+주의: StreamingResponse 본문은 핸들러(및 get_db 의존성)가 끝난 뒤에 생성되므로
+조회는 요청 세션이 아니라 iter_query_rows가 직접 여는 읽기 세션으로 한다.
+"""
+
+import csv
+import io
+import re
+import tempfile
+from datetime import datetime, date
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+from core.config import settings
+from core.database import ReadSessionLocal
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_CHUNK_SIZE = 2000         # 서버 사이드 커서 fetch 크기
+CSV_FLUSH_ROWS = 1000            # CSV 청크당 행 수
+FILE_READ_SIZE = 64 * 1024
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+EXPORT_FORMATS = ("xlsx", "csv")
+
+# openpyxl.cell.cell.ILLEGAL_CHARACTERS_RE와 동일 (엑셀에서 허용하지 않는 제어 문자)
+ILLEGAL_CHARACTERS_RE = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
+
+
+class ExportColumn(NamedTuple):
+    """내보내기 컬럼 (헤더, 엑셀 열 너비)"""
+    header: str
+    width: int = 15
+
+
+def iter_query_rows(stmt, chunk_size: int = EXPORT_CHUNK_SIZE, session_factory=None) -> Iterator[Any]:
+    """쿼리 결과를 chunk_size 단위로 스트리밍 조회 (전용 읽기 세션)"""
+    db = (session_factory or ReadSessionLocal)()
+    db.info["statement_timeout_ms"] = settings.DB_REPORT_STATEMENT_TIMEOUT_MS
+    try:
+        result = db.execute(stmt.execution_options(yield_per=chunk_size))
+        for row in result:
+            yield row
+    finally:
+        db.close()
+
+
+def _clean_cell(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str):
+        # 엑셀에서 허용하지 않는 제어 문자 제거
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def csv_chunks(columns: Sequence[ExportColumn], rows: Iterable[Sequence[Any]]) -> Iterator[bytes]:
+    """CSV 바이트 청크 생성 (엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    buffer.write("\ufeff")
+    writer.writerow([column.header for column in columns])
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= CSV_FLUSH_ROWS:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue().encode("utf-8")
+
+
+def xlsx_chunks(
+    columns: Sequence[ExportColumn],
+    rows: Iterable[Sequence[Any]],
+    sheet_name: str = "Sheet1"
+) -> Iterator[bytes]:
+    """write-only 워크북으로 엑셀 생성 후 파일을 청크로 전송 (메모리 사용량 일정)"""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet(title=sheet_name)
+    for index, column in enumerate(columns, start=1):
+        worksheet.column_dimensions[get_column_letter(index)].width = column.width
+
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
+    header_cells = []
+    for column in columns:
+        cell = WriteOnlyCell(worksheet, value=column.header)
+        cell.font = header_font
+        cell.fill = header_fill
+        header_cells.append(cell)
+    worksheet.append(header_cells)
+
+    for row in rows:
+        worksheet.append([_clean_cell(value) for value in row])
+
+    with tempfile.TemporaryFile() as output:
+        workbook.save(output)
+        output.seek(0)
+        while True:
+            chunk = output.read(FILE_READ_SIZE)
+            if not chunk:
+                break
+            yield chunk
+
+
+def streaming_export(
+    columns: Sequence[ExportColumn],
+    rows: Iterable[Sequence[Any]],
+    filename_prefix: str,
+    file_format: str = "xlsx",
+    sheet_name: str = "Sheet1"
+) -> StreamingResponse:
+    """내보내기 StreamingResponse 생성"""
+    if file_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format은 xlsx 또는 csv만 가능합니다")
+
+    filename = f"{filename_prefix}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{file_format}"
+    if file_format == "csv":
+        body = csv_chunks(columns, rows)
+        media_type = CSV_MEDIA_TYPE
+    else:
+        body = xlsx_chunks(columns, rows, sheet_name)
+        media_type = XLSX_MEDIA_TYPE
+
+    return StreamingResponse(
+        _log_failures(body, filename),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+def _log_failures(chunks: Iterator[bytes], filename: str) -> Iterator[bytes]:
+    # 응답 헤더가 이미 전송된 뒤의 오류는 HTTP 에러로 바꿀 수 없으므로 로그만 남김
+    try:
+        yield from chunks
+    except Exception as e:
+        logger.error(f"Streaming export failed ({filename}): {e}", exc_info=True)
+        raise
+
+
+def format_date(value: Optional[date], fmt: str = "%Y-%m-%d") -> str:
+    return value.strftime(fmt) if value else ""
+
+
+def format_datetime(value: Optional[datetime]) -> str:
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else ""
+
+
+def map_rows(rows: Iterable[Any], mapper: Callable[[Any], List[Any]]) -> Iterator[List[Any]]:
+    """DB 행 → 내보내기 행 변환 (지연 평가)"""
+    for row in rows:
+        yield mapper(row)
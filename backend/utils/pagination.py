@@ -0,0 +1,193 @@
+"""
+커서(keyset) 페이지네이션 유틸리티
+
+OFFSET 대신 마지막 행의 (정렬 키, id)를 커서로 넘겨 다음 페이지를 조회한다.
+페이지 깊이와 관계없이 인덱스 범위 스캔 한 번으로 끝난다.
+
+커서는 정렬 기준과 마지막 행 값을 담은 불투명 문자열(base64 JSON)이며,
+정렬 기준이 바뀐 커서는 400으로 거부한다.
+"""
+
+import base64
+import hashlib
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, func, select, text, tuple_
+from sqlalchemy.orm import Session
+
+from utils.cache import CacheService
+
+COUNT_MODES = ("exact", "approximate", "none")
+COUNT_CACHE_SECONDS = 60
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"n": str(value)}
+    if hasattr(value, "value"):  # Enum
+        return value.value
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        if "n" in value:
+            return Decimal(value["n"])
+    return value
+
+
+def encode_cursor(sort_key: str, sort_value: Any, row_id: Any) -> str:
+    """마지막 행의 정렬 값과 id로 커서 생성"""
+    payload = {"s": sort_key, "v": _encode_value(sort_value), "id": row_id}
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_key: str) -> Tuple[Any, Any]:
+    """커서를 (정렬 값, id)로 복원"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort_key:
+            raise ValueError("sort mismatch")
+        return _decode_value(payload["v"]), payload["id"]
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 커서입니다. 정렬 조건이 바뀌었다면 첫 페이지부터 다시 조회하세요."
+        )
+
+
+class KeysetPage:
+    """정렬 컬럼 + id 컬럼 기준 keyset 페이지네이션
+
+    NOT NULL 정렬 컬럼은 (정렬 값, id) 행 비교 하나로 커서 이후를 찾으므로
+    (정렬 컬럼, id) 복합 인덱스의 범위 스캔(내림차순이면 역방향)으로 처리된다.
+    NULL을 가질 수 있는 컬럼은 NULL을 항상 마지막에 두며(nulls_last),
+    내림차순 인덱스는 DESC NULLS LAST로 만들어야 정렬 없이 인덱스 순서로 읽힌다.
+    정렬 컬럼이 id 컬럼 자체면 sort_column=None으로 둔다.
+    """
+
+    def __init__(
+        self,
+        sort_column,
+        id_column,
+        descending: bool = True,
+        sort_key: Optional[str] = None,
+        nullable: Optional[bool] = None
+    ):
+        self.sort_column = sort_column
+        self.id_column = id_column
+        self.descending = descending
+        name = sort_column.key if sort_column is not None else id_column.key
+        self.sort_key = sort_key or f"{name}:{'desc' if descending else 'asc'}"
+        if nullable is None:
+            nullable = sort_column is not None and sort_column.expression.nullable
+        self.nullable = nullable
+
+    def order_by(self) -> list:
+        id_order = self.id_column.desc() if self.descending else self.id_column.asc()
+        if self.sort_column is None:
+            return [id_order]
+        sort_order = self.sort_column.desc() if self.descending else self.sort_column.asc()
+        if self.nullable:
+            sort_order = sort_order.nulls_last()
+        return [sort_order, id_order]
+
+    def _after(self, column, value):
+        return column < value if self.descending else column > value
+
+    def condition(self, cursor: str):
+        """커서 이후 행만 남기는 WHERE 조건"""
+        last_value, last_id = decode_cursor(cursor, self.sort_key)
+        if self.sort_column is None:
+            return self._after(self.id_column, last_id)
+        if self.nullable and last_value is None:
+            # NULL 구간 안에서는 id로만 진행
+            return and_(self.sort_column.is_(None), self._after(self.id_column, last_id))
+        # (정렬 값, id) 행 비교 - 복합 인덱스 범위 스캔으로 처리됨
+        row_after = self._after(tuple_(self.sort_column, self.id_column), tuple_(last_value, last_id))
+        if self.nullable:
+            return or_(row_after, self.sort_column.is_(None))
+        return row_after
+
+    def apply(self, query, cursor: Optional[str], limit: int):
+        """정렬 + 커서 조건 + limit(+1) 적용 (다음 페이지 존재 여부 확인용으로 1행 더 조회)"""
+        if cursor:
+            query = query.where(self.condition(cursor))
+        return query.order_by(*self.order_by()).limit(limit + 1)
+
+    def page(self, rows: list, limit: int, get_sort_value, get_id) -> Tuple[list, Optional[str]]:
+        """조회한 limit+1행을 (페이지 행, 다음 커서)로 분리"""
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_next and rows:
+            last = rows[-1]
+            sort_value = get_sort_value(last) if self.sort_column is not None else None
+            next_cursor = encode_cursor(self.sort_key, sort_value, get_id(last))
+        return rows, next_cursor
+
+
+def approximate_table_count(db: Session, table_name: str) -> Optional[int]:
+    """통계 기반 테이블 행 수 추정 (pg_class.reltuples, PostgreSQL 전용)"""
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = db.execute(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"),
+        {"table_name": table_name}
+    ).scalar()
+    # ANALYZE 전에는 -1 (PG14+) 또는 0
+    return int(estimate) if estimate and estimate > 0 else None
+
+
+def count_rows(db: Session, query, count_mode: str = "exact", table_name: Optional[str] = None) -> Optional[int]:
+    """
+    목록 전체 건수
+
+    - exact: COUNT(*) 실행
+    - approximate: 필터가 없으면 pg_class 추정치, 있으면 COUNT 결과를 잠시 캐싱
+    - none: 건수 생략 (None)
+    """
+    if count_mode == "none":
+        return None
+
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    if count_mode != "approximate":
+        return db.execute(count_query).scalar()
+
+    if table_name and query.whereclause is None:
+        estimate = approximate_table_count(db, table_name)
+        if estimate is not None:
+            return estimate
+
+    compiled = count_query.compile(db.get_bind())
+    key_data = f"{compiled}:{sorted(compiled.params.items())}"
+    cache_key = f"aibio:count:{hashlib.md5(key_data.encode()).hexdigest()}"
+    cached = CacheService.get(cache_key)
+    if cached is not None:
+        return cached
+    total = db.execute(count_query).scalar()
+    CacheService.set(cache_key, total, COUNT_CACHE_SECONDS)
+    return total
+
+
+def validate_count_mode(count_mode: str) -> str:
+    if count_mode not in COUNT_MODES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"count는 {', '.join(COUNT_MODES)} 중 하나여야 합니다"
+        )
+    return count_mode
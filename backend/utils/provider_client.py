@@ -0,0 +1,337 @@
+"""
+외부 메시지 공급자(알리고/카카오) 공용 HTTP 클라이언트
+
+- httpx Client/AsyncClient 커넥션 풀 재사용 (keep-alive, TCP/TLS 핸드셰이크 1회)
+  AsyncClient는 이벤트 루프별로 두고 루프가 끝날 때 닫는다
+- 동시 요청 수 제한(max_concurrency)과 초당 요청 수 제한(rate_per_second) - 공급자 호출 한도 보호
+- 호출 경로별 지연 시간 히스토그램
+- 서킷 브레이커: 연속 실패가 failure_threshold에 도달하면 reset_seconds 동안 호출하지 않고 바로 실패,
+  이후 한 건만 시험 호출(half-open)해서 성공하면 복구
+"""
+import asyncio
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# 지연 시간 히스토그램 상한 (ms)
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출하지 않음"""
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램 (스레드 안전)"""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self._lock = threading.Lock()
+        self.buckets_ms = tuple(buckets_ms)
+        self.counts = [0] * (len(self.buckets_ms) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float, error: bool = False) -> None:
+        with self._lock:
+            self.counts[bisect_left(self.buckets_ms, seconds * 1000)] += 1
+            self.count += 1
+            self.total += seconds
+            if error:
+                self.errors += 1
+
+    def _quantile_ms(self, ratio: float) -> Optional[float]:
+        """버킷 상한 기준 근사 분위수"""
+        if not self.count:
+            return None
+        target = self.count * ratio
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                return float(self.buckets_ms[index]) if index < len(self.buckets_ms) else float("inf")
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            labels = [f"le_{bucket}ms" for bucket in self.buckets_ms] + ["le_inf"]
+            return {
+                "count": self.count,
+                "errors": self.errors,
+                "avg_ms": round(self.total / self.count * 1000, 2) if self.count else 0.0,
+                "p50_ms": self._quantile_ms(0.5),
+                "p95_ms": self._quantile_ms(0.95),
+                "p99_ms": self._quantile_ms(0.99),
+                "buckets": dict(zip(labels, self.counts)),
+            }
+
+
+class CircuitBreaker:
+    """closed → (연속 실패) open → (reset_seconds 후) half_open → 성공 시 closed / 실패 시 open"""
+
+    def __init__(self, failure_threshold: int = 5, reset_seconds: float = 30.0):
+        self._lock = threading.Lock()
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.trial_in_flight = False
+        self.open_count = 0
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_seconds:
+                self.state = "half_open"
+                self.trial_in_flight = False
+            if self.state == "half_open" and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self.trial_in_flight = False
+
+    def abandon(self) -> None:
+        """결과 없이 끝난 호출 (요청 구성 오류, 취소 등) - half-open 시험 호출이었으면 다음 호출이 다시 시험"""
+        with self._lock:
+            self.trial_in_flight = False
+
+    def record_failure(self) -> bool:
+        """실패 기록 - 이번 실패로 서킷이 열렸으면 True"""
+        with self._lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                opened = self.state != "open"
+                if opened:
+                    self.open_count += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                return opened
+            return False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "open_count": self.open_count,
+            }
+
+
+class RateLimiter:
+    """초당 요청 수 제한 - 다음 호출 가능 시각을 예약하는 방식 (0이면 제한 없음)"""
+
+    def __init__(self, rate_per_second: float = 0):
+        self._lock = threading.Lock()
+        self.interval = 1.0 / rate_per_second if rate_per_second and rate_per_second > 0 else 0.0
+        self.next_slot = 0.0
+
+    def reserve(self) -> float:
+        """기다려야 할 시간(초)을 돌려주고 다음 슬롯을 예약"""
+        if not self.interval:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+            return slot - now
+
+
+class ProviderClient:
+    """공급자별 공용 클라이언트 (모듈 싱글톤 서비스가 하나씩 가짐)"""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: str,
+        max_concurrency: int = 4,
+        rate_per_second: float = 0,
+        timeout: float = 10.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+    ):
+        self.name = name
+        self.base_url = base_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(failure_threshold, reset_seconds)
+        self.rate_limiter = RateLimiter(rate_per_second)
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self._histogram_lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
+        self._in_flight = 0
+        self._in_flight_lock = threading.Lock()
+        self._client: Optional[httpx.Client] = None
+        self._client_lock = threading.Lock()
+        # 이벤트 루프 → (AsyncClient, Semaphore, 루프 종료 시 클라이언트를 닫는 async generator)
+        self._async_clients: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, asyncio.Semaphore, Any]] = {}
+
+    # ------------------------------------------------------------------
+    # 클라이언트 (지연 생성)
+    # ------------------------------------------------------------------
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+
+    @property
+    def client(self) -> httpx.Client:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = httpx.Client(timeout=self.timeout, limits=self._limits())
+        return self._client
+
+    async def _async_state(self) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        """이벤트 루프별 AsyncClient/Semaphore
+
+        AsyncClient의 연결은 만든 루프에 묶이므로 루프마다 하나씩 둔다.
+        asyncio.run()이 루프를 닫기 전에 shutdown_asyncgens()로 _close_on_loop_shutdown을 닫으면서
+        그 루프의 클라이언트 연결도 닫힌다. 이미 닫힌 루프의 항목은 새 루프가 생길 때 정리한다.
+        """
+        loop = asyncio.get_running_loop()
+        with self._client_lock:
+            state = self._async_clients.get(loop)
+            created = state is None
+            if created:
+                for closed_loop in [other for other in self._async_clients if other.is_closed()]:
+                    del self._async_clients[closed_loop]
+                client = httpx.AsyncClient(timeout=self.timeout, limits=self._limits())
+                state = (client, asyncio.Semaphore(self.max_concurrency), _close_on_loop_shutdown(client))
+                self._async_clients[loop] = state
+        if created:
+            await state[2].__anext__()  # 루프의 async generator로 등록
+        return state[0], state[1]
+
+    # ------------------------------------------------------------------
+    # 호출
+    # ------------------------------------------------------------------
+    def _track(self, delta: int) -> None:
+        with self._in_flight_lock:
+            self._in_flight += delta
+
+    def request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """동기 호출 - 서킷이 열려 있으면 CircuitOpenError, 네트워크 오류는 httpx.HTTPError"""
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.name} 서킷 열림 - 잠시 후 다시 시도하세요")
+        observed = False
+        try:
+            wait = self.rate_limiter.reserve()
+            if wait:
+                time.sleep(wait)
+            with self._semaphore:
+                self._track(1)
+                started = time.perf_counter()
+                try:
+                    response = self.client.request(method, f"{self.base_url}{path}", **kwargs)
+                except httpx.HTTPError:
+                    observed = True
+                    self._observe(path, time.perf_counter() - started, failed=True)
+                    raise
+                finally:
+                    self._track(-1)
+            observed = True
+            self._observe(path, time.perf_counter() - started, failed=response.status_code >= 500)
+            return response
+        finally:
+            if not observed:
+                self.breaker.abandon()
+
+    async def arequest(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """비동기 호출 (request와 같은 제한/통계)"""
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.name} 서킷 열림 - 잠시 후 다시 시도하세요")
+        observed = False
+        try:
+            client, semaphore = await self._async_state()
+            wait = self.rate_limiter.reserve()
+            if wait:
+                await asyncio.sleep(wait)
+            async with semaphore:
+                self._track(1)
+                started = time.perf_counter()
+                try:
+                    response = await client.request(method, f"{self.base_url}{path}", **kwargs)
+                except httpx.HTTPError:
+                    observed = True
+                    self._observe(path, time.perf_counter() - started, failed=True)
+                    raise
+                finally:
+                    self._track(-1)
+            observed = True
+            self._observe(path, time.perf_counter() - started, failed=response.status_code >= 500)
+            return response
+        finally:
+            if not observed:
+                self.breaker.abandon()
+
+    def _observe(self, path: str, seconds: float, failed: bool) -> None:
+        histogram = self.histograms.get(path)
+        if histogram is None:
+            with self._histogram_lock:
+                histogram = self.histograms.setdefault(path, LatencyHistogram())
+        histogram.observe(seconds, error=failed)
+        if failed:
+            if self.breaker.record_failure():
+                logger.warning(f"{self.name} 서킷 열림 (연속 실패 {self.breaker.failures}회)")
+        else:
+            self.breaker.record_success()
+
+    # ------------------------------------------------------------------
+    # 상태
+    # ------------------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "base_url": self.base_url,
+            "max_concurrency": self.max_concurrency,
+            "rate_per_second": round(1 / self.rate_limiter.interval, 2) if self.rate_limiter.interval else None,
+            "in_flight": self._in_flight,
+            "circuit": self.breaker.snapshot(),
+            "latency": {path: histogram.snapshot() for path, histogram in sorted(self.histograms.items())},
+        }
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 AsyncClient 닫기"""
+        with self._client_lock:
+            state = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state[2].aclose()
+
+
+async def _close_on_loop_shutdown(client: httpx.AsyncClient):
+    """한 번 yield하고 멈춰 있다가, 닫히면(루프 종료 시 shutdown_asyncgens 또는 aclose) client를 닫음"""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+_registry: List[ProviderClient] = []
+
+
+def register_provider_client(client: ProviderClient) -> ProviderClient:
+    """상태 조회(/system/message-providers) 대상에 등록"""
+    _registry.append(client)
+    return client
+
+
+def provider_stats() -> List[Dict[str, Any]]:
+    return [client.stats() for client in _registry]
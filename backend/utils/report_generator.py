@@ -1,36 +1,54 @@
-"""보고서 생성 유틸리티"""
+"""보고서 생성 유틸리티
+
+matplotlib/reportlab은 import만 수백 ms가 걸리므로 보고서를 실제로 만들 때 불러온다.
+(API 프로세스 콜드 스타트에서 제외 - scripts/benchmark_import_time.py)
+
+차트는 pyplot 전역 상태(현재 figure) 대신 Figure 객체를 직접 만들어 그린다.
+스레드/프로세스 어디에서 동시에 호출해도 서로의 그림을 건드리지 않는다.
+API 요청에서는 services/report_render_service.py가 render_report를 별도 프로세스에서 실행한다.
+"""
 import io
 from datetime import datetime, date
 from typing import Dict, List, Any, Optional
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT
-import pandas as pd
-import numpy as np
 
-# matplotlib 한글 폰트 설정
-plt.rcParams['font.family'] = 'AppleGothic'
-plt.rcParams['axes.unicode_minus'] = False
+_figure_class = None
+
+
+def _get_figure_class():
+    """matplotlib.figure.Figure (처음 호출 시 import + 한글 폰트 설정)"""
+    global _figure_class
+    if _figure_class is None:
+        import matplotlib
+        from matplotlib.figure import Figure
+
+        # matplotlib 한글 폰트 설정
+        matplotlib.rcParams['font.family'] = 'AppleGothic'
+        matplotlib.rcParams['axes.unicode_minus'] = False
+        _figure_class = Figure
+    return _figure_class
 
 
 class ReportGenerator:
     """보고서 생성 클래스"""
     
     def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_korean_styles()
+        self._styles = None
+
+    @property
+    def styles(self):
+        if self._styles is None:
+            from reportlab.lib.styles import getSampleStyleSheet
+            self._styles = getSampleStyleSheet()
+            self._setup_korean_styles()
+        return self._styles
     
     def _setup_korean_styles(self):
         """한글 스타일 설정"""
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.styles import ParagraphStyle
+
         # 제목 스타일
-        self.styles.add(ParagraphStyle(
+        self._styles.add(ParagraphStyle(
             name='KoreanTitle',
             fontName='Helvetica-Bold',
             fontSize=20,
@@ -39,7 +57,7 @@ class ReportGenerator:
         ))
         
         # 부제목 스타일
-        self.styles.add(ParagraphStyle(
+        self._styles.add(ParagraphStyle(
             name='KoreanHeading',
             fontName='Helvetica-Bold',
             fontSize=14,
@@ -47,7 +65,7 @@ class ReportGenerator:
         ))
         
         # 본문 스타일
-        self.styles.add(ParagraphStyle(
+        self._styles.add(ParagraphStyle(
             name='KoreanNormal',
             fontName='Helvetica',
             fontSize=10,
@@ -56,7 +74,9 @@ class ReportGenerator:
     
     def create_chart(self, chart_type: str, data: Dict[str, Any], title: str) -> io.BytesIO:
         """차트 생성"""
-        fig, ax = plt.subplots(figsize=(8, 6))
+        # pyplot 없이 Figure를 직접 생성 (Agg 캔버스가 자동으로 붙음)
+        fig = _get_figure_class()(figsize=(8, 6))
+        ax = fig.subplots()
         
         if chart_type == 'bar':
             labels = list(data.keys())
@@ -86,18 +106,22 @@ class ReportGenerator:
             ax.pie(values, labels=labels, autopct='%1.1f%%', colors=colors_list[:len(labels)])
         
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
+        fig.tight_layout()
         
-        # 이미지로 저장
+        # 이미지로 저장 (Figure는 pyplot에 등록되지 않으므로 close 불필요)
         img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close()
+        fig.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
         img_buffer.seek(0)
         
         return img_buffer
     
     def generate_monthly_revenue_report(self, data: Dict[str, Any]) -> bytes:
         """월간 매출 보고서 생성"""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
         story = []
@@ -180,6 +204,11 @@ class ReportGenerator:
     
     def generate_customer_analysis_report(self, data: Dict[str, Any]) -> bytes:
         """고객 분석 보고서 생성"""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+
         buffer = io.BytesIO()
         doc = SimpleDocTemplate(buffer, pagesize=A4)
         story = []
@@ -257,4 +286,22 @@ class ReportGenerator:
         pdf_data = buffer.getvalue()
         buffer.close()
         
-        return pdf_data
\ No newline at end of file
+        return pdf_data
+
+
+REPORT_METHODS = {
+    'monthly_revenue': 'generate_monthly_revenue_report',
+    'customer_analysis': 'generate_customer_analysis_report',
+}
+
+_generator: Optional[ReportGenerator] = None
+
+
+def render_report(report_type: str, data: Dict[str, Any]) -> bytes:
+    """보고서 종류와 데이터로 PDF 생성 (프로세스 풀에서 호출하는 진입점 - 피클 가능한 최상위 함수)"""
+    global _generator
+    if report_type not in REPORT_METHODS:
+        raise ValueError(f"알 수 없는 보고서 종류: {report_type}")
+    if _generator is None:
+        _generator = ReportGenerator()
+    return getattr(_generator, REPORT_METHODS[report_type])(data)
@@ -117,16 +117,32 @@ class ResponseFormatter:
         )
 
 
-def paginate_query(query, page: int, page_size: int) -> Dict[str, Any]:
-    """SQLAlchemy 쿼리에 페이지네이션 적용"""
+def paginate_query(
+    query,
+    page: int,
+    page_size: int,
+    count_mode: str = "exact",
+    table_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """SQLAlchemy 쿼리에 페이지네이션 적용 (count_mode: exact | approximate | none)"""
+    from utils.pagination import count_rows
+
     # 전체 개수
-    total = query.count()
+    if count_mode == "exact":
+        total = query.count()
+    else:
+        total = count_rows(query.session, query, count_mode, table_name)
     
     # 페이지네이션 적용
     items = query.offset((page - 1) * page_size).limit(page_size).all()
     
-    # 총 페이지 수
-    total_pages = (total + page_size - 1) // page_size
+    # 총 페이지 수 (건수를 모르면 현재 페이지가 가득 찼는지로 판단)
+    if total is None:
+        total_pages = None
+        has_next = len(items) >= page_size
+    else:
+        total_pages = (total + page_size - 1) // page_size
+        has_next = page < total_pages
     
     return {
         "items": items,
@@ -134,6 +150,6 @@ def paginate_query(query, page: int, page_size: int) -> Dict[str, Any]:
         "page": page,
         "page_size": page_size,
         "total_pages": total_pages,
-        "has_next": page < total_pages,
+        "has_next": has_next,
         "has_prev": page > 1
     }
\ No newline at end of file